@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""Load-test the daemon API in threaded and async serving modes.
+
+For each mode, starts a DaemonService API server on a temporary agent
+home, opens 200 concurrent SSE ``/api/v1/activity`` clients, then fires
+mixed GET traffic (``/ping``, ``/status``, ``/api/v1/dashboard``,
+``/api/v1/household/agents``) from a client thread pool while the streams
+stay open. Reports:
+
+    threads       OS threads in this process with all SSE clients connected
+    req/s         mixed GET throughput
+    p50 / p99     GET latency
+    fan-out       time for one ``activity.push()`` to reach every SSE client
+
+The per-IP rate limiter (100 req/min) is disabled for the run; every
+client here is 127.0.0.1.
+
+Usage:
+    python scripts/bench/bench_async_api.py
+    python scripts/bench/bench_async_api.py --sse 500 --requests 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import socket
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import patch
+
+REPO = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO / "src"))
+
+from skcapstone import activity  # noqa: E402
+from skcapstone.daemon import DaemonConfig, DaemonService  # noqa: E402
+
+PATHS = ("/ping", "/status", "/api/v1/dashboard", "/api/v1/household/agents")
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _start(home: Path, mode: str) -> DaemonService:
+    config = DaemonConfig(home=home, shared_root=home, port=_free_port(), api_mode=mode)
+    svc = DaemonService(config)
+    svc.state.running = True
+    with patch.object(svc, "_load_components"):
+        svc._write_pid()
+        svc._start_api_server()
+    time.sleep(0.5)
+    return svc
+
+
+def _open_sse(port: int, count: int) -> list[socket.socket]:
+    clients = []
+    for _ in range(count):
+        sock = socket.create_connection(("127.0.0.1", port), timeout=30)
+        sock.sendall(b"GET /api/v1/activity HTTP/1.1\r\nHost: localhost\r\n\r\n")
+        clients.append(sock)
+    return clients
+
+
+def _await_marker(clients: list[socket.socket], marker: bytes) -> None:
+    for sock in clients:
+        data = b""
+        while marker not in data:
+            chunk = sock.recv(65536)
+            if not chunk:
+                raise RuntimeError("SSE client disconnected")
+            data = data[-len(marker) :] + chunk
+
+
+def _get(url: str) -> float:
+    t0 = time.perf_counter()
+    with urllib.request.urlopen(url, timeout=30) as resp:
+        resp.read()
+    return time.perf_counter() - t0
+
+
+def _run(mode: str, sse: int, requests: int, workers: int) -> dict:
+    with tempfile.TemporaryDirectory(prefix="skcap_bench_api_") as tmp:
+        home = Path(tmp)
+        (home / "logs").mkdir()
+        svc = _start(home, mode)
+        port = svc.config.port
+        clients = _open_sse(port, sse)
+        try:
+            activity.push("bench.warmup", {})
+            _await_marker(clients, b"bench.warmup")
+            threads = threading.active_count()
+
+            urls = [f"http://127.0.0.1:{port}{PATHS[i % len(PATHS)]}" for i in range(requests)]
+            t0 = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                latencies = sorted(pool.map(_get, urls))
+            elapsed = time.perf_counter() - t0
+
+            t1 = time.perf_counter()
+            activity.push("bench.fanout", {})
+            _await_marker(clients, b"bench.fanout")
+            fanout = time.perf_counter() - t1
+        finally:
+            for sock in clients:
+                sock.close()
+            svc.stop()
+    return {
+        "threads": threads,
+        "rps": requests / elapsed,
+        "p50": statistics.median(latencies) * 1000,
+        "p99": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+        "fanout": fanout * 1000,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--sse", type=int, default=200, help="concurrent SSE clients")
+    ap.add_argument("--requests", type=int, default=2000, help="mixed GET requests")
+    ap.add_argument("--workers", type=int, default=16, help="GET client threads")
+    ap.add_argument("--modes", default="threaded,async")
+    args = ap.parse_args(argv)
+    logging.basicConfig(level=logging.ERROR)
+
+    print(f"{args.sse} SSE clients, {args.requests} GETs over {args.workers} client threads")
+    print(f"{'mode':<10}{'threads':>9}{'req/s':>10}{'p50 ms':>9}{'p99 ms':>9}{'fan-out ms':>12}")
+    for mode in args.modes.split(","):
+        with patch("skcapstone.rate_limiter.RateLimiter.is_allowed", return_value=True):
+            r = _run(mode, args.sse, args.requests, args.workers)
+        print(
+            f"{mode:<10}{r['threads']:>9}{r['rps']:>10.0f}{r['p50']:>9.2f}"
+            f"{r['p99']:>9.2f}{r['fanout']:>12.1f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
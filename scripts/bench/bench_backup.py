@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""Benchmark GFS backup creation for each tier against an agent home.
+
+Artifacts go to a temporary directory that is removed afterwards; the home
+is only read. Runs, in order:
+
+    full (1 thread)   a full archive compressed on one thread
+    grandfather       the monthly tier: full, ``--workers`` threads
+    father            the weekly tier, deduplicated against the grandfather
+    son               the daily tier, deduplicated against the father
+
+Usage:
+    python scripts/bench/bench_backup.py
+    python scripts/bench/bench_backup.py --home ~/.skcapstone/agents/opus --workers 4 --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+REPO = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO / "src"))
+
+from skcapstone.backup import COMPRESS_WORKERS, create_backup  # noqa: E402
+
+
+def bench_backup_tiers(
+    home: Path,
+    workers: int = 0,
+    scratch: Optional[Path] = None,
+) -> list[dict[str, Any]]:
+    """Time backup creation for each GFS tier against *home*.
+
+    Args:
+        home: Agent home to back up.
+        workers: Compression threads (``0`` = one per core, max 8).
+        scratch: Parent for the temporary directory.
+
+    Returns:
+        One dict per run: ``tier``, ``seconds``, ``cpu_seconds``, ``mb_per_s``
+        (uncompressed input per wall second), ``archive_size``, ``stored``
+        and ``referenced`` file counts.
+    """
+    workers = workers or COMPRESS_WORKERS
+    rows: list[dict[str, Any]] = []
+    with tempfile.TemporaryDirectory(prefix="skcapstone-backup-bench-", dir=scratch) as tmp:
+        out = Path(tmp)
+        runs = [
+            ("full (1 thread)", 1, None),
+            ("grandfather (monthly, full)", workers, None),
+            ("father (weekly, dedup)", workers, "prev"),
+            ("son (daily, dedup)", workers, "prev"),
+        ]
+        previous: Optional[Path] = None
+        for tier, n, base in runs:
+            wall, cpu = time.perf_counter(), time.process_time()
+            result = create_backup(
+                home=home,
+                output_dir=out,
+                base=previous if base else None,
+                workers=n,
+            )
+            wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+            previous = Path(result["filepath"])
+            rows.append(
+                {
+                    "tier": tier,
+                    "seconds": round(wall, 3),
+                    "cpu_seconds": round(cpu, 3),
+                    "mb_per_s": round(result["total_size"] / 1e6 / wall, 1) if wall else None,
+                    "archive_size": result["archive_size"],
+                    "stored": result["stored_count"],
+                    "referenced": result["referenced_count"],
+                }
+            )
+    return rows
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--home", type=Path, default=None, help="agent home (default: active)")
+    parser.add_argument("--workers", type=int, default=0, help="compression threads")
+    parser.add_argument("--json", action="store_true", help="print the rows as JSON")
+    parser.add_argument("--dir", type=Path, default=None, help="scratch directory")
+    args = parser.parse_args(argv)
+
+    if args.home is None:
+        from skcapstone import agent_home
+
+        args.home = agent_home()
+    try:
+        rows = bench_backup_tiers(args.home.expanduser(), args.workers, args.dir)
+    except FileNotFoundError as exc:
+        print(exc, file=sys.stderr)
+        return 1
+
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return 0
+    print(f"backup benchmark ({args.home})")
+    print(
+        f"{'tier':<28} {'seconds':>8} {'cpu s':>7} {'MB/s':>7} "
+        f"{'archive MB':>11} {'stored':>7} {'ref':>6}"
+    )
+    for r in rows:
+        print(
+            f"{r['tier']:<28} {r['seconds']:>8.2f} {r['cpu_seconds']:>7.2f} "
+            f"{r['mb_per_s'] or 0:>7.1f} {r['archive_size'] / 2**20:>11.1f} "
+            f"{r['stored']:>7} {r['referenced']:>6}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
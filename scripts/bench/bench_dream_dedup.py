@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Benchmark the dreaming dedup gate over a long insight history.
+
+Records ``--dreams`` dreams of ``--per-dream`` insights each (1000 x 5 by
+default) with ``dedup_lookback`` covering all of them, then times the
+dedup of one new dream's insights (half of them near-repeats):
+
+    pairwise       the previous gate: every new insight against every
+                   recent one with _keyword_overlap
+    store/disk     new process, dream-insights.jsonl loaded from disk
+    store/warm     later dream cycles in the same process
+
+Usage:
+    python scripts/bench/bench_dream_dedup.py
+    python scripts/bench/bench_dream_dedup.py --dreams 4000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO / "src"))
+
+from skcapstone import insight_store  # noqa: E402
+from skcapstone.dreaming import (  # noqa: E402
+    DreamingConfig,
+    DreamingEngine,
+    DreamResult,
+    _extract_keywords,
+    _keyword_overlap,
+)
+
+VOCAB = ["".join(random.Random(i).choices("abcdefghijklmnopqrstuvwxyz", k=7)) for i in range(3000)]
+
+
+def _sentence(rng: random.Random) -> str:
+    return "The " + " ".join(rng.sample(VOCAB, 14)) + "."
+
+
+def _pairwise(new: list[str], recent: list[str], threshold: float) -> int:
+    """The pre-store gate."""
+    kept = 0
+    for insight in new:
+        if not any(_keyword_overlap(insight, old) >= threshold for old in recent):
+            kept += 1
+    return kept
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dreams", type=int, default=1000)
+    parser.add_argument("--per-dream", type=int, default=5)
+    parser.add_argument("--passes", type=int, default=5)
+    parser.add_argument("--dir", type=Path, default=None, help="scratch directory")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(42)
+    history = [[_sentence(rng) for _ in range(args.per_dream)] for _ in range(args.dreams)]
+    flat = [text for dream in history for text in dream]
+    new = [_sentence(rng) for _ in range(5)]
+    new += [old.replace(old.split()[3], "dreamlike") for old in rng.sample(flat, 5)]
+
+    scratch = Path(tempfile.mkdtemp(prefix="bench-dedup-", dir=args.dir))
+    try:
+        eng = DreamingEngine.__new__(DreamingEngine)
+        eng._config = DreamingConfig(dedup_lookback=args.dreams)
+        eng._log_path = scratch / "dream-log.json"
+        eng._insights_path = scratch / insight_store.INSIGHT_STORE_NAME
+        store = eng._insight_store()
+        store.extend([[(t, _extract_keywords(t)) for t in dream] for dream in history])
+        threshold = eng._config.dedup_overlap_threshold
+        rows = []
+
+        def timed(label: str, fn, passes: int) -> int:
+            t0 = time.perf_counter()
+            for _ in range(passes):
+                kept = fn()
+            rows.append((label, (time.perf_counter() - t0) / passes))
+            return kept
+
+        expected = timed("pairwise", lambda: _pairwise(new, flat, threshold), 1)
+
+        def gate() -> int:
+            return len(eng._dedup_insights(new, DreamResult()))
+
+        insight_store.clear_insight_stores()
+        kept = timed("store/disk", gate, 1)
+        timed("store/warm", gate, args.passes)
+        stats = eng._insight_store().stats
+
+        print(f"{len(flat)} insights in the window, {len(new)} new, kept {kept}/{expected}")
+        print(f"{'mode':<12} {'ms':>9} {'speedup':>8}")
+        base = rows[0][1]
+        for label, seconds in rows:
+            print(f"{label:<12} {seconds * 1000:>9.1f} {base / seconds:>7.1f}x")
+        print(f"store: {stats}")
+        return 0
+    finally:
+        insight_store.clear_insight_stores()
+        shutil.rmtree(scratch, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""Benchmark DreamingEngine memory gathering on a large memory store.
+
+Builds an agent home of ``--memories`` memories (20000 by default) split
+evenly over the three tiers and times one standard and one diversity-mode
+gather with ``max_context_memories`` of 20:
+
+    scan           the previous approach: glob every tier, parse every file
+                   into a MemoryEntry, sort, keep 20
+    index/cold     first gather of a process, no meta-index.json yet
+    index/disk     new process, meta-index.json present (stat only)
+    index/warm     later gathers in the same process
+
+Usage:
+    python scripts/bench/bench_dream_gather.py
+    python scripts/bench/bench_dream_gather.py --memories 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO / "src"))
+
+from skcapstone import memory_index  # noqa: E402
+from skcapstone.dreaming import DreamingConfig, DreamingEngine  # noqa: E402
+from skcapstone.memory_engine import _load_entry  # noqa: E402
+from skcapstone.models import MemoryEntry, MemoryLayer  # noqa: E402
+
+MAX_CTX = 20
+
+
+def _build(home: Path, memories: int) -> None:
+    then = time.time() - memories - 3600
+    layers = list(MemoryLayer)
+    for layer in layers:
+        (home / "memory" / layer.value).mkdir(parents=True)
+    for i in range(memories):
+        layer = layers[i % len(layers)]
+        entry = MemoryEntry(
+            memory_id=f"mem{i:06d}",
+            content=f"Benchmark memory {i}. " * 20,
+            tags=["bench", f"t{i % 17}"],
+            layer=layer,
+            importance=(i * 7919 % 1000) / 1000,
+        )
+        path = home / "memory" / layer.value / f"mem{i:06d}.json"
+        path.write_text(entry.model_dump_json(indent=2), encoding="utf-8")
+        os.utime(path, (then + i, then + i))
+
+
+def _scan(home: Path) -> int:
+    """The pre-index gather: parse everything, keep MAX_CTX."""
+    mem = home / "memory"
+    files = sorted(
+        (mem / "short-term").glob("*.json"), key=lambda p: p.stat().st_mtime, reverse=True
+    )
+    kept = [_load_entry(f) for f in files[:MAX_CTX]]
+    for layer in ("mid-term", "long-term"):
+        entries = [e for f in (mem / layer).glob("*.json") if (e := _load_entry(f))]
+        entries.sort(key=lambda e: e.importance, reverse=True)
+        kept.extend(entries[:MAX_CTX])
+    return len(kept)
+
+
+def _engine(home: Path) -> DreamingEngine:
+    eng = DreamingEngine.__new__(DreamingEngine)
+    eng._config = DreamingConfig(max_context_memories=MAX_CTX)
+    eng._home = home
+    return eng
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--memories", type=int, default=20000)
+    parser.add_argument("--passes", type=int, default=3)
+    parser.add_argument("--dir", type=Path, default=None, help="scratch directory")
+    args = parser.parse_args(argv)
+
+    scratch = Path(tempfile.mkdtemp(prefix="bench-dream-", dir=args.dir))
+    try:
+        home = scratch / "agents" / "bench"
+        _build(home, args.memories)
+        eng = _engine(home)
+        rows = []
+
+        def timed(label: str, fn, passes: int) -> None:
+            t0 = time.perf_counter()
+            for _ in range(passes):
+                fn()
+            rows.append((label, (time.perf_counter() - t0) / passes))
+
+        def gather() -> None:
+            eng._gather_memories()
+            eng._gather_diverse_memories()
+
+        timed("scan", lambda: (_scan(home), _scan(home)), 1)
+        timed("index/cold", gather, 1)
+        memory_index.clear_meta_indexes()
+        timed("index/disk", gather, 1)
+        timed("index/warm", gather, args.passes)
+        stats = memory_index.meta_index(home / "memory").stats
+
+        print(f"{args.memories} memories, standard + diversity gather, {MAX_CTX} kept")
+        print(f"{'mode':<12} {'ms':>9} {'speedup':>8}")
+        base = rows[0][1]
+        for label, seconds in rows:
+            print(f"{label:<12} {seconds * 1000:>9.1f} {base / seconds:>7.1f}x")
+        print(f"index: {stats}")
+        return 0
+    finally:
+        memory_index.clear_meta_indexes()
+        shutil.rmtree(scratch, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
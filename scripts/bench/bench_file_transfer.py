@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""Benchmark FileTransfer send/receive throughput and peak memory.
+
+For each ``--sizes`` entry (MB; 100 and 2048 by default) a random file is
+sent and received twice, each run in a fresh child process so its peak RSS
+(``ru_maxrss``) is its own:
+
+    whole-file   the old shape: ``read_bytes()`` the file, slice, encrypt
+                 chunk by chunk, and reassemble the received file in memory
+    streaming    ``FileTransfer`` as shipped: chunked reads, incremental
+                 hashing, ``--workers`` encrypt/decrypt threads
+
+Usage:
+    python scripts/bench/bench_file_transfer.py
+    python scripts/bench/bench_file_transfer.py --sizes 100 --workers 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO / "src"))
+
+from skcapstone.file_transfer import CHUNK_SIZE, TRANSFER_WORKERS, FileTransfer  # noqa: E402
+
+
+def _make_home(root: Path) -> Path:
+    home = root / "home"
+    (home / "identity").mkdir(parents=True)
+    (home / "security").mkdir()
+    (home / "identity" / "identity.json").write_text(
+        json.dumps({"name": "bench", "fingerprint": "AB" * 20}), encoding="utf-8"
+    )
+    return home
+
+
+def _whole_file(ft: FileTransfer, src: Path, out: Path) -> float:
+    """The pre-streaming send + receive; returns the send time."""
+    t0 = time.perf_counter()
+    chunk_dir = out.parent / "chunks"
+    chunk_dir.mkdir()
+    data = src.read_bytes()
+    file_hash = hashlib.sha256(data).hexdigest()
+    key = ft._get_encryption_key()
+    hashes = []
+    for i, start in enumerate(range(0, len(data), CHUNK_SIZE)):
+        chunk = data[start : start + CHUNK_SIZE]
+        hashes.append(hashlib.sha256(chunk).hexdigest())
+        (chunk_dir / f"chunk-{i:04d}.enc").write_bytes(ft._encrypt_chunk(chunk, key))
+    send_s = time.perf_counter() - t0
+
+    assembled = bytearray()
+    for i, chunk_hash in enumerate(hashes):
+        chunk = ft._decrypt_chunk((chunk_dir / f"chunk-{i:04d}.enc").read_bytes(), key)
+        assert hashlib.sha256(chunk).hexdigest() == chunk_hash
+        assembled.extend(chunk)
+    assert hashlib.sha256(assembled).hexdigest() == file_hash
+    out.write_bytes(assembled)
+    return send_s
+
+
+def _child(mode: str, src: Path, root: Path, workers: int) -> None:
+    home = _make_home(root)
+    ft = FileTransfer(home, agent_name="bench", workers=workers)
+    ft.initialize()
+    ft._get_encryption_key()  # KMS setup is not what we are timing
+    t0 = time.perf_counter()
+    if mode == "whole-file":
+        send_s = _whole_file(ft, src, root / "out.bin")
+    else:
+        manifest = ft.send(src, recipient="peer")
+        send_s = time.perf_counter() - t0
+        ft.receive(manifest.transfer_id, output_dir=root / "out")
+    total_s = time.perf_counter() - t0
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps({"send_s": send_s, "total_s": total_s, "peak_mb": peak_kb / 1024}))
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="100,2048", help="file sizes in MB")
+    parser.add_argument("--workers", type=int, default=TRANSFER_WORKERS)
+    parser.add_argument("--dir", type=Path, default=None, help="scratch directory")
+    parser.add_argument(
+        "--child", nargs=3, metavar=("MODE", "SRC", "ROOT"), help=argparse.SUPPRESS
+    )
+    args = parser.parse_args(argv)
+
+    if args.child:
+        mode, src, root = args.child
+        _child(mode, Path(src), Path(root), args.workers)
+        return 0
+
+    print(f"workers={args.workers}, chunk={CHUNK_SIZE // 1024} KB")
+    print(f"{'size MB':>8} {'mode':<11} {'send MB/s':>10} {'total MB/s':>11} {'peak RSS MB':>12}")
+    for size_mb in (int(s) for s in args.sizes.split(",")):
+        scratch = Path(tempfile.mkdtemp(prefix="bench-ft-", dir=args.dir))
+        try:
+            src = scratch / "payload.bin"
+            with open(src, "wb") as f:
+                for _ in range(size_mb):
+                    f.write(os.urandom(1024 * 1024))
+            for mode in ("whole-file", "streaming"):
+                root = scratch / mode
+                root.mkdir()
+                out = subprocess.run(
+                    [sys.executable, __file__, "--workers", str(args.workers)]
+                    + ["--child", mode, str(src), str(root)],
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                )
+                r = json.loads(out.stdout.strip().splitlines()[-1])
+                print(
+                    f"{size_mb:>8} {mode:<11} {size_mb / r['send_s']:>10.1f} "
+                    f"{size_mb / r['total_s']:>11.1f} "
+                    f"{r['peak_mb']:>12.0f}"
+                )
+                shutil.rmtree(root, ignore_errors=True)
+        finally:
+            shutil.rmtree(scratch, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""Benchmark fleet listings and controller passes with and without the index.
+
+Builds a synthetic fleet tree of ``--nodes`` admitted nodes (50 by default)
+and ``--services`` services (200), each placed on one node with a status
+there, then times ``--passes`` rounds of the skfleet listing work
+(``service_rows`` + ``node_views``) and one ``reconcile_once`` pass:
+
+    disk         SKFLEET_INDEX=0: every read parses its file, as before
+    index/cold   the first indexed pass (full scan, every file parsed)
+    index/stat   later passes, stat-scan refresh (no inotify)
+    index/inotify  later passes, inotify-driven refresh
+
+The tree is backdated past the index's racy-mtime window first, as a live
+tree mostly is. Between passes one service spec is rewritten, so every
+refresh has real work to pick up.
+
+Usage:
+    python scripts/bench/bench_fleet_index.py
+    python scripts/bench/bench_fleet_index.py --nodes 100 --services 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO / "src"))
+
+from skcapstone.fleet import node_controller, service_controller, store  # noqa: E402
+from skcapstone.fleet.paths import FleetPaths  # noqa: E402
+
+NOW = "2026-08-15T00:00:00Z"
+
+
+def _build(paths: FleetPaths, nodes: int, services: int) -> None:
+    operator = store.Writer(role="operator", node="node-000", identity="")
+    sched = store.Writer(role="scheduler", node="node-000", identity="")
+    names = [f"node-{i:03d}" for i in range(nodes)]
+    for name in names:
+        store.write_spec(paths, "node", name, {"cordoned": False}, writer=operator)
+        noded = store.Writer(role="sknoded", node=name, identity="")
+        store.write_node_file(paths, noded, "heartbeat.json", {"ts": NOW})
+        store.write_node_file(
+            paths,
+            noded,
+            "node.json",
+            {"status": {"allocatable": {"cores": 16, "ram_gb": 64.0}}, "conditions": []},
+        )
+    for i in range(services):
+        name = f"svc-{i:04d}"
+        node = names[i % nodes]
+        store.write_spec(paths, "service", name, {"unit": f"{name}.service"}, writer=operator)
+        store.write_placement(paths, "service", name, node=node, reason="bench", writer=sched)
+        store.write_status(
+            paths,
+            "service",
+            name,
+            node=node,
+            status={"state": "running"},
+            conditions=[{"type": "Ready", "status": "True"}],
+            observed_generation=1,
+            writer=store.Writer(role="sknoded", node=node, identity=""),
+        )
+
+
+def _pass(paths: FleetPaths) -> tuple[float, float]:
+    t0 = time.perf_counter()
+    service_controller.service_rows(paths)
+    node_controller.node_views(paths)
+    listing = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    service_controller.reconcile_once(paths, node="node-000", alert=lambda *a, **k: True)
+    return listing, time.perf_counter() - t0
+
+
+def _touch_one(paths: FleetPaths, i: int) -> None:
+    operator = store.Writer(role="operator", node="node-000", identity="")
+    store.write_spec(paths, "service", "svc-0000", {"unit": f"rev{i}.service"}, writer=operator)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=50)
+    parser.add_argument("--services", type=int, default=200)
+    parser.add_argument("--passes", type=int, default=5)
+    parser.add_argument("--dir", type=Path, default=None, help="scratch directory")
+    args = parser.parse_args(argv)
+
+    scratch = Path(tempfile.mkdtemp(prefix="bench-fleet-", dir=args.dir))
+    try:
+        paths = FleetPaths(root=scratch / "fleet")
+        _build(paths, args.nodes, args.services)
+        then = time.time() - 60
+        files = 0
+        for f in paths.root.rglob("*.json"):
+            os.utime(f, (then, then))
+            files += 1
+        rows = []
+
+        def timed(label: str, passes: int) -> None:
+            listing = reconcile = 0.0
+            for i in range(passes):
+                _touch_one(paths, i)
+                a, b = _pass(paths)
+                listing += a
+                reconcile += b
+            rows.append((label, listing / passes, reconcile / passes))
+
+        store.INDEX_ENABLED = False
+        timed("disk", args.passes)
+        store.INDEX_ENABLED = True
+
+        real_inotify = store.Inotify
+
+        def no_inotify():
+            raise OSError("disabled")
+
+        store.reset_indexes()
+        store.Inotify = no_inotify
+        timed("index/cold", 1)
+        timed("index/stat", args.passes)
+        store.Inotify = real_inotify
+
+        store.reset_indexes()
+        _pass(paths)
+        timed("index/inotify", args.passes)
+        index = store.fleet_index(paths)
+
+        print(f"{args.nodes} nodes x {args.services} services, {files} JSON files")
+        print(f"{'mode':<14} {'listing ms':>11} {'reconcile ms':>13} {'speedup':>8}")
+        base = rows[0][1] + rows[0][2]
+        for label, listing, reconcile in rows:
+            print(
+                f"{label:<14} {listing * 1000:>11.1f} {reconcile * 1000:>13.1f} "
+                f"{base / (listing + reconcile):>7.1f}x"
+            )
+        print(f"inotify index: {index.stats}")
+        return 0
+    finally:
+        store.reset_indexes()
+        shutil.rmtree(scratch, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
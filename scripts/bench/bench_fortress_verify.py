@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""Benchmark MemoryFortress.verify_all throughput in memories/second.
+
+Seals ``--memories`` memories (50000 by default) across the three layers
+of a temporary agent home, backdates them past the racy-mtime window, then
+sweeps them:
+
+    per-read     the old shape: ``verify_and_load`` per file, one
+                 ``MEMORY_VERIFIED`` audit append per memory
+    full         ``verify_all`` in-process, one summary audit record
+    pool/N       ``verify_all(processes=N)``
+    incremental  ``verify_all(incremental=True)`` after touching
+                 ``--change-pct`` percent of the files (the first
+                 incremental sweep builds the Merkle state and is not timed)
+
+Usage:
+    python scripts/bench/bench_fortress_verify.py
+    python scripts/bench/bench_fortress_verify.py --memories 10000 --processes 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO / "src"))
+
+from skcapstone.memory_fortress import MemoryFortress  # noqa: E402
+from skcapstone.models import MemoryEntry, MemoryLayer  # noqa: E402
+
+LAYERS = (MemoryLayer.SHORT_TERM, MemoryLayer.MID_TERM, MemoryLayer.LONG_TERM)
+
+
+def _make_home(root: Path) -> Path:
+    # An agent home (``.../agents/<name>``) so memory paths resolve under it.
+    home = root / "agents" / "bench"
+    (home / "identity").mkdir(parents=True)
+    (home / "security").mkdir()
+    (home / "identity" / "identity.json").write_text(
+        json.dumps({"name": "bench", "fingerprint": "AB" * 20}), encoding="utf-8"
+    )
+    return home
+
+
+def _seed(fortress: MemoryFortress, home: Path, count: int) -> list[Path]:
+    then = time.time() - 3600
+    paths = []
+    for i in range(count):
+        entry = MemoryEntry(
+            memory_id=f"bench{i:07d}",
+            content=f"memory {i} " + "sovereign recall " * 20,
+            tags=["bench", f"t{i % 17}"],
+            source="bench",
+            layer=LAYERS[i % 3],
+        )
+        path = fortress.save_sealed(home, entry)
+        os.utime(path, (then, then))
+        paths.append(path)
+    return paths
+
+
+def _per_read(fortress: MemoryFortress, home: Path) -> int:
+    total = 0
+    for layer in MemoryLayer:
+        layer_dir = home / "memory" / layer.value
+        if layer_dir.is_dir():
+            for f in sorted(layer_dir.glob("*.json")):
+                fortress.verify_and_load(f)
+                total += 1
+    return total
+
+
+def _timed(fn):
+    t0 = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - t0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--memories", type=int, default=50000)
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--change-pct", type=float, default=1.0)
+    parser.add_argument("--dir", type=Path, default=None, help="scratch directory")
+    args = parser.parse_args(argv)
+
+    scratch = Path(tempfile.mkdtemp(prefix="bench-fortress-", dir=args.dir))
+    try:
+        home = _make_home(scratch)
+        fortress = MemoryFortress(home, seal_key=b"bench-fortress-seal-key-32-bytes")
+        fortress.initialize()
+        paths = _seed(fortress, home, args.memories)
+        audit_log = home / "security" / "audit.log"
+        rows = []
+
+        def audit_lines() -> int:
+            with open(audit_log, "rb") as f:
+                return sum(1 for _ in f)
+
+        before = audit_lines()
+        n, secs = _timed(lambda: _per_read(fortress, home))
+        rows.append(("per-read", n, secs, n, audit_lines() - before))
+
+        before = audit_lines()
+        res, secs = _timed(lambda: fortress.verify_all(home))
+        rows.append(("full", len(res), secs, len(res), audit_lines() - before))
+
+        before = audit_lines()
+        res, secs = _timed(lambda: fortress.verify_all(home, processes=args.processes))
+        rows.append((f"pool/{args.processes}", len(res), secs, len(res), audit_lines() - before))
+
+        fortress.verify_all(home, incremental=True)
+        then = time.time() - 60
+        for path in paths[:: max(1, int(100 / args.change_pct))]:
+            os.utime(path, (then, then))
+        before = audit_lines()
+        res, secs = _timed(lambda: fortress.verify_all(home, incremental=True))
+        rows.append(
+            ("incremental", len(res), secs, fortress.last_scan["checked"], audit_lines() - before)
+        )
+
+        print(f"{args.memories} sealed memories")
+        print(f"{'mode':<12} {'seconds':>8} {'memories/s':>11} {'checked':>8} {'audit lines':>12}")
+        for label, total, secs, checked, lines in rows:
+            print(f"{label:<12} {secs:>8.2f} {total / secs:>11.0f} {checked:>8} {lines:>12}")
+        return 0
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
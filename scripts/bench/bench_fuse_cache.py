@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""Benchmark SovereignFS getattr/readdir/read with and without the cache.
+
+Builds an agent home holding ``--memories`` memories (10000 by default)
+spread over the three layers, then drives the FUSE operations directly on
+a SovereignFS instance, without mounting, the way ``ls -l`` followed by
+``cat`` of every file would: one readdir per layer, one getattr per file,
+then a full read of every file. Each mode runs ``--passes`` rounds:
+
+    uncached       cache=False: every call parses and renders, as before
+    cache/cold     the first cached round (every memory rendered once)
+    cache/stat     later rounds, entries validated by stat (no inotify)
+    cache/inotify  later rounds, entries invalidated by inotify
+
+The memories are backdated past the cache's racy-mtime window first, as a
+live home mostly is.
+
+Usage:
+    python scripts/bench/bench_fuse_cache.py
+    python scripts/bench/bench_fuse_cache.py --memories 50000 --passes 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO / "src"))
+
+from skcapstone import fuse_mount  # noqa: E402
+from skcapstone.fuse_mount import SovereignFS  # noqa: E402
+
+LAYERS = {"short": "short-term", "mid": "mid-term", "long": "long-term"}
+
+
+def _build(home: Path, memories: int) -> None:
+    slugs = list(LAYERS)
+    for value in LAYERS.values():
+        (home / "memory" / value).mkdir(parents=True)
+    then = time.time() - 60
+    for i in range(memories):
+        slug = slugs[i % len(slugs)]
+        memory = {
+            "memory_id": f"mem{i:06d}",
+            "created_at": "2026-08-15T00:00:00+00:00",
+            "layer": LAYERS[slug],
+            "importance": (i % 10) / 10,
+            "tags": ["bench", f"t{i % 17}"],
+            "source": "bench",
+            "content": f"Benchmark memory {i}. " * 20,
+            "metadata": {"seq": i},
+        }
+        path = home / "memory" / LAYERS[slug] / f"mem{i:06d}.json"
+        path.write_text(json.dumps(memory), encoding="utf-8")
+        os.utime(path, (then, then))
+    for value in LAYERS.values():
+        os.utime(home / "memory" / value, (then, then))
+
+
+def _pass(fs: SovereignFS) -> tuple[float, float, float, int]:
+    t0 = time.perf_counter()
+    listings = {slug: fs.readdir(f"/memories/{slug}", 0)[2:] for slug in LAYERS}
+    readdir = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    sizes = {}
+    for slug, names in listings.items():
+        for name in names:
+            path = f"/memories/{slug}/{name}"
+            sizes[path] = fs.getattr(path)["st_size"]
+    getattr_s = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    for path, size in sizes.items():
+        fs.read(path, size, 0, 0)
+    read = time.perf_counter() - t0
+    return readdir, getattr_s, read, len(sizes)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--memories", type=int, default=10000)
+    parser.add_argument("--passes", type=int, default=3)
+    parser.add_argument("--dir", type=Path, default=None, help="scratch directory")
+    args = parser.parse_args(argv)
+
+    scratch = Path(tempfile.mkdtemp(prefix="bench-fuse-", dir=args.dir))
+    try:
+        home = scratch / "agents" / "bench"
+        _build(home, args.memories)
+        rows = []
+
+        def timed(label: str, fs: SovereignFS, passes: int) -> None:
+            totals = [0.0, 0.0, 0.0]
+            files = 0
+            for _ in range(passes):
+                *times, files = _pass(fs)
+                totals = [a + b for a, b in zip(totals, times)]
+            rows.append((label, files, *(t / passes for t in totals)))
+
+        timed("uncached", SovereignFS(home, cache=False), args.passes)
+
+        real_inotify = fuse_mount.Inotify
+
+        def no_inotify():
+            raise OSError("disabled")
+
+        fuse_mount.Inotify = no_inotify
+        fs = SovereignFS(home)
+        timed("cache/cold", fs, 1)
+        timed("cache/stat", fs, args.passes)
+        fuse_mount.Inotify = real_inotify
+
+        fs = SovereignFS(home)
+        _pass(fs)
+        timed("cache/inotify", fs, args.passes)
+        stats = fs.cache_stats
+        fs.destroy("/")
+
+        print(f"{args.memories} memories over {len(LAYERS)} layers")
+        print(f"{'mode':<14} {'readdir ms':>11} {'getattr/s':>11} {'read/s':>11} {'speedup':>8}")
+        base = sum(rows[0][2:])
+        for label, files, readdir, getattr_s, read in rows:
+            print(
+                f"{label:<14} {readdir * 1000:>11.1f} {files / getattr_s:>11.0f} "
+                f"{files / read:>11.0f} {base / (readdir + getattr_s + read):>7.1f}x"
+            )
+        print(f"inotify cache: {stats}")
+        return 0
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""Benchmark tail-indexed JSONL reads against full-file reads.
+
+Builds a synthetic append-only log (1M lines by default) shaped like the
+fleet event log, then times, for each query shape, the old read-it-all
+approach against ``skcapstone.jsonl_tail``:
+
+    last-N        full read + ``[-N:]``     vs  ``tail_records``
+    filtered      full read + filter        vs  ``tail_records(predicate=)``
+    since         full read + ``ts >=``     vs  ``read_since`` (warm index)
+
+The first ``read_since`` call builds the sparse index with one forward
+pass; that cost is reported separately as ``index build``.
+
+Usage:
+    python scripts/bench/bench_jsonl_tail.py
+    python scripts/bench/bench_jsonl_tail.py --lines 200000 --limit 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+REPO = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO / "src"))
+
+from skcapstone import jsonl_tail  # noqa: E402
+
+_EPOCH = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _ts(i: int) -> str:
+    return (_EPOCH + timedelta(seconds=i)).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _build(path: Path, lines: int) -> None:
+    kinds = ("service", "job", "node", "placement")
+    with open(path, "w", encoding="utf-8") as fh:
+        for i in range(lines):
+            fh.write(
+                json.dumps(
+                    {
+                        "ts": _ts(i),
+                        "node": "node-41",
+                        "kind": kinds[i % len(kinds)],
+                        "name": f"svc-{i % 97}",
+                        "reason": "Started",
+                        "message": "synthetic",
+                        "count": 1,
+                    },
+                    sort_keys=True,
+                )
+                + "\n"
+            )
+
+
+def _full(path: Path) -> list[dict]:
+    out = []
+    for raw in path.read_text(encoding="utf-8").splitlines():
+        try:
+            out.append(json.loads(raw))
+        except ValueError:
+            continue
+    return out
+
+
+def _time(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--lines", type=int, default=1_000_000)
+    ap.add_argument("--limit", type=int, default=50)
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args(argv)
+
+    with tempfile.TemporaryDirectory(prefix="skcap_bench_tail_") as tmp:
+        log = Path(tmp) / "events.jsonl"
+        t0 = time.perf_counter()
+        _build(log, args.lines)
+        size_mb = log.stat().st_size / 1e6
+        build_s = time.perf_counter() - t0
+        print(f"log: {args.lines:,} lines, {size_mb:.1f} MB (built in {build_s:.1f}s)")
+
+        limit = args.limit
+        since = _ts(args.lines - limit * 10)
+
+        def is_job(ev: dict) -> bool:
+            return ev["kind"] == "job" and ev["name"] == "svc-5"
+
+        t0 = time.perf_counter()
+        jsonl_tail.index_for(log)
+        build_ms = (time.perf_counter() - t0) * 1000
+
+        rows = [
+            (
+                f"last {limit}",
+                _time(lambda: _full(log)[-limit:], args.repeat),
+                _time(lambda: jsonl_tail.tail_records(log, limit), args.repeat),
+            ),
+            (
+                f"last {limit} filtered",
+                _time(lambda: [e for e in _full(log) if is_job(e)][-limit:], args.repeat),
+                _time(lambda: jsonl_tail.tail_records(log, limit, predicate=is_job), args.repeat),
+            ),
+            (
+                f"since (~{limit * 10} lines)",
+                _time(lambda: [e for e in _full(log) if e["ts"] >= since], args.repeat),
+                _time(lambda: jsonl_tail.read_since(log, since), args.repeat),
+            ),
+        ]
+
+        print(f"index build: {build_ms:.0f} ms (one-time, incremental after)")
+        print(f"{'query':<28}{'full read ms':>14}{'tail ms':>12}{'speedup':>10}")
+        for label, full_ms, tail_ms in rows:
+            speedup = full_ms / max(tail_ms, 1e-6)
+            print(f"{label:<28}{full_ms:>14.1f}{tail_ms:>12.2f}{speedup:>9.0f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""Benchmark KeyStore.get_key_material throughput with and without caches.
+
+Builds a keystore holding ``--keys`` service keys (50 by default), backdates
+``keystore.json`` past the racy-mtime window, then measures lookups per
+second in two shapes, each with ``cache=False`` (every call parses
+``keystore.json`` and unwraps the key from disk, as before) and with the
+process-wide record and key material caches:
+
+    same-instance  one ``KeyStore``, ``get_key_material`` in a loop
+    fresh-instance the MemoryFortress / FileTransfer / message_crypto
+                   pattern: a new ``KeyStore`` per call, then
+                   ``derive_service_key`` + ``get_key_material``
+
+Usage:
+    python scripts/bench/bench_kms.py
+    python scripts/bench/bench_kms.py --keys 200 --calls 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO / "src"))
+
+from skcapstone.kms import KeyStore, _get_material_cache, clear_caches  # noqa: E402
+
+
+def _make_home(root: Path) -> Path:
+    home = root / "home"
+    (home / "identity").mkdir(parents=True)
+    (home / "security").mkdir()
+    (home / "identity" / "identity.json").write_text(
+        json.dumps({"name": "bench", "fingerprint": "AB" * 20}), encoding="utf-8"
+    )
+    return home
+
+
+def _same_instance(home: Path, key_id: str, calls: int, cache: bool) -> float:
+    store = KeyStore(home, cache=cache)
+    store.initialize()
+    t0 = time.perf_counter()
+    for _ in range(calls):
+        store.get_key_material(key_id)
+    return time.perf_counter() - t0
+
+
+def _fresh_instance(home: Path, calls: int, cache: bool) -> float:
+    t0 = time.perf_counter()
+    for _ in range(calls):
+        store = KeyStore(home, cache=cache)
+        record = store.derive_service_key("memory-fortress-seal")
+        store.get_key_material(record.key_id)
+    return time.perf_counter() - t0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--keys", type=int, default=50, help="service keys in the keystore")
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--dir", type=Path, default=None, help="scratch directory")
+    args = parser.parse_args(argv)
+
+    scratch = Path(tempfile.mkdtemp(prefix="bench-kms-", dir=args.dir))
+    try:
+        home = _make_home(scratch)
+        store = KeyStore(home)
+        store.initialize()
+        for i in range(args.keys):
+            store.derive_service_key(f"service-{i:04d}")
+        key_id = store.derive_service_key("memory-fortress-seal").key_id
+        then = time.time() - 60
+        os.utime(home / "security" / "kms" / "keystore.json", (then, then))
+
+        print(
+            f"{args.keys + 2} records, {args.calls} calls; "
+            f"material arena mlocked: {_get_material_cache().locked}"
+        )
+        print(f"{'shape':<15} {'uncached/s':>11} {'cached/s':>10} {'speedup':>8}")
+        for label, run in (
+            ("same-instance", lambda c: _same_instance(home, key_id, args.calls, c)),
+            ("fresh-instance", lambda c: _fresh_instance(home, args.calls, c)),
+        ):
+            clear_caches()
+            uncached = run(False)
+            cached = run(True)
+            print(
+                f"{label:<15} {args.calls / uncached:>11.0f} {args.calls / cached:>10.0f} "
+                f"{uncached / cached:>7.1f}x"
+            )
+        return 0
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
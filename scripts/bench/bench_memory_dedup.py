@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""Benchmark PromotionEngine near-duplicate detection on a large memory store.
+
+Builds an agent home of ``--memories`` synthetic memories (50000 by
+default) over the three tiers, ``--dup-rate`` of them rewordings of
+another (one word swapped), and times detection without archiving:
+
+    legacy         the previous pass: read every file twice (raw JSON,
+                   then _load_entry) and group by title and 50-char prefix
+    sig/cold       find_duplicates, no dedup-signatures.json yet
+    sig/disk       new process, signatures loaded from dedup-signatures.json
+    sig/edited     later pass after one memory changed (one read, full rescan)
+    sig/warm       later pass with nothing changed (stat only, result reused)
+
+Usage:
+    python scripts/bench/bench_memory_dedup.py
+    python scripts/bench/bench_memory_dedup.py --memories 10000 --dup-rate 0.1
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+
+REPO = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO / "src"))
+
+from skcapstone import memory_dedup  # noqa: E402
+from skcapstone.memory_engine import _load_entry  # noqa: E402
+from skcapstone.memory_promoter import PromotionEngine  # noqa: E402
+from skcapstone.models import MemoryEntry, MemoryLayer  # noqa: E402
+
+VOCAB = ["".join(random.Random(i).choices("abcdefghijklmnopqrstuvwxyz", k=6)) for i in range(5000)]
+
+
+def _build(home: Path, memories: int, dup_rate: float) -> int:
+    rng = random.Random(42)
+    then = time.time() - 3600
+    layers = list(MemoryLayer)
+    for layer in layers:
+        (home / "memory" / layer.value).mkdir(parents=True)
+    texts: list[str] = []
+    dups = 0
+    for i in range(memories):
+        if texts and rng.random() < dup_rate:
+            words = rng.choice(texts).split()
+            words[rng.randrange(len(words))] = rng.choice(VOCAB)
+            dups += 1
+        else:
+            words = rng.sample(VOCAB, 40)
+        text = " ".join(words)
+        texts.append(text)
+        layer = layers[i % len(layers)]
+        entry = MemoryEntry(
+            memory_id=f"mem{i:06d}", content=text, tags=[f"t{i % 17}"], layer=layer
+        )
+        path = home / "memory" / layer.value / f"mem{i:06d}.json"
+        path.write_text(entry.model_dump_json(indent=2), encoding="utf-8")
+        os.utime(path, (then, then))
+    return dups
+
+
+def _legacy(home: Path) -> int:
+    """Detection half of the pre-signature dedup_memories."""
+    groups: dict[str, list] = defaultdict(list)
+    for layer in MemoryLayer:
+        for f in sorted((home / "memory" / layer.value).glob("*.json")):
+            raw = json.loads(f.read_text(encoding="utf-8"))
+            entry = _load_entry(f)
+            if entry is None:
+                continue
+            title = raw.get("title", entry.content.split("\n", 1)[0])
+            groups[title.strip().lower()].append(entry)
+    prefixes: dict[str, int] = defaultdict(int)
+    for title, group in groups.items():
+        prefixes[title[:50]] += len(group)
+    return sum(n - 1 for n in prefixes.values())
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--memories", type=int, default=50000)
+    parser.add_argument("--dup-rate", type=float, default=0.05)
+    parser.add_argument("--passes", type=int, default=3)
+    parser.add_argument("--dir", type=Path, default=None, help="scratch directory")
+    args = parser.parse_args(argv)
+
+    scratch = Path(tempfile.mkdtemp(prefix="bench-dedup-", dir=args.dir))
+    try:
+        home = scratch / "agents" / "bench"
+        planted = _build(home, args.memories, args.dup_rate)
+        engine = PromotionEngine(home)
+        rows = []
+
+        def timed(label: str, fn, passes: int) -> int:
+            t0 = time.perf_counter()
+            for _ in range(passes):
+                found = fn()
+            rows.append((label, (time.perf_counter() - t0) / passes, found))
+            return found
+
+        def detect() -> int:
+            return len(engine.find_duplicates())
+
+        timed("legacy", lambda: _legacy(home), 1)
+        timed("sig/cold", detect, 1)
+        memory_dedup.clear_signature_caches()
+        timed("sig/disk", detect, 1)
+        edited = next((home / "memory" / "short-term").glob("*.json"))
+        touches = iter(range(1, args.passes + 1))
+
+        def edit_and_detect() -> int:
+            stamp = time.time() - 3600 + next(touches)
+            os.utime(edited, (stamp, stamp))
+            return detect()
+
+        timed("sig/edited", edit_and_detect, args.passes)
+        timed("sig/warm", detect, args.passes)
+
+        print(f"{args.memories} memories, {planted} planted rewordings")
+        print(f"{'mode':<10} {'ms':>9} {'speedup':>8} {'found':>7}")
+        base = rows[0][1]
+        for label, seconds, found in rows:
+            print(f"{label:<10} {seconds * 1000:>9.1f} {base / seconds:>7.1f}x {found:>7}")
+        return 0
+    finally:
+        memory_dedup.clear_signature_caches()
+        shutil.rmtree(scratch, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
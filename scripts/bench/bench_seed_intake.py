@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""Benchmark batched seed intake against the per-seed import path.
+
+Queues a backlog of plaintext seeds (500 by default, 10 memories each) in
+a temporary inbox, then imports it twice with local stand-in backends:
+
+    per-seed   the old shape: one seed at a time, a fresh vector and graph
+               client per memory, one upsert round trip per memory, and a
+               processed.json rewrite per seed
+    batched    ``SyncWatcher`` as shipped: seeds parsed on the intake pool,
+               deduped by hash, one long-lived client per backend, one
+               upsert call per backend per batch, processed.json per batch
+
+The stand-ins simulate connection setup (``--connect-ms``) and a network
+round trip per call (``--rtt-ms``); the memory store is an in-process
+stand-in so only intake overhead is measured. ``--duplicates`` adds that
+many Syncthing conflict copies of existing seeds.
+
+Usage:
+    python scripts/bench/bench_seed_intake.py
+    python scripts/bench/bench_seed_intake.py --seeds 200 --connect-ms 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+REPO = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO / "src"))
+
+from skcapstone.sync_watcher import (  # noqa: E402
+    IndexClients,
+    ProcessedTracker,
+    SyncWatcher,
+    _compute_seed_hash,
+    _import_seed_data,
+)
+
+
+class Latency:
+    connect_s = 0.002
+    rtt_s = 0.0005
+
+
+class StandInStore:
+    def __init__(self) -> None:
+        self.count = 0
+
+    def snapshot(self, **kwargs):
+        self.count += 1
+        return SimpleNamespace(id=f"m{self.count}", **kwargs)
+
+
+class StandInVector:
+    built = 0
+
+    def __init__(self) -> None:
+        StandInVector.built += 1
+        time.sleep(Latency.connect_s)
+
+    def save(self, memory) -> str:
+        time.sleep(Latency.rtt_s)
+        return memory.id
+
+    def save_many(self, memories) -> list[str]:
+        time.sleep(Latency.rtt_s)
+        return [m.id for m in memories]
+
+
+class StandInGraph:
+    built = 0
+
+    def __init__(self) -> None:
+        StandInGraph.built += 1
+        time.sleep(Latency.connect_s)
+
+    def index_memory(self, memory) -> bool:
+        time.sleep(Latency.rtt_s)
+        return True
+
+    def index_many(self, memories) -> int:
+        time.sleep(Latency.rtt_s)
+        return len(memories)
+
+
+class CountingTracker(ProcessedTracker):
+    writes = 0
+
+    def _persist(self) -> None:
+        CountingTracker.writes += 1
+        super()._persist()
+
+
+def _queue(inbox: Path, seeds: int, memories: int, duplicates: int) -> None:
+    inbox.mkdir(parents=True, exist_ok=True)
+    for i in range(seeds):
+        data = {
+            "schema_version": "1.0",
+            "agent_name": f"peer{i % 5}",
+            "source_host": f"node{i % 5}",
+            "created_at": f"2026-01-01T00:{i // 60 % 60:02d}:{i % 60:02d}Z",
+            "memory_entries": [
+                {
+                    "content": f"seed {i} memory {j} " + "lorem ipsum " * 20,
+                    "tags": ["bench"],
+                    "layer": "short-term",
+                }
+                for j in range(memories)
+            ],
+        }
+        (inbox / f"seed-{i:05d}.seed.json").write_text(json.dumps(data), encoding="utf-8")
+    for i in range(duplicates):
+        src = inbox / f"seed-{i:05d}.seed.json"
+        (inbox / f"seed-{i:05d}.sync-conflict.seed.json").write_bytes(src.read_bytes())
+
+
+def _per_seed(home: Path, inbox: Path) -> int:
+    """The pre-batching import loop, reproduced with the stand-ins."""
+    tracker = CountingTracker(home / "sync" / "processed.json")
+    archive = inbox.parent / "archive"
+    archive.mkdir(exist_ok=True)
+    store = StandInStore()
+    imported = 0
+    for path in sorted(inbox.iterdir()):
+        if tracker.is_processed(path.name):
+            continue
+        data = json.loads(path.read_text(encoding="utf-8"))
+        _, saved = _import_seed_data(path.name, data, _compute_seed_hash(data), lambda: store)
+        for memory in saved:
+            StandInVector().save(memory)
+            StandInGraph().index_memory(memory)
+        tracker.mark_processed(path.name)
+        path.rename(archive / path.name)
+        imported += 1
+    return imported
+
+
+def _batched(home: Path, inbox: Path, batch_size: int) -> int:
+    watcher = SyncWatcher(
+        home,
+        threading.Event(),
+        inbox_path=str(inbox),
+        processed_log=str(home / "sync" / "processed.json"),
+        store=StandInStore(),
+        clients=IndexClients(vector=StandInVector(), graph=StandInGraph()),
+        batch_size=batch_size,
+    )
+    watcher._tracker = CountingTracker(home / "sync" / "processed.json")
+    return watcher.poll_inbox()
+
+
+def _run(label: str, fn, args) -> dict:
+    home = Path(tempfile.mkdtemp(prefix="bench-intake-"))
+    try:
+        inbox = home / "sync" / "inbox"
+        _queue(inbox, args.seeds, args.memories, args.duplicates)
+        StandInVector.built = StandInGraph.built = CountingTracker.writes = 0
+        t0 = time.perf_counter()
+        imported = fn(home, inbox)
+        elapsed = time.perf_counter() - t0
+        return {
+            "mode": label,
+            "imported": imported,
+            "seconds": elapsed,
+            "seeds_per_s": (args.seeds + args.duplicates) / elapsed,
+            "clients": StandInVector.built + StandInGraph.built,
+            "writes": CountingTracker.writes,
+        }
+    finally:
+        shutil.rmtree(home, ignore_errors=True)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seeds", type=int, default=500)
+    parser.add_argument("--memories", type=int, default=10, help="memories per seed")
+    parser.add_argument("--duplicates", type=int, default=0, help="conflict copies to add")
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--connect-ms", type=float, default=2.0)
+    parser.add_argument("--rtt-ms", type=float, default=0.5)
+    args = parser.parse_args(argv)
+
+    Latency.connect_s = args.connect_ms / 1000
+    Latency.rtt_s = args.rtt_ms / 1000
+
+    rows = [
+        _run("per-seed", _per_seed, args),
+        _run("batched", lambda h, i: _batched(h, i, args.batch_size), args),
+    ]
+    print(
+        f"{args.seeds} seeds x {args.memories} memories, {args.duplicates} duplicates, "
+        f"connect {args.connect_ms} ms, rtt {args.rtt_ms} ms"
+    )
+    print(
+        f"{'mode':<10} {'imported':>8} {'seconds':>8} {'seeds/s':>9} {'clients':>8} {'writes':>7}"
+    )
+    for r in rows:
+        print(
+            f"{r['mode']:<10} {r['imported']:>8} {r['seconds']:>8.2f} "
+            f"{r['seeds_per_s']:>9.0f} {r['clients']:>8} {r['writes']:>7}"
+        )
+    print(f"speedup: {rows[0]['seconds'] / rows[1]['seconds']:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
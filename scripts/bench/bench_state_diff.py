@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Benchmark state_diff memory snapshots on a large memory store.
+
+Builds an agent home of ``--memories`` memories (20000 by default) and
+times the memory part of a snapshot and a diff:
+
+    list_memories  the previous snapshot: parse every file into a
+                   MemoryEntry, capped at 10000 memories
+    hash/full      per-file content hashes, no baseline (every file read)
+    hash/incr      against a saved baseline after editing ``--edits``
+                   memories (only those files are read again)
+
+Usage:
+    python scripts/bench/bench_state_diff.py
+    python scripts/bench/bench_state_diff.py --memories 50000 --edits 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO / "src"))
+
+from skcapstone import state_diff  # noqa: E402
+from skcapstone.memory_engine import list_memories  # noqa: E402
+from skcapstone.models import MemoryEntry, MemoryLayer  # noqa: E402
+
+
+def _build(home: Path, memories: int) -> list[Path]:
+    then = time.time() - 3600
+    layers = list(MemoryLayer)
+    for layer in layers:
+        (home / "memory" / layer.value).mkdir(parents=True)
+    paths = []
+    for i in range(memories):
+        layer = layers[i % len(layers)]
+        entry = MemoryEntry(
+            memory_id=f"mem{i:06d}",
+            content=f"Benchmark memory {i}. " * 20,
+            tags=["bench", f"t{i % 17}"],
+            layer=layer,
+        )
+        path = home / "memory" / layer.value / f"mem{i:06d}.json"
+        path.write_text(entry.model_dump_json(indent=2), encoding="utf-8")
+        os.utime(path, (then, then))
+        paths.append(path)
+    return paths
+
+
+def _legacy(home: Path) -> int:
+    """The pre-hash memory snapshot."""
+    entries = list_memories(home, limit=10000)
+    return len([{"id": e.memory_id, "content": e.content[:100]} for e in entries])
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--memories", type=int, default=20000)
+    parser.add_argument("--edits", type=int, default=20)
+    parser.add_argument("--dir", type=Path, default=None, help="scratch directory")
+    args = parser.parse_args(argv)
+
+    scratch = Path(tempfile.mkdtemp(prefix="bench-diff-", dir=args.dir))
+    try:
+        home = scratch / "agents" / "bench"
+        paths = _build(home, args.memories)
+        rows = []
+
+        def timed(label: str, fn):
+            t0 = time.perf_counter()
+            out = fn()
+            rows.append((label, time.perf_counter() - t0))
+            return out
+
+        timed("list_memories", lambda: _legacy(home))
+        baseline = {
+            "timestamp": state_diff.datetime.now(state_diff.timezone.utc).isoformat(),
+            "memories": timed("hash/full", lambda: state_diff._snapshot_memories(home)),
+        }
+        for path in paths[:: max(1, len(paths) // args.edits)][: args.edits]:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            data["content"] += " (edited)"
+            path.write_text(json.dumps(data), encoding="utf-8")
+
+        def incremental() -> list:
+            current = {"memories": state_diff._snapshot_memories(home, baseline)}
+            return list(state_diff.iter_memory_changes(home, baseline, current))
+
+        changes = timed("hash/incr", incremental)
+
+        print(f"{args.memories} memories, {args.edits} edited, {len(changes)} changes found")
+        print(f"{'mode':<14} {'ms':>9} {'speedup':>8}")
+        base = rows[0][1]
+        for label, seconds in rows:
+            print(f"{label:<14} {seconds * 1000:>9.1f} {base / seconds:>7.1f}x")
+        return 0
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
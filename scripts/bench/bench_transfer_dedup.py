@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""Benchmark bytes written to the outbox for successive file versions.
+
+Sends ``--versions`` versions of a ``--size-mb`` file to one recipient.
+Each version applies ``--edits`` small random edits (inserts, deletes and
+overwrites of up to 4 KB) to the previous one. Every version is sent with
+fixed 256 KB chunks and again with ``chunking="cdc"``, which only writes
+chunks the recipient does not already have. The cdc transfers are
+received and acknowledged in between, which fills the receiver's chunk
+store, and each reassembled file is checked against its source.
+
+Usage:
+    python scripts/bench/bench_transfer_dedup.py
+    python scripts/bench/bench_transfer_dedup.py --size-mb 256 --versions 5 --edits 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import random
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO / "src"))
+
+from skcapstone.file_transfer import FileTransfer  # noqa: E402
+
+
+def _make_home(root: Path) -> Path:
+    home = root / "home"
+    (home / "identity").mkdir(parents=True)
+    (home / "security").mkdir()
+    (home / "identity" / "identity.json").write_text(
+        json.dumps({"name": "bench", "fingerprint": "AB" * 20}), encoding="utf-8"
+    )
+    return home
+
+
+def _edit(data: bytes, edits: int, rnd: random.Random) -> bytes:
+    buf = bytearray(data)
+    for _ in range(edits):
+        at = rnd.randrange(len(buf))
+        n = rnd.randint(1, 4096)
+        kind = rnd.choice(("insert", "delete", "overwrite"))
+        if kind == "insert":
+            buf[at:at] = rnd.randbytes(n)
+        elif kind == "delete":
+            del buf[at : at + n]
+        else:
+            buf[at : at + n] = rnd.randbytes(min(n, len(buf) - at))
+    return bytes(buf)
+
+
+def _written(ft: FileTransfer, transfer_id: str) -> int:
+    outbox = ft._outbox / transfer_id
+    return sum(p.stat().st_size for p in outbox.glob("chunk-*.enc"))
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size-mb", type=int, default=128)
+    parser.add_argument("--versions", type=int, default=5)
+    parser.add_argument("--edits", type=int, default=10, help="random edits per version")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--dir", type=Path, default=None, help="scratch directory")
+    args = parser.parse_args(argv)
+
+    rnd = random.Random(args.seed)
+    scratch = Path(tempfile.mkdtemp(prefix="bench-dedup-", dir=args.dir))
+    try:
+        ft = FileTransfer(_make_home(scratch), agent_name="bench")
+        ft.initialize()
+        ft._get_encryption_key()
+        src = scratch / "model.bin"
+        data = rnd.randbytes(args.size_mb * 1024 * 1024)
+
+        print(f"{args.size_mb} MB file, {args.edits} edits per version")
+        print(
+            f"{'version':>7} {'fixed MB':>9} {'cdc MB':>8} {'cdc chunks':>11} "
+            f"{'reused':>7} {'fixed s':>8} {'cdc s':>7}"
+        )
+        totals = [0, 0]
+        for version in range(args.versions):
+            if version:
+                data = _edit(data, args.edits, rnd)
+            src.write_bytes(data)
+
+            t0 = time.perf_counter()
+            fixed = ft.send(src, recipient="peer")
+            fixed_s = time.perf_counter() - t0
+            fixed_bytes = _written(ft, fixed.transfer_id)
+            ft.cleanup(fixed.transfer_id)
+
+            t0 = time.perf_counter()
+            cdc = ft.send(src, recipient="peer", chunking="cdc")
+            cdc_s = time.perf_counter() - t0
+            cdc_bytes = _written(ft, cdc.transfer_id)
+            out = ft.receive(cdc.transfer_id, output_dir=scratch / "received")
+            assert hashlib.sha256(out.read_bytes()).hexdigest() == cdc.file_sha256
+            ft.acknowledge(cdc.transfer_id)
+            ft.cleanup(cdc.transfer_id)
+
+            reused = sum(1 for c in cdc.chunks if not c.stored)
+            totals[0] += fixed_bytes
+            totals[1] += cdc_bytes
+            print(
+                f"{version:>7} {fixed_bytes / 2**20:>9.1f} {cdc_bytes / 2**20:>8.1f} "
+                f"{cdc.total_chunks:>11} {reused:>7} {fixed_s:>8.2f} {cdc_s:>7.2f}"
+            )
+        print(
+            f"total   {totals[0] / 2**20:>9.1f} {totals[1] / 2**20:>8.1f}  "
+            f"({100 * (1 - totals[1] / totals[0]):.0f}% fewer bytes written)"
+        )
+        return 0
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""Benchmark vault pack/unpack throughput on a synthetic agent home.
+
+Builds an agent home of ``--size-mb`` (2048 by default), half compressible
+JSON-ish memory files and half random blobs, then measures:
+
+    legacy       the old packer: ``tar.add`` + a second ``_sha256_file``
+                 read per file, single-threaded ``w:gz``, and a third read
+                 of the archive for its hash
+    stream/1     ``Vault.pack`` with one compression thread
+    stream/N     ``Vault.pack`` with ``--workers`` compression threads
+    incremental  ``Vault.pack(incremental=True)`` after rewriting
+                 ``--change-pct`` percent of the files
+    unpack       ``Vault.unpack`` of the full vault (hash-on-extract)
+
+Usage:
+    python scripts/bench/bench_vault.py
+    python scripts/bench/bench_vault.py --size-mb 256 --workers 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import shutil
+import sys
+import tarfile
+import tempfile
+import time
+from pathlib import Path
+
+REPO = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO / "src"))
+
+from skcapstone.sync.vault import (  # noqa: E402
+    COMPRESS_WORKERS,
+    PILLARS_TO_SYNC,
+    Vault,
+    _sha256_file,
+)
+
+FILE_SIZE = 256 * 1024
+
+
+def _build_home(home: Path, size_mb: int) -> list[Path]:
+    files = []
+    total = size_mb * 1024 * 1024
+    n = max(1, total // FILE_SIZE)
+    text = (b'{"content": "sovereign memory", "tags": ["bench"], "importance": 0.5}\n') * (
+        FILE_SIZE // 72 + 1
+    )
+    for i in range(n):
+        pillar = PILLARS_TO_SYNC[i % len(PILLARS_TO_SYNC)]
+        d = home / pillar / f"d{i % 32:02d}"
+        d.mkdir(parents=True, exist_ok=True)
+        f = d / f"f{i:06d}.json"
+        f.write_bytes(text[:FILE_SIZE] if i % 2 else os.urandom(FILE_SIZE))
+        files.append(f)
+    return files
+
+
+def _legacy_pack(home: Path, out: Path) -> Path:
+    archive = out / "legacy.tar.gz"
+    hashes = {}
+    with tarfile.open(archive, "w:gz") as tar:
+        for pillar in PILLARS_TO_SYNC:
+            for root, _, names in os.walk(home / pillar):
+                for name in names:
+                    full = Path(root) / name
+                    arc = str(full.relative_to(home))
+                    tar.add(str(full), arcname=arc)
+                    hashes[arc] = _sha256_file(full)
+    _sha256_file(archive)
+    return archive
+
+
+def _timed(fn):
+    t0 = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - t0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size-mb", type=int, default=2048)
+    parser.add_argument("--workers", type=int, default=COMPRESS_WORKERS)
+    parser.add_argument("--change-pct", type=float, default=1.0)
+    parser.add_argument("--dir", type=Path, default=None, help="scratch directory")
+    args = parser.parse_args(argv)
+
+    scratch = Path(tempfile.mkdtemp(prefix="bench-vault-", dir=args.dir))
+    try:
+        home = scratch / ".skcapstone"
+        files = _build_home(home, args.size_mb)
+        mb = sum(f.stat().st_size for f in files) / (1024 * 1024)
+        vault = Vault(home)
+        rows = []
+
+        legacy_out = scratch / "legacy"
+        legacy_out.mkdir()
+        archive, secs = _timed(lambda: _legacy_pack(home, legacy_out))
+        rows.append(("legacy", secs, archive.stat().st_size))
+        archive.unlink()
+
+        for workers in sorted({1, args.workers}):
+            archive, secs = _timed(lambda: vault.pack(workers=workers))
+            rows.append((f"stream/{workers}", secs, archive.stat().st_size))
+            if workers != args.workers:
+                archive.unlink()
+                archive.with_suffix(".manifest.json").unlink()
+        full = archive
+
+        changed = files[:: max(1, int(100 / args.change_pct))]
+        for f in changed:
+            f.write_bytes(os.urandom(FILE_SIZE))
+        delta, secs = _timed(lambda: vault.pack(workers=args.workers, incremental=True))
+        rows.append((f"incremental ({len(changed)} files)", secs, delta.stat().st_size))
+
+        restore = scratch / "restore"
+        restore.mkdir()
+        _, secs = _timed(lambda: vault.unpack(full, target=restore, verify_signature=False))
+        rows.append(("unpack", secs, full.stat().st_size))
+
+        print(f"agent home: {len(files)} files, {mb:.0f} MB; workers={args.workers}")
+        print(f"{'mode':<26} {'seconds':>8} {'MB/s':>8} {'archive MB':>11}")
+        for label, secs, size in rows:
+            print(f"{label:<26} {secs:>8.2f} {mb / secs:>8.1f} {size / (1024 * 1024):>11.1f}")
+        return 0
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
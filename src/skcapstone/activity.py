@@ -26,6 +26,7 @@ Usage::
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import queue
@@ -85,6 +86,41 @@ def unregister_client(q: queue.Queue) -> None:
         _clients.discard(q)
 
 
+class LoopQueue:
+    """Fan-out target that hands chunks to an ``asyncio.Queue``.
+
+    Lets an SSE coroutine await live events instead of parking an
+    executor thread in ``queue.Queue.get()`` per client. ``push()`` may
+    run on any thread, so chunks are delivered via the owning loop.
+
+    Usage::
+
+        q = activity.LoopQueue(asyncio.get_running_loop())
+        activity.register_client(q)
+        chunk = await asyncio.wait_for(q.get(), timeout=15)
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, maxsize: int = 200) -> None:
+        self._loop = loop
+        self._queue: asyncio.Queue[bytes] = asyncio.Queue(maxsize=maxsize)
+
+    def put_nowait(self, chunk: bytes) -> None:
+        """Queue *chunk*; raises ``queue.Full`` so slow clients get dropped."""
+        if self._queue.full():
+            raise queue.Full
+        self._loop.call_soon_threadsafe(self._deliver, chunk)
+
+    def _deliver(self, chunk: bytes) -> None:
+        try:
+            self._queue.put_nowait(chunk)
+        except asyncio.QueueFull:
+            pass
+
+    async def get(self) -> bytes:
+        """Wait for the next chunk."""
+        return await self._queue.get()
+
+
 # ── internal helpers ──────────────────────────────────────────────────────────
 
 
@@ -16,6 +16,14 @@ Usage (programmatic, from daemon):
     from skcapstone.api import init_api, app
     init_api(state=state, config=config, consciousness=consciousness)
     # Then run with uvicorn in a background thread.
+
+Usage (daemon async serving mode):
+    SKCAPSTONE_API_MODE=async skcapstone daemon start
+    # The daemon serves this app and its legacy routes from one event
+    # loop; see skcapstone.async_server.
+
+Endpoints that touch the filesystem are plain ``def`` functions so FastAPI
+runs them on its threadpool; only the streaming endpoints are coroutines.
 """
 
 from __future__ import annotations
@@ -24,7 +32,6 @@ import asyncio
 import json
 import logging
 import os
-import queue
 import re
 import subprocess
 import threading
@@ -33,6 +40,13 @@ from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, AsyncIterator, Dict, List, Optional
 
+from .snapshot_service import (
+    SnapshotService,
+    etag_for,
+    if_none_match,
+    register_daemon_views,
+)
+
 logger = logging.getLogger("skcapstone.api")
 
 # ── FastAPI import guard ──────────────────────────────────────────────────────
@@ -53,7 +67,12 @@ try:
         Path as FPath,
     )
     from fastapi.middleware.cors import CORSMiddleware
-    from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse  # noqa: F401
+    from fastapi.responses import (  # noqa: F401
+        JSONResponse,
+        PlainTextResponse,
+        Response,
+        StreamingResponse,
+    )
     from fastapi.security import APIKeyHeader, HTTPAuthorizationCredentials, HTTPBearer
     from pydantic import BaseModel, Field
 except ImportError as _exc:
@@ -107,6 +126,9 @@ def init_api(
         consciousness: Optional ConsciousnessLoop instance (may be None).
         runtime: Optional AgentRuntime instance (may be None).
     """
+    previous = _ctx.pop("snapshots", None)
+    if previous is not None:
+        previous.stop()
     _ctx["state"] = state
     _ctx["config"] = config
     _ctx["consciousness"] = consciousness
@@ -119,6 +141,26 @@ def _get_ctx() -> Dict[str, Any]:
     return _ctx
 
 
+def _snapshots(config: Any) -> SnapshotService:
+    """Return the snapshot service for *config*, creating it on first use."""
+    svc = _ctx.get("snapshots")
+    if svc is None:
+        svc = SnapshotService()
+        register_daemon_views(svc, config.home, config.shared_root)
+        _ctx["snapshots"] = svc
+    return svc
+
+
+def _etag_response(request: Request, model: BaseModel) -> Response:
+    """Serialise *model* with an ETag, or answer 304 if the client has it."""
+    body = model.model_dump_json().encode()
+    etag = etag_for(body)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if if_none_match(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
 # ── Pydantic response models ──────────────────────────────────────────────────
 
 
@@ -700,7 +742,7 @@ app.openapi = _custom_openapi  # type: ignore[method-assign]
         503: {"description": "Daemon is stopped or unreachable."},
     },
 )
-async def get_health(
+def get_health(
     _key: Optional[str] = Depends(_check_api_key),
 ) -> HealthResponse:
     """Return a comprehensive health snapshot of the running daemon.
@@ -785,7 +827,7 @@ async def get_components(
         503: {"description": "Daemon context not initialised."},
     },
 )
-async def get_dashboard(
+def get_dashboard(
     _key: Optional[str] = Depends(_check_api_key),
 ) -> DashboardResponse:
     """Return the complete dashboard data used by the HTML UI and Flutter app.
@@ -892,7 +934,7 @@ async def get_dashboard(
         503: {"description": "Daemon context not initialised."},
     },
 )
-async def get_capstone(
+def get_capstone(
     _key: Optional[str] = Depends(_check_api_key),
 ) -> CapstoneResponse:
     """Return pillars, memory stats, coordination board summary, and consciousness.
@@ -1012,7 +1054,7 @@ async def get_activity_stream(
     """
     from . import activity as _activity
 
-    q: queue.Queue = queue.Queue(maxsize=200)
+    q = _activity.LoopQueue(asyncio.get_running_loop())
     _activity.register_client(q)
 
     async def event_generator() -> AsyncIterator[bytes]:
@@ -1022,18 +1064,15 @@ async def get_activity_stream(
                 yield chunk
         except Exception as exc:
             logger.warning("Failed to replay activity stream history: %s", exc)
-        # Stream live events; yield keep-alive comments on timeout
+        # Stream live events; yield keep-alive comments on timeout.  Waiting
+        # on the loop queue keeps no thread busy, so idle clients are free.
         try:
             while True:
                 if await request.is_disconnected():
                     break
                 try:
-                    # Poll the queue with a short timeout to allow disconnect checks
-                    chunk = await asyncio.get_event_loop().run_in_executor(
-                        None, lambda: q.get(timeout=15)
-                    )
-                    yield chunk
-                except Exception:
+                    yield await asyncio.wait_for(q.get(), timeout=15)
+                except asyncio.TimeoutError:
                     yield b": heartbeat\n\n"
         finally:
             _activity.unregister_client(q)
@@ -1062,14 +1101,16 @@ async def get_activity_stream(
         503: {"description": "Daemon context not initialised."},
     },
 )
-async def list_household_agents(
+def list_household_agents(
+    request: Request,
     _key: Optional[str] = Depends(_check_api_key),
-) -> HouseholdAgentsResponse:
+) -> Response:
     """Return a list of all agents known to the shared household.
 
-    Reads agent identity files and heartbeats from the shared root and
-    enriches each entry with liveness status.  The calling agent's
-    consciousness stats are attached where available.
+    Agent identity files and heartbeats come from a snapshot that is only
+    re-read when the shared agents or heartbeats directories change;
+    liveness is evaluated per request.  The calling agent's consciousness
+    stats are attached where available.  Supports ``If-None-Match``.
     """
     config = _ctx.get("config")
     if config is None:
@@ -1078,45 +1119,29 @@ async def list_household_agents(
             detail="Daemon is not running.",
         )
     consciousness = _ctx.get("consciousness")
-    agents_dir = config.shared_root / "agents"
-    heartbeats_dir = config.shared_root / "heartbeats"
     agents: List[HouseholdAgent] = []
 
-    if agents_dir.exists():
-        for agent_dir in sorted(agents_dir.iterdir()):
-            if not agent_dir.is_dir():
-                continue
-            agent_name = agent_dir.name
-            entry: Dict[str, Any] = {"name": agent_name}
-
-            identity_path = agent_dir / "identity" / "identity.json"
-            if identity_path.exists():
-                try:
-                    entry["identity"] = json.loads(identity_path.read_text(encoding="utf-8"))
-                except Exception as exc:
-                    logger.warning("Failed to read identity for agent %s: %s", agent_name, exc)
-
-            hb: Optional[Dict[str, Any]] = None
-            hb_path = heartbeats_dir / f"{agent_name.lower()}.json"
-            if hb_path.exists():
-                try:
-                    hb = json.loads(hb_path.read_text(encoding="utf-8"))
-                    alive = _hb_alive(hb)
-                    hb["alive"] = alive
-                    entry["heartbeat"] = hb
-                    entry["status"] = hb.get("status", "unknown") if alive else "stale"
-                except Exception as exc:
-                    logger.warning("Failed to read heartbeat for agent %s: %s", agent_name, exc)
-                    entry["status"] = "unknown"
-            else:
-                entry["status"] = "no_heartbeat"
+    for cached in _snapshots(config).get("household"):
+        entry: Dict[str, Any] = {"name": cached["name"]}
+        if "identity" in cached:
+            entry["identity"] = cached["identity"]
+        if "heartbeat" in cached:
+            hb = dict(cached["heartbeat"])
+            alive = _hb_alive(hb)
+            hb["alive"] = alive
+            entry["heartbeat"] = hb
+            entry["status"] = hb.get("status", "unknown") if alive else "stale"
+        elif cached.get("heartbeat_error"):
+            entry["status"] = "unknown"
+        else:
+            entry["status"] = "no_heartbeat"
 
-            if consciousness:
-                entry["consciousness"] = consciousness.stats
+        if consciousness:
+            entry["consciousness"] = consciousness.stats
 
-            agents.append(HouseholdAgent(**entry))
+        agents.append(HouseholdAgent(**entry))
 
-    return HouseholdAgentsResponse(agents=agents)
+    return _etag_response(request, HouseholdAgentsResponse(agents=agents))
 
 
 # ── /api/v1/household/agent/{name} ───────────────────────────────────────────
@@ -1134,7 +1159,7 @@ async def list_household_agents(
         503: {"description": "Daemon context not initialised."},
     },
 )
-async def get_household_agent(
+def get_household_agent(
     name: str = FPath(..., description="Agent directory name (e.g. 'opus')."),
     _key: Optional[str] = Depends(_check_api_key),
 ) -> HouseholdAgent:
@@ -1211,7 +1236,7 @@ async def get_household_agent(
         503: {"description": "Daemon context not initialised."},
     },
 )
-async def list_conversations(
+def list_conversations(
     _key: Optional[str] = Depends(_check_api_key),
 ) -> ConversationsResponse:
     """Return a summary of all conversation threads in the shared conversations directory.
@@ -1263,7 +1288,7 @@ async def list_conversations(
         503: {"description": "Daemon context not initialised."},
     },
 )
-async def get_conversation(
+def get_conversation(
     peer: str = FPath(
         ..., description="Peer agent or user name (alphanumeric, dashes, underscores)."
     ),
@@ -1316,7 +1341,7 @@ async def get_conversation(
         503: {"description": "Daemon context not initialised."},
     },
 )
-async def send_message(
+def send_message(
     peer: str = FPath(..., description="Target peer agent or user name."),
     body: SendMessageRequest = ...,
     _key: Optional[str] = Depends(_check_api_key),
@@ -1396,7 +1421,7 @@ async def send_message(
         503: {"description": "Daemon context not initialised."},
     },
 )
-async def delete_conversation(
+def delete_conversation(
     peer: str = FPath(..., description="Peer name whose conversation to delete."),
     _key: Optional[str] = Depends(_check_api_key),
 ) -> DeleteConversationResponse:
@@ -1445,7 +1470,7 @@ async def delete_conversation(
         503: {"description": "Consciousness loop is not loaded."},
     },
 )
-async def get_metrics(
+def get_metrics(
     _key: Optional[str] = Depends(_check_api_key),
 ) -> MetricsResponse:
     """Return runtime statistics for the consciousness loop.
@@ -1625,7 +1650,7 @@ def _collect_prometheus_metrics() -> str:
         },
     },
 )
-async def get_prometheus_metrics(
+def get_prometheus_metrics(
     _key: Optional[str] = Depends(_check_api_key),
 ) -> "PlainTextResponse":
     """Expose daemon metrics in Prometheus text exposition format.
@@ -1845,7 +1870,7 @@ def _get_argocd_status() -> dict:
         500: {"description": "Failed to parse manifests."},
     },
 )
-async def get_argocd_status(
+def get_argocd_status(
     _key: Optional[str] = Depends(_check_api_key),
 ) -> ArgoCDStatusResponse:
     """Return ArgoCD Applications defined in the skstacks/v2 manifests.
@@ -1887,8 +1912,15 @@ async def websocket_logs(
     The connection is closed with code 4401 if the token is missing or invalid.
 
     **Protocol:** Each message is a JSON object with ``{"type": "line", "line": "..."}``
-    for log entries.  The last 50 lines from the current ``daemon.log`` are
-    replayed on connect before streaming live tails.
+    for log entries, or ``{"type": "lines", "lines": [...]}`` per batch with
+    ``?batch=1``.  The last 50 lines from the current ``daemon.log`` are
+    replayed on connect before streaming live tails.  A client too slow to
+    keep up loses lines instead of stalling others and is told so with
+    ``{"type": "dropped", "count": n}``.
+
+    **Filtering:** ``?level=WARNING`` keeps lines at or above a level and
+    ``?logger=skcapstone.daemon,skcomms`` keeps lines from those logger
+    prefixes.  All clients share one tailer per log file.
 
     **Tags:** Streaming, Auth
     """
@@ -1920,39 +1952,52 @@ async def websocket_logs(
         await websocket.close(code=4401, reason="CapAuth token required")
         return
 
+    from .log_tailer import LineFilter, LogBatch, tailer_for, ws_messages
+
+    params = websocket.query_params
+    try:
+        line_filter = LineFilter.from_params(params.get("level"), params.get("logger"))
+    except ValueError as exc:
+        await websocket.close(code=4400, reason=str(exc))
+        return
+    batched = params.get("batch", "0") in ("1", "true", "yes")
+
     await websocket.accept()
-    log_file: Optional[Path] = config.log_file if config else None
+    if config is None:
+        await websocket.close(code=1011, reason="Daemon is not running")
+        return
 
-    # Replay the last 50 log lines
-    if log_file and log_file.exists():
-        try:
-            from collections import deque
+    # One shared tailer per log file; subscribe before replaying so nothing
+    # written in between is lost.
+    tailer = tailer_for(config.log_file)
+    sub = tailer.subscribe(line_filter, loop=asyncio.get_running_loop())
+    disconnected = asyncio.Event()
 
-            with open(log_file, encoding="utf-8", errors="replace") as fh:
-                tail_lines = list(deque(fh, maxlen=50))
-            for line in tail_lines:
-                await websocket.send_json({"type": "line", "line": line.rstrip("\n")})
-        except Exception as exc:
-            logger.warning("Failed to replay log tail history over websocket: %s", exc)
+    async def _watch_disconnect() -> None:
+        try:
+            while (await websocket.receive())["type"] != "websocket.disconnect":
+                pass
+        finally:
+            disconnected.set()
 
-    # Tail the log file and stream new lines
+    watcher = asyncio.create_task(_watch_disconnect())
     try:
-        offset = log_file.stat().st_size if log_file and log_file.exists() else 0
-        while True:
-            if log_file and log_file.exists():
-                try:
-                    with open(log_file, encoding="utf-8", errors="replace") as fh:
-                        fh.seek(offset)
-                        chunk = fh.read()
-                        if chunk:
-                            for ln in chunk.splitlines():
-                                await websocket.send_json({"type": "line", "line": ln})
-                        offset = fh.tell()
-                except Exception as exc:
-                    logger.warning("Log tail websocket read error: %s", exc)
-            await asyncio.sleep(0.5)
-    except WebSocketDisconnect:
+        try:
+            recent = await asyncio.to_thread(tailer.recent, 50, line_filter)
+        except OSError as exc:
+            logger.warning("Failed to replay log tail history over websocket: %s", exc)
+            recent = []
+        batch: Optional[LogBatch] = LogBatch(recent)
+        while not disconnected.is_set():
+            if batch is not None:
+                for msg in ws_messages(batch, batched):
+                    await websocket.send_json(msg)
+            batch = await sub.get(timeout=1.0)
+    except (WebSocketDisconnect, RuntimeError):
         pass
+    finally:
+        sub.close()
+        watcher.cancel()
 
 
 # ── Legacy endpoints ──────────────────────────────────────────────────────────
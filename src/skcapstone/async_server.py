@@ -0,0 +1,376 @@
+"""
+Asyncio serving mode for the daemon HTTP API.
+
+The default status API is a ``ThreadingHTTPServer``: one OS thread per
+connection, so every open SSE ``/api/v1/activity`` stream and every
+``/ws`` socket pins a thread in a blocking loop for as long as the client
+stays connected. ``AsyncApiServer`` serves the same port from a single
+event loop (uvicorn) instead:
+
+    * ``/api/v1/activity`` (SSE) and ``/ws`` are coroutines here. The SSE
+      stream keeps the legacy handler's contract (rate limited, CORS
+      headers, no API key, since ``EventSource`` cannot send one); ``/ws``
+      receives ``DaemonService._ws_broadcast`` pushes. ``/api/v1/logs``
+      (WebSocket) is the FastAPI coroutine from ``skcapstone.api``.
+    * ``/docs``, ``/redoc``, ``/openapi.json`` and FastAPI-only routes go
+      to the FastAPI ``app`` as well.
+    * Every other request is replayed through the legacy
+      ``DaemonHandler`` on a small thread pool (``LegacyBridge``), so the
+      JSON shapes connectors depend on stay byte-for-byte identical and
+      their blocking file reads never run on the event loop.
+
+Enable with ``SKCAPSTONE_API_MODE=async`` (or ``DaemonConfig(api_mode=
+"async")``). Requires ``fastapi`` and ``uvicorn``; the daemon falls back
+to the threaded server when either is missing.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import json
+import logging
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Optional
+
+logger = logging.getLogger("skcapstone.async_server")
+
+Scope = dict
+Receive = Callable[[], Awaitable[dict]]
+Send = Callable[[dict], Awaitable[None]]
+
+#: Paths served by the FastAPI app rather than the legacy handler.
+NATIVE_PREFIXES = (
+    "/api/v1/skstacks/",
+    "/docs",
+    "/redoc",
+    "/openapi.json",
+)
+
+#: CORS headers the legacy handler adds to every response.
+_CORS_HEADERS = [
+    (b"access-control-allow-origin", b"*"),
+    (b"access-control-allow-methods", b"GET, POST, DELETE, OPTIONS"),
+    (b"access-control-allow-headers", b"Content-Type, Authorization"),
+]
+
+#: Response headers of the SSE activity stream, as the legacy handler sends them.
+_ACTIVITY_HEADERS = [
+    (b"content-type", b"text/event-stream"),
+    (b"cache-control", b"no-cache"),
+    (b"x-accel-buffering", b"no"),
+    *_CORS_HEADERS,
+]
+
+#: Seconds between keep-alive comments on an idle activity stream.
+_ACTIVITY_HEARTBEAT = 15
+
+#: Headers the ASGI server sets itself.
+_HOP_HEADERS = {b"server", b"date", b"connection", b"transfer-encoding", b"keep-alive"}
+
+
+def in_memory_handler(handler_cls: type) -> type:
+    """Subclass of *handler_cls* that reads and writes byte buffers.
+
+    The "request" passed to the constructor is the raw request bytes.
+    """
+    if getattr(handler_cls, "_in_memory", False):
+        return handler_cls
+
+    class _InMemoryHandler(handler_cls):  # type: ignore[misc, valid-type]
+        _in_memory = True
+
+        def setup(self) -> None:
+            self.connection = None
+            self.rfile = io.BytesIO(self.request)
+            self.wfile = io.BytesIO()
+
+        def finish(self) -> None:
+            self.response_bytes = self.wfile.getvalue()
+
+    return _InMemoryHandler
+
+
+def run_legacy_request(
+    handler_cls: type,
+    raw_request: bytes,
+    client_address: tuple[str, int],
+) -> tuple[int, list[tuple[bytes, bytes]], bytes]:
+    """Run one HTTP request through a ``BaseHTTPRequestHandler`` in memory.
+
+    Args:
+        handler_cls: The handler class (e.g. the daemon's ``DaemonHandler``),
+            or one already wrapped by ``in_memory_handler()``.
+        raw_request: Full request bytes: request line, headers, body.
+        client_address: ``(host, port)`` reported to the handler.
+
+    Returns:
+        ``(status, headers, body)`` parsed from what the handler wrote.
+    """
+    handler = in_memory_handler(handler_cls)(raw_request, client_address, None)
+    raw = handler.response_bytes
+    head, _, body = raw.partition(b"\r\n\r\n")
+    lines = head.split(b"\r\n")
+    try:
+        status = int(lines[0].split()[1])
+    except (IndexError, ValueError):
+        logger.error("Legacy handler produced no status line for %r", raw_request[:80])
+        return 500, [(b"content-type", b"application/json")], b'{"error": "internal error"}'
+    headers = []
+    for line in lines[1:]:
+        name, sep, value = line.partition(b":")
+        if sep and name.strip().lower() not in _HOP_HEADERS:
+            headers.append((name.strip().lower(), value.strip()))
+    return status, headers, body
+
+
+class LegacyBridge:
+    """ASGI app that replays HTTP requests through the legacy handler.
+
+    Args:
+        handler_cls: ``BaseHTTPRequestHandler`` subclass to serve with.
+        executor: Pool the blocking handler runs on.
+    """
+
+    def __init__(self, handler_cls: type, executor: ThreadPoolExecutor) -> None:
+        self._handler_cls = in_memory_handler(handler_cls)
+        self._executor = executor
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        body = b""
+        while True:
+            message = await receive()
+            body += message.get("body", b"")
+            if not message.get("more_body"):
+                break
+        target = scope.get("raw_path") or scope["path"].encode("utf-8")
+        if scope.get("query_string"):
+            target += b"?" + scope["query_string"]
+        lines = [scope["method"].encode("ascii") + b" " + target + b" HTTP/1.1"]
+        for name, value in scope.get("headers", []):
+            if name.lower() not in (b"connection", b"content-length"):
+                lines.append(name + b": " + value)
+        lines.append(b"Content-Length: " + str(len(body)).encode("ascii"))
+        lines.append(b"Connection: close")
+        raw = b"\r\n".join(lines) + b"\r\n\r\n" + body
+        client = tuple(scope.get("client") or ("127.0.0.1", 0))
+
+        loop = asyncio.get_running_loop()
+        status, headers, payload = await loop.run_in_executor(
+            self._executor, run_legacy_request, self._handler_cls, raw, client
+        )
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": payload})
+
+
+class AsyncApiServer:
+    """uvicorn-backed daemon API sharing one event loop across all clients.
+
+    Exposes ``shutdown()`` like ``HTTPServer`` so ``DaemonService.stop()``
+    treats both serving modes the same.
+
+    Args:
+        service: The owning ``DaemonService`` (state, config, consciousness).
+        handler_cls: The legacy ``DaemonHandler`` class.
+        sock: A bound, listening socket to serve on.
+        ssl: Optional ``(certfile, keyfile)`` for HTTPS.
+        legacy_workers: Threads available to legacy handler requests.
+    """
+
+    def __init__(
+        self,
+        service: Any,
+        handler_cls: type,
+        sock: socket.socket,
+        ssl: Optional[tuple[str, str]] = None,
+        legacy_workers: int = 16,
+    ) -> None:
+        import uvicorn
+
+        from . import api
+
+        api.init_api(
+            state=service.state,
+            config=service.config,
+            consciousness=service._consciousness,
+            runtime=service._runtime,
+        )
+        self._service = service
+        self._fastapi = api.app
+        self._sock = sock
+        self._executor = ThreadPoolExecutor(
+            max_workers=legacy_workers, thread_name_prefix="daemon-api-legacy"
+        )
+        self._legacy = LegacyBridge(handler_cls, self._executor)
+        self._ws_clients: set = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        kwargs: dict = {}
+        if ssl:
+            kwargs.update(ssl_certfile=ssl[0], ssl_keyfile=ssl[1])
+        self._server = uvicorn.Server(
+            uvicorn.Config(
+                self,
+                log_level="warning",
+                access_log=False,
+                lifespan="off",
+                timeout_graceful_shutdown=2,
+                **kwargs,
+            )
+        )
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def start(self) -> threading.Thread:
+        """Serve on a background thread and return it."""
+        self._thread = threading.Thread(target=self._run, name="daemon-api", daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def shutdown(self) -> None:
+        """Stop accepting requests and wait for the loop to finish.
+
+        The wait is capped at ``config.shutdown_timeout`` so a stuck event
+        loop cannot hang daemon stop.
+        """
+        self._server.should_exit = True
+        if self._thread is not None:
+            self._thread.join(timeout=self._service.config.shutdown_timeout)
+            if self._thread.is_alive():
+                logger.warning(
+                    "Async API loop still running after %.0fs; abandoning it",
+                    self._service.config.shutdown_timeout,
+                )
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run(self) -> None:
+        asyncio.run(self._serve())
+
+    async def _serve(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        await self._server.serve(sockets=[self._sock])
+
+    # ------------------------------------------------------------------
+    # /ws fan-out
+    # ------------------------------------------------------------------
+
+    def broadcast(self, msg: dict) -> None:
+        """Queue *msg* for every ``/ws`` client (callable from any thread)."""
+        loop = self._loop
+        if loop is None or not self._ws_clients or loop.is_closed():
+            return
+        text = json.dumps(msg, default=str)
+        try:
+            loop.call_soon_threadsafe(self._fan_out, text)
+        except RuntimeError:
+            pass  # loop shut down between the check and the call
+
+    def _fan_out(self, text: str) -> None:
+        for ws in list(self._ws_clients):
+            asyncio.ensure_future(self._send_ws(ws, text))
+
+    async def _send_ws(self, ws: Any, text: str) -> None:
+        try:
+            await ws.send_text(text)
+        except Exception:
+            self._ws_clients.discard(ws)
+
+    async def _serve_ws(self, scope: Scope, receive: Receive, send: Send) -> None:
+        from starlette.websockets import WebSocket, WebSocketDisconnect
+
+        ws = WebSocket(scope, receive, send)
+        await ws.accept()
+        try:
+            hello = {"type": "connected", "state": self._service.state.snapshot()}
+            await ws.send_text(json.dumps(hello, default=str))
+            self._ws_clients.add(ws)
+            while True:
+                message = await ws.receive()
+                if message["type"] == "websocket.disconnect":
+                    break
+        except WebSocketDisconnect:
+            pass
+        finally:
+            self._ws_clients.discard(ws)
+
+    # ------------------------------------------------------------------
+    # /api/v1/activity (SSE)
+    # ------------------------------------------------------------------
+
+    async def _serve_activity(self, scope: Scope, receive: Receive, send: Send) -> None:
+        from . import activity as _activity
+
+        limiter = getattr(self._service, "_rate_limiter", None)
+        client = scope.get("client") or ("127.0.0.1", 0)
+        if limiter is not None and not limiter.is_allowed(client[0]):
+            body = json.dumps({"error": "rate limit exceeded", "retry_after_seconds": 60})
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 429,
+                    "headers": [(b"content-type", b"application/json"), *_CORS_HEADERS],
+                }
+            )
+            await send({"type": "http.response.body", "body": body.encode("utf-8")})
+            return
+
+        q = _activity.LoopQueue(asyncio.get_running_loop())
+        _activity.register_client(q)
+        disconnected = asyncio.ensure_future(self._wait_disconnect(receive))
+        try:
+            await send(
+                {"type": "http.response.start", "status": 200, "headers": _ACTIVITY_HEADERS}
+            )
+            # Replay history so late-joining clients see context
+            for chunk in _activity.get_history_encoded():
+                await send({"type": "http.response.body", "body": chunk, "more_body": True})
+            # Stream live events; send keep-alive comments on timeout
+            while not disconnected.done() and not self._service._stop_event.is_set():
+                getter = asyncio.ensure_future(q.get())
+                done, _ = await asyncio.wait(
+                    {getter, disconnected},
+                    timeout=_ACTIVITY_HEARTBEAT,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if getter in done:
+                    chunk = getter.result()
+                else:
+                    getter.cancel()
+                    if disconnected.done():
+                        break
+                    chunk = b": heartbeat\n\n"
+                await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        except OSError:
+            pass
+        finally:
+            disconnected.cancel()
+            _activity.unregister_client(q)
+
+    @staticmethod
+    async def _wait_disconnect(receive: Receive) -> None:
+        while (await receive())["type"] != "http.disconnect":
+            pass
+
+    # ------------------------------------------------------------------
+    # ASGI entry point
+    # ------------------------------------------------------------------
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        path = scope.get("path", "")
+        if scope["type"] == "websocket":
+            if path == "/ws":
+                await self._serve_ws(scope, receive, send)
+            else:
+                await self._fastapi(scope, receive, send)
+        elif scope["type"] == "http" and path == "/api/v1/activity":
+            await self._serve_activity(scope, receive, send)
+        elif scope["type"] == "http" and path.startswith(NATIVE_PREFIXES):
+            await self._fastapi(scope, receive, send)
+        elif scope["type"] == "http":
+            await self._legacy(scope, receive, send)
+        else:
+            await self._fastapi(scope, receive, send)
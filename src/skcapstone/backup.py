@@ -7,6 +7,13 @@ Restores to any machine with a single command.
 The backup is a gzip-compressed tar archive. When a PGP key is
 available, the archive content manifest is signed for integrity.
 
+Archives are written in one pass: each file is hashed while it streams
+into the tar, and the gzip stream is compressed in independent members on
+a thread pool. A copy of the manifest is written next to the archive
+(``<backup_id>.manifest.json``). Given a ``base`` artifact, files whose
+size and mtime match the base manifest are not stored again; the manifest
+references the artifact that holds them and restore pulls them from there.
+
 Layout inside the tarball:
     backup-<timestamp>/
     ├── manifest.json          # backup metadata + file checksums
@@ -33,6 +40,9 @@ from typing import Any, Optional
 from pydantic import BaseModel, Field
 
 from . import AGENT_HOME, __version__
+from .atomic_io import atomic_write_text
+from .file_watch import RACY_WINDOW_NS
+from .tar_stream import COMPRESS_LEVEL, COMPRESS_WORKERS, ParallelGzipWriter, add_file
 
 logger = logging.getLogger("skcapstone.backup")
 
@@ -48,6 +58,10 @@ class BackupManifest(BaseModel):
         home_path: Original agent home path.
         files: Dict of relative path -> SHA-256 hash.
         total_size: Total uncompressed size in bytes.
+        file_stats: Dict of relative path -> [size, mtime_ns] at backup time.
+        base_backup: Backup this one was deduplicated against ("" = full).
+        references: Dict of relative path -> backup_id of the artifact that
+            stores the file, for files not stored in this archive.
     """
 
     backup_id: str = ""
@@ -57,6 +71,9 @@ class BackupManifest(BaseModel):
     home_path: str = ""
     files: dict[str, str] = Field(default_factory=dict)
     total_size: int = 0
+    file_stats: dict[str, list[int]] = Field(default_factory=dict)
+    base_backup: str = ""
+    references: dict[str, str] = Field(default_factory=dict)
 
 
 # Directories relative to agent home to include in backup.
@@ -83,6 +100,9 @@ EXCLUDE_PATTERNS = [
     ".git",
 ]
 
+# Suffix of the manifest copy written next to each archive.
+MANIFEST_SUFFIX = ".manifest.json"
+
 
 def _sha256_file(filepath: Path) -> str:
     """Compute SHA-256 of a file.
@@ -119,10 +139,66 @@ def _should_exclude(name: str) -> bool:
     return False
 
 
+def _walk_backup_files(home_path: Path) -> list[tuple[str, Path, os.stat_result]]:
+    """List every file to back up in one directory walk.
+
+    Returns:
+        list: (relative path, absolute path, stat) tuples in path order.
+    """
+    found: list[tuple[str, Path, os.stat_result]] = []
+
+    def walk(directory: str) -> None:
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError as exc:
+            logger.warning("backup: cannot list %s: %s", directory, exc)
+            return
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                walk(entry.path)
+            elif entry.is_file() and not _should_exclude(entry.name):
+                path = Path(entry.path)
+                found.append((str(path.relative_to(home_path)), path, entry.stat()))
+
+    for dir_name in BACKUP_DIRS:
+        if (home_path / dir_name).is_dir():
+            walk(str(home_path / dir_name))
+    found.sort(key=lambda item: item[0])
+
+    for filename in BACKUP_FILES:
+        filepath = home_path / filename
+        if filepath.is_file():
+            found.append((filename, filepath, filepath.stat()))
+    return found
+
+
+def manifest_path_for(archive: Path) -> Path:
+    """Path of the manifest copy kept next to *archive*."""
+    name = archive.name
+    if name.endswith(".tar.gz"):
+        name = name[: -len(".tar.gz")]
+    return archive.with_name(name + MANIFEST_SUFFIX)
+
+
+def read_backup_manifest(archive: Path) -> Optional[BackupManifest]:
+    """Load the manifest copy kept next to *archive*, or None."""
+    try:
+        return BackupManifest.model_validate_json(
+            manifest_path_for(archive).read_text(encoding="utf-8")
+        )
+    except (OSError, ValueError):
+        return None
+
+
 def create_backup(
     home: Optional[Path] = None,
     output_dir: Optional[Path] = None,
     agent_name: str = "",
+    *,
+    base: Optional[Path] = None,
+    workers: Optional[int] = None,
+    compresslevel: int = COMPRESS_LEVEL,
 ) -> dict[str, Any]:
     """Create a compressed backup of the full agent state.
 
@@ -133,9 +209,15 @@ def create_backup(
         home: Agent home directory. Defaults to ~/.skcapstone.
         output_dir: Where to write the backup file. Defaults to ~/backups.
         agent_name: Agent name for the manifest.
+        base: A previous archive in *output_dir* to deduplicate against.
+            Files unchanged since it (same size and mtime) are referenced,
+            not stored. Ignored when its manifest copy is missing.
+        workers: Compression threads. Defaults to one per core (max 8).
+        compresslevel: gzip level.
 
     Returns:
-        dict: Result with 'filepath', 'size', 'file_count', 'manifest'.
+        dict: Result with 'filepath', 'size', 'file_count', 'manifest',
+        plus 'stored_count' and 'referenced_count'.
     """
     home_path = (home or Path(AGENT_HOME)).expanduser()
     if not home_path.exists():
@@ -147,6 +229,7 @@ def create_backup(
     out_dir = (output_dir or home_path / "backups").expanduser()
     out_dir.mkdir(parents=True, exist_ok=True)
     archive_path = out_dir / f"{backup_id}.tar.gz"
+    partial_path = out_dir / f".{backup_id}.tar.gz.partial"
 
     manifest = BackupManifest(
         backup_id=backup_id,
@@ -154,51 +237,66 @@ def create_backup(
         home_path=str(home_path),
     )
 
+    base_manifest = read_backup_manifest(base) if base is not None else None
+    base_cutoff_ns = 0
+    if base_manifest is not None:
+        manifest.base_backup = base_manifest.backup_id
+        base_cutoff_ns = int(base_manifest.created_at.timestamp() * 1e9) - RACY_WINDOW_NS
+    available: dict[str, bool] = {}
+
+    def stored_in(rel: str, st: os.stat_result) -> Optional[str]:
+        """backup_id already holding *rel* unchanged, if any."""
+        if base_manifest is None or rel not in base_manifest.files:
+            return None
+        if base_manifest.file_stats.get(rel) != [st.st_size, st.st_mtime_ns]:
+            return None
+        if st.st_mtime_ns >= base_cutoff_ns:
+            return None
+        holder = base_manifest.references.get(rel, base_manifest.backup_id)
+        if holder not in available:
+            available[holder] = (out_dir / f"{holder}.tar.gz").is_file()
+        return holder if available[holder] else None
+
     total_size = 0
     file_count = 0
 
-    with tarfile.open(archive_path, "w:gz") as tar:
-        for dir_name in BACKUP_DIRS:
-            dir_path = home_path / dir_name
-            if not dir_path.exists():
-                continue
-
-            for filepath in sorted(dir_path.rglob("*")):
-                if not filepath.is_file():
-                    continue
-                if _should_exclude(str(filepath)):
-                    continue
-
-                rel = filepath.relative_to(home_path)
-                arcname = f"{backup_id}/{rel}"
-
-                tar.add(filepath, arcname=arcname)
-                manifest.files[str(rel)] = _sha256_file(filepath)
-                total_size += filepath.stat().st_size
-                file_count += 1
-
-        for filename in BACKUP_FILES:
-            filepath = home_path / filename
-            if filepath.exists():
-                arcname = f"{backup_id}/{filename}"
-                tar.add(filepath, arcname=arcname)
-                manifest.files[filename] = _sha256_file(filepath)
-                total_size += filepath.stat().st_size
-                file_count += 1
-
-        manifest.total_size = total_size
-
-        manifest_json = manifest.model_dump_json(indent=2).encode("utf-8")
-        info = tarfile.TarInfo(name=f"{backup_id}/_backup_manifest.json")
-        info.size = len(manifest_json)
-        tar.addfile(info, BytesIO(manifest_json))
+    try:
+        with open(partial_path, "wb") as raw:
+            gz = ParallelGzipWriter(raw, level=compresslevel, workers=workers or COMPRESS_WORKERS)
+            try:
+                with tarfile.open(fileobj=gz, mode="w|") as tar:
+                    for rel, filepath, st in _walk_backup_files(home_path):
+                        manifest.file_stats[rel] = [st.st_size, st.st_mtime_ns]
+                        holder = stored_in(rel, st)
+                        if holder is not None:
+                            manifest.files[rel] = base_manifest.files[rel]
+                            manifest.references[rel] = holder
+                        else:
+                            manifest.files[rel] = add_file(tar, filepath, f"{backup_id}/{rel}")
+                        total_size += st.st_size
+                        file_count += 1
+
+                    manifest.total_size = total_size
+
+                    manifest_json = manifest.model_dump_json(indent=2).encode("utf-8")
+                    info = tarfile.TarInfo(name=f"{backup_id}/_backup_manifest.json")
+                    info.size = len(manifest_json)
+                    tar.addfile(info, BytesIO(manifest_json))
+            finally:
+                gz.close()
+        atomic_write_text(manifest_path_for(archive_path), manifest.model_dump_json(indent=2))
+        os.replace(partial_path, archive_path)
+    except BaseException:
+        partial_path.unlink(missing_ok=True)
+        raise
 
     archive_size = archive_path.stat().st_size
 
     logger.info(
-        "Backup created: %s (%d files, %d bytes -> %d bytes compressed)",
+        "Backup created: %s (%d files, %d referenced, %d bytes -> %d bytes compressed)",
         archive_path,
         file_count,
+        len(manifest.references),
         total_size,
         archive_size,
     )
@@ -207,12 +305,29 @@ def create_backup(
         "filepath": str(archive_path),
         "backup_id": backup_id,
         "file_count": file_count,
+        "stored_count": file_count - len(manifest.references),
+        "referenced_count": len(manifest.references),
         "total_size": total_size,
         "archive_size": archive_size,
         "manifest": manifest.model_dump(mode="json"),
     }
 
 
+def _forget_memory_caches() -> None:
+    """Drop the process-wide views of memory files a restore just replaced.
+
+    Restored files keep their archived mtimes, so a cache validated by
+    (size, mtime) could keep serving what it read before the restore.
+    """
+    from .insight_store import clear_insight_stores
+    from .memory_dedup import clear_signature_caches
+    from .memory_index import clear_meta_indexes
+
+    clear_meta_indexes()
+    clear_insight_stores()
+    clear_signature_caches()
+
+
 def restore_backup(
     archive_path: str | Path,
     target_home: Optional[Path] = None,
@@ -271,6 +386,10 @@ def restore_backup(
             file_count += 1
 
     errors: list[str] = []
+    if manifest and manifest.references:
+        restored, missing = _restore_references(archive.parent, manifest.references, target)
+        file_count += restored
+        errors.extend(f"Missing base artifact: {holder}" for holder in missing)
     if verify and manifest:
         for rel_path, expected_hash in manifest.files.items():
             restored_file = target / rel_path
@@ -281,6 +400,8 @@ def restore_backup(
             if actual != expected_hash:
                 errors.append(f"Checksum mismatch: {rel_path}")
 
+    _forget_memory_caches()
+
     logger.info(
         "Restored %d files to %s (%d verification errors)",
         file_count,
@@ -299,6 +420,39 @@ def restore_backup(
     }
 
 
+def _restore_references(
+    backup_dir: Path, references: dict[str, str], target: Path
+) -> tuple[int, list[str]]:
+    """Extract deduplicated files from the artifacts that hold them.
+
+    Returns:
+        tuple: (files restored, backup_ids whose artifact is missing).
+    """
+    by_holder: dict[str, set[str]] = {}
+    for rel, holder in references.items():
+        by_holder.setdefault(holder, set()).add(rel)
+
+    restored = 0
+    missing: list[str] = []
+    for holder, rels in sorted(by_holder.items()):
+        holder_path = backup_dir / f"{holder}.tar.gz"
+        if not holder_path.is_file():
+            missing.append(holder)
+            continue
+        prefix = f"{holder}/"
+        with tarfile.open(holder_path, "r:gz") as tar:
+            for member in tar:
+                if not member.isfile() or not member.name.startswith(prefix):
+                    continue
+                rel = member.name[len(prefix) :]
+                if rel not in rels:
+                    continue
+                member.name = rel
+                tar.extract(member, path=target, filter="data")
+                restored += 1
+    return restored, missing
+
+
 def list_backups(
     backup_dir: Optional[Path] = None,
 ) -> list[dict[str, Any]]:
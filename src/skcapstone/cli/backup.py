@@ -184,7 +184,12 @@ def register_backup_commands(main: click.Group) -> None:
         help="Backup directory (default: config or <home>/backups).",
     )
     @click.option("--json", "as_json", is_flag=True, help="Emit the result as JSON.")
-    def backup_gfs(home: str, agent: str, output: str, as_json: bool):
+    @click.option(
+        "--dedup/--no-dedup",
+        default=None,
+        help="Reference files unchanged since the previous backup (default: config).",
+    )
+    def backup_gfs(home: str, agent: str, output: str, as_json: bool, dedup: bool | None):
         """Run the GFS backup job: create a backup then prune old ones.
 
         Creates a timestamped backup and applies Grandfather-Father-Son
@@ -199,6 +204,9 @@ def register_backup_commands(main: click.Group) -> None:
             skcapstone backup gfs
 
             skcapstone backup gfs --agent opus -o /mnt/usb/backups
+
+        To time each tier against a home, run scripts/bench/bench_backup.py
+        from a source checkout.
         """
         import json as _json
 
@@ -211,7 +219,11 @@ def register_backup_commands(main: click.Group) -> None:
         else:
             home_path = agent_home(agent_name or None)
 
-        overrides = {"dir": output} if output else None
+        overrides: dict = {}
+        if output:
+            overrides["dir"] = output
+        if dedup is not None:
+            overrides["dedup"] = dedup
         cfg = resolve_config(home_path, agent_name=agent_name or "", overrides=overrides)
 
         try:
@@ -69,7 +69,8 @@ def register_housekeeping_commands(main: click.Group) -> None:
             size_before = _fmt_size(info.get("size_before", 0))
 
             if dry_run:
-                action = f"{info.get('would_delete', 0)} would delete"
+                would_free = _fmt_size(info.get("would_free", 0))
+                action = f"{info.get('would_delete', 0)} would delete ({would_free})"
             else:
                 deleted = info.get("deleted", 0)
                 freed = _fmt_size(info.get("freed", 0))
@@ -79,6 +80,17 @@ def register_housekeeping_commands(main: click.Group) -> None:
 
         console.print(table)
 
+        scan = results.get("scan", {})
+        if scan:
+            rate = scan.get("files_per_second")
+            console.print(
+                f"[dim]Scanned {scan.get('files_scanned', 0)} files in "
+                f"{scan.get('dirs_scanned', 0)} dirs ({scan.get('dirs_skipped', 0)} unchanged "
+                f"dirs skipped) in {scan.get('elapsed_seconds', 0)}s"
+                + (f", {rate} files/s" if rate else "")
+                + "[/]"
+            )
+
         if not dry_run:
             summary = results.get("summary", {})
             console.print(
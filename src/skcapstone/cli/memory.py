@@ -442,11 +442,19 @@ def register_memory_commands(main: click.Group) -> None:
 
     @memory.command("dedup")
     @click.option("--home", default=AGENT_HOME, type=click.Path())
-    def memory_dedup(home):
+    @click.option("--dry-run", is_flag=True, help="List near-duplicates without archiving.")
+    @click.option(
+        "--threshold",
+        type=click.FloatRange(0.0, 1.0),
+        default=None,
+        help="Word-set similarity counted as a duplicate (default 0.85).",
+    )
+    def memory_dedup(home, dry_run, threshold):
         """Deduplicate memories across all tiers.
 
-        Scans for exact and near-duplicate titles. Keeps the newest
-        copy and archives the rest to memory/archive/deduped/.
+        Finds exact and near-duplicate memories by word-set similarity.
+        Keeps the highest-tier, newest copy, merges the others' tags and
+        importance into it and archives them to memory/archive/deduped/.
         """
         from ..memory_promoter import PromotionEngine
 
@@ -457,7 +465,23 @@ def register_memory_commands(main: click.Group) -> None:
 
         console.print("\n  Scanning for duplicate memories...\n")
         engine = PromotionEngine(home_path)
-        removed = engine.dedup_memories()
+        if dry_run:
+            candidates = engine.find_duplicates(threshold)
+            for c in candidates:
+                console.print(
+                    f"  [dim]{c.memory_id}[/] ~ {c.duplicate_of} ({c.similarity:.0%} similar)"
+                )
+            if candidates:
+                console.print(
+                    f"\n  [yellow]Dry run:[/] {len(candidates)} duplicate"
+                    f"{'s' if len(candidates) != 1 else ''} would be archived."
+                )
+            else:
+                console.print("  [green]No duplicates found.[/]")
+            console.print()
+            return
+
+        removed = engine.dedup_memories(threshold=threshold)
 
         if removed:
             console.print(
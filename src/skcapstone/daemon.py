@@ -20,6 +20,7 @@ import os
 import queue
 import re
 import signal
+import socket
 import struct
 import threading
 import time
@@ -765,6 +766,9 @@ class DaemonConfig:
         shutdown_timeout: Upper bound in seconds for the graceful shutdown
             sequence.  Thread joins and the API-server shutdown share this
             budget so ``stop()`` can never block forever.
+        api_mode: ``"threaded"`` (default, one thread per connection) or
+            ``"async"`` (single event loop, see ``async_server``).  Set via
+            ``SKCAPSTONE_API_MODE``.
     """
 
     def __init__(
@@ -780,6 +784,7 @@ class DaemonConfig:
         tls_enabled: Optional[bool] = None,
         tls_dir: Optional[Path] = None,
         shutdown_timeout: float = 30.0,
+        api_mode: Optional[str] = None,
     ):
         self.home = (home or Path(AGENT_HOME)).expanduser()
         self.shared_root = (shared_root or Path(SHARED_ROOT)).expanduser()
@@ -799,6 +804,10 @@ class DaemonConfig:
         self.tls_enabled: bool = tls_enabled
         self.tls_dir: Path = (tls_dir or self.home / "tls").expanduser()
 
+        if api_mode is None:
+            api_mode = os.environ.get("SKCAPSTONE_API_MODE", "threaded").lower()
+        self.api_mode: str = api_mode
+
         log_dir = self.home / LOG_DIR
         log_dir.mkdir(parents=True, exist_ok=True)
         self.log_file = log_dir / "daemon.log"
@@ -987,6 +996,10 @@ class DaemonService:
         # WebSocket clients: set of raw sockets for connected /ws clients
         self._ws_clients: set = set()
         self._ws_lock = threading.Lock()
+        # File-derived dashboard views, cached until their files change
+        self._snapshots = None
+        # Per-IP API rate limiter, shared by both serving modes
+        self._rate_limiter = None
         # Component health manager - populated in start()
         self._component_mgr = ComponentManager(self._stop_event)
 
@@ -1146,6 +1159,8 @@ class DaemonService:
                     logger.warning("Shutdown: API server did not stop within budget")
                 else:
                     logger.info("Shutdown: API server stopped")
+            if self._snapshots:
+                self._snapshots.stop()
 
             # 5. Join background threads, sharing what's left of the budget.
             live_threads = [t for t in self._threads if t.is_alive()]
@@ -1493,9 +1508,10 @@ class DaemonService:
                 freed_mb = summary.get("total_freed_mb", 0)
                 if deleted > 0:
                     logger.info(
-                        "Housekeeping: pruned %d files, freed %.1f MB",
+                        "Housekeeping: pruned %d files, freed %.1f MB (%s files/s scanned)",
                         deleted,
                         freed_mb,
+                        summary.get("files_per_second"),
                     )
             except Exception as exc:
                 logger.error("Housekeeping error: %s", exc)
@@ -1663,6 +1679,9 @@ class DaemonService:
         Args:
             msg: JSON-serialisable dict to send as a text frame.
         """
+        if self._server is not None and hasattr(self._server, "broadcast"):
+            self._server.broadcast(msg)
+            return
         with self._ws_lock:
             if not self._ws_clients:
                 return
@@ -1681,13 +1700,75 @@ class DaemonService:
     def _start_api_server(self) -> None:
         """Start the local HTTP API server in a background thread."""
         from .rate_limiter import RateLimiter
+        from .snapshot_service import (
+            DirDep,
+            SnapshotService,
+            etag_for,
+            if_none_match,
+            register_daemon_views,
+        )
 
         service = self
         state = self.state
         config = self.config
         consciousness = self._consciousness
         runtime = self._runtime
-        rate_limiter = RateLimiter(requests_per_minute=100)
+        rate_limiter = self._rate_limiter = RateLimiter(requests_per_minute=100)
+        snapshots = self._snapshots = SnapshotService()
+        register_daemon_views(snapshots, config.home, config.shared_root)
+
+        def _memory_view() -> dict:
+            from .memory_engine import get_stats as _mem_stats
+
+            ms = _mem_stats(config.home)
+            return {
+                "total": ms.total_memories,
+                "short_term": ms.short_term,
+                "mid_term": ms.mid_term,
+                "long_term": ms.long_term,
+                "status": ms.status.value,
+            }
+
+        def _board_view() -> dict:
+            from .coordination import Board
+
+            views = Board(config.home).get_task_views()
+            return {
+                "summary": {
+                    "total": len(views),
+                    "done": sum(1 for v in views if v.status.value == "done"),
+                    "in_progress": sum(1 for v in views if v.status.value == "in_progress"),
+                    "claimed": sum(1 for v in views if v.status.value == "claimed"),
+                    "open": sum(1 for v in views if v.status.value == "open"),
+                },
+                "active": [
+                    {
+                        "id": v.task.id,
+                        "title": v.task.title,
+                        "priority": v.task.priority.value,
+                        "status": v.status.value,
+                        "claimed_by": v.claimed_by,
+                    }
+                    for v in views
+                    if v.status.value in ("in_progress", "claimed")
+                ],
+            }
+
+        # Memory counts only change when files are added or removed; the
+        # board is event-sourced somewhere under coordination/, so watch it all.
+        snapshots.register(
+            "memory",
+            _memory_view,
+            dirs=[
+                DirDep(config.home / "memory" / layer, contents=False)
+                for layer in ("short-term", "mid-term", "long-term")
+            ],
+        )
+        snapshots.register(
+            "board",
+            _board_view,
+            dirs=[DirDep(config.home / "coordination", recursive=True)],
+        )
 
         class DaemonHandler(BaseHTTPRequestHandler):
             """HTTP handler for daemon status API."""
@@ -1762,47 +1843,18 @@ class DaemonService:
                         agent_fingerprint = getattr(runtime.manifest, "fingerprint", "")
                     except Exception as exc:
                         logger.warning("Failed to read agent name from runtime manifest: %s", exc)
-                identity_file = config.home / "identity" / "identity.json"
-                if identity_file.exists():
-                    try:
-                        ident = json.loads(identity_file.read_text(encoding="utf-8"))
-                        agent_name = ident.get("name", agent_name)
-                        agent_fingerprint = ident.get("fingerprint", agent_fingerprint)
-                    except Exception as exc:
-                        logger.warning("Failed to read identity.json for dashboard: %s", exc)
+                ident = snapshots.get("identity")
+                agent_name = ident.get("name", agent_name)
+                agent_fingerprint = ident.get("fingerprint", agent_fingerprint)
 
                 # Consciousness stats
                 c_stats: dict = snap.get("consciousness", {})
                 if consciousness:
                     c_stats = consciousness.stats
 
-                # Recent conversations (last 5 by mtime)
-                conversations: list = []
-                conversations_dir = config.shared_root / "conversations"
-                if conversations_dir.exists():
-                    try:
-                        conv_files = sorted(
-                            conversations_dir.glob("*.json"),
-                            key=lambda p: p.stat().st_mtime,
-                            reverse=True,
-                        )[:5]
-                        for cf in conv_files:
-                            try:
-                                msgs = json.loads(cf.read_text(encoding="utf-8"))
-                                if isinstance(msgs, list):
-                                    conversations.append(
-                                        {
-                                            "peer": cf.stem,
-                                            "message_count": len(msgs),
-                                            "last_message": (
-                                                msgs[-1].get("timestamp") if msgs else None
-                                            ),
-                                        }
-                                    )
-                            except Exception as exc:
-                                logger.warning("Failed to read conversation file %s: %s", cf, exc)
-                    except Exception as exc:
-                        logger.warning("Failed to list conversation files: %s", exc)
+                # Recent conversations (last 5 by mtime), rebuilt only when
+                # the conversations directory changes
+                conversations = snapshots.get("conversations")
 
                 return {
                     "agent": {
@@ -1852,16 +1904,9 @@ class DaemonService:
                         logger.warning(
                             "Failed to read agent identity from runtime manifest: %s", exc
                         )
-                identity_file = config.home / "identity" / "identity.json"
-                if identity_file.exists():
-                    try:
-                        ident = json.loads(identity_file.read_text(encoding="utf-8"))
-                        agent["name"] = ident.get("name", agent["name"])
-                        agent["fingerprint"] = ident.get("fingerprint", agent["fingerprint"])
-                    except Exception as exc:
-                        logger.warning(
-                            "Failed to read identity.json for capstone dashboard: %s", exc
-                        )
+                ident = snapshots.get("identity")
+                agent["name"] = ident.get("name", agent["name"])
+                agent["fingerprint"] = ident.get("fingerprint", agent["fingerprint"])
 
                 # ── Pillar status ─────────────────────────────────────────
                 pillars: dict = {}
@@ -1874,52 +1919,14 @@ class DaemonService:
                 # ── Memory stats ──────────────────────────────────────────
                 memory: dict = {}
                 try:
-                    from .memory_engine import get_stats as _mem_stats
-
-                    ms = _mem_stats(config.home)
-                    memory = {
-                        "total": ms.total_memories,
-                        "short_term": ms.short_term,
-                        "mid_term": ms.mid_term,
-                        "long_term": ms.long_term,
-                        "status": ms.status.value,
-                    }
+                    memory = snapshots.get("memory")
                 except Exception as exc:
                     logger.warning("Failed to collect memory stats for dashboard: %s", exc)
 
                 # ── Coordination board ────────────────────────────────────
                 board: dict = {"summary": {}, "active": []}
                 try:
-                    from .coordination import Board
-
-                    brd = Board(config.home)
-                    views = brd.get_task_views()
-                    total = len(views)
-                    done = sum(1 for v in views if v.status.value == "done")
-                    in_prog = sum(1 for v in views if v.status.value == "in_progress")
-                    claimed = sum(1 for v in views if v.status.value == "claimed")
-                    open_ = sum(1 for v in views if v.status.value == "open")
-                    active_tasks = [
-                        {
-                            "id": v.task.id,
-                            "title": v.task.title,
-                            "priority": v.task.priority.value,
-                            "status": v.status.value,
-                            "claimed_by": v.claimed_by,
-                        }
-                        for v in views
-                        if v.status.value in ("in_progress", "claimed")
-                    ]
-                    board = {
-                        "summary": {
-                            "total": total,
-                            "done": done,
-                            "in_progress": in_prog,
-                            "claimed": claimed,
-                            "open": open_,
-                        },
-                        "active": active_tasks,
-                    }
+                    board = snapshots.get("board")
                 except Exception as exc:
                     logger.warning(
                         "Failed to collect coordination board data for dashboard: %s", exc
@@ -2296,7 +2303,7 @@ class DaemonService:
                             service._ws_clients.discard(sock)
 
                 # ── Log stream WebSocket endpoint (CapAuth required) ─────
-                elif self.path == "/api/v1/logs":
+                elif self.path.split("?", 1)[0] == "/api/v1/logs":
                     key = self.headers.get("Sec-WebSocket-Key", "")
                     if self.headers.get("Upgrade", "").lower() != "websocket" or not key:
                         self._json_response(
@@ -2305,6 +2312,22 @@ class DaemonService:
                         )
                         return
 
+                    # Optional server-side filtering: ?level=WARNING&logger=a.b,c
+                    # and ?batch=1 for one {"type": "lines"} frame per batch.
+                    from urllib.parse import parse_qs
+
+                    from .log_tailer import LineFilter, LogBatch, tailer_for, ws_messages
+
+                    params = parse_qs(self.path.partition("?")[2])
+                    try:
+                        line_filter = LineFilter.from_params(
+                            params.get("level", [None])[0], params.get("logger", [None])[0]
+                        )
+                    except ValueError as exc:
+                        self._json_response({"error": str(exc)}, status=400)
+                        return
+                    batched = params.get("batch", ["0"])[0] in ("1", "true", "yes")
+
                     # Validate CapAuth bearer token before upgrading
                     auth_header = self.headers.get("Authorization", "")
                     token_str = (
@@ -2356,65 +2379,47 @@ class DaemonService:
                         return
 
                     sock = self.request
-                    log_file = config.log_file
                     stop = service._stop_event
+                    tailer = tailer_for(config.log_file)
+                    # Subscribe before replaying so nothing written in between is lost.
+                    sub = tailer.subscribe(line_filter)
+
+                    def _send_batch(batch) -> bool:
+                        frames = b"".join(
+                            _ws_encode_frame(json.dumps(msg, default=str).encode("utf-8"))
+                            for msg in ws_messages(batch, batched)
+                        )
+                        try:
+                            sock.sendall(frames)
+                        except OSError:
+                            return False
+                        return True
 
-                    # Send the last 50 lines from daemon.log, record EOF offset
-                    tail_offset: int = 0
+                    # Send the last 50 lines from daemon.log
                     try:
-                        if log_file.exists():
-                            from collections import deque as _deque
-
-                            with open(log_file, encoding="utf-8", errors="replace") as _fh:
-                                tail_lines = list(_deque(_fh, maxlen=50))
-                                tail_offset = _fh.tell()
-                            for _line in tail_lines:
-                                _line = _line.rstrip("\n")
-                                _frame = _ws_encode_frame(
-                                    json.dumps(
-                                        {"type": "line", "line": _line}, default=str
-                                    ).encode("utf-8")
-                                )
-                                sock.sendall(_frame)
-                    except OSError:
+                        recent = tailer.recent(50, line_filter)
+                    except OSError as exc:
+                        logger.warning("Failed to read log tail for websocket: %s", exc)
+                        recent = []
+                    if not _send_batch(LogBatch(recent)):
+                        sub.close()
                         return
 
-                    # Per-client tail thread: stream new log lines as they arrive
-                    def _tail_and_send(
-                        _sock=sock,
-                        _log=log_file,
-                        _stop=stop,
-                        _offset=tail_offset,
-                    ):
+                    # Sender thread: forward batches from the shared tailer. The
+                    # tailer's queue is bounded, so a slow client loses batches
+                    # (reported as a "dropped" frame) instead of backing it up.
+                    def _forward(_sub=sub, _stop=stop):
                         try:
-                            # Wait for the log file if it doesn't exist yet
-                            while not _stop.is_set() and not _log.exists():
-                                _stop.wait(timeout=1.0)
-                            if _stop.is_set():
-                                return
-                            with open(_log, encoding="utf-8", errors="replace") as _fh:
-                                _fh.seek(_offset)
-                                while not _stop.is_set():
-                                    chunk = _fh.read()
-                                    if chunk:
-                                        for _ln in chunk.splitlines():
-                                            _f = _ws_encode_frame(
-                                                json.dumps(
-                                                    {"type": "line", "line": _ln},
-                                                    default=str,
-                                                ).encode("utf-8")
-                                            )
-                                            try:
-                                                _sock.sendall(_f)
-                                            except OSError:
-                                                return
-                                    _stop.wait(timeout=0.5)
-                        except OSError:
-                            pass
+                            while not _stop.is_set() and not _sub.closed:
+                                batch = _sub.get(timeout=1.0)
+                                if batch is not None and not _send_batch(batch):
+                                    return
+                        finally:
+                            _sub.close()
 
                     threading.Thread(
-                        target=_tail_and_send,
-                        name="ws-logs-tail",
+                        target=_forward,
+                        name="ws-logs-send",
                         daemon=True,
                     ).start()
 
@@ -2438,56 +2443,30 @@ class DaemonService:
                                     pass
                                 break
                     finally:
-                        pass  # tail thread is daemon - exits when socket closes
+                        sub.close()  # lets the sender thread exit
 
                 # ── Household: list all agents ───────────────────────────
                 elif self.path == "/api/v1/household/agents":
                     agents = []
-                    agents_dir = config.shared_root / "agents"
-                    heartbeats_dir = config.shared_root / "heartbeats"
-
-                    if agents_dir.exists():
-                        for agent_dir in sorted(agents_dir.iterdir()):
-                            if not agent_dir.is_dir():
-                                continue
-                            agent_name = agent_dir.name
-                            entry: dict = {"name": agent_name}
-
-                            identity_path = agent_dir / "identity" / "identity.json"
-                            if identity_path.exists():
-                                try:
-                                    entry["identity"] = json.loads(
-                                        identity_path.read_text(encoding="utf-8")
-                                    )
-                                except Exception as exc:
-                                    logger.warning(
-                                        "Failed to read identity for agent %s: %s", agent_name, exc
-                                    )
-
-                            hb_path = heartbeats_dir / f"{agent_name.lower()}.json"
-                            if hb_path.exists():
-                                try:
-                                    hb = json.loads(hb_path.read_text(encoding="utf-8"))
-                                    alive = self._hb_alive(hb)
-                                    hb["alive"] = alive
-                                    entry["heartbeat"] = hb
-                                    entry["status"] = (
-                                        hb.get("status", "unknown") if alive else "stale"
-                                    )
-                                except Exception as exc:
-                                    logger.warning(
-                                        "Failed to read heartbeat for agent %s: %s",
-                                        agent_name,
-                                        exc,
-                                    )
-                                    entry["status"] = "unknown"
-                            else:
-                                entry["status"] = "no_heartbeat"
+                    for cached in snapshots.get("household"):
+                        entry: dict = {"name": cached["name"]}
+                        if "identity" in cached:
+                            entry["identity"] = cached["identity"]
+                        if "heartbeat" in cached:
+                            hb = dict(cached["heartbeat"])
+                            alive = self._hb_alive(hb)
+                            hb["alive"] = alive
+                            entry["heartbeat"] = hb
+                            entry["status"] = hb.get("status", "unknown") if alive else "stale"
+                        elif cached.get("heartbeat_error"):
+                            entry["status"] = "unknown"
+                        else:
+                            entry["status"] = "no_heartbeat"
 
-                            if consciousness:
-                                entry["consciousness"] = consciousness.stats
+                        if consciousness:
+                            entry["consciousness"] = consciousness.stats
 
-                            agents.append(entry)
+                        agents.append(entry)
 
                     self._json_response({"agents": agents})
 
@@ -2780,22 +2759,45 @@ class DaemonService:
                 self.send_header("Access-Control-Allow-Methods", "GET, POST, DELETE, OPTIONS")
                 self.send_header("Access-Control-Allow-Headers", "Content-Type, Authorization")
 
-            def _json_response(self, data: dict, status: int = 200):
-                self.send_response(status)
-                self.send_header("Content-Type", "application/json")
-                self._add_cors_headers()
-                self.end_headers()
-                self.wfile.write(json.dumps(data, indent=2, default=str).encode())
+            def _not_modified(self, body: bytes, status: int) -> bool:
+                """Send ETag headers; answer 304 if the client already has *body*.
 
-            def _html_response(self, html: str, status: int = 200):
-                body = html.encode("utf-8")
+                Only successful GETs are validated. Returns True when a 304
+                was sent and the caller must not write the body.
+                """
+                if status != 200 or self.command != "GET":
+                    return False
+                etag = etag_for(body)
+                if if_none_match(self.headers.get("If-None-Match"), etag):
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self._add_cors_headers()
+                    self.end_headers()
+                    return True
+                self._etag = etag
+                return False
+
+            def _send_body(self, body: bytes, status: int, content_type: str):
+                self._etag = None
+                if self._not_modified(body, status):
+                    return
                 self.send_response(status)
-                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Type", content_type)
                 self.send_header("Content-Length", str(len(body)))
+                if self._etag:
+                    self.send_header("ETag", self._etag)
+                    self.send_header("Cache-Control", "no-cache")
                 self._add_cors_headers()
                 self.end_headers()
                 self.wfile.write(body)
 
+            def _json_response(self, data: dict, status: int = 200):
+                body = json.dumps(data, indent=2, default=str).encode()
+                self._send_body(body, status, "application/json")
+
+            def _html_response(self, html: str, status: int = 200):
+                self._send_body(html.encode("utf-8"), status, "text/html; charset=utf-8")
+
             def _text_response(
                 self,
                 text: str,
@@ -2814,6 +2816,8 @@ class DaemonService:
                 logger.debug("API: %s", format % args)
 
         try:
+            if config.api_mode == "async" and self._start_async_api_server(DaemonHandler):
+                return
             self._server, bound_port = self._bind_api_server(config.port, DaemonHandler)
 
             if config.tls_enabled:
@@ -2839,16 +2843,7 @@ class DaemonService:
             )
             t.start()
             self._threads.append(t)
-            logger.info("API server listening on %s://127.0.0.1:%d", scheme, bound_port)
-            if bound_port == config.port:
-                self.state.record_api_server("ok", port=bound_port)
-            else:
-                # Bound, but not on the intended port - degraded. Loud, not silent.
-                detail = f"intended port {config.port} was in use; " f"rebound on {bound_port}"
-                self.state.record_api_server("rebound", port=bound_port, detail=detail)
-                self.state.record_error(f"ALERT: API server {detail}")
-                logger.warning("ALERT: API server %s", detail)
-                self._emit_api_alert("rebound", config.port, detail, bound_port=bound_port)
+            self._record_api_bound(scheme, bound_port)
         except OSError as exc:
             # No API server at all - the daemon is running blind (no status /
             # health monitoring). This must be loud: alert event + degraded
@@ -2859,6 +2854,65 @@ class DaemonService:
             logger.error("ALERT: API server %s", detail)
             self._emit_api_alert("down", config.port, detail)
 
+    def _start_async_api_server(self, handler) -> bool:
+        """Serve the API from one asyncio loop (``api_mode="async"``).
+
+        Returns False, after logging why, when FastAPI or uvicorn is not
+        installed so the caller can fall back to the threaded server.
+
+        Raises:
+            OSError: If no port could be bound.
+        """
+        config = self.config
+        try:
+            from .async_server import AsyncApiServer
+        except ImportError as exc:
+            logger.warning("Async API mode unavailable (%s) - using threaded server", exc)
+            return False
+
+        def _listen(port: int) -> socket.socket:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            try:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                sock.bind(("127.0.0.1", port))
+                sock.listen(128)
+            except OSError:
+                sock.close()
+                raise
+            return sock
+
+        sock, bound_port = self._bind_with_fallback(config.port, _listen)
+        ssl = None
+        if config.tls_enabled:
+            from .tls import ensure_tls_cert
+
+            cert_path, key_path = ensure_tls_cert(config.tls_dir)
+            ssl = (str(cert_path), str(key_path))
+        try:
+            server = AsyncApiServer(self, handler, sock, ssl=ssl)
+        except ImportError as exc:
+            sock.close()
+            logger.warning("Async API mode unavailable (%s) - using threaded server", exc)
+            return False
+        self._server = server
+        self._threads.append(server.start())
+        self._record_api_bound("https" if ssl else "http", bound_port, mode="async")
+        return True
+
+    def _record_api_bound(self, scheme: str, bound_port: int, mode: str = "threaded") -> None:
+        """Log the bound API port and flag a fallback-port rebind loudly."""
+        config = self.config
+        logger.info("API server listening on %s://127.0.0.1:%d (%s)", scheme, bound_port, mode)
+        if bound_port == config.port:
+            self.state.record_api_server("ok", port=bound_port)
+        else:
+            # Bound, but not on the intended port - degraded. Loud, not silent.
+            detail = f"intended port {config.port} was in use; rebound on {bound_port}"
+            self.state.record_api_server("rebound", port=bound_port, detail=detail)
+            self.state.record_error(f"ALERT: API server {detail}")
+            logger.warning("ALERT: API server %s", detail)
+            self._emit_api_alert("rebound", config.port, detail, bound_port=bound_port)
+
     def _bind_api_server(self, preferred_port: int, handler):
         """Bind the status-API HTTP server, retrying on a port collision.
 
@@ -2874,11 +2928,28 @@ class DaemonService:
         Returns:
             Tuple of (bound ``ThreadingHTTPServer``, actual port).
 
+        Raises:
+            OSError: If no port in the scan could be bound.
+        """
+        return self._bind_with_fallback(
+            preferred_port, lambda port: ThreadingHTTPServer(("127.0.0.1", port), handler)
+        )
+
+    @staticmethod
+    def _bind_with_fallback(preferred_port: int, bind):
+        """Call ``bind(port)`` on *preferred_port*, then the dynamic range.
+
+        Shared by both serving modes so they degrade the same way on a port
+        collision.
+
+        Returns:
+            Tuple of (``bind``'s result, actual port).
+
         Raises:
             OSError: If no port in the scan could be bound.
         """
         try:
-            return ThreadingHTTPServer(("127.0.0.1", preferred_port), handler), preferred_port
+            return bind(preferred_port), preferred_port
         except OSError as exc:
             if exc.errno != errno.EADDRINUSE:
                 raise
@@ -2890,7 +2961,7 @@ class DaemonService:
             if candidate == preferred_port or candidate in FLEET_RESERVED_PORTS:
                 continue
             try:
-                return ThreadingHTTPServer(("127.0.0.1", candidate), handler), candidate
+                return bind(candidate), candidate
             except OSError as exc:
                 if exc.errno != errno.EADDRINUSE:
                     raise
@@ -35,7 +35,9 @@ from typing import Any, Optional
 
 from pydantic import BaseModel
 
+from .insight_store import INSIGHT_STORE_NAME, InsightStore, insight_store
 from .memory_engine import _load_entry, _memory_dir, store
+from .memory_index import MemoryMeta, meta_index
 from .models import MemoryLayer
 
 logger = logging.getLogger("skcapstone.dreaming")
@@ -220,6 +222,21 @@ def _extract_keywords(text: str, min_length: int = 4) -> set[str]:
     return {w for w in words if len(w) >= min_length and w not in _STOP_WORDS}
 
 
+def _stratified_sample(items: list[Any], k: int) -> list[Any]:
+    """Pick *k* of *items* at random, one from each of *k* equal contiguous strata.
+
+    With *items* ordered by time this spreads the sample over the whole
+    period instead of letting it cluster, which plain ``random.sample``
+    may do. Returns every item when *k* covers them all.
+    """
+    n = len(items)
+    if k >= n:
+        return list(items)
+    if k <= 0:
+        return []
+    return [items[random.randrange(i * n // k, (i + 1) * n // k)] for i in range(k)]
+
+
 def _keyword_overlap(text_a: str, text_b: str) -> float:
     """Compute Jaccard similarity between keyword sets of two texts.
 
@@ -370,6 +387,7 @@ class DreamingEngine:
         self._agent_name = os.environ.get("SKCAPSTONE_AGENT") or active_agent_name() or ""
         self._state_path = home / "agents" / self._agent_name / "memory" / "dreaming-state.json"
         self._log_path = home / "agents" / self._agent_name / "memory" / "dream-log.json"
+        self._insights_path = home / "agents" / self._agent_name / "memory" / INSIGHT_STORE_NAME
         self._graduated_path = (
             home / "agents" / self._agent_name / "memory" / "graduated-themes.json"
         )
@@ -539,26 +557,36 @@ class DreamingEngine:
     # Dedup gate (Feature 1)
     # ------------------------------------------------------------------
 
+    def _insight_store(self) -> InsightStore:
+        """The insight signature store, seeded from the dream log on first use."""
+        lookback = self._config.dedup_lookback
+        insights = insight_store(
+            self._insights_path, lookback, self._config.dedup_overlap_threshold
+        )
+        if insights.needs_seed:
+            insights.extend(
+                [
+                    [(text, _extract_keywords(text)) for text in entry.get("insights", [])]
+                    for entry in self._load_dream_log()[-lookback:]
+                ]
+            )
+        return insights
+
     def _load_recent_insights(self) -> list[str]:
-        """Load insights from the last N dream log entries.
+        """Load insights from the last N recorded dreams.
 
         Returns:
             Flat list of insight strings from recent dreams.
         """
-        lookback = self._config.dedup_lookback
-        log = self._load_dream_log()
-        recent = log[-lookback:] if log else []
-        insights: list[str] = []
-        for entry in recent:
-            insights.extend(entry.get("insights", []))
-        return insights
+        return self._insight_store().recent_texts()
 
     def _dedup_insights(self, new_insights: list[str], result: DreamResult) -> list[str]:
         """Filter out insights that have >threshold overlap with recent ones.
 
-        For each new insight, checks keyword overlap against every recent
-        insight. If overlap exceeds the threshold, the insight is dropped
-        and result.dedup_filtered is incremented directly.
+        Each new insight's keyword set is looked up in the insight store,
+        which only verifies recent insights sharing an LSH bucket with it.
+        If overlap exceeds the threshold, the insight is dropped and
+        result.dedup_filtered is incremented directly.
 
         Args:
             new_insights: List of newly generated insight strings.
@@ -567,28 +595,22 @@ class DreamingEngine:
         Returns:
             Filtered list of novel insights.
         """
-        recent = self._load_recent_insights()
-        if not recent:
+        recent = self._insight_store()
+        if not recent.window_size():
             return new_insights
 
-        threshold = self._config.dedup_overlap_threshold
         novel: list[str] = []
         filtered = 0
 
         for insight in new_insights:
-            is_duplicate = False
-            for old_insight in recent:
-                overlap = _keyword_overlap(insight, old_insight)
-                if overlap >= threshold:
-                    is_duplicate = True
-                    logger.debug(
-                        "Dedup: filtered insight (%.0f%% overlap): %s",
-                        overlap * 100,
-                        insight[:80],
-                    )
-                    break
-            if is_duplicate:
+            match = recent.match(_extract_keywords(insight))
+            if match is not None:
                 filtered += 1
+                logger.debug(
+                    "Dedup: filtered insight (%.0f%% overlap): %s",
+                    match[1] * 100,
+                    insight[:80],
+                )
             else:
                 novel.append(insight)
 
@@ -825,46 +847,29 @@ class DreamingEngine:
         Returns:
             (short_term_list, established_list) tuples.
         """
-        mem_dir = _memory_dir(self._home)
+        index = meta_index(_memory_dir(self._home))
         max_ctx = self._config.max_context_memories
 
-        # Short-term: sample from OLDEST half instead of newest
-        short_term: list[dict[str, Any]] = []
-        st_dir = mem_dir / MemoryLayer.SHORT_TERM.value
-        if st_dir.exists():
-            files = sorted(st_dir.glob("*.json"), key=lambda p: p.stat().st_mtime)
-            # Take oldest half, then pick random sample
-            oldest_half = files[: len(files) // 2] if len(files) > 4 else files
-            sample_size = min(len(oldest_half), max_ctx // 2)
-            sampled = random.sample(oldest_half, sample_size) if oldest_half else []
-            for f in sampled:
-                entry = _load_entry(f)
-                if entry:
-                    short_term.append(self._entry_to_dict(entry))
+        # Short-term: sample from OLDEST half instead of newest, one memory
+        # per time stratum so the sample spans the whole older period
+        by_age = sorted(index.entries(MemoryLayer.SHORT_TERM), key=lambda m: m.mtime_ns)
+        oldest_half = by_age[: len(by_age) // 2] if len(by_age) > 4 else by_age
+        short_term = self._load_selected(_stratified_sample(oldest_half, max_ctx // 2))
 
         # Established: sample from LOWER importance memories
         established: list[dict[str, Any]] = []
         remaining = max(0, max_ctx - len(short_term))
         for layer in (MemoryLayer.MID_TERM, MemoryLayer.LONG_TERM):
-            layer_dir = mem_dir / layer.value
-            if not layer_dir.exists():
-                continue
-            entries = []
-            for f in layer_dir.glob("*.json"):
-                entry = _load_entry(f)
-                if entry:
-                    entries.append(entry)
+            if remaining <= 0:
+                break
             # Sort by importance ASCENDING (explore undervalued memories)
-            entries.sort(key=lambda e: e.importance)
-            # Take bottom half, random sample
-            bottom_half = entries[: len(entries) // 2] if len(entries) > 4 else entries
-            sample_size = min(len(bottom_half), remaining)
-            sampled_entries = random.sample(bottom_half, sample_size) if bottom_half else []
-            for entry in sampled_entries:
-                established.append(self._entry_to_dict(entry))
-                remaining -= 1
-                if remaining <= 0:
-                    break
+            ranked = sorted(index.entries(layer), key=lambda m: m.importance)
+            # Take bottom half, stratified across creation time
+            bottom_half = ranked[: len(ranked) // 2] if len(ranked) > 4 else ranked
+            bottom_half.sort(key=lambda m: m.created)
+            picked = self._load_selected(_stratified_sample(bottom_half, remaining))
+            established.extend(picked)
+            remaining -= len(picked)
 
         logger.info(
             "Diversity mode: gathered %d short-term (oldest) + %d established (undervalued)",
@@ -886,41 +891,45 @@ class DreamingEngine:
             (short_term_list, established_list) - each is a list of dicts
             with memory_id, content, tags, importance, layer, created_at.
         """
-        mem_dir = _memory_dir(self._home)
+        index = meta_index(_memory_dir(self._home))
         max_ctx = self._config.max_context_memories
 
         # Short-term: newest first
-        short_term: list[dict[str, Any]] = []
-        st_dir = mem_dir / MemoryLayer.SHORT_TERM.value
-        if st_dir.exists():
-            files = sorted(st_dir.glob("*.json"), key=lambda p: p.stat().st_mtime, reverse=True)
-            for f in files[:max_ctx]:
-                entry = _load_entry(f)
-                if entry:
-                    short_term.append(self._entry_to_dict(entry))
+        newest = sorted(
+            index.entries(MemoryLayer.SHORT_TERM), key=lambda m: m.mtime_ns, reverse=True
+        )
+        short_term = self._load_selected(newest, max_ctx)
 
         # Mid/long-term: highest importance first
         established: list[dict[str, Any]] = []
         remaining = max(0, max_ctx - len(short_term))
         for layer in (MemoryLayer.MID_TERM, MemoryLayer.LONG_TERM):
-            layer_dir = mem_dir / layer.value
-            if not layer_dir.exists():
-                continue
-            entries = []
-            for f in layer_dir.glob("*.json"):
-                entry = _load_entry(f)
-                if entry:
-                    entries.append(entry)
-            # Sort by importance descending
-            entries.sort(key=lambda e: e.importance, reverse=True)
-            for entry in entries[:remaining]:
-                established.append(self._entry_to_dict(entry))
-                remaining -= 1
-                if remaining <= 0:
-                    break
+            if remaining <= 0:
+                break
+            ranked = sorted(index.entries(layer), key=lambda m: m.importance, reverse=True)
+            picked = self._load_selected(ranked, remaining)
+            established.extend(picked)
+            remaining -= len(picked)
 
         return short_term, established
 
+    def _load_selected(
+        self, candidates: list[MemoryMeta], limit: Optional[int] = None
+    ) -> list[dict[str, Any]]:
+        """Load full entries for *candidates*, in order, until *limit* have loaded.
+
+        A candidate whose file no longer loads is skipped and the next one
+        takes its place.
+        """
+        out: list[dict[str, Any]] = []
+        for meta in candidates:
+            if limit is not None and len(out) >= limit:
+                break
+            entry = _load_entry(meta.path)
+            if entry:
+                out.append(self._entry_to_dict(entry))
+        return out
+
     @staticmethod
     def _entry_to_dict(entry: Any) -> dict[str, Any]:
         return {
@@ -1953,7 +1962,9 @@ class DreamingEngine:
         return []
 
     def _record_dream(self, result: DreamResult) -> None:
-        """Append to dream-log.json (cap at 50 entries)."""
+        """Append to dream-log.json (cap at 50 entries) and the insight store."""
+        # Before the log write, so a first-use seed from the log cannot count it twice.
+        self._insight_store().append([(text, _extract_keywords(text)) for text in result.insights])
         log = self._load_dream_log()
 
         log.append(
@@ -4,9 +4,14 @@ Records every LLM fallback event to ~/.skcapstone/fallbacks.json so
 operators can diagnose which backends are failing and how often the
 agent is degrading to lower-quality providers.
 
+During an outage every attempt is a fallback, so record() must not
+rewrite the file: events are buffered and flushed in batches to the
+append-only fallbacks.journal.jsonl (see write_behind), which is
+periodically compacted into fallbacks.json.
+
 Architecture:
     FallbackEvent  - Pydantic model for a single fallback occurrence
-    FallbackTracker - thread-safe writer / reader for fallbacks.json
+    FallbackTracker - thread/process-safe writer / reader for fallbacks.json
 """
 
 from __future__ import annotations
@@ -21,6 +26,14 @@ from typing import Optional
 from pydantic import BaseModel, Field
 
 from . import AGENT_HOME
+from .atomic_io import atomic_write_text
+from .write_behind import (
+    DEFAULT_COMPACT_BYTES,
+    DEFAULT_FLUSH_EVERY,
+    DEFAULT_FLUSH_INTERVAL,
+    Journal,
+    WriteBehindLog,
+)
 
 logger = logging.getLogger("skcapstone.fallback_tracker")
 
@@ -50,27 +63,50 @@ class FallbackEvent(BaseModel):
     success: bool
 
 
+def _event_key(item: dict) -> tuple:
+    """Identity of a stored event; timestamps are microsecond-precise."""
+    return (
+        item.get("timestamp"),
+        item.get("primary_backend"),
+        item.get("fallback_backend"),
+        item.get("reason"),
+    )
+
+
 class FallbackTracker:
-    """Thread-safe store for fallback events.
+    """Thread- and process-safe store for fallback events.
 
-    Events are appended to a JSON file (list of objects). The file is
-    created on first write. Reads never raise - a missing or corrupt
-    file returns an empty list.
+    Events are buffered, journaled and compacted into a JSON file (list of
+    objects). The file is created on the first write. Reads never raise -
+    a missing or corrupt file returns an empty list.
 
     Args:
         path: Path to the fallbacks JSON file.
                Defaults to ``~/.skcapstone/fallbacks.json``.
         max_events: Maximum number of events retained (oldest are pruned).
+        flush_every: Buffered events that trigger a journal flush.
+        flush_interval: Max seconds an event stays buffered; 0 disables.
+        compact_bytes: Journal size that triggers folding into the file.
     """
 
     def __init__(
         self,
         path: Optional[Path] = None,
         max_events: int = _MAX_EVENTS,
+        flush_every: int = DEFAULT_FLUSH_EVERY,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        compact_bytes: int = DEFAULT_COMPACT_BYTES,
     ) -> None:
         self._path = Path(path) if path is not None else _DEFAULT_PATH
         self._max_events = max_events
-        self._lock = threading.Lock()
+        self._journal = WriteBehindLog(
+            self._path.with_name(self._path.stem + ".journal.jsonl"),
+            compact=self._compact,
+            materialized=lambda _record: self._path.exists(),
+            flush_every=flush_every,
+            flush_interval=flush_interval,
+            compact_bytes=compact_bytes,
+        )
 
     # ------------------------------------------------------------------
     # Public API
@@ -82,12 +118,7 @@ class FallbackTracker:
         Args:
             event: The fallback event to persist.
         """
-        with self._lock:
-            events = self._load_raw()
-            events.append(event.model_dump())
-            if len(events) > self._max_events:
-                events = events[-self._max_events :]
-            self._save_raw(events)
+        self._journal.append(event.model_dump())
         logger.debug(
             "Fallback recorded: %s → %s (%s, success=%s)",
             event.primary_backend,
@@ -96,6 +127,10 @@ class FallbackTracker:
             event.success,
         )
 
+    def flush(self) -> None:
+        """Write buffered events to the journal now (e.g. at shutdown)."""
+        self._journal.flush()
+
     def load_events(self, limit: int = 0) -> list[FallbackEvent]:
         """Return stored fallback events, newest first.
 
@@ -105,8 +140,7 @@ class FallbackTracker:
         Returns:
             List of :class:`FallbackEvent` objects.
         """
-        with self._lock:
-            raw = self._load_raw()
+        raw = self._current()
 
         events: list[FallbackEvent] = []
         for item in reversed(raw):
@@ -125,10 +159,8 @@ class FallbackTracker:
         Returns:
             Number of events that were cleared.
         """
-        with self._lock:
-            raw = self._load_raw()
-            count = len(raw)
-            self._save_raw([])
+        count = len(self._current())
+        self._journal.discard(lambda: self._save_raw([]))
         return count
 
     @property
@@ -140,6 +172,23 @@ class FallbackTracker:
     # Internal helpers
     # ------------------------------------------------------------------
 
+    def _current(self) -> list[dict]:
+        """Compacted events plus journaled and unflushed ones, capped."""
+        base, journal, unflushed = self._journal.view(self._load_raw)
+        return self._merge(base, [e.record for e in journal.entries] + unflushed)
+
+    def _merge(self, base: list[dict], records: list[dict]) -> list[dict]:
+        # A compaction that died after writing the file but before resetting
+        # the journal leaves those events in both; the key drops the copies.
+        seen = {_event_key(item) for item in base[-len(records) :]} if records else set()
+        merged = base + [r for r in records if _event_key(r) not in seen]
+        return merged[-self._max_events :]
+
+    def _compact(self, journal: Journal) -> None:
+        """Fold *journal* into fallbacks.json (journal lock held)."""
+        records = [e.record for e in journal.entries]
+        self._save_raw(self._merge(self._load_raw(), records))
+
     def _load_raw(self) -> list[dict]:
         """Load raw JSON list from disk without locking."""
         if not self._path.exists():
@@ -156,9 +205,9 @@ class FallbackTracker:
     def _save_raw(self, events: list[dict]) -> None:
         """Write raw JSON list to disk without locking."""
         self._path.parent.mkdir(parents=True, exist_ok=True)
-        self._path.write_text(
+        atomic_write_text(
+            self._path,
             json.dumps(events, indent=2, ensure_ascii=False),
-            encoding="utf-8",
         )
 
 
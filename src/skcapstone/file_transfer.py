@@ -6,18 +6,38 @@ using the agent's KMS-derived service key (Fernet AES-128-CBC).
 Transfers can be paused and resumed by tracking which chunks have
 been sent/received.
 
+Files are streamed, never loaded whole: the sender reads one chunk at a
+time and hashes the file incrementally, chunks are encrypted (or
+decrypted and verified) on a small worker pool with a bounded window of
+chunks in flight, and results are committed strictly in order. The
+manifest is rewritten every ``MANIFEST_FLUSH_CHUNKS`` chunks, so an
+interrupted send or receive picks up at the first unfinished chunk.
+
+``send(..., chunking="cdc")`` cuts chunks at content-defined boundaries
+instead of fixed offsets, so an edit early in a file only changes the
+chunks around it. Chunks the recipient already holds are listed in the
+manifest with ``stored=False`` and are not written to the outbox again;
+the receiver finds them in its per-sender chunk store. A recipient only
+counts as holding a chunk once it has acknowledged a completed transfer
+containing it (``acknowledge``, tracked in ``peers/<recipient>.json``).
+If a referenced chunk is gone anyway (the receiver's chunk store is kept
+under ``CHUNK_STORE_MAX_BYTES``, least recently used first), the receiver
+reports it through ``resume_receive`` and ``resend_chunks`` writes it
+into the transfer from the source file and forgets it for that peer.
+
 Architecture:
     Sender:
-        1. Split file into 256 KB chunks.
-        2. Encrypt each chunk with KMS service key.
-        3. Write chunk files to outbox directory.
-        4. Create a transfer manifest (JSON) with metadata.
+        1. Create a transfer manifest (JSON) listing every chunk as unsent.
+        2. Stream the file in 256 KB chunks, hashing as it goes.
+        3. Encrypt each chunk with KMS service key and write it to the
+           outbox directory.
+        4. Record the whole-file SHA-256 once the last chunk is written.
 
     Receiver:
         1. Read manifest to learn expected chunks.
         2. Decrypt and verify each chunk (HMAC in Fernet).
-        3. Reassemble in order.
-        4. Verify final SHA-256 of complete file.
+        3. Append in order to ``.<filename>.part``.
+        4. Verify final SHA-256 of complete file, then rename into place.
 
 Storage layout:
     ~/.skcapstone/file-transfer/
@@ -31,8 +51,12 @@ Storage layout:
     │   └── <transfer_id>/
     │       ├── manifest.json
     │       └── ...
-    └── completed/
-        └── <transfer_id>.json   # completion receipt
+    ├── completed/
+    │   └── <transfer_id>.json   # completion receipt
+    ├── peers/
+    │   └── <recipient>.json     # chunk hashes the recipient acknowledged (cdc mode)
+    └── chunk-store/
+        └── <sender>/<sha256>.enc   # chunks received, reused by reference
 
 Usage:
     ft = FileTransfer(home)
@@ -45,18 +69,107 @@ Usage:
 from __future__ import annotations
 
 import hashlib
+import json
 import logging
+import os
+import shutil
 import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Iterable, Optional
 
 from pydantic import BaseModel, Field
 
+from .atomic_io import atomic_write_text
+
 logger = logging.getLogger("skcapstone.file_transfer")
 
 CHUNK_SIZE = 256 * 1024  # 256 KB
 
+#: Threads encrypting/decrypting chunks. At most ``2 * workers`` chunks are
+#: in memory at once, whatever the file size.
+TRANSFER_WORKERS = min(8, os.cpu_count() or 1)
+
+#: Persist chunk progress to the manifest every this many chunks.
+MANIFEST_FLUSH_CHUNKS = 64
+
+CHUNKING_MODES = ("fixed", "cdc")
+
+#: Bound on the received-chunk store; least recently used chunks not needed
+#: by a transfer still in the inbox are pruned past it.
+CHUNK_STORE_MAX_BYTES = 256 * 1024 * 1024
+
+
+def _cdc_bits() -> tuple[bytes, bytes]:
+    """Byte->bit translation table and target bit pattern for CDC.
+
+    Both derive from SHA-256 so every sender on every platform cuts the
+    same content at the same places.
+    """
+    bits = bytes(b"01"[hashlib.sha256(bytes([i])).digest()[0] & 1] for i in range(256))
+    digest = hashlib.sha256(b"skcapstone-file-transfer-cdc").digest()
+    pattern = bytes(b"01"[(digest[i // 8] >> (i % 8)) & 1] for i in range(len(digest) * 8))
+    return bytes.maketrans(bytes(range(256)), bits), pattern
+
+
+_CDC_TABLE, _CDC_PATTERN = _cdc_bits()
+
+
+def _safe_name(name: str) -> str:
+    """Agent name usable as a single path component."""
+    return "".join(c if c.isalnum() or c in "-_." else "_" for c in name) or "_"
+
+
+def _touch(path: Path) -> None:
+    """Mark a stored chunk as recently used."""
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+
+def iter_cdc_chunks(f, avg_size: int = CHUNK_SIZE) -> Iterable[bytes]:
+    """Split a binary stream into content-defined chunks.
+
+    Every byte maps to one pseudo-random bit; a chunk ends where the bits
+    of the preceding ``log2(avg_size)`` bytes spell a fixed pattern. The
+    boundary therefore depends only on nearby content, and inserting or
+    deleting bytes moves the boundaries next to the edit and no others.
+    The translate-and-find runs in C, which keeps this within an order of
+    magnitude of a plain read. Chunks are between ``avg_size // 4`` and
+    ``avg_size * 4`` bytes (the last one may be shorter).
+
+    Args:
+        f: Binary file object, read sequentially.
+        avg_size: Target average chunk size.
+
+    Yields:
+        Chunk bytes, in file order.
+    """
+    bits = min(max(1, avg_size.bit_length() - 1), len(_CDC_PATTERN))
+    pattern = _CDC_PATTERN[:bits]
+    min_size = max(bits, avg_size // 4)
+    max_size = avg_size * 4
+    buf = bytearray()
+    eof = False
+    while True:
+        while not eof and len(buf) < max_size:
+            data = f.read(max_size - len(buf))
+            if not data:
+                eof = True
+            buf += data
+        if not buf:
+            return
+        cut = len(buf)
+        if len(buf) > min_size:
+            found = buf[min_size - bits : max_size].translate(_CDC_TABLE).find(pattern)
+            if found >= 0:
+                cut = min_size + found
+        yield bytes(buf[:cut])
+        del buf[:cut]
+
 
 # ---------------------------------------------------------------------------
 # Models
@@ -72,6 +185,9 @@ class ChunkInfo(BaseModel):
     encrypted: bool = True
     sent: bool = False
     received: bool = False
+    # False when the chunk was not written to this transfer's directory
+    # because the recipient already has it (cdc mode).
+    stored: bool = True
 
 
 class TransferManifest(BaseModel):
@@ -82,6 +198,7 @@ class TransferManifest(BaseModel):
     file_size: int
     file_sha256: str
     chunk_size: int = CHUNK_SIZE
+    chunking: str = "fixed"
     total_chunks: int
     sender: str = ""
     recipient: str = ""
@@ -134,6 +251,9 @@ class FileTransfer:
         home: Agent home directory (~/.skcapstone).
         agent_name: Name of the local agent.
         chunk_size: Override chunk size (default 256 KB).
+        workers: Encrypt/decrypt threads (default ``TRANSFER_WORKERS``).
+        chunk_store_max_bytes: Bound on the received-chunk store
+            (default ``CHUNK_STORE_MAX_BYTES``).
     """
 
     def __init__(
@@ -141,14 +261,20 @@ class FileTransfer:
         home: Path,
         agent_name: str = "anonymous",
         chunk_size: int = CHUNK_SIZE,
+        workers: Optional[int] = None,
+        chunk_store_max_bytes: int = CHUNK_STORE_MAX_BYTES,
     ) -> None:
         self._home = home
         self._agent = agent_name
         self._chunk_size = chunk_size
+        self._workers = max(1, workers or TRANSFER_WORKERS)
+        self._chunk_store_max = chunk_store_max_bytes
         self._base_dir = home / "file-transfer"
         self._outbox = self._base_dir / "outbox"
         self._inbox = self._base_dir / "inbox"
         self._completed = self._base_dir / "completed"
+        self._peers = self._base_dir / "peers"
+        self._chunk_store = self._base_dir / "chunk-store"
 
     def initialize(self) -> None:
         """Create the file transfer directory structure."""
@@ -161,85 +287,166 @@ class FileTransfer:
         file_path: Path,
         recipient: str,
         encrypt: bool = True,
+        transfer_id: Optional[str] = None,
+        chunking: str = "fixed",
     ) -> TransferManifest:
         """Prepare a file for transfer by chunking and encrypting.
 
+        The file is streamed chunk by chunk; memory use does not grow with
+        file size. Passing the ``transfer_id`` of an interrupted send
+        resumes it at the first unsent chunk.
+
         Args:
             file_path: Path to the file to send.
             recipient: Recipient agent name.
             encrypt: Whether to encrypt chunks (default True).
+            transfer_id: Resume this existing outbox transfer.
+            chunking: ``"fixed"`` (``chunk_size`` slices) or ``"cdc"``
+                (content-defined boundaries averaging ``chunk_size``, with
+                chunks the recipient acknowledged sent by reference only).
 
         Returns:
             TransferManifest with all chunk metadata.
 
         Raises:
-            FileNotFoundError: If the file doesn't exist.
-            ValueError: If the file is empty.
+            FileNotFoundError: If the file (or the transfer to resume)
+                doesn't exist.
+            ValueError: If the file is empty, or changed since the
+                transfer being resumed started, or chunking is unknown.
         """
+        if chunking not in CHUNKING_MODES:
+            raise ValueError(
+                f"Unknown chunking mode {chunking!r}; expected one of {CHUNKING_MODES}"
+            )
         self.initialize()
 
         file_path = Path(file_path)
         if not file_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
 
-        file_data = file_path.read_bytes()
-        if not file_data:
+        file_size = file_path.stat().st_size
+        if not file_size:
             raise ValueError("Cannot transfer empty file")
 
-        file_hash = hashlib.sha256(file_data).hexdigest()
-        total_chunks = (len(file_data) + self._chunk_size - 1) // self._chunk_size
-
-        manifest = TransferManifest(
-            filename=file_path.name,
-            file_size=len(file_data),
-            file_sha256=file_hash,
-            chunk_size=self._chunk_size,
-            total_chunks=total_chunks,
-            sender=self._agent,
-            recipient=recipient,
-        )
-
-        transfer_dir = self._outbox / manifest.transfer_id
-        transfer_dir.mkdir(parents=True, exist_ok=True)
+        if transfer_id is not None:
+            transfer_dir = self._outbox / transfer_id
+            manifest = self._read_manifest(transfer_dir)
+            if manifest is None:
+                raise FileNotFoundError(f"Transfer {transfer_id} not found")
+            if manifest.file_size != file_size:
+                raise ValueError(f"{file_path.name} changed since transfer {transfer_id} began")
+            sent = [c for c in manifest.chunks if c.sent]
+            if sent:
+                encrypt = sent[0].encrypted
+            chunking = manifest.chunking
+        elif chunking == "cdc":
+            # Boundaries are unknown until the data is read; chunks are
+            # appended to the manifest as they are committed.
+            manifest = TransferManifest(
+                filename=file_path.name,
+                file_size=file_size,
+                file_sha256="",
+                chunk_size=self._chunk_size,
+                chunking="cdc",
+                total_chunks=0,
+                sender=self._agent,
+                recipient=recipient,
+            )
+        else:
+            total_chunks = (file_size + self._chunk_size - 1) // self._chunk_size
+            manifest = TransferManifest(
+                filename=file_path.name,
+                file_size=file_size,
+                file_sha256="",  # filled in once the last chunk is written
+                chunk_size=self._chunk_size,
+                total_chunks=total_chunks,
+                sender=self._agent,
+                recipient=recipient,
+                chunks=[
+                    ChunkInfo(
+                        index=i,
+                        size=min(self._chunk_size, file_size - i * self._chunk_size),
+                        sha256="",
+                    )
+                    for i in range(total_chunks)
+                ],
+            )
+        if transfer_id is None:
+            transfer_dir = self._outbox / manifest.transfer_id
+            transfer_dir.mkdir(parents=True, exist_ok=True)
+            atomic_write_text(transfer_dir / "manifest.json", manifest.model_dump_json(indent=2))
 
+        manifest_path = transfer_dir / "manifest.json"
         enc_key = self._get_encryption_key() if encrypt else None
-
-        for i in range(total_chunks):
-            start = i * self._chunk_size
-            end = min(start + self._chunk_size, len(file_data))
-            chunk_data = file_data[start:end]
-            chunk_hash = hashlib.sha256(chunk_data).hexdigest()
-
-            if encrypt and enc_key is not None:
-                chunk_data = self._encrypt_chunk(chunk_data, enc_key)
-
-            chunk_file = transfer_dir / f"chunk-{i:04d}.enc"
-            chunk_file.write_bytes(chunk_data)
-
-            manifest.chunks.append(
-                ChunkInfo(
-                    index=i,
-                    size=end - start,
-                    sha256=chunk_hash,
-                    encrypted=encrypt and enc_key is not None,
-                    sent=True,
-                )
+        encrypted = encrypt and enc_key is not None
+        chunk_size = manifest.chunk_size
+        cdc = chunking == "cdc"
+        resume_at = next((c.index for c in manifest.chunks if not c.sent), len(manifest.chunks))
+        file_hash = hashlib.sha256()
+        known = self._peer_chunks(manifest.recipient) if cdc else set()
+        known.update(c.sha256 for c in manifest.chunks[:resume_at] if c.stored)
+
+        def prepare(index: int, item: tuple[bytes, Optional[str], bool]) -> tuple[str, int, bool]:
+            data, chunk_hash, store = item
+            size = len(data)
+            if chunk_hash is None:
+                chunk_hash = hashlib.sha256(data).hexdigest()
+            if store:
+                if encrypted:
+                    data = self._encrypt_chunk(data, enc_key)
+                (transfer_dir / f"chunk-{index:04d}.enc").write_bytes(data)
+            return chunk_hash, size, store
+
+        def commit(index: int, result: tuple[str, int, bool]) -> None:
+            chunk_hash, size, store = result
+            if index == len(manifest.chunks):
+                manifest.chunks.append(ChunkInfo(index=index, size=size, sha256=""))
+                manifest.total_chunks = len(manifest.chunks)
+            chunk = manifest.chunks[index]
+            chunk.sha256 = chunk_hash
+            chunk.encrypted = encrypted
+            chunk.stored = store
+            chunk.sent = True
+
+        with open(file_path, "rb") as f:
+            for chunk in manifest.chunks[:resume_at]:
+                data = f.read(chunk.size)
+                if hashlib.sha256(data).hexdigest() != chunk.sha256:
+                    raise ValueError(
+                        f"{file_path.name} changed since transfer {manifest.transfer_id} began"
+                    )
+                file_hash.update(data)
+
+            def fixed_chunks() -> Iterable[tuple[int, tuple]]:
+                for index in range(resume_at, manifest.total_chunks):
+                    data = f.read(chunk_size)
+                    file_hash.update(data)
+                    yield index, (data, None, True)
+
+            def cdc_chunks() -> Iterable[tuple[int, tuple]]:
+                for index, data in enumerate(iter_cdc_chunks(f, chunk_size), start=resume_at):
+                    file_hash.update(data)
+                    chunk_hash = hashlib.sha256(data).hexdigest()
+                    store = chunk_hash not in known
+                    known.add(chunk_hash)
+                    yield index, (data, chunk_hash, store)
+
+            self._pipeline(
+                cdc_chunks() if cdc else fixed_chunks(), prepare, commit, manifest, manifest_path
             )
 
-        # Write manifest
-        manifest_path = transfer_dir / "manifest.json"
-        manifest_path.write_text(
-            manifest.model_dump_json(indent=2),
-            encoding="utf-8",
-        )
+        manifest.file_sha256 = file_hash.hexdigest()
+        atomic_write_text(manifest_path, manifest.model_dump_json(indent=2))
 
         logger.info(
-            "Prepared transfer %s: %s (%d chunks, %d bytes) -> %s",
+            "Prepared transfer %s: %s (%d chunks, %d bytes, %d written%s) -> %s",
             manifest.transfer_id,
             manifest.filename,
-            total_chunks,
+            manifest.total_chunks,
             manifest.file_size,
-            recipient,
+            sum(c.size for c in manifest.chunks if c.stored),
+            f", resumed at chunk {resume_at}" if resume_at else "",
+            manifest.recipient,
         )
 
         return manifest
@@ -252,7 +459,8 @@ class FileTransfer:
         """Receive and reassemble a file transfer.
 
         Reads chunks from inbox, decrypts them, verifies integrity,
-        and reassembles the original file.
+        and streams them in order into the output file. An interrupted
+        receive continues from the chunks it already wrote.
 
         Args:
             transfer_id: The transfer ID to receive.
@@ -278,20 +486,34 @@ class FileTransfer:
             raise FileNotFoundError(f"Manifest not found for {transfer_id}")
 
         manifest = TransferManifest.model_validate_json(manifest_path.read_text(encoding="utf-8"))
+        if not manifest.file_sha256:
+            raise ValueError(f"Transfer {transfer_id} is incomplete: sender has not finished")
 
+        dest_dir = output_dir or transfer_dir
+        dest_dir.mkdir(parents=True, exist_ok=True)
+        output_path = dest_dir / manifest.filename
+        part_path = dest_dir / f".{manifest.filename}.part"
+
+        ordered = sorted(manifest.chunks, key=lambda c: c.index)
+        stored = {c.sha256: c for c in ordered if c.stored}
         enc_key = self._get_encryption_key()
-        assembled = bytearray()
+        file_hash = hashlib.sha256()
+
+        done = self._resumable_prefix(ordered, part_path)
+        if not done:
+            for c in ordered:
+                c.received = False
 
-        for chunk_info in sorted(manifest.chunks, key=lambda c: c.index):
-            chunk_file = transfer_dir / f"chunk-{chunk_info.index:04d}.enc"
-            if not chunk_file.exists():
+        def load(index: int, _: None) -> bytes:
+            chunk_info = ordered[index]
+            source = self._locate_chunk(manifest, chunk_info, stored, transfer_dir)
+            if source is None:
                 raise FileNotFoundError(
                     f"Missing chunk {chunk_info.index} for transfer {transfer_id}"
                 )
-
+            chunk_file, encrypted = source
             chunk_data = chunk_file.read_bytes()
-
-            if chunk_info.encrypted and enc_key is not None:
+            if encrypted and enc_key is not None:
                 chunk_data = self._decrypt_chunk(chunk_data, enc_key)
 
             # Verify chunk integrity
@@ -301,23 +523,41 @@ class FileTransfer:
                     f"Chunk {chunk_info.index} integrity check failed: "
                     f"expected {chunk_info.sha256[:16]}..., got {actual_hash[:16]}..."
                 )
+            if manifest.chunking == "cdc":
+                if chunk_info.stored:
+                    self._keep_chunk(manifest.sender, chunk_info, chunk_file)
+                else:
+                    _touch(chunk_file)  # recently used: pruned last
+            return chunk_data
+
+        with open(part_path, "r+b" if done else "wb") as out:
+            if done:
+                self._hash_prefix(out, sum(c.size for c in ordered[:done]), file_hash)
+                out.truncate()
 
-            chunk_info.received = True
-            assembled.extend(chunk_data)
+            def commit(index: int, chunk_data: bytes) -> None:
+                out.write(chunk_data)
+                file_hash.update(chunk_data)
+                ordered[index].received = True
+
+            def before_flush() -> None:
+                out.flush()
+
+            work = ((i, None) for i in range(done, len(ordered)))
+            self._pipeline(work, load, commit, manifest, manifest_path, before_flush)
 
         # Verify complete file integrity
-        file_hash = hashlib.sha256(assembled).hexdigest()
-        if file_hash != manifest.file_sha256:
+        if file_hash.hexdigest() != manifest.file_sha256:
+            part_path.unlink(missing_ok=True)
+            for c in manifest.chunks:
+                c.received = False
+            atomic_write_text(manifest_path, manifest.model_dump_json(indent=2))
             raise ValueError(
                 f"File integrity check failed: "
-                f"expected {manifest.file_sha256[:16]}..., got {file_hash[:16]}..."
+                f"expected {manifest.file_sha256[:16]}..., got {file_hash.hexdigest()[:16]}..."
             )
 
-        # Write assembled file
-        dest_dir = output_dir or transfer_dir
-        dest_dir.mkdir(parents=True, exist_ok=True)
-        output_path = dest_dir / manifest.filename
-        output_path.write_bytes(assembled)
+        os.replace(part_path, output_path)
 
         # Record completion
         manifest.completed_at = datetime.now(timezone.utc)
@@ -325,14 +565,17 @@ class FileTransfer:
         receipt.write_text(manifest.model_dump_json(indent=2), encoding="utf-8")
 
         # Update manifest
-        manifest_path.write_text(manifest.model_dump_json(indent=2), encoding="utf-8")
+        atomic_write_text(manifest_path, manifest.model_dump_json(indent=2))
+        if manifest.chunking == "cdc":
+            self.prune_chunk_store()
 
         logger.info(
-            "Received transfer %s: %s (%d bytes, %d chunks)",
+            "Received transfer %s: %s (%d bytes, %d chunks%s)",
             transfer_id,
             manifest.filename,
             manifest.file_size,
             manifest.total_chunks,
+            f", resumed at chunk {done}" if done else "",
         )
 
         return output_path
@@ -399,6 +642,10 @@ class FileTransfer:
     def resume_receive(self, transfer_id: str) -> list[int]:
         """Find missing chunks for a transfer.
 
+        A chunk sent by reference (``stored=False``) counts as missing
+        when neither this transfer nor the chunk store for its sender
+        holds a copy.
+
         Args:
             transfer_id: The transfer ID.
 
@@ -413,12 +660,147 @@ class FileTransfer:
         if not transfer_dir.is_dir():
             transfer_dir = self._outbox / transfer_id
 
-        missing = []
-        for c in manifest.chunks:
-            chunk_file = transfer_dir / f"chunk-{c.index:04d}.enc"
-            if not chunk_file.exists():
-                missing.append(c.index)
-        return missing
+        stored = {c.sha256: c for c in manifest.chunks if c.stored}
+        return [
+            c.index
+            for c in manifest.chunks
+            if self._locate_chunk(manifest, c, stored, transfer_dir) is None
+        ]
+
+    def acknowledge(self, transfer_id: str) -> bool:
+        """Record that the recipient completed an outbox transfer.
+
+        Its chunks are then sent by reference in later cdc transfers to
+        the same recipient. Call this when the recipient's completion
+        receipt arrives; chunks of a transfer that was never acknowledged
+        are always written out again.
+
+        Args:
+            transfer_id: The completed outbox transfer.
+
+        Returns:
+            True if recorded, False if the transfer is unknown, unfinished
+            or not a cdc transfer.
+        """
+        manifest = self._read_manifest(self._outbox / transfer_id)
+        if manifest is None or manifest.chunking != "cdc" or not manifest.file_sha256:
+            return False
+        known = self._peer_chunks(manifest.recipient)
+        known.update(c.sha256 for c in manifest.chunks)
+        self._save_peer_chunks(manifest.recipient, known)
+        return True
+
+    def resend_chunks(self, transfer_id: str, file_path: Path, indices: Iterable[int]) -> int:
+        """Write chunks the recipient reported missing into an outbox transfer.
+
+        For chunks sent by reference that the recipient no longer holds
+        (``resume_receive`` on its side): each is read again from
+        *file_path*, written to the transfer like any other chunk, and
+        forgotten for that recipient so later sends do not reference it.
+
+        Args:
+            transfer_id: The outbox transfer.
+            file_path: The file that was sent.
+            indices: Chunk indices reported missing.
+
+        Returns:
+            Number of chunks written.
+
+        Raises:
+            FileNotFoundError: If the transfer doesn't exist.
+            ValueError: If the file changed since it was sent.
+        """
+        transfer_dir = self._outbox / transfer_id
+        manifest_path = transfer_dir / "manifest.json"
+        manifest = self._read_manifest(transfer_dir)
+        if manifest is None:
+            raise FileNotFoundError(f"Transfer {transfer_id} not found")
+        wanted = set(indices)
+        missing = [c for c in manifest.chunks if c.index in wanted and not c.stored]
+        if not missing:
+            return 0
+        enc_key = self._get_encryption_key() if any(c.encrypted for c in missing) else None
+
+        offsets: dict[int, int] = {}
+        offset = 0
+        for c in sorted(manifest.chunks, key=lambda c: c.index):
+            offsets[c.index] = offset
+            offset += c.size
+        with open(file_path, "rb") as f:
+            for chunk in missing:
+                f.seek(offsets[chunk.index])
+                data = f.read(chunk.size)
+                if hashlib.sha256(data).hexdigest() != chunk.sha256:
+                    raise ValueError(
+                        f"{Path(file_path).name} changed since transfer {transfer_id}"
+                    )
+                chunk.encrypted = chunk.encrypted and enc_key is not None
+                if chunk.encrypted:
+                    data = self._encrypt_chunk(data, enc_key)
+                (transfer_dir / f"chunk-{chunk.index:04d}.enc").write_bytes(data)
+                chunk.stored = True
+        atomic_write_text(manifest_path, manifest.model_dump_json(indent=2))
+
+        known = self._peer_chunks(manifest.recipient)
+        known.difference_update(c.sha256 for c in missing)
+        self._save_peer_chunks(manifest.recipient, known)
+        logger.info(
+            "Re-sent %d referenced chunk(s) of transfer %s to %s",
+            len(missing),
+            transfer_id,
+            manifest.recipient,
+        )
+        return len(missing)
+
+    def prune_chunk_store(self) -> int:
+        """Keep the received-chunk store under its size bound.
+
+        Chunks needed by a transfer still in the inbox are kept; of the
+        rest, the least recently used go first. A sender referencing a
+        pruned chunk later has it reported missing and re-sends it.
+
+        Returns:
+            Bytes freed.
+        """
+        files: list[tuple[float, int, Path]] = []
+        total = 0
+        try:
+            with os.scandir(self._chunk_store) as it:
+                senders = [d for d in it if d.is_dir()]
+        except OSError:
+            return 0
+        for sender in senders:
+            try:
+                with os.scandir(sender.path) as it:
+                    for entry in it:
+                        st = entry.stat()
+                        files.append((st.st_mtime, st.st_size, Path(entry.path)))
+                        total += st.st_size
+            except OSError:
+                continue
+        if total <= self._chunk_store_max:
+            return 0
+
+        live: set[str] = set()
+        for d in self._inbox.iterdir() if self._inbox.is_dir() else []:
+            manifest = self._read_manifest(d) if d.is_dir() else None
+            if manifest is not None and manifest.completed_at is None:
+                live.update(c.sha256 for c in manifest.chunks)
+
+        freed = 0
+        for _, size, path in sorted(files):
+            if total - freed <= self._chunk_store_max:
+                break
+            if path.name.rsplit(".", 1)[0] in live:
+                continue
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            freed += size
+        if freed:
+            logger.info("Pruned %d bytes from the file-transfer chunk store", freed)
+        return freed
 
     def cleanup(self, transfer_id: str) -> bool:
         """Remove all files for a completed transfer.
@@ -433,8 +815,6 @@ class FileTransfer:
         for base in (self._outbox, self._inbox):
             transfer_dir = base / transfer_id
             if transfer_dir.is_dir():
-                import shutil
-
                 shutil.rmtree(transfer_dir)
                 cleaned = True
         return cleaned
@@ -487,6 +867,153 @@ class FileTransfer:
 
         return _fernet_decrypt(data, key)
 
+    def _pipeline(
+        self,
+        items: Iterable[tuple[int, Any]],
+        work: Callable[[int, Any], Any],
+        commit: Callable[[int, Any], None],
+        manifest: TransferManifest,
+        manifest_path: Path,
+        before_flush: Optional[Callable[[], None]] = None,
+    ) -> None:
+        """Run *work* on a worker pool and *commit* the results in order.
+
+        At most ``2 * workers`` items are in flight. The manifest is
+        persisted every ``MANIFEST_FLUSH_CHUNKS`` commits and once more if
+        anything fails, so the committed prefix survives an interruption.
+
+        Args:
+            items: ``(index, payload)`` pairs, in order. Consumed lazily.
+            work: Called on a worker thread with each pair.
+            commit: Called on this thread with ``(index, work result)``.
+            manifest: Manifest whose chunk flags ``commit`` updates.
+            manifest_path: Where to persist it.
+            before_flush: Called before each manifest write (e.g. to flush
+                the data the manifest is about to vouch for).
+        """
+        workers = self._workers
+        committed = 0
+
+        def flush() -> None:
+            if before_flush is not None:
+                before_flush()
+            atomic_write_text(manifest_path, manifest.model_dump_json(indent=2))
+
+        pending: deque = deque()
+        try:
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="file-transfer"
+            ) as pool:
+                for index, payload in items:
+                    pending.append((index, pool.submit(work, index, payload)))
+                    while len(pending) > 2 * workers:
+                        index_done, future = pending.popleft()
+                        commit(index_done, future.result())
+                        committed += 1
+                        if committed % MANIFEST_FLUSH_CHUNKS == 0:
+                            flush()
+                while pending:
+                    index_done, future = pending.popleft()
+                    commit(index_done, future.result())
+                    committed += 1
+                    if committed % MANIFEST_FLUSH_CHUNKS == 0:
+                        flush()
+        except BaseException:
+            for _, future in pending:
+                future.cancel()
+            if committed:
+                flush()
+            raise
+        flush()
+
+    @staticmethod
+    def _resumable_prefix(ordered: list[ChunkInfo], part_path: Path) -> int:
+        """How many leading chunks an existing ``.part`` file already holds."""
+        if not part_path.exists():
+            return 0
+        done = 0
+        for c in ordered:
+            if not c.received:
+                break
+            done += 1
+        if part_path.stat().st_size < sum(c.size for c in ordered[:done]):
+            return 0
+        return done
+
+    @staticmethod
+    def _hash_prefix(f, length: int, digest) -> None:
+        """Feed the first *length* bytes of *f* into *digest*; leave f there."""
+        remaining = length
+        while remaining:
+            data = f.read(min(remaining, CHUNK_SIZE * 4))
+            if not data:
+                break
+            digest.update(data)
+            remaining -= len(data)
+
+    def _locate_chunk(
+        self,
+        manifest: TransferManifest,
+        chunk: ChunkInfo,
+        stored: dict[str, ChunkInfo],
+        transfer_dir: Path,
+    ) -> Optional[tuple[Path, bool]]:
+        """Find the bytes for *chunk*.
+
+        Args:
+            manifest: The transfer the chunk belongs to.
+            chunk: The chunk to find.
+            stored: Chunks written to this transfer's directory, by hash.
+            transfer_dir: The transfer's directory.
+
+        Returns:
+            (file, whether it is encrypted), or None if nowhere to be found.
+        """
+        if chunk.stored:
+            path = transfer_dir / f"chunk-{chunk.index:04d}.enc"
+            return (path, chunk.encrypted) if path.exists() else None
+        sibling = stored.get(chunk.sha256)
+        if sibling is not None:
+            path = transfer_dir / f"chunk-{sibling.index:04d}.enc"
+            if path.exists():
+                return path, sibling.encrypted
+        store = self._chunk_store / _safe_name(manifest.sender)
+        for suffix, encrypted in ((".enc", True), (".raw", False)):
+            path = store / f"{chunk.sha256}{suffix}"
+            if path.exists():
+                return path, encrypted
+        return None
+
+    def _keep_chunk(self, sender: str, chunk: ChunkInfo, chunk_file: Path) -> None:
+        """Add a verified chunk to the per-sender store for later references."""
+        store = self._chunk_store / _safe_name(sender)
+        dest = store / f"{chunk.sha256}{'.enc' if chunk.encrypted else '.raw'}"
+        if dest.exists():
+            _touch(dest)
+            return
+        store.mkdir(parents=True, exist_ok=True)
+        try:
+            os.link(chunk_file, dest)
+        except FileExistsError:
+            pass
+        except OSError:
+            shutil.copyfile(chunk_file, dest)
+
+    def _peer_chunks(self, recipient: str) -> set[str]:
+        """Chunk hashes *recipient* acknowledged holding (cdc mode)."""
+        path = self._peers / f"{_safe_name(recipient)}.json"
+        try:
+            return set(json.loads(path.read_text(encoding="utf-8")).get("chunks", []))
+        except (OSError, ValueError, AttributeError):
+            return set()
+
+    def _save_peer_chunks(self, recipient: str, hashes: set[str]) -> None:
+        self._peers.mkdir(parents=True, exist_ok=True)
+        atomic_write_text(
+            self._peers / f"{_safe_name(recipient)}.json",
+            json.dumps({"chunks": sorted(hashes)}),
+        )
+
     def _read_manifest(self, transfer_dir: Path) -> Optional[TransferManifest]:
         """Read a manifest from a transfer directory."""
         manifest_path = transfer_dir / "manifest.json"
@@ -0,0 +1,399 @@
+"""
+Change tokens for watched files and directories.
+
+Several read paths (daemon dashboards, household listings, peer
+discovery) re-read and re-parse the same files on every request just in
+case something changed. ``PathWatcher`` answers the cheaper question
+"has anything under this path changed since I last looked?" by handing
+out an opaque, comparable *token* per path:
+
+    * With ``watchdog`` installed (same optional dependency the
+      consciousness loop and SyncWatcher use), each watched directory gets
+      an inotify watch that bumps a counter on every event, so a token is
+      a dict lookup plus one ``stat`` of the directory. A directory that
+      was deleted (and maybe recreated) has lost its watch with its inode;
+      the stat notices, and the watch is re-armed on the new inode.
+    * Without it, or for a directory that does not exist yet, the token is
+      a stat signature: the directory's own ``mtime_ns`` for listing-only
+      watches, plus ``(name, mtime_ns, size)`` of every child for content
+      watches (recursively when asked).
+
+File tokens are always a single ``stat`` -- cheaper than any watch.
+
+Callers that want pushes instead of polling can ``subscribe()`` a
+callback to a directory; it is invoked with the changed path from the
+watchdog thread (and never in stat-fallback mode).
+
+``Inotify`` is the synchronous alternative for callers that must not
+miss their own or a sibling process's last write: it talks to inotify(7)
+directly through ctypes (Linux only, no watchdog needed) and the caller
+drains events with ``read_events()``. The kernel queues an event inside
+the writing syscall, so every change completed before the drain is in it.
+
+``stable_signature()`` is the shared rule for stat-signature caches: a
+file's ``(mtime_ns, size)`` only proves it unchanged once its mtime is
+outside ``RACY_WINDOW_NS``.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import errno
+import logging
+import os
+import stat
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Hashable, Optional
+
+logger = logging.getLogger("skcapstone.file_watch")
+
+Callback = Callable[[Path], None]
+
+
+def file_token(path: Path) -> Hashable:
+    """Token for one file: ``(ino, mtime_ns, size)`` or None if missing."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+#: A file modified this recently may be rewritten again within the same
+#: mtime tick at the same size, so its stat signature is not yet trusted.
+RACY_WINDOW_NS = 2_000_000_000
+
+
+def is_racy(mtime_ns: int, now_ns: Optional[int] = None) -> bool:
+    """Whether *mtime_ns* is still inside the racy window of *now_ns* (default: now)."""
+    return (time.time_ns() if now_ns is None else now_ns) - mtime_ns < RACY_WINDOW_NS
+
+
+def stable_signature(
+    st: os.stat_result, now_ns: Optional[int] = None
+) -> Optional[tuple[int, int]]:
+    """``(mtime_ns, size)`` of *st*, or None while its mtime is racy."""
+    if is_racy(st.st_mtime_ns, now_ns):
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _scan_token(path: Path, contents: bool, recursive: bool) -> Hashable:
+    try:
+        root = os.stat(path)
+    except OSError:
+        return None
+    if not contents:
+        return root.st_mtime_ns
+    entries: list[tuple] = []
+    stack = [str(path)]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    try:
+                        st = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    entries.append((entry.path, st.st_mtime_ns, st.st_size))
+                    if recursive and entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+        except OSError:
+            continue
+    entries.sort()
+    return (root.st_mtime_ns, hash(tuple(entries)))
+
+
+class _Handler:
+    """Watchdog event sink for one watched directory."""
+
+    def __init__(self, watcher: "PathWatcher", root: Path) -> None:
+        self._watcher = watcher
+        self._root = root
+
+    def dispatch(self, event) -> None:
+        src = Path(getattr(event, "src_path", self._root))
+        self._watcher._bump(self._root, src)
+        dest = getattr(event, "dest_path", None)
+        if dest:
+            self._watcher._bump(self._root, Path(dest))
+
+
+class PathWatcher:
+    """Hands out change tokens for directories, inotify-backed when possible.
+
+    Args:
+        use_inotify: Try watchdog; False forces the stat fallback.
+    """
+
+    def __init__(self, use_inotify: bool = True) -> None:
+        self._lock = threading.Lock()
+        self._observer = None
+        self._counters: dict[tuple[Path, bool], int] = {}
+        # (path, recursive) -> (st_dev, st_ino, watchdog watch) of the live watch
+        self._watches: dict[tuple[Path, bool], tuple[int, int, Any]] = {}
+        self._subscribers: dict[Path, list[Callback]] = {}
+        if use_inotify:
+            try:
+                from watchdog.observers import Observer
+
+                self._observer = Observer()
+                self._observer.daemon = True
+                self._observer.start()
+            except ImportError:
+                logger.debug("watchdog not installed - change tokens use stat scans")
+            except Exception as exc:  # inotify watch limits, etc.
+                logger.warning("inotify unavailable, using stat scans: %s", exc)
+                self._observer = None
+
+    @property
+    def inotify(self) -> bool:
+        """True when change tokens are inotify-driven."""
+        return self._observer is not None
+
+    def token(self, path: Path, *, contents: bool = True, recursive: bool = False) -> Hashable:
+        """Return a token that changes whenever *path* changes.
+
+        Args:
+            path: Directory to watch.
+            contents: Also track edits to existing children, not just
+                additions, removals and renames.
+            recursive: Track the whole subtree.
+        """
+        path = Path(path)
+        key = (path, recursive)
+        if self._observer is not None:
+            try:
+                st = os.stat(path)
+            except OSError:
+                st = None
+            with self._lock:
+                armed = self._watches.get(key)
+                if armed is not None and st is not None and armed[:2] == (st.st_dev, st.st_ino):
+                    return ("inotify", self._counters[key])
+            if armed is not None:
+                self._disarm(key)
+            if st is not None and self._schedule(path, recursive):
+                with self._lock:
+                    return ("inotify", self._counters[key])
+        return _scan_token(path, contents, recursive)
+
+    def subscribe(self, path: Path, callback: Callback, *, recursive: bool = False) -> bool:
+        """Call *callback(changed_path)* for every change under *path*.
+
+        Returns:
+            False when inotify is unavailable (callers must poll tokens).
+        """
+        path = Path(path)
+        if self._observer is None or not self._schedule(path, recursive):
+            return False
+        with self._lock:
+            self._subscribers.setdefault(path, []).append(callback)
+        return True
+
+    def stop(self) -> None:
+        """Stop the observer thread, if any."""
+        if self._observer is not None:
+            try:
+                self._observer.stop()
+                self._observer.join(timeout=5)
+            except Exception as exc:
+                logger.warning("Error stopping path watcher: %s", exc)
+            self._observer = None
+
+    def _schedule(self, path: Path, recursive: bool) -> bool:
+        key = (path, recursive)
+        with self._lock:
+            if key in self._watches:
+                return True
+            try:
+                st = os.stat(path)
+            except OSError:
+                return False
+            if not stat.S_ISDIR(st.st_mode):
+                return False
+            try:
+                watch = self._observer.schedule(
+                    _Handler(self, path), str(path), recursive=recursive
+                )
+            except Exception as exc:
+                logger.warning("Cannot watch %s, using stat scans: %s", path, exc)
+                return False
+            self._watches[key] = (st.st_dev, st.st_ino, watch)
+            # A re-armed watch starts past every token the old one handed out.
+            self._counters[key] = self._counters.get(key, -1) + 1
+            return True
+
+    def _disarm(self, key: tuple[Path, bool]) -> None:
+        """Drop the watch on a directory whose inode is gone."""
+        with self._lock:
+            armed = self._watches.pop(key, None)
+        if armed is None:
+            return
+        try:
+            self._observer.unschedule(armed[2])
+        except Exception as exc:  # watchdog may already have dropped it
+            logger.debug("Unscheduling dead watch on %s: %s", key[0], exc)
+
+    def _bump(self, root: Path, changed: Path) -> None:
+        with self._lock:
+            for key in self._counters:
+                if key[0] == root:
+                    self._counters[key] += 1
+            callbacks = list(self._subscribers.get(root, ()))
+        for cb in callbacks:
+            try:
+                cb(changed)
+            except Exception:
+                logger.exception("Path watch callback failed for %s", changed)
+
+
+# ---------------------------------------------------------------------------
+# Synchronous inotify
+# ---------------------------------------------------------------------------
+
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+
+#: Everything that can change what a directory listing or a file holds.
+IN_CHANGES = (
+    IN_MODIFY
+    | IN_ATTRIB
+    | IN_CLOSE_WRITE
+    | IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE
+    | IN_DELETE_SELF
+    | IN_MOVE_SELF
+)
+
+_IN_NONBLOCK = os.O_NONBLOCK
+_IN_CLOEXEC = os.O_CLOEXEC
+_EVENT = struct.Struct("iIII")
+
+
+class Inotify:
+    """Non-recursive inotify watches on directories, drained by the caller.
+
+    Raises:
+        OSError: inotify is unavailable (not Linux, no libc symbol, or the
+            per-user instance limit is reached).
+    """
+
+    def __init__(self) -> None:
+        if not sys.platform.startswith("linux"):
+            raise OSError(errno.ENOSYS, "inotify is Linux-only")
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._add = libc.inotify_add_watch
+        self._add.argtypes = (ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32)
+        self._rm = libc.inotify_rm_watch
+        self._rm.argtypes = (ctypes.c_int, ctypes.c_int)
+        fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        self._fd = fd
+        self._lock = threading.Lock()
+        self._paths: dict[int, Path] = {}
+        self._wds: dict[Path, int] = {}
+
+    def fileno(self) -> int:
+        """The inotify file descriptor (readable when events are queued)."""
+        return self._fd
+
+    def add(self, path: Path, mask: int = IN_CHANGES) -> bool:
+        """Watch directory *path*; False when it is gone or the watch limit is hit."""
+        path = Path(path)
+        with self._lock:
+            if path in self._wds:
+                return True
+            wd = self._add(self._fd, os.fsencode(path), mask | IN_ONLYDIR)
+            if wd < 0:
+                err = ctypes.get_errno()
+                if err not in (errno.ENOENT, errno.ENOTDIR):
+                    logger.warning("Cannot watch %s: %s", path, os.strerror(err))
+                return False
+            self._paths[wd] = path
+            self._wds[path] = wd
+            return True
+
+    def remove(self, path: Path) -> None:
+        """Stop watching *path* (no-op when it is not watched)."""
+        with self._lock:
+            wd = self._wds.pop(Path(path), None)
+            if wd is not None:
+                self._paths.pop(wd, None)
+                self._rm(self._fd, wd)
+
+    def watched(self) -> set[Path]:
+        """The directories currently watched."""
+        with self._lock:
+            return set(self._wds)
+
+    def read_events(self) -> list[tuple[Path, int]]:
+        """Drain queued events without blocking.
+
+        Returns:
+            ``(path, mask)`` per event, where *path* is the watched
+            directory joined with the event's name (the directory itself
+            for events on it). A queue overflow is reported once as
+            ``(Path(), IN_Q_OVERFLOW)``: the caller must rescan everything.
+        """
+        out: list[tuple[Path, int]] = []
+        while True:
+            try:
+                buf = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return out
+            except OSError as exc:
+                if exc.errno == errno.EINTR:
+                    continue
+                raise
+            if not buf:
+                return out
+            offset = 0
+            with self._lock:
+                while offset + _EVENT.size <= len(buf):
+                    wd, mask, _cookie, length = _EVENT.unpack_from(buf, offset)
+                    offset += _EVENT.size
+                    name = buf[offset : offset + length].rstrip(b"\0")
+                    offset += length
+                    if mask & IN_Q_OVERFLOW:
+                        out.append((Path(), IN_Q_OVERFLOW))
+                        continue
+                    base = self._paths.get(wd)
+                    if base is None:
+                        continue
+                    if mask & IN_IGNORED:
+                        # The kernel dropped the watch (directory removed).
+                        self._paths.pop(wd, None)
+                        if self._wds.get(base) == wd:
+                            del self._wds[base]
+                    out.append((base / os.fsdecode(name) if name else base, mask))
+
+    def close(self) -> None:
+        """Release the descriptor and every watch."""
+        with self._lock:
+            if self._fd >= 0:
+                os.close(self._fd)
+                self._fd = -1
+            self._paths.clear()
+            self._wds.clear()
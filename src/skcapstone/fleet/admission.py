@@ -84,12 +84,11 @@ def role_gate_on() -> bool:
 def pending_joins(paths: FleetPaths) -> list[dict]:
     """Join requests that do not yet have a node object, sorted by name."""
     out = []
-    if not paths.status.exists():
-        return out
-    for node_dir in sorted(p for p in paths.status.iterdir() if p.is_dir()):
-        join = store.read_node_file(paths, node_dir.name, "join.json")
-        if join and store.read_spec(paths, "node", node_dir.name) is None:
-            out.append(join)
+    with store.indexed(paths):
+        for node in store.status_nodes(paths):
+            join = store.read_node_file(paths, node, "join.json")
+            if join and store.read_spec(paths, "node", node) is None:
+                out.append(join)
     return out
 
 
@@ -165,9 +165,27 @@ def unfreeze_cmd() -> None:
     "actuation_interval",
     default=None,
     type=int,
-    help="Seconds between converge passes (default 30).",
+    help="Seconds between converge passes with --no-watch (default 30).",
 )
-def sknoded_cmd(once: bool, interval: int, actuation_interval: int | None) -> None:
+@click.option(
+    "--watch/--no-watch",
+    default=None,
+    help="Converge on desired-state changes (default; SKNODED_WATCH=0 turns it off).",
+)
+@click.option(
+    "--full-interval",
+    "full_interval",
+    default=None,
+    type=int,
+    help="Seconds between safety-net full converge passes when watching (default 120).",
+)
+def sknoded_cmd(
+    once: bool,
+    interval: int,
+    actuation_interval: int | None,
+    watch: bool | None,
+    full_interval: int | None,
+) -> None:
     """Run the node agent loop (self-report + Phase 3 converge)."""
     sknoded_mod.main_loop(
         default_paths(),
@@ -175,6 +193,8 @@ def sknoded_cmd(once: bool, interval: int, actuation_interval: int | None) -> No
         interval=interval,
         once=once,
         actuation_interval=actuation_interval,
+        watch=watch,
+        full_interval=full_interval,
     )
 
 
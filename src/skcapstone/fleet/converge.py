@@ -3,19 +3,55 @@
 Gate order is the whole point: tree readable, then freeze, then per-node
 opt-in, then per-service spec validity and pause, and only then verbs
 under bounded backoff. Anything unreadable degrades to "touch nothing".
+
+Services converge concurrently on a small bounded pool, so one hung unit
+(a stuck systemctl, a probe against a wedged port) no longer delays
+healing every other service on the node. Each service has a time budget
+and the pass has a deadline inside the actuation interval. A service
+that overruns is reported with a ConvergeTimeout condition and left to
+finish in the background. It is not converged again until that run
+returns, so two runs never touch the same unit at once, and its late
+result is dropped rather than written over the ConvergeTimeout status. Signatures are
+verified up front, one verifier call per distinct payload per pass, and
+results are collected in placement order.
 """
 
 from __future__ import annotations
 
 import socket
+import threading
 import time
-from typing import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Collection
 
 from . import actuation, alerts, backoff, events, profiles, signing, store
 from .paths import FleetPaths
 from .services import ServiceSpecError, normalize_service_spec
 
 ACTUATION_INTERVAL_S = 30
+#: Services converged at once. Small on purpose: most of the work is
+#: waiting on systemctl/docker, and the node is also running the services.
+CONVERGE_WORKERS = 4
+#: Budget for one service, measured from when its worker picks it up.
+SERVICE_TIMEOUT_S = 20.0
+#: Whole-pass deadline; kept inside the actuation interval so passes never
+#: stack up behind a hung unit.
+PASS_DEADLINE_S = 25.0
+
+# (node, service) pairs whose converge is still running, possibly left
+# behind by an earlier pass that timed it out.
+_inflight: set[tuple[str, str]] = set()
+# In-flight pairs a pass has given up on and reported as ConvergeTimeout;
+# the status file belongs to that report until the run returns.
+_abandoned: set[tuple[str, str]] = set()
+_inflight_lock = threading.Lock()
+
+
+def reset_inflight() -> None:
+    """Forget in-flight services (tests, daemon restart)."""
+    with _inflight_lock:
+        _inflight.clear()
+        _abandoned.clear()
 
 
 def tcp_probe(check: dict) -> bool:
@@ -39,16 +75,21 @@ def actuation_enabled(paths: FleetPaths, node: str) -> bool:
     return bool(spec.get("spec", {}).get("actuate"))
 
 
-def local_services(paths: FleetPaths, node: str) -> list[dict]:
+def local_services(
+    paths: FleetPaths, node: str, names: Collection[str] | None = None
+) -> list[dict]:
     """Service placements addressed to this node, joined with their specs.
 
     spec_payload is None when the spec file is missing or unreadable; the
-    caller must treat that as "do not touch" (degrade-safe).
+    caller must treat that as "do not touch" (degrade-safe). *names*
+    narrows the result to those services (None means all of them).
     """
     out: list[dict] = []
     for placement in store.list_placements(paths, "service"):
         if placement.get("node") != node:
             continue
+        if names is not None and placement["name"] not in names:
+            continue
         name = placement["name"]
         out.append(
             {
@@ -64,13 +105,16 @@ def verify_desired(
     spec_payload: dict,
     placement: dict | None,
     verifier,
+    *,
+    cache: dict | None = None,
 ) -> tuple[bool, str]:
     """Classify the pair of files actuation consumes (Card 3.5).
 
     Both the service spec and its placement must verify. A missing
     verifier (no roster, capauth absent) is unverified by definition:
     under enforce that refuses NEW actuation and never touches running
-    services (fail safe at the trust boundary).
+    services (fail safe at the trust boundary). *cache* is the per-pass
+    memo passed through to signing.verify_payload.
     """
     if verifier is None:
         return (False, "no verifier available (empty roster or capauth missing)")
@@ -78,7 +122,7 @@ def verify_desired(
     for label, payload in (("spec", spec_payload), ("placement", placement)):
         if payload is None:
             continue
-        status, detail = signing.verify_payload(payload, verifier)
+        status, detail = signing.verify_payload(payload, verifier, cache=cache)
         if status != "verified":
             failures.append(f"{label} {status}: {detail}")
     if failures:
@@ -389,10 +433,130 @@ def converge_service(
         ),
     ]
     generation = int(spec_payload.get("generation", 0))
-    _write_service_status(paths, writer, name, state, spec, generation, conds, track)
+    # Held across the check and the write so a pass cannot time this run
+    # out between them and then have its ConvergeTimeout overwritten.
+    with _inflight_lock:
+        if (node, name) not in _abandoned:
+            _write_service_status(paths, writer, name, state, spec, generation, conds, track)
     return {"state": state.state, "acted": acted}
 
 
+def _write_timeout_status(
+    paths: FleetPaths, writer: store.Writer, name: str, reason: str, message: str, now: float
+) -> None:
+    """Mark one service ConvergeTimeout, keeping its last observed status."""
+    from .conditions import merge_transitions
+
+    previous = store.read_status(paths, "service", name, writer.node) or {}
+    cond = _cond("ConvergeTimeout", True, reason, message, _now_iso(now))
+    conds = [c for c in previous.get("conditions", []) if c.get("type") != "ConvergeTimeout"]
+    store.write_status(
+        paths,
+        "service",
+        name,
+        node=writer.node,
+        status=previous.get("status") or {"state": "unknown", "pid": None, "since": ""},
+        conditions=merge_transitions([*conds, cond], previous.get("conditions", [])),
+        observed_generation=int(previous.get("observedGeneration", 0)),
+        writer=writer,
+    )
+
+
+def _run_bounded(
+    node: str,
+    jobs: list[tuple[str, Callable[[], dict]]],
+    *,
+    workers: int,
+    service_timeout_s: float,
+    deadline_s: float,
+) -> dict[str, dict | tuple[str, str]]:
+    """Run each (name, job) on a bounded pool under the two time limits.
+
+    Returns:
+        name -> the job's result, or a (reason, message) pair for a service
+        that did not finish in time (or was still running from an earlier
+        pass). Exceptions from jobs propagate, as they did serially.
+    """
+    out: dict[str, dict | tuple[str, str]] = {}
+    started: dict[str, float] = {}
+
+    def run(name: str, job: Callable[[], dict]) -> dict:
+        started[name] = time.monotonic()
+        try:
+            return job()
+        finally:
+            with _inflight_lock:
+                _inflight.discard((node, name))
+                _abandoned.discard((node, name))
+
+    def abandon(fut: Future) -> bool:
+        """Give up on *fut* unless it has returned; True if abandoned."""
+        key = (node, futures[fut])
+        with _inflight_lock:
+            if fut.done() or key not in _inflight:
+                return False
+            _abandoned.add(key)
+            return True
+
+    runnable = []
+    with _inflight_lock:
+        for name, job in jobs:
+            if (node, name) in _inflight:
+                out[name] = (
+                    "StillRunning",
+                    "a previous converge of this service has not returned",
+                )
+            else:
+                _inflight.add((node, name))
+                runnable.append((name, job))
+    if not runnable:
+        return out
+    pool = ThreadPoolExecutor(
+        max_workers=max(1, min(workers, len(runnable))), thread_name_prefix="converge"
+    )
+    futures: dict[Future, str] = {pool.submit(run, name, job): name for name, job in runnable}
+    pending = set(futures)
+    pass_end = time.monotonic() + deadline_s
+    try:
+        while pending:
+            now = time.monotonic()
+            for fut in [f for f in pending if futures[f] in started and not f.done()]:
+                if now - started[futures[fut]] >= service_timeout_s and abandon(fut):
+                    pending.discard(fut)
+                    out[futures[fut]] = (
+                        "ServiceTimeout",
+                        f"no result after {service_timeout_s:g}s; still running",
+                    )
+            if pending and now >= pass_end:
+                for fut in pending:
+                    name = futures[fut]
+                    if fut.cancel():
+                        with _inflight_lock:
+                            _inflight.discard((node, name))
+                        message = f"not started before the {deadline_s:g}s pass deadline"
+                    elif abandon(fut):
+                        message = f"still running at the {deadline_s:g}s pass deadline"
+                    else:
+                        out[name] = fut.result()
+                        continue
+                    out[name] = ("PassDeadline", message)
+                break
+            expiries = [
+                started[futures[f]] + service_timeout_s for f in pending if futures[f] in started
+            ]
+            # Poll briefly too: a worker that starts while we wait has no
+            # expiry in this list yet.
+            wake = min([pass_end, now + 0.5, *expiries])
+            done, pending = wait(
+                pending, timeout=max(0.0, wake - now), return_when=FIRST_COMPLETED
+            )
+            for fut in done:
+                out[futures[fut]] = fut.result()
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+    return out
+
+
 def converge_once(
     paths: FleetPaths,
     node: str,
@@ -401,8 +565,25 @@ def converge_once(
     prober: Callable[[dict], bool] | None = None,
     now: float | None = None,
     verifier=None,
+    workers: int | None = None,
+    service_timeout_s: float | None = None,
+    deadline_s: float | None = None,
+    services: Collection[str] | None = None,
 ) -> dict:
-    """One actuation pass for this node (spec section 6, steps 2-4)."""
+    """One actuation pass for this node (spec section 6, steps 2-4).
+
+    Args:
+        workers: Pool size (default CONVERGE_WORKERS).
+        service_timeout_s: Per-service budget (default SERVICE_TIMEOUT_S).
+        deadline_s: Whole-pass deadline (default PASS_DEADLINE_S).
+        services: Converge only these services (the event-driven sknoded
+            loop passes the ones whose spec or placement changed). The
+            freeze and opt-in gates are evaluated exactly as for a full pass.
+
+    Returns:
+        {"mode": ..., "services": {name: summary}} in placement order. A
+        service that ran out of time has summary {"timeout": message}.
+    """
     runner = actuation.default_runner if runner is None else runner
     prober = tcp_probe if prober is None else prober
     now = time.time() if now is None else now
@@ -420,28 +601,61 @@ def converge_once(
             mode = "report-only"
         if profile_gate != "off":
             role = profiles.profile_of(store.read_spec(paths, "node", node)) or ""
-        entries = local_services(paths, node)
+        entries = local_services(paths, node, services)
     except OSError:
         return {"mode": "degraded", "services": {}}
     writer = store.Writer(role="sknoded", node=node, identity=store.writer_identity())
-    results: dict[str, dict] = {}
+    verified: dict[tuple[str, str], tuple[str, str]] = {}
+    jobs: list[tuple[str, Callable[[], dict]]] = []
     for entry in entries:
         verification = (True, "")
         if sig_mode != "off" and entry["spec_payload"] is not None:
-            verification = verify_desired(entry["spec_payload"], entry["placement"], verifier)
-        results[entry["name"]] = converge_service(
-            paths,
-            node,
-            entry["name"],
-            entry["spec_payload"],
-            writer=writer,
-            runner=runner,
-            prober=prober,
-            mode=mode,
-            now=now,
-            sig_mode=sig_mode,
-            verification=verification,
-            role=role,
-            profile_gate=profile_gate,
+            verification = verify_desired(
+                entry["spec_payload"], entry["placement"], verifier, cache=verified
+            )
+        jobs.append(
+            (
+                entry["name"],
+                lambda entry=entry, verification=verification: converge_service(
+                    paths,
+                    node,
+                    entry["name"],
+                    entry["spec_payload"],
+                    writer=writer,
+                    runner=runner,
+                    prober=prober,
+                    mode=mode,
+                    now=now,
+                    sig_mode=sig_mode,
+                    verification=verification,
+                    role=role,
+                    profile_gate=profile_gate,
+                ),
+            )
         )
+    outcomes = _run_bounded(
+        node,
+        jobs,
+        workers=CONVERGE_WORKERS if workers is None else workers,
+        service_timeout_s=SERVICE_TIMEOUT_S if service_timeout_s is None else service_timeout_s,
+        deadline_s=PASS_DEADLINE_S if deadline_s is None else deadline_s,
+    )
+    results: dict[str, dict] = {}
+    for name, _ in jobs:
+        outcome = outcomes[name]
+        if isinstance(outcome, tuple):
+            reason, message = outcome
+            events.emit(
+                paths,
+                writer,
+                kind="service",
+                name=name,
+                type="Degrade",
+                reason="ConvergeTimeout",
+                message=message,
+                now=now,
+            )
+            _write_timeout_status(paths, writer, name, reason, message, now)
+            outcome = {"timeout": message}
+        results[name] = outcome
     return {"mode": mode, "services": results}
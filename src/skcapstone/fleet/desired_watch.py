@@ -0,0 +1,226 @@
+"""What changed in the desired state, for the event-driven sknoded loop.
+
+sknoded used to run a full converge pass every 30s whether or not anything
+had changed, so a new placement or spec edit arriving over Syncthing waited
+up to a full interval, while an idle node paid for a pass it did not need.
+DesiredStateWatch watches the directories converge reads (the service specs
+and placements, plus objects/ for the freeze flag and the node's own spec)
+and turns their changes into a small answer: which services to converge,
+or "everything" when a gate that covers every service moved.
+
+inotify is used when it is available (file_watch.Inotify, synchronous and
+stdlib-only); otherwise the same directories are stat-scanned every
+POLL_INTERVAL_S. Bursts are debounced, because a Syncthing pull lands as
+many renames within milliseconds. Temp files and conflict copies are
+ignored, exactly as the store readers ignore them.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import select
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from ..file_watch import IN_CHANGES, IN_DELETE_SELF, IN_MOVE_SELF, IN_Q_OVERFLOW, Inotify
+from .paths import FleetPaths
+from .store import _is_conflict_copy
+
+logger = logging.getLogger("skcapstone.fleet.desired_watch")
+
+#: Quiet time that ends a burst of changes.
+DEBOUNCE_S = 0.25
+#: Upper bound on how long a steady trickle of changes can defer a pass.
+DEBOUNCE_MAX_S = 2.0
+#: Scan period when inotify is unavailable.
+POLL_INTERVAL_S = 2.0
+
+
+@dataclass
+class Changes:
+    """The outcome of one wait.
+
+    Attributes:
+        services: Changed service name -> newest mtime (epoch seconds) of
+            its spec or placement file; 0.0 when the file was removed.
+        full: A node-wide gate changed (freeze flag, this node's spec, a
+            watched directory appearing or vanishing, an event overflow):
+            every service must be converged.
+    """
+
+    services: dict[str, float] = field(default_factory=dict)
+    full: bool = False
+
+    def __bool__(self) -> bool:
+        return self.full or bool(self.services)
+
+    def merge(self, other: Changes) -> None:
+        self.full = self.full or other.full
+        for name, mtime in other.services.items():
+            self.services[name] = max(mtime, self.services.get(name, 0.0))
+
+
+class DesiredStateWatch:
+    """Watch one node's desired-state inputs.
+
+    Args:
+        paths: The fleet tree.
+        node: This node's name (only its own node spec is a gate).
+        use_inotify: Try inotify first; False forces stat scanning.
+    """
+
+    def __init__(self, paths: FleetPaths, node: str, *, use_inotify: bool = True) -> None:
+        self.paths = paths
+        self.node = node
+        self._service_dirs = (paths.objects / "service", paths.placements / "service")
+        self._node_dir = paths.objects / "node"
+        self._dirs = (
+            paths.root,
+            paths.objects,
+            paths.placements,
+            self._node_dir,
+            *self._service_dirs,
+        )
+        self._inotify: Inotify | None = None
+        if use_inotify:
+            try:
+                self._inotify = Inotify()
+            except OSError as exc:
+                logger.info("inotify unavailable (%s); polling every %gs", exc, POLL_INTERVAL_S)
+        self._present: set[Path] = {d for d in self._dirs if d.is_dir()}
+        self._snapshot: dict[Path, tuple[int, int]] = {}
+        if self._inotify is not None:
+            for d in self._present:
+                self._inotify.add(d, IN_CHANGES)
+        else:
+            self._snapshot = self._scan()
+
+    @property
+    def inotify(self) -> bool:
+        """True when changes are delivered by inotify rather than polling."""
+        return self._inotify is not None
+
+    def close(self) -> None:
+        """Release the inotify descriptor (no-op when polling)."""
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+
+    # -- waiting ----------------------------------------------------------------
+
+    def wait(self, timeout: float) -> Changes:
+        """Block up to *timeout* seconds for a change, then debounce the burst.
+
+        Returns:
+            The accumulated Changes; empty when the timeout passed quietly.
+        """
+        deadline = time.monotonic() + max(0.0, timeout)
+        changes = self._collect(deadline)
+        if not changes:
+            return changes
+        burst_end = time.monotonic() + DEBOUNCE_MAX_S
+        while True:
+            quiet = min(time.monotonic() + DEBOUNCE_S, burst_end)
+            more = self._collect(quiet, poll_every=DEBOUNCE_S)
+            if not more:
+                return changes
+            changes.merge(more)
+            if time.monotonic() >= burst_end:
+                return changes
+
+    def drain(self) -> None:
+        """Forget pending changes (a full pass is about to cover them)."""
+        self._collect(time.monotonic())
+
+    def _collect(self, deadline: float, *, poll_every: float = POLL_INTERVAL_S) -> Changes:
+        changes = self._attach()
+        if self._inotify is not None:
+            while True:
+                changes.merge(self._drain_events())
+                remaining = deadline - time.monotonic()
+                if changes or remaining <= 0:
+                    return changes
+                select.select([self._inotify.fileno()], [], [], remaining)
+        while True:
+            snapshot = self._scan()
+            changes.merge(self._diff(self._snapshot, snapshot))
+            self._snapshot = snapshot
+            remaining = deadline - time.monotonic()
+            if changes or remaining <= 0:
+                return changes
+            time.sleep(min(poll_every, remaining))
+
+    # -- inotify ----------------------------------------------------------------
+
+    def _attach(self) -> Changes:
+        """(Re)watch the directories; one appearing or vanishing is a full change."""
+        present = {d for d in self._dirs if d.is_dir()}
+        changes = Changes(full=present != self._present)
+        if self._inotify is not None:
+            for d in present - self._inotify.watched():
+                self._inotify.add(d, IN_CHANGES)
+        self._present = present
+        return changes
+
+    def _drain_events(self) -> Changes:
+        changes = Changes()
+        for path, mask in self._inotify.read_events():
+            if mask & IN_Q_OVERFLOW or mask & (IN_DELETE_SELF | IN_MOVE_SELF):
+                changes.full = True
+                continue
+            self._classify(path, changes)
+        return changes
+
+    def _classify(self, path: Path, changes: Changes) -> None:
+        parent = path.parent
+        if parent in self._service_dirs:
+            name = _service_name(path)
+            if name is not None:
+                changes.services[name] = max(_mtime(path), changes.services.get(name, 0.0))
+        elif path == self.paths.freeze_path() or path == self._node_dir / f"{self.node}.json":
+            changes.full = True
+        elif path in self._dirs:
+            changes.full = True  # a watched directory was created or replaced
+
+    # -- polling ----------------------------------------------------------------
+
+    def _scan(self) -> dict[Path, tuple[int, int]]:
+        out: dict[Path, tuple[int, int]] = {}
+        files = [self.paths.freeze_path(), self._node_dir / f"{self.node}.json"]
+        for d in self._service_dirs:
+            try:
+                with os.scandir(d) as it:
+                    files.extend(Path(e.path) for e in it if _service_name(Path(e.name)))
+            except OSError:
+                continue
+        for f in files:
+            try:
+                st = f.stat()
+            except OSError:
+                continue
+            out[f] = (st.st_mtime_ns, st.st_size)
+        return out
+
+    def _diff(self, old: dict, new: dict) -> Changes:
+        changes = Changes()
+        for path in old.keys() | new.keys():
+            if old.get(path) != new.get(path):
+                self._classify(path, changes)
+        return changes
+
+
+def _service_name(path: Path) -> str | None:
+    """The service a spec/placement filename names, None for temp/conflict files."""
+    name = path.name
+    if not name.endswith(".json") or name.startswith((".", "_")) or _is_conflict_copy(path):
+        return None
+    return name[: -len(".json")]
+
+
+def _mtime(path: Path) -> float:
+    try:
+        return path.stat().st_mtime
+    except OSError:
+        return 0.0
@@ -13,6 +13,7 @@ import os
 import time
 from datetime import datetime, timezone
 
+from ..jsonl_tail import tail_records
 from .paths import FleetPaths
 from .store import OwnershipError, Writer
 
@@ -84,21 +85,27 @@ def read(
     kind: str | None = None,
     name: str | None = None,
     limit: int = 200,
+    since: str | None = None,
 ) -> list[dict]:
-    """Read events for a node, oldest first, filtered by kind/name."""
-    out: list[dict] = []
+    """Read events for a node, oldest first, filtered by kind/name.
+
+    Reads backwards from the end of the live file (then the rotated one)
+    and stops once *limit* matches are found, or at the first event older
+    than *since* (an ISO ``ts`` string, compared lexically like the log
+    writes it).
+    """
     live = paths.events_path(node)
-    for p in (live.with_name("events.jsonl.1"), live):
-        if not p.exists():
-            continue
-        for raw in p.read_text(encoding="utf-8").splitlines():
-            try:
-                ev = json.loads(raw)
-            except ValueError:
-                continue
-            if kind is not None and ev.get("kind") != kind:
-                continue
-            if name is not None and ev.get("name") != name:
-                continue
-            out.append(ev)
-    return out[-limit:]
+
+    def keep(ev: dict) -> bool:
+        if kind is not None and ev.get("kind") != kind:
+            return False
+        return name is None or ev.get("name") == name
+
+    out = tail_records(
+        (live.with_name("events.jsonl.1"), live),
+        limit,
+        predicate=keep,
+        since=since,
+    )
+    out.reverse()
+    return out
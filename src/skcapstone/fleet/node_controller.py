@@ -64,13 +64,16 @@ def _phase(age: float | None) -> str:
 
 def node_views(paths: FleetPaths, *, now: datetime | None = None) -> list[NodeView]:
     """All known nodes: admitted (from spec) plus Pending joiners."""
-    now = now or datetime.now(timezone.utc)
+    with store.indexed(paths):
+        return _node_views(paths, now or datetime.now(timezone.utc))
+
+
+def _node_views(paths: FleetPaths, now: datetime) -> list[NodeView]:
     admitted = {s["name"]: s for s in store.list_specs(paths, "node")}
     names = set(admitted)
-    if paths.status.exists():
-        for node_dir in paths.status.iterdir():
-            if node_dir.is_dir() and (node_dir / "join.json").exists():
-                names.add(node_dir.name)
+    for node in store.status_nodes(paths):
+        if store.has_node_file(paths, node, "join.json"):
+            names.add(node)
     views = []
     for name in sorted(names):
         report = store.read_node_file(paths, name, "node.json") or {}
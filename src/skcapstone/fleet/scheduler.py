@@ -7,11 +7,19 @@ untolerated PreferNoSchedule nodes (Card 2.1b): they are used only when no
 untainted candidate is feasible. feasible() itself is untouched; a
 PreferNoSchedule taint never excludes a node, it only deprioritizes it.
 The scheduler writes ONLY placements: never status, never spec.
+
+place_batch() places several workloads in one pass with resource
+accounting: each node's allocatable is reduced by the requests already
+committed to it (existing placements) and by every assignment made
+earlier in the same pass, so a pass placing ten services no longer piles
+them all onto the node with the most static RAM. Workloads go
+largest-first; the spread policy keeps the least-loaded ranking, pack
+picks the feasible node with the least headroom left (best fit).
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 
 from . import events, store
 from .node_controller import NodeView, node_views
@@ -19,6 +27,10 @@ from .paths import FleetPaths
 
 DEFAULT_REQUESTS: dict = {"cores": 1, "ram_gb": 2.0}
 
+#: Batch placement policies: "spread" (most headroom first, the select()
+#: ranking) and "pack" (least headroom that still fits, best fit).
+PLACEMENT_POLICIES: tuple[str, ...] = ("spread", "pack")
+
 
 @dataclass(frozen=True)
 class Workload:
@@ -167,29 +179,119 @@ def select(views: list[NodeView], workload: Workload) -> Decision:
     return Decision(node=chosen.name, reason=reason, excluded=excluded)
 
 
-def place(
-    paths: FleetPaths,
-    workload: Workload,
+def _need(requests: dict) -> tuple[float, float]:
+    """(ram_gb, cores) a requests map asks for; missing keys ask for nothing."""
+    return float(requests.get("ram_gb", 0.0)), float(requests.get("cores", 0))
+
+
+def _size_key(workload: Workload) -> tuple:
+    """Largest-first order: most RAM, then most cores, then (kind, name)."""
+    ram, cores = _need(workload.requests)
+    return (-ram, -cores, workload.kind, workload.name)
+
+
+def add_requests(committed: dict, node: str, requests: dict) -> None:
+    """Add one workload's requests to *committed* (node -> {"cores", "ram_gb"})."""
+    ram, cores = _need(requests)
+    used = committed.setdefault(node, {"cores": 0.0, "ram_gb": 0.0})
+    used["cores"] += cores
+    used["ram_gb"] += ram
+
+
+def _net_of(view: NodeView, used: dict | None) -> NodeView:
+    """The view with *used* subtracted from its allocatable cores and RAM."""
+    if not used:
+        return view
+    allocatable = dict(view.allocatable)
+    allocatable["cores"] = float(allocatable.get("cores", 0)) - used["cores"]
+    allocatable["ram_gb"] = round(float(allocatable.get("ram_gb", 0.0)) - used["ram_gb"], 3)
+    return replace(view, allocatable=allocatable)
+
+
+def plan_batch(
+    views: list[NodeView],
+    workloads: list[Workload],
     *,
-    writer: store.Writer,
-    views: list[NodeView] | None = None,
-) -> dict | None:
-    """Decide and record one placement (level-triggered, idempotent).
+    committed: dict | None = None,
+    policy: str = "spread",
+) -> list[tuple[Workload, Decision]]:
+    """Decide placements for *workloads* together, accounting for resources.
 
-    Honors the freeze flag: a frozen tree gets no placement writes (spec
-    section 8, guardrail 2). Emits one Placement event per CHANGED decision
-    (the Card 2.3 audit trail; unchanged re-runs stay silent, R2).
+    Pure: nothing is read from or written to the tree. Each node's
+    allocatable is reduced by *committed* (node -> summed {"cores",
+    "ram_gb"} of workloads already placed there) and then by every
+    assignment made earlier in the batch. Workloads are decided
+    largest-first (RAM, then cores), which keeps big workloads from being
+    stranded by fragments. With policy "spread" each decision is exactly
+    select() on the net views; with "pack" the feasible node with the least
+    remaining headroom wins, soft-avoided nodes still last.
 
     Returns:
-        The placement payload as on disk, or None when frozen or
-        unschedulable (nothing is written in either case).
+        (workload, decision) pairs in decision order. Every decision's
+        reason names the strategy and the node's committed requests.
     """
-    if not store.actuation_allowed(paths):
-        return None
-    views = node_views(paths) if views is None else views
+    if policy not in PLACEMENT_POLICIES:
+        raise ValueError(f"unknown placement policy {policy!r} (expected spread or pack)")
+    used: dict = {name: dict(req) for name, req in (committed or {}).items()}
+    by_name = {v.name: v for v in views}
+    net = {name: _net_of(v, used.get(name)) for name, v in by_name.items()}
+    order = sorted(workloads, key=_size_key)
+    out: list[tuple[Workload, Decision]] = []
+    for workload in order:
+        candidates = list(net.values())
+        if policy == "pack":
+            decision = _select_pack(candidates, workload)
+        else:
+            decision = select(candidates, workload)
+        if decision.node is not None:
+            before = used.get(decision.node, {"cores": 0.0, "ram_gb": 0.0})
+            decision = replace(
+                decision,
+                reason=(
+                    f"{decision.reason}; batch: largest-first {policy} "
+                    f"({len(order)} workload(s)), {decision.node} had "
+                    f"ram={before['ram_gb']:g}GB cores={before['cores']:g} committed"
+                ),
+            )
+            add_requests(used, decision.node, workload.requests)
+            net[decision.node] = _net_of(by_name[decision.node], used[decision.node])
+        out.append((workload, decision))
+    return out
+
+
+def _select_pack(views: list[NodeView], workload: Workload) -> Decision:
+    """select() with best-fit ranking: least RAM, then cores, left after placing."""
     decision = select(views, workload)
     if decision.node is None:
-        return None
+        return decision
+    candidates = [v for v in views if v.name not in decision.excluded]
+    chosen = min(
+        candidates,
+        key=lambda v: (
+            _soft_avoid(v, workload),
+            float(v.allocatable.get("ram_gb", 0.0)),
+            float(v.allocatable.get("cores", 0)),
+            v.name,
+        ),
+    )
+    reason = (
+        f"best-fit: {chosen.name} allocatable "
+        f"ram={chosen.allocatable.get('ram_gb')}GB "
+        f"cores={chosen.allocatable.get('cores')} "
+        f"of {len(candidates)} candidate(s)"
+    )
+    if _soft_avoid(chosen, workload):
+        reason += "; soft-avoided, chosen because no non-avoided candidate was feasible"
+    return Decision(node=chosen.name, reason=reason, excluded=decision.excluded)
+
+
+def _record(
+    paths: FleetPaths,
+    workload: Workload,
+    decision: Decision,
+    writer: store.Writer,
+) -> dict:
+    """Write one decided placement and emit its Placement event on change."""
     payload, changed = store.write_placement(
         paths,
         workload.kind,
@@ -209,3 +311,59 @@ def place(
             message=decision.reason,
         )
     return payload
+
+
+def place_batch(
+    paths: FleetPaths,
+    workloads: list[Workload],
+    *,
+    writer: store.Writer,
+    views: list[NodeView] | None = None,
+    committed: dict | None = None,
+    policy: str = "spread",
+) -> list[tuple[Workload, Decision, dict | None]]:
+    """Decide (plan_batch) and record placements for several workloads.
+
+    Same write and event semantics as place(), per workload: freeze-gated,
+    write-on-change, one Placement event per changed decision. The caller
+    supplies *committed*, the summed requests of workloads already placed
+    per node, because only it knows which placements are still live.
+
+    Returns:
+        (workload, decision, payload) triples in decision order; payload is
+        None when frozen or unschedulable (nothing written for it).
+    """
+    if not store.actuation_allowed(paths):
+        return [(w, Decision(node=None, reason="frozen"), None) for w in workloads]
+    views = node_views(paths) if views is None else views
+    out: list[tuple[Workload, Decision, dict | None]] = []
+    for workload, decision in plan_batch(views, workloads, committed=committed, policy=policy):
+        payload = None if decision.node is None else _record(paths, workload, decision, writer)
+        out.append((workload, decision, payload))
+    return out
+
+
+def place(
+    paths: FleetPaths,
+    workload: Workload,
+    *,
+    writer: store.Writer,
+    views: list[NodeView] | None = None,
+) -> dict | None:
+    """Decide and record one placement (level-triggered, idempotent).
+
+    Honors the freeze flag: a frozen tree gets no placement writes (spec
+    section 8, guardrail 2). Emits one Placement event per CHANGED decision
+    (the Card 2.3 audit trail; unchanged re-runs stay silent, R2).
+
+    Returns:
+        The placement payload as on disk, or None when frozen or
+        unschedulable (nothing is written in either case).
+    """
+    if not store.actuation_allowed(paths):
+        return None
+    views = node_views(paths) if views is None else views
+    decision = select(views, workload)
+    if decision.node is None:
+        return None
+    return _record(paths, workload, decision, writer)
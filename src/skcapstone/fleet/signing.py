@@ -13,6 +13,7 @@ fails safe by refusing actuation, never by stopping running services).
 
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 import stat
@@ -78,18 +79,39 @@ def canonical_bytes(payload: dict) -> bytes:
     return json.dumps(body, sort_keys=True, separators=(",", ":")).encode("utf-8")
 
 
-def verify_payload(payload: dict, verifier: Callable[[bytes, str], bool]) -> tuple[str, str]:
-    """Classify one payload: verified, unsigned, or invalid (with detail)."""
+def verify_payload(
+    payload: dict,
+    verifier: Callable[[bytes, str], bool],
+    *,
+    cache: dict[tuple[str, str], tuple[str, str]] | None = None,
+) -> tuple[str, str]:
+    """Classify one payload: verified, unsigned, or invalid (with detail).
+
+    Args:
+        cache: Optional memo shared by the callers of one pass, keyed by the
+            SHA-256 of the canonical bytes plus the signature, so each
+            distinct signed payload reaches the verifier once. Only use
+            it with the same verifier; it has no expiry.
+    """
     signature = (payload.get("writer") or {}).get("signature")
     if not signature:
         return ("unsigned", "no signature in writer block")
+    data = canonical_bytes(payload)
+    key = (hashlib.sha256(data).hexdigest(), signature)
+    if cache is not None and key in cache:
+        return cache[key]
     try:
-        ok = verifier(canonical_bytes(payload), signature)
+        ok = verifier(data, signature)
     except Exception as exc:
-        return ("invalid", f"verifier error: {exc}")
-    if ok:
-        return ("verified", "signature matches a trusted key")
-    return ("invalid", "signature does not match any trusted key")
+        result = ("invalid", f"verifier error: {exc}")
+    else:
+        if ok:
+            result = ("verified", "signature matches a trusted key")
+        else:
+            result = ("invalid", "signature does not match any trusted key")
+    if cache is not None:
+        cache[key] = result
+    return result
 
 
 def _acting_agent() -> str:
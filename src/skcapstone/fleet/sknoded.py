@@ -2,13 +2,23 @@
 
 Phase 1 is report-only: heartbeat + node.json + join request. Actuation
 arrives in Phase 3 and will gate on store.actuation_allowed().
+
+The converge side of the loop is event-driven: it watches the desired
+state (desired_watch.DesiredStateWatch) and converges just the services
+whose spec or placement changed, as soon as a burst of writes settles. A
+full pass still runs every FULL_PASS_INTERVAL_S as a safety net. The full
+pass is what notices a unit that died locally, since nothing in the tree
+changes when that happens. SKNODED_WATCH=0 restores the fixed 30s polling.
 """
 
 from __future__ import annotations
 
+import os
 import platform
 import socket
+import statistics
 import time
+from collections import deque
 from copy import deepcopy
 from datetime import datetime, timezone
 
@@ -37,6 +47,19 @@ INVENTORY_INTERVAL_S = 900
 MAX_INVENTORY_UNITS = 400
 MAX_INVENTORY_PACKAGES = 200
 
+#: Safety-net full converge pass of the event-driven loop. Longer than the
+#: old 30s poll because desired-state changes no longer wait for it; short
+#: enough that a unit which crashed locally is healed within two minutes.
+FULL_PASS_INTERVAL_S = 120
+
+#: SKNODED_WATCH=0 turns the event-driven loop off (fixed-interval polling).
+WATCH_ENABLED = os.environ.get("SKNODED_WATCH", "1").strip().lower() not in {"0", "false", "off"}
+
+#: Seconds from a spec/placement write (its file mtime, which Syncthing
+#: carries over from the writing node) to the end of the pass that
+#: converged it. Recent samples only, published in node.json.
+_converge_latencies: deque[float] = deque(maxlen=64)
+
 #: Cached publishable inventory plus the monotonic clock reading it was taken
 #: at. Process-global because sknoded is a single long-lived loop; a restart
 #: simply re-observes, which is the correct behaviour after an upgrade.
@@ -134,6 +157,41 @@ def node_inventory(*, now: float | None = None) -> dict:
     return deepcopy(_inventory_cache)
 
 
+def converge_latency() -> dict | None:
+    """Summary of recent write-to-converged latencies, None before the first."""
+    if not _converge_latencies:
+        return None
+    samples = list(_converge_latencies)
+    return {
+        "samples": len(samples),
+        "lastSeconds": round(samples[-1], 2),
+        "p50Seconds": round(statistics.median(samples), 2),
+        "maxSeconds": round(max(samples), 2),
+    }
+
+
+def reset_converge_latency() -> None:
+    """Forget latency samples (tests, daemon restart)."""
+    _converge_latencies.clear()
+
+
+def converge_changed(paths: FleetPaths, node: str, changed: dict[str, float], converge) -> dict:
+    """Converge only the *changed* services and record their latency.
+
+    Args:
+        changed: Service name -> mtime of its newest changed file.
+        converge: converge.converge_once (passed in so the lazy import and
+            test seams stay in main_loop).
+    """
+    out = converge(paths, node, services=set(changed))
+    done = time.time()
+    for name, result in out.get("services", {}).items():
+        written = changed.get(name, 0.0)
+        if written and "timeout" not in result:
+            _converge_latencies.append(max(0.0, done - written))
+    return out
+
+
 def build_heartbeat(node: str, now_iso: str) -> dict:
     """The one small heartbeat file, overwritten in place (R2)."""
     return {"kind": "Node", "name": node, "node": node, "ts": now_iso}
@@ -148,7 +206,7 @@ def build_node_report(paths: FleetPaths, node: str, now_iso: str) -> dict:
     conds.extend(probe_conditions(probes, now_iso))
     previous = store.read_node_file(paths, node, "node.json") or {}
     conds = merge_transitions(conds, previous.get("conditions", []))
-    return {
+    report = {
         "kind": "Node",
         "name": node,
         "node": node,
@@ -166,6 +224,10 @@ def build_node_report(paths: FleetPaths, node: str, now_iso: str) -> dict:
         },
         "conditions": conds,
     }
+    latency = converge_latency()
+    if latency is not None:
+        report["status"]["convergeLatency"] = latency
+    return report
 
 
 def build_join_request(paths: FleetPaths, node: str, capacity: dict, now_iso: str) -> dict:
@@ -203,24 +265,58 @@ def main_loop(
     interval: int = HEARTBEAT_INTERVAL_S,
     once: bool = False,
     actuation_interval: int | None = None,
+    watch: bool | None = None,
+    full_interval: int | None = None,
 ) -> None:
     """The daemon loop behind sknoded.service.
 
-    Self-report runs every `interval` seconds; the Phase 3 converge pass
-    runs every `actuation_interval` seconds (default 30, spec 3.3). The
-    converge pass re-reads the freeze flag and the node's actuate opt-in
-    every time, so both are live level-triggered gates.
+    Self-report runs every `interval` seconds. The Phase 3 converge pass
+    re-reads the freeze flag and the node's actuate opt-in every time, so
+    both are live level-triggered gates.
+
+    With `watch` on (the default, see WATCH_ENABLED), converge is driven
+    by desired-state changes: changed services are converged once their
+    burst of writes settles, a freeze or node-spec change triggers a full
+    pass, and a full pass also runs every `full_interval` seconds (default
+    FULL_PASS_INTERVAL_S). With it off, a full pass runs every
+    `actuation_interval` seconds (default 30, spec 3.3).
     """
     from .converge import ACTUATION_INTERVAL_S, converge_once
 
-    act_every = ACTUATION_INTERVAL_S if actuation_interval is None else actuation_interval
-    last_report = 0.0
-    while True:
-        now = time.time()
-        if now - last_report >= interval or last_report == 0.0:
-            run_once(paths, node)
-            last_report = now
-        converge_once(paths, node)
-        if once:
-            return
-        time.sleep(act_every)
+    use_watch = WATCH_ENABLED if watch is None else watch
+    if once or not use_watch:
+        act_every = ACTUATION_INTERVAL_S if actuation_interval is None else actuation_interval
+        last_report = 0.0
+        while True:
+            now = time.time()
+            if now - last_report >= interval or last_report == 0.0:
+                run_once(paths, node)
+                last_report = now
+            converge_once(paths, node)
+            if once:
+                return
+            time.sleep(act_every)
+
+    from .desired_watch import DesiredStateWatch
+
+    full_every = FULL_PASS_INTERVAL_S if full_interval is None else full_interval
+    watcher = DesiredStateWatch(paths, node)
+    last_report = last_full = 0.0
+    try:
+        while True:
+            now = time.time()
+            if now - last_report >= interval or last_report == 0.0:
+                run_once(paths, node)
+                last_report = now
+            if now - last_full >= full_every or last_full == 0.0:
+                watcher.drain()  # the full pass covers whatever was pending
+                converge_once(paths, node)
+                last_full = now
+            due = min(last_report + interval, last_full + full_every)
+            changes = watcher.wait(due - time.time())
+            if changes.full:
+                last_full = 0.0
+            elif changes.services:
+                converge_changed(paths, node, changes.services, converge_once)
+    finally:
+        watcher.close()
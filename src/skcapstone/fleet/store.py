@@ -4,18 +4,34 @@ Single-writer-per-file is the load-bearing invariant (spec 3.2). This
 module is the only code allowed to touch fleet files, and it enforces
 ownership at write time: operator role writes spec, sknoded writes only
 its own node's status subtree, scheduler (Phase 2) writes placements.
+
+Reads can be served from a materialized index (FleetIndex): inside
+``with indexed(paths):`` every spec, placement, status and node file is
+answered from memory after one incremental refresh, instead of one JSON
+parse per file per call. Controller passes and skfleet listings open
+that scope; outside it every read goes to disk exactly as before.
 """
 
 from __future__ import annotations
 
 import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Iterator
 
 from ..atomic_io import atomic_write_text
+from ..file_watch import IN_ISDIR, IN_Q_OVERFLOW, Inotify, is_racy
 from .paths import FleetPaths, valid_name
 
+logger = logging.getLogger("skcapstone.fleet.store")
+
 
 class OwnershipError(Exception):
     """A writer attempted a write outside its ownership boundary."""
@@ -96,7 +112,9 @@ def _load(path: Path) -> dict | None:
 
 def _dump(path: Path, payload: dict) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    atomic_write_text(path, json.dumps(payload, indent=2, sort_keys=True) + "\n")
+    text = json.dumps(payload, indent=2, sort_keys=True) + "\n"
+    atomic_write_text(path, text)
+    _note_write(path, text)
 
 
 def _writer_block(writer: Writer) -> dict:
@@ -220,12 +238,18 @@ def write_spec(
 
 def read_spec(paths: FleetPaths, kind: str, name: str) -> dict | None:
     """Read one spec file, or None when absent."""
+    index = _active_index(paths)
+    if index is not None:
+        return index.read(paths.spec_path(kind, name))
     return _load(paths.spec_path(kind, name))
 
 
 def list_specs(paths: FleetPaths, kind: str) -> list[dict]:
     """All specs of a kind, sorted by name. Zero objects cost nothing."""
     kind_dir = paths.objects / kind
+    index = _active_index(paths)
+    if index is not None:
+        return index.payloads(kind_dir)
     if not kind_dir.exists():
         return []
     out = []
@@ -291,6 +315,9 @@ def write_status(
 
 def read_status(paths: FleetPaths, kind: str, name: str, node: str) -> dict | None:
     """Read one node's status file for an object, or None."""
+    index = _active_index(paths)
+    if index is not None:
+        return index.read(paths.status_path(node, kind, name))
     return _load(paths.status_path(node, kind, name))
 
 
@@ -321,9 +348,30 @@ def write_node_file(
 
 def read_node_file(paths: FleetPaths, node: str, filename: str) -> dict | None:
     """Read a node-owned singleton file, or None."""
+    index = _active_index(paths)
+    if index is not None:
+        return index.read(paths.node_status_dir(node) / filename)
     return _load(paths.node_status_dir(node) / filename)
 
 
+def has_node_file(paths: FleetPaths, node: str, filename: str) -> bool:
+    """True when a node-owned singleton file exists (even if unparseable)."""
+    index = _active_index(paths)
+    if index is not None:
+        return index.exists(paths.node_status_dir(node) / filename)
+    return (paths.node_status_dir(node) / filename).exists()
+
+
+def status_nodes(paths: FleetPaths) -> list[str]:
+    """Names of every node with a status subtree, sorted."""
+    index = _active_index(paths)
+    if index is not None:
+        return index.subdirs(paths.status)
+    if not paths.status.exists():
+        return []
+    return sorted(p.name for p in paths.status.iterdir() if p.is_dir())
+
+
 def merged(paths: FleetPaths, kind: str, name: str) -> dict | None:
     """Assemble the object a reader sees: spec + placement + statuses.
 
@@ -333,14 +381,17 @@ def merged(paths: FleetPaths, kind: str, name: str) -> dict | None:
     spec = read_spec(paths, kind, name)
     if spec is None:
         return None
-    placement = _load(paths.placement_path(kind, name))
+    placement = read_placement(paths, kind, name)
+    index = _active_index(paths)
+    if index is not None:
+        found = index.statuses(kind, name)
+    else:
+        found = [read_status(paths, kind, name, node) for node in status_nodes(paths)]
     statuses: list[dict] = []
-    if paths.status.exists():
-        for node_dir in sorted(p for p in paths.status.iterdir() if p.is_dir()):
-            st = _load(node_dir / kind / f"{name}.json")
-            if st is not None:
-                st["stale"] = int(st.get("observedGeneration", 0)) < int(spec["generation"])
-                statuses.append(st)
+    for st in found:
+        if st is not None:
+            st["stale"] = int(st.get("observedGeneration", 0)) < int(spec["generation"])
+            statuses.append(st)
     return {"spec": spec, "placement": placement, "statuses": statuses}
 
 
@@ -453,11 +504,21 @@ def write_placement(
 
 def read_placement(paths: FleetPaths, kind: str, name: str) -> dict | None:
     """Read one placement record, or None when absent."""
+    index = _active_index(paths)
+    if index is not None:
+        return index.read(paths.placement_path(kind, name))
     return _load(paths.placement_path(kind, name))
 
 
 def list_placements(paths: FleetPaths, kind: str | None = None) -> list[dict]:
     """All placement records, sorted by (kind, name). Zero objects cost nothing."""
+    index = _active_index(paths)
+    if index is not None:
+        kinds = [kind] if kind is not None else index.subdirs(paths.placements)
+        out = []
+        for k in kinds:
+            out.extend(index.payloads(paths.placements / k))
+        return out
     if not paths.placements.exists():
         return []
     kinds = (
@@ -477,3 +538,316 @@ def list_placements(paths: FleetPaths, kind: str | None = None) -> list[dict]:
             if payload is not None:
                 out.append(payload)
     return out
+
+
+# ---------------------------------------------------------------------------
+# Materialized index
+# ---------------------------------------------------------------------------
+
+#: The top-level directories the index mirrors (the freeze file is read from
+#: disk on every check: a kill switch must never be served from memory).
+_INDEXED_TOPS = ("objects", "placements", "status")
+
+#: objects/<kind>/, placements/<kind>/, status/<node>/<kind>/ - no deeper.
+_INDEX_DEPTH = 3
+
+
+def _copy(value):
+    """Deep copy of a parsed JSON value; callers may mutate what they read."""
+    if type(value) is dict:
+        return {k: _copy(v) for k, v in value.items()}
+    if type(value) is list:
+        return [_copy(v) for v in value]
+    return value
+
+
+class FleetIndex:
+    """In-memory mirror of one fleet tree's JSON files, refreshed incrementally.
+
+    Every ``*.json`` under objects/, placements/ and status/ is held parsed,
+    per directory, with the ``(ino, mtime_ns, size)`` it was parsed at.
+    refresh() re-parses only files whose signature moved and forgets
+    removed ones. On Linux it keeps an inotify watch per directory and
+    rescans only directories that had events since the last refresh (the
+    drain is synchronous, so nothing written before refresh() is missed);
+    elsewhere, or when inotify is unavailable, every directory is
+    stat-scanned, which costs an lstat per file but no parse.
+
+    Syncthing conflict copies are never indexed, exactly as the direct
+    readers skip them (_is_conflict_copy): a conflict stays a finding for
+    the SyncConflict condition, never data.
+
+    Store writes update the mirror in place (_note_write), so a pass reads
+    its own writes without a refresh. Readers always get copies. Directories
+    are keyed by their path string: pathlib arithmetic would cost more than
+    the lookups it feeds.
+
+    Args:
+        paths: The fleet tree to mirror.
+        use_inotify: False forces stat scans.
+    """
+
+    def __init__(self, paths: FleetPaths, *, use_inotify: bool = True) -> None:
+        self.paths = paths
+        self._root = str(paths.root)
+        self._status = str(paths.status)
+        self._lock = threading.RLock()
+        #: dir -> {file name: (signature or None, payload or None)}
+        self._files: dict[str, dict[str, tuple]] = {}
+        #: dir -> sorted child directory names
+        self._subdirs: dict[str, list[str]] = {}
+        self._inotify = None
+        self._scanned = False
+        self.stats = {"refreshes": 0, "dirs_scanned": 0, "parsed": 0}
+        if use_inotify:
+            try:
+                self._inotify = Inotify()
+            except OSError as exc:
+                logger.debug("fleet index uses stat scans: %s", exc)
+
+    @property
+    def inotify(self) -> bool:
+        """True when refreshes are driven by inotify events."""
+        return self._inotify is not None
+
+    def close(self) -> None:
+        """Drop the inotify watches; the next refresh() is a full scan."""
+        with self._lock:
+            if self._inotify is not None:
+                self._inotify.close()
+                self._inotify = None
+            self._scanned = False
+
+    # -- refresh ------------------------------------------------------------
+
+    def refresh(self) -> None:
+        """Bring the mirror up to date with the tree on disk."""
+        with self._lock:
+            self.stats["refreshes"] += 1
+            now_ns = time.time_ns()
+            if self._inotify is None or not self._scanned:
+                self._scan(self._root, 0, now_ns, recursive=True)
+                self._scanned = self._root in self._files
+                return
+            dirty: set[str] = set()
+            for path, mask in self._inotify.read_events():
+                if mask & IN_Q_OVERFLOW:  # events were lost: start over
+                    self._scan(self._root, 0, now_ns, recursive=True)
+                    return
+                path_s = str(path)
+                if mask & IN_ISDIR or path_s in self._files:
+                    dirty.add(path_s)
+                dirty.add(os.path.dirname(path_s))
+            # Also revisit files parsed inside the racy window last time.
+            dirty.update(d for d, files in self._files.items() if _has_racy(files))
+            for d in sorted(dirty, key=len):
+                depth = self._depth_of(d)
+                if depth is None:
+                    continue
+                if d in self._files or os.path.dirname(d) in self._files:
+                    self._scan(d, depth, now_ns, recursive=False)
+
+    def _depth_of(self, d: str) -> int | None:
+        """Depth of *d* below the root when it is inside the mirrored scope."""
+        if d == self._root:
+            return 0
+        if not d.startswith(self._root + os.sep):
+            return None
+        rel = d[len(self._root) + 1 :].split(os.sep)
+        if rel[0] not in _INDEXED_TOPS or len(rel) > _INDEX_DEPTH:
+            return None
+        return len(rel)
+
+    def _scan(self, d: str, depth: int, now_ns: int, *, recursive: bool) -> None:
+        """Rescan one directory, then its new children (every child when *recursive*)."""
+        if self._inotify is not None:
+            self._inotify.add(Path(d))
+        try:
+            it = os.scandir(d)
+        except OSError:
+            self._forget(d)
+            return
+        self.stats["dirs_scanned"] += 1
+        old = self._files.get(d, {})
+        files: dict[str, tuple] = {}
+        subdirs: list[str] = []
+        with it:
+            for entry in it:
+                name = entry.name
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    continue
+                if is_dir:
+                    if depth == 0 and name not in _INDEXED_TOPS:
+                        continue
+                    if depth < _INDEX_DEPTH:
+                        subdirs.append(name)
+                    continue
+                if depth == 0 or not name.endswith(".json") or _CONFLICT_MARKER in name:
+                    continue
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                sig = (st.st_ino, st.st_mtime_ns, st.st_size)
+                prev = old.get(name)
+                if prev is not None and prev[0] == sig:
+                    files[name] = prev
+                    continue
+                self.stats["parsed"] += 1
+                payload = _load(Path(entry.path))
+                files[name] = (None if is_racy(st.st_mtime_ns, now_ns) else sig, payload)
+        subdirs.sort()
+        for gone in set(self._subdirs.get(d, ())) - set(subdirs):
+            self._forget(os.path.join(d, gone))
+        self._files[d] = files
+        self._subdirs[d] = subdirs
+        for name in subdirs:
+            child = os.path.join(d, name)
+            if recursive or child not in self._files:
+                self._scan(child, depth + 1, now_ns, recursive=recursive)
+
+    def _forget(self, d: str) -> None:
+        for child in self._subdirs.pop(d, ()):
+            self._forget(os.path.join(d, child))
+        self._files.pop(d, None)
+        if self._inotify is not None:
+            self._inotify.remove(Path(d))
+
+    # -- reads ----------------------------------------------------------------
+
+    def read(self, path: Path) -> dict | None:
+        """The parsed payload of one file, or None (absent or unparseable)."""
+        with self._lock:
+            entry = self._files.get(str(path.parent), {}).get(path.name)
+            return None if entry is None or entry[1] is None else _copy(entry[1])
+
+    def exists(self, path: Path) -> bool:
+        """True when *path* is indexed, whether or not it parsed."""
+        with self._lock:
+            return path.name in self._files.get(str(path.parent), {})
+
+    def payloads(self, d: Path) -> list[dict]:
+        """Every parseable payload in directory *d*, sorted by file name."""
+        with self._lock:
+            files = self._files.get(str(d), {})
+            return [_copy(files[n][1]) for n in sorted(files) if files[n][1] is not None]
+
+    def subdirs(self, d: Path) -> list[str]:
+        """Sorted child directory names of *d*."""
+        with self._lock:
+            return list(self._subdirs.get(str(d), ()))
+
+    def statuses(self, kind: str, name: str) -> list[dict]:
+        """Every node's status payload for one object, in node-name order."""
+        filename = f"{name}.json"
+        prefix, suffix = self._status + os.sep, os.sep + kind
+        out = []
+        with self._lock:
+            for node in self._subdirs.get(self._status, ()):
+                entry = self._files.get(prefix + node + suffix, {}).get(filename)
+                if entry is not None and entry[1] is not None:
+                    out.append(_copy(entry[1]))
+        return out
+
+    # -- writes -----------------------------------------------------------------
+
+    def note(self, path: Path, text: str) -> None:
+        """Record a store write (its JSON *text*) so the current pass reads it back."""
+        parent = str(path.parent)
+        with self._lock:
+            if parent not in self._files:
+                # A new directory: link it under the nearest mirrored
+                # ancestor so this pass sees it; refresh() fills in the rest.
+                chain = []
+                d = parent
+                while d not in self._files and d != self._root and self._depth_of(d):
+                    chain.append(d)
+                    d = os.path.dirname(d)
+                if d not in self._files or self._depth_of(parent) is None:
+                    return
+                for child in reversed(chain):
+                    names = self._subdirs.setdefault(d, [])
+                    if os.path.basename(child) not in names:
+                        names.append(os.path.basename(child))
+                        names.sort()
+                    self._files.setdefault(child, {})
+                    self._subdirs.setdefault(child, [])
+                    d = child
+            self._files[parent][path.name] = (None, json.loads(text))
+
+
+def _has_racy(files: dict[str, tuple]) -> bool:
+    return any(entry[0] is None for entry in files.values())
+
+
+_INDEXES: dict[Path, FleetIndex] = {}
+# Indexes entered by the current thread (or asyncio task), by root. Never
+# mutated in place: indexed() sets a new mapping and resets it on exit.
+_ACTIVE: ContextVar[dict[Path, FleetIndex]] = ContextVar("fleet_active_indexes", default={})
+_INDEX_LOCK = threading.Lock()
+
+#: SKFLEET_INDEX=0 turns indexed() into a no-op: every read goes to disk.
+INDEX_ENABLED = os.environ.get("SKFLEET_INDEX", "1").strip().lower() not in {"0", "false", "off"}
+
+
+def fleet_index(paths: FleetPaths) -> FleetIndex:
+    """The process-wide index for *paths* (created on first use)."""
+    with _INDEX_LOCK:
+        index = _INDEXES.get(paths.root)
+        if index is None:
+            index = _INDEXES[paths.root] = FleetIndex(paths)
+        return index
+
+
+@contextmanager
+def indexed(paths: FleetPaths) -> Iterator[FleetIndex | None]:
+    """Serve this tree's reads from its index for the duration of the block.
+
+    The scope belongs to the calling thread (or asyncio task): its
+    outermost entry refreshes the index once and nested entries share that
+    snapshot, while other threads keep reading from disk unless they enter
+    ``indexed()`` themselves. Writes made inside are visible to reads
+    inside. Changes by other processes show up on the next outermost entry.
+    Yields None (reads stay on disk) when INDEX_ENABLED is off.
+    """
+    if not INDEX_ENABLED:
+        yield None
+        return
+    index = fleet_index(paths)
+    active = _ACTIVE.get()
+    if active.get(paths.root) is index:
+        yield index
+        return
+    index.refresh()
+    token = _ACTIVE.set({**active, paths.root: index})
+    try:
+        yield index
+    finally:
+        _ACTIVE.reset(token)
+
+
+def reset_indexes() -> None:
+    """Drop every index (tests, and after a tree is replaced wholesale)."""
+    with _INDEX_LOCK:
+        for index in _INDEXES.values():
+            index.close()
+        _INDEXES.clear()
+
+
+def _active_index(paths: FleetPaths) -> FleetIndex | None:
+    active = _ACTIVE.get()
+    if not active:
+        return None
+    index = active.get(paths.root)
+    # A scope still open across reset_indexes() falls back to disk.
+    return index if index is not None and _INDEXES.get(paths.root) is index else None
+
+
+def _note_write(path: Path, text: str) -> None:
+    if not _INDEXES:
+        return
+    for root, index in list(_INDEXES.items()):
+        if path.is_relative_to(root):
+            index.note(path, text)
@@ -35,10 +35,14 @@ import platform
 import stat
 import subprocess
 import sys
+import threading
 import time
+from collections import OrderedDict
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from .file_watch import IN_CHANGES, IN_Q_OVERFLOW, Inotify, is_racy
 
 logger = logging.getLogger("skcapstone.fuse")
 
@@ -115,12 +119,13 @@ def _dir_stat(nlink: int = 2) -> Dict[str, Any]:
     }
 
 
-def _file_stat(size: int, writable: bool = False) -> Dict[str, Any]:
+def _file_stat(size: int, writable: bool = False, mtime: Optional[float] = None) -> Dict[str, Any]:
     """Build a stat dict for a virtual file.
 
     Args:
         size: File size in bytes.
         writable: Whether the file is writable (e.g., outbox files).
+        mtime: Modification time of the backing file; defaults to now.
 
     Returns:
         Stat dictionary suitable for FUSE Operations.getattr().
@@ -134,8 +139,8 @@ def _file_stat(size: int, writable: bool = False) -> Dict[str, Any]:
         "st_gid": os.getgid(),
         "st_size": size,
         "st_atime": ts,
-        "st_mtime": ts,
-        "st_ctime": ts,
+        "st_mtime": ts if mtime is None else mtime,
+        "st_ctime": ts if mtime is None else mtime,
     }
 
 
@@ -488,6 +493,206 @@ def _parse_path(path: str) -> Tuple[str, ...]:
     return tuple(p for p in path.strip("/").split("/") if p)
 
 
+# ---------------------------------------------------------------------------
+# Content / attribute cache
+# ---------------------------------------------------------------------------
+
+#: Kernel dentry and attribute cache lifetimes passed to the mount. The
+#: filesystem cannot push invalidations to the kernel, so these bound how
+#: long a rewritten memory may show its old size or a deleted one its name.
+ENTRY_TIMEOUT_S = 5.0
+ATTR_TIMEOUT_S = 5.0
+
+#: Rendered file contents kept in memory, by total size.
+CONTENT_CACHE_BYTES = 32 * 1024 * 1024
+#: File attributes (size, mtime) kept in memory, by count.
+ATTR_CACHE_ENTRIES = 100_000
+
+#: How often watched directories that do not exist yet are looked for.
+_ATTACH_INTERVAL_S = 1.0
+
+_Signature = Tuple[Optional[Tuple[int, int]], ...]
+
+
+def _signature(sources: Tuple[Path, ...]) -> _Signature:
+    """``(mtime_ns, size)`` of every source file, None for a missing one."""
+    out: List[Optional[Tuple[int, int]]] = []
+    for path in sources:
+        try:
+            st = path.stat()
+        except OSError:
+            out.append(None)
+            continue
+        out.append((st.st_mtime_ns, st.st_size))
+    return tuple(out)
+
+
+def _newest_mtime(sig: _Signature) -> Optional[float]:
+    """The newest source mtime in *sig* (epoch seconds), None if all missing."""
+    stamps = [s[0] for s in sig if s is not None]
+    return max(stamps) / 1e9 if stamps else None
+
+
+class _FSCache:
+    """Rendered contents, attributes and directory listings of a SovereignFS.
+
+    Tables map a virtual path to ``(sources, signature, trusted, value)``:
+    the real files the value was built from and their signature at the time.
+    A *trusted* entry has every source in a directory watched by inotify, so
+    a hit costs no syscalls and a change event drops it; anything else is
+    re-stat'ed on every hit and dropped when its signature moved.
+
+    Args:
+        watch_dirs: Directories whose changes invalidate entries.
+        use_inotify: Try inotify first; False forces stat validation.
+        max_bytes: Bound on the total size of cached contents.
+        max_attrs: Bound on the number of cached attribute entries.
+    """
+
+    _TABLES = ("content", "attr", "listing")
+
+    def __init__(
+        self,
+        watch_dirs: Tuple[Path, ...],
+        use_inotify: bool = True,
+        max_bytes: int = CONTENT_CACHE_BYTES,
+        max_attrs: int = ATTR_CACHE_ENTRIES,
+    ) -> None:
+        self._watch_dirs = watch_dirs
+        self._max_bytes = max_bytes
+        self._max_attrs = max_attrs
+        self._lock = threading.Lock()
+        self._tables: Dict[str, "OrderedDict[str, Tuple[Any, ...]]"] = {
+            t: OrderedDict() for t in self._TABLES
+        }
+        self._content_bytes = 0
+        self._by_source: Dict[Path, Set[Tuple[str, str]]] = {}
+        self._watched: Set[Path] = set()
+        self._next_attach = 0.0
+        self._inotify: Optional[Inotify] = None
+        if use_inotify:
+            try:
+                self._inotify = Inotify()
+            except OSError as exc:
+                logger.debug("inotify unavailable for the mount cache (%s); stat-checking", exc)
+        self.stats = {"hits": 0, "misses": 0, "invalidated": 0}
+
+    @property
+    def inotify(self) -> bool:
+        """True when entries are invalidated by inotify rather than stat."""
+        return self._inotify is not None
+
+    def close(self) -> None:
+        """Drop every entry and release the inotify descriptor."""
+        with self._lock:
+            self._clear()
+            if self._inotify is not None:
+                self._inotify.close()
+                self._inotify = None
+
+    # -- lookups ------------------------------------------------------------
+
+    def get(self, table: str, key: str) -> Any:
+        """The cached value for *key*, or None when absent or stale."""
+        with self._lock:
+            self._sync()
+            entries = self._tables[table]
+            entry = entries.get(key)
+            if entry is not None:
+                sources, sig, trusted, value = entry
+                if trusted or _signature(sources) == sig:
+                    entries.move_to_end(key)
+                    self.stats["hits"] += 1
+                    return value
+                self._drop(table, key)
+            self.stats["misses"] += 1
+            return None
+
+    def signature(self, sources: Tuple[Path, ...]) -> _Signature:
+        """Signature to pass to :meth:`put`; take it *before* reading the sources."""
+        return _signature(sources)
+
+    def put(
+        self, table: str, key: str, sources: Tuple[Path, ...], sig: _Signature, value: Any
+    ) -> None:
+        """Remember *value* for *key*, built from *sources* as of *sig*."""
+        with self._lock:
+            trusted = self._inotify is not None and all(
+                p.parent in self._watched or p in self._watched for p in sources
+            )
+            if not trusted:
+                now = time.time_ns()
+                if any(s is not None and is_racy(s[0], now) for s in sig):
+                    return
+            size = len(value) if table == "content" else 0
+            if size > self._max_bytes:
+                return
+            self._drop(table, key)
+            self._tables[table][key] = (sources, sig, trusted, value)
+            self._content_bytes += size
+            for path in sources:
+                self._by_source.setdefault(path, set()).add((table, key))
+            self._evict()
+
+    # -- bookkeeping ----------------------------------------------------------
+
+    def _sync(self) -> None:
+        """Watch directories that appeared and apply queued change events."""
+        if self._inotify is None:
+            return
+        now = time.monotonic()
+        if now >= self._next_attach:
+            self._next_attach = now + _ATTACH_INTERVAL_S
+            attached = False
+            for d in self._watch_dirs:
+                if d not in self._watched and self._inotify.add(d, IN_CHANGES):
+                    self._watched.add(d)
+                    attached = True
+            if attached:
+                self._clear()  # entries built while the directory was missing
+        for path, mask in self._inotify.read_events():
+            if mask & IN_Q_OVERFLOW or path in self._watch_dirs:
+                # Lost events, or a watched directory itself moved or vanished.
+                self._watched = self._inotify.watched()
+                self._next_attach = 0.0
+                self._clear()
+                continue
+            self._invalidate(path)
+            self._invalidate(path.parent)
+
+    def _invalidate(self, source: Path) -> None:
+        for table, key in list(self._by_source.get(source, ())):
+            self._drop(table, key)
+            self.stats["invalidated"] += 1
+
+    def _drop(self, table: str, key: str) -> None:
+        entry = self._tables[table].pop(key, None)
+        if entry is None:
+            return
+        if table == "content":
+            self._content_bytes -= len(entry[3])
+        for path in entry[0]:
+            keys = self._by_source.get(path)
+            if keys is not None:
+                keys.discard((table, key))
+                if not keys:
+                    del self._by_source[path]
+
+    def _evict(self) -> None:
+        content = self._tables["content"]
+        while self._content_bytes > self._max_bytes and content:
+            self._drop("content", next(iter(content)))
+        attrs = self._tables["attr"]
+        while len(attrs) > self._max_attrs:
+            self._drop("attr", next(iter(attrs)))
+
+    def _clear(self) -> None:
+        for entries in self._tables.values():
+            entries.clear()
+        self._by_source.clear()
+        self._content_bytes = 0
+
+
 # ---------------------------------------------------------------------------
 # SovereignFS
 # ---------------------------------------------------------------------------
@@ -508,11 +713,18 @@ class SovereignFS:
         fs = SovereignFS(agent_home=Path("~/.skcapstone").expanduser())
         fuse.FUSE(fs, mount_point, nothreads=True, foreground=True)
 
+    File contents, sizes and directory listings are cached per instance,
+    keyed by the backing files' mtime and size and invalidated through
+    inotify on the directories they live in (see ``_FSCache``), so an
+    ``ls -l`` of a memory layer renders each memory once rather than on
+    every ``stat``.
+
     Args:
         agent_home: Sovereign agent home directory.
+        cache: Cache contents, attributes and listings (default True).
     """
 
-    def __init__(self, agent_home: Path) -> None:
+    def __init__(self, agent_home: Path, *, cache: bool = True) -> None:
         self._home = agent_home
         from . import active_agent_name
 
@@ -530,6 +742,23 @@ class SovereignFS:
             self._memory_dir = agent_home / "memory"
         # Buffer for outbox writes: maps virtual path → bytes written so far
         self._outbox_buffers: Dict[str, bytes] = {}
+        self._capauth_profile = Path("~/.capauth/profile.json").expanduser()
+        self._cache: Optional[_FSCache] = None
+        if cache:
+            watch_dirs = tuple(self._memory_dir / v for v in _LAYER_SLUG_TO_VALUE.values())
+            watch_dirs += (
+                agent_home,
+                agent_home / "comms" / "inbox",
+                agent_home / "documents",
+                agent_home / "coordination" / "tasks",
+                self._capauth_profile.parent,
+            )
+            self._cache = _FSCache(watch_dirs)
+
+    @property
+    def cache_stats(self) -> Optional[Dict[str, int]]:
+        """Cache hit/miss/invalidation counters, or None when caching is off."""
+        return dict(self._cache.stats) if self._cache is not None else None
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -598,6 +827,108 @@ class SovereignFS:
 
         return None
 
+    def _sources(self, parts: Tuple[str, ...]) -> Optional[Tuple[Path, ...]]:
+        """Real files a virtual file is rendered from, None when it is not cacheable.
+
+        Args:
+            parts: Parsed path components.
+
+        Returns:
+            Tuple of backing file paths, or None (outbox buffers, unknown paths).
+        """
+        if len(parts) == 3 and parts[0] == _MEMORIES_DIR:
+            layer_value = _LAYER_SLUG_TO_VALUE.get(parts[1])
+            if not layer_value:
+                return None
+            memory_id = parts[2][:-3] if parts[2].endswith(".md") else parts[2]
+            return (self._memory_dir / layer_value / f"{memory_id}.json",)
+        if len(parts) != 2:
+            return None
+        top, name = parts
+        if top == _IDENTITY_DIR:
+            return (self._capauth_profile, self._home / "manifest.json")
+        if top == _INBOX_DIR:
+            return (self._home / "comms" / "inbox" / name,)
+        if top == _DOCUMENTS_DIR:
+            return (self._home / "documents" / name,)
+        if top == _COORDINATION_DIR:
+            return (self._home / "coordination" / "tasks" / name,)
+        return None
+
+    def _file_content(self, parts: Tuple[str, ...]) -> Optional[bytes]:
+        """Resolve file content through the cache.
+
+        Args:
+            parts: Parsed path components.
+
+        Returns:
+            File content as bytes, or None if the path is not a file.
+        """
+        if self._cache is None:
+            return self._resolve_file_content(parts)
+        key = "/".join(parts)
+        content = self._cache.get("content", key)
+        if content is not None:
+            return content
+        sources = self._sources(parts)
+        if sources is None:
+            return self._resolve_file_content(parts)
+        sig = self._cache.signature(sources)
+        content = self._resolve_file_content(parts)
+        if content is not None:
+            self._cache.put("content", key, sources, sig, content)
+        return content
+
+    def _file_attrs(self, parts: Tuple[str, ...]) -> Optional[Tuple[int, Optional[float]]]:
+        """Size and backing mtime of a virtual file, through the cache.
+
+        Args:
+            parts: Parsed path components.
+
+        Returns:
+            ``(size, mtime)`` where mtime is None when the file has no
+            backing file (or caching is off), or None if the path is not a file.
+        """
+        if self._cache is not None:
+            key = "/".join(parts)
+            attrs = self._cache.get("attr", key)
+            if attrs is not None:
+                return attrs
+            sources = self._sources(parts)
+            if sources is not None:
+                sig = self._cache.signature(sources)
+                content = self._file_content(parts)
+                if content is None:
+                    return None
+                attrs = (len(content), _newest_mtime(sig))
+                self._cache.put("attr", key, sources, sig, attrs)
+                return attrs
+        content = self._resolve_file_content(parts)
+        return None if content is None else (len(content), None)
+
+    def _listing(
+        self, parts: Tuple[str, ...], source: Path, lister: Callable[[], List[str]]
+    ) -> List[str]:
+        """List a directory backed by *source*, through the cache.
+
+        Args:
+            parts: Parsed path components of the virtual directory.
+            source: Real directory the listing is read from.
+            lister: Produces the listing on a miss.
+
+        Returns:
+            List of entry names (without ``.`` and ``..``).
+        """
+        if self._cache is None:
+            return lister()
+        key = "/".join(parts)
+        names = self._cache.get("listing", key)
+        if names is None:
+            sig = self._cache.signature((source,))
+            names = lister()
+            self._cache.put("listing", key, (source,), sig, names)
+        return names
+
     def _is_dir(self, parts: Tuple[str, ...]) -> bool:
         """Check if a set of path components resolves to a virtual directory.
 
@@ -629,7 +960,7 @@ class SovereignFS:
         Returns:
             True if the path is a valid virtual file.
         """
-        return self._resolve_file_content(parts) is not None
+        return self._file_attrs(parts) is not None
 
     def _file_size(self, parts: Tuple[str, ...]) -> int:
         """Return the byte size of a virtual file.
@@ -640,8 +971,8 @@ class SovereignFS:
         Returns:
             Size in bytes (0 if content is unavailable).
         """
-        content = self._resolve_file_content(parts)
-        return len(content) if content is not None else 0
+        attrs = self._file_attrs(parts)
+        return attrs[0] if attrs is not None else 0
 
     # ------------------------------------------------------------------
     # FUSE Operations
@@ -670,10 +1001,10 @@ class SovereignFS:
             )
             return _dir_stat(nlink=nlink)
 
-        if self._is_file(parts):
-            size = self._file_size(parts)
+        attrs = self._file_attrs(parts)
+        if attrs is not None:
             writable = bool(parts) and parts[0] == _OUTBOX_DIR
-            return _file_stat(size=size, writable=writable)
+            return _file_stat(size=attrs[0], writable=writable, mtime=attrs[1])
 
         raise OSError(errno.ENOENT, "No such file or directory", path)
 
@@ -708,8 +1039,15 @@ class SovereignFS:
             slug = parts[1]
             layer_value = _LAYER_SLUG_TO_VALUE.get(slug)
             if layer_value:
-                ids = _list_memory_ids(self._memory_dir, layer_value)
-                entries.extend(f"{mid}.md" for mid in ids)
+                entries.extend(
+                    self._listing(
+                        parts,
+                        self._memory_dir / layer_value,
+                        lambda: [
+                            f"{mid}.md" for mid in _list_memory_ids(self._memory_dir, layer_value)
+                        ],
+                    )
+                )
             return entries
 
         if top == _IDENTITY_DIR and len(parts) == 1:
@@ -717,7 +1055,11 @@ class SovereignFS:
             return entries
 
         if top == _INBOX_DIR and len(parts) == 1:
-            entries.extend(_list_inbox(self._home))
+            entries.extend(
+                self._listing(
+                    parts, self._home / "comms" / "inbox", lambda: _list_inbox(self._home)
+                )
+            )
             return entries
 
         if top == _OUTBOX_DIR and len(parts) == 1:
@@ -727,11 +1069,19 @@ class SovereignFS:
             return entries
 
         if top == _DOCUMENTS_DIR and len(parts) == 1:
-            entries.extend(_list_documents(self._home))
+            entries.extend(
+                self._listing(parts, self._home / "documents", lambda: _list_documents(self._home))
+            )
             return entries
 
         if top == _COORDINATION_DIR and len(parts) == 1:
-            entries.extend(_list_coordination_tasks(self._home))
+            entries.extend(
+                self._listing(
+                    parts,
+                    self._home / "coordination" / "tasks",
+                    lambda: _list_coordination_tasks(self._home),
+                )
+            )
             return entries
 
         raise OSError(errno.ENOENT, "No such file or directory", path)
@@ -784,7 +1134,7 @@ class SovereignFS:
             OSError: With ``errno.ENOENT`` if the path is not a file.
         """
         parts = _parse_path(path)
-        content = self._resolve_file_content(parts)
+        content = self._file_content(parts)
         if content is None:
             raise OSError(errno.ENOENT, "No such file or directory", path)
         return content[offset : offset + size]
@@ -912,6 +1262,15 @@ class SovereignFS:
         buf = self._outbox_buffers.get(path, b"")
         self._outbox_buffers[path] = buf[:length]
 
+    def destroy(self, path: str) -> None:
+        """Release the cache's inotify descriptor when the filesystem is unmounted.
+
+        Args:
+            path: Mount point (unused).
+        """
+        if self._cache is not None:
+            self._cache.close()
+
     # Pass-through stubs for operations that the kernel may call
     def chmod(self, path: str, mode: int) -> int:
         """Ignore chmod on the virtual filesystem."""
@@ -1076,6 +1435,8 @@ class FUSEDaemon:
                     nothreads=True,
                     foreground=True,
                     allow_other=False,
+                    entry_timeout=ENTRY_TIMEOUT_S,
+                    attr_timeout=ATTR_TIMEOUT_S,
                 )
                 return True
             except Exception as exc:
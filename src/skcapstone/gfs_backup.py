@@ -22,6 +22,12 @@ primitive (:func:`~skcapstone.backup.create_backup`):
    configurable freshness threshold.  :func:`make_backup_monitor_task` wraps it as
    a zero-arg scheduler callback that logs and (best-effort) fires an ``sk-alert``.
 
+With ``dedup`` enabled the job passes the newest artifact to
+:func:`~skcapstone.backup.create_backup` as a dedup base, so unchanged files are
+referenced rather than stored again.  The first artifact of each calendar month
+(the grandfather) is always a full archive, so references never cross a month,
+and pruning keeps any artifact a kept artifact still references.
+
 All destinations and thresholds are config-driven (``config/config.yaml`` under a
 ``backup:`` block, overridable by environment variables) with safe defaults.  The
 job is safe to re-run and never deletes anything outside its own backup directory.
@@ -177,14 +183,14 @@ def discover_artifacts(backup_dir: Path) -> list[BackupArtifact]:
     if not backup_dir.is_dir():
         return []
 
+    root = backup_dir.resolve()
     artifacts: list[BackupArtifact] = []
-    for child in backup_dir.iterdir():
-        if not child.is_file():
-            continue
-        ts = parse_backup_timestamp(child.name)
-        if ts is None:
-            continue
-        artifacts.append(BackupArtifact(path=child.resolve(), timestamp=ts))
+    with os.scandir(root) as it:
+        for entry in it:
+            ts = parse_backup_timestamp(entry.name)
+            if ts is None or not entry.is_file():
+                continue
+            artifacts.append(BackupArtifact(path=root / entry.name, timestamp=ts))
 
     artifacts.sort(key=lambda a: a.timestamp, reverse=True)
     return artifacts
@@ -295,6 +301,40 @@ def select_gfs_retention(
     return keep, prune
 
 
+def protect_referenced(
+    keep: list[BackupArtifact],
+    prune: list[BackupArtifact],
+) -> tuple[list[BackupArtifact], list[BackupArtifact]]:
+    """Move artifacts that kept (deduplicated) artifacts reference into *keep*.
+
+    A deduplicated artifact's manifest copy names the artifacts holding its
+    unchanged files; pruning those would make it unrestorable.
+
+    Args:
+        keep: Artifacts selected for keeping.
+        prune: Artifacts selected for pruning.
+
+    Returns:
+        The adjusted ``(keep, prune)`` tuple, each sorted newest-first.
+    """
+    from .backup import read_backup_manifest
+
+    if not prune:
+        return keep, prune
+    needed: set[str] = set()
+    for art in keep:
+        manifest = read_backup_manifest(art.path)
+        if manifest is not None:
+            needed.update(manifest.references.values())
+    if not needed:
+        return keep, prune
+    moved = [a for a in prune if a.path.name[: -len(".tar.gz")] in needed]
+    if moved:
+        logger.info("Keeping %d artifact(s) still referenced by deduplicated backups", len(moved))
+    keep = sorted(keep + moved, key=lambda a: a.timestamp, reverse=True)
+    return keep, [a for a in prune if a not in moved]
+
+
 def prune_artifacts(
     prune: list[BackupArtifact],
     backup_dir: Path,
@@ -306,7 +346,8 @@ def prune_artifacts(
     Each candidate path is resolved and confirmed to live directly inside the
     resolved *backup_dir* and to match the backup naming convention before it is
     unlinked.  Any path failing those checks is skipped and logged - the job can
-    never delete outside its own directory.
+    never delete outside its own directory.  A deleted artifact's manifest copy
+    (``<backup_id>.manifest.json``) is removed with it.
 
     Args:
         prune: Artifacts selected for deletion by :func:`select_gfs_retention`.
@@ -316,6 +357,8 @@ def prune_artifacts(
     Returns:
         List of filenames actually deleted (or that would be, when *dry_run*).
     """
+    from .backup import manifest_path_for
+
     root = Path(backup_dir).resolve()
     deleted: list[str] = []
     for art in prune:
@@ -332,6 +375,8 @@ def prune_artifacts(
             deleted.append(path.name)
         except OSError as exc:
             logger.warning("Failed to prune %s: %s", path, exc)
+            continue
+        manifest_path_for(path).unlink(missing_ok=True)
     return deleted
 
 
@@ -351,6 +396,9 @@ class BackupJobConfig:
         min_interval_seconds: Skip creating a new backup when the newest existing
             one is younger than this (``0`` = always create).
         agent_name: Agent name recorded in the backup manifest.
+        dedup: Reference files unchanged since the previous artifact of the
+            same month instead of storing them again.
+        workers: Compression threads (``0`` = one per core, max 8).
     """
 
     backup_dir: Path
@@ -358,6 +406,8 @@ class BackupJobConfig:
     max_age_seconds: float = DEFAULT_MAX_AGE_SECONDS
     min_interval_seconds: float = DEFAULT_MIN_INTERVAL_SECONDS
     agent_name: str = ""
+    dedup: bool = False
+    workers: int = 0
     extra: dict[str, Any] = field(default_factory=dict)
 
 
@@ -428,6 +478,8 @@ def resolve_config(
         ``keep_yearly`` / ``SKCAPSTONE_BACKUP_KEEP_YEARLY``
         ``max_age_seconds`` / ``SKCAPSTONE_BACKUP_MAX_AGE_SECONDS``
         ``min_interval_seconds`` / ``SKCAPSTONE_BACKUP_MIN_INTERVAL_SECONDS``
+        ``dedup`` / ``SKCAPSTONE_BACKUP_DEDUP``
+        ``workers`` / ``SKCAPSTONE_BACKUP_WORKERS``
 
     Args:
         home: Agent home directory (source of ``config.yaml`` and the default
@@ -487,9 +539,18 @@ def resolve_config(
             )
         ),
         agent_name=agent_name,
+        dedup=_truthy(pick("dedup", "SKCAPSTONE_BACKUP_DEDUP", False, str)),
+        workers=int(pick("workers", "SKCAPSTONE_BACKUP_WORKERS", 0, int)),
     )
 
 
+def _truthy(value: Any) -> bool:
+    """Interpret a YAML/env flag value."""
+    if isinstance(value, str):
+        return value.strip().lower() in {"1", "true", "yes", "on"}
+    return bool(value)
+
+
 # ---------------------------------------------------------------------------
 # State sidecar
 # ---------------------------------------------------------------------------
@@ -552,7 +613,10 @@ def run_backup_job(
            younger than it, skip creation (still records state) - extra idempotency.
         3. Otherwise call :func:`~skcapstone.backup.create_backup` writing into the
            configured backup dir.
-        4. Re-scan the dir and prune per :func:`select_gfs_retention`.
+           With ``dedup`` on, the newest artifact is the dedup base unless it is
+           from an earlier month (the month's first artifact is always full).
+        4. Prune per :func:`select_gfs_retention`, keeping artifacts that kept
+           deduplicated artifacts reference (:func:`protect_referenced`).
         5. Write the ``gfs-state.json`` sidecar and return a status dict.
 
     A failure in the underlying backup is caught and recorded in state (so the
@@ -567,7 +631,8 @@ def run_backup_job(
     Returns:
         Status dict with keys: ``created`` (bool), ``backup_id``, ``filepath``,
         ``kept`` (count), ``pruned`` (count), ``pruned_files`` (list),
-        ``backup_dir``, ``skipped`` (bool), ``error`` (str|None).
+        ``backup_dir``, ``skipped`` (bool), ``error`` (str|None), and for a
+        created artifact ``base_backup`` (str|None) and ``referenced`` (count).
     """
     from . import AGENT_HOME
 
@@ -588,7 +653,7 @@ def run_backup_job(
                 age,
                 cfg.min_interval_seconds,
             )
-            keep, prune = select_gfs_retention(existing, cfg.policy)
+            keep, prune = protect_referenced(*select_gfs_retention(existing, cfg.policy))
             pruned_files = prune_artifacts(prune, backup_dir)
             result = {
                 "created": False,
@@ -606,6 +671,12 @@ def run_backup_job(
 
     from .backup import create_backup
 
+    base: Optional[Path] = None
+    if cfg.dedup and existing:
+        newest = existing[0]
+        if (newest.timestamp.year, newest.timestamp.month) == (now.year, now.month):
+            base = newest.path
+
     error: Optional[str] = None
     backup_result: dict[str, Any] = {}
     try:
@@ -613,6 +684,8 @@ def run_backup_job(
             home=home_path,
             output_dir=backup_dir,
             agent_name=cfg.agent_name,
+            base=base,
+            workers=cfg.workers or None,
         )
     except Exception as exc:  # noqa: BLE001 - record then re-raise
         error = str(exc)
@@ -631,9 +704,13 @@ def run_backup_job(
         _record_run_state(backup_dir, result, now, ok=False)
         raise
 
-    # Re-scan (now includes the just-written artifact) and prune.
-    artifacts = discover_artifacts(backup_dir)
-    keep, prune = select_gfs_retention(artifacts, cfg.policy)
+    # The listing from before the run plus the artifact just written.
+    created = Path(backup_result["filepath"]).resolve()
+    artifacts = list(existing)
+    created_ts = parse_backup_timestamp(created.name)
+    if created_ts is not None:
+        artifacts.append(BackupArtifact(path=created, timestamp=created_ts))
+    keep, prune = protect_referenced(*select_gfs_retention(artifacts, cfg.policy))
     pruned_files = prune_artifacts(prune, backup_dir)
 
     result = {
@@ -646,6 +723,8 @@ def run_backup_job(
         "pruned_files": pruned_files,
         "backup_dir": str(backup_dir),
         "error": None,
+        "base_backup": backup_result["manifest"].get("base_backup") or None,
+        "referenced": backup_result.get("referenced_count", 0),
     }
     _record_run_state(backup_dir, result, now, ok=True)
     logger.info(
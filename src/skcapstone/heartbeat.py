@@ -16,11 +16,19 @@ Architecture:
     ├── grok.json         # Peer heartbeat
     └── ...
 
+Peer discovery reads through a process-wide cache per heartbeat
+directory. A file is parsed again only when its mtime or size changes.
+The changed files come from inotify where available, otherwise from a
+stat scan. Age and liveness are computed at read time from the cached
+timestamp, ``find_capable`` uses a capability -> peers index, and
+``subscribe()`` delivers peer up/down transitions to callers.
+
 Usage:
     beacon = HeartbeatBeacon(home, agent_name="opus")
     beacon.pulse()                    # Publish heartbeat
     peers = beacon.discover_peers()   # Find live peers
     health = beacon.mesh_health()     # Network overview
+    beacon.subscribe(lambda event, peer: ...)  # "up" / "down"
 """
 
 from __future__ import annotations
@@ -30,12 +38,16 @@ import logging
 import os
 import platform
 import shutil
+import threading
+import time
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 from pydantic import BaseModel, Field, field_validator
 
+from .file_watch import IN_Q_OVERFLOW, Inotify, stable_signature
+
 logger = logging.getLogger("skcapstone.heartbeat")
 
 DEFAULT_TTL_SECONDS = 300  # 5 minutes
@@ -161,6 +173,233 @@ class MeshHealth(BaseModel):
     collected_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 
+# ---------------------------------------------------------------------------
+# Peer cache
+# ---------------------------------------------------------------------------
+
+PeerCallback = Callable[[str, PeerInfo], None]
+
+
+def _peer_info(hb: Heartbeat, now: float) -> PeerInfo:
+    """PeerInfo for *hb* as of *now* (epoch seconds)."""
+    published = hb.timestamp.timestamp()
+    alive = now <= published + hb.ttl_seconds
+    return PeerInfo(
+        agent_name=hb.agent_name,
+        status=hb.status if alive else "offline",
+        alive=alive,
+        age_seconds=round(now - published, 1),
+        hostname=hb.hostname,
+        capabilities=[c.name for c in hb.capabilities if c.enabled],
+        soul_active=hb.soul_active,
+        claimed_tasks=len(hb.claimed_tasks),
+        services=[s.name for s in hb.services],
+        tailscale_ip=hb.tailscale_ip,
+    )
+
+
+def _reachable(hb: Optional[Heartbeat], now: float) -> bool:
+    """Up for subscribers: within TTL and not announced offline."""
+    return (
+        hb is not None
+        and hb.status != "offline"
+        and now <= hb.timestamp.timestamp() + hb.ttl_seconds
+    )
+
+
+class _PeerCache:
+    """Parsed heartbeats of one directory, refreshed incrementally.
+
+    Entries map a file name to ``(signature, heartbeat)``, where the
+    signature is ``(mtime_ns, size)`` (None inside the racy window) and the
+    heartbeat is None for a file that failed to parse, so a broken file
+    is reported once per change rather than on every read.
+    """
+
+    def __init__(self, directory: Path, use_inotify: bool = True) -> None:
+        self.directory = directory
+        self._lock = threading.RLock()
+        self._entries: dict[str, tuple[Optional[tuple[int, int]], Optional[Heartbeat]]] = {}
+        self._by_capability: dict[str, set[str]] = {}
+        self._up: dict[str, bool] = {}
+        self._subscribers: list[PeerCallback] = []
+        self._scanned = False
+        self._inotify: Optional[Inotify] = None
+        if use_inotify:
+            try:
+                self._inotify = Inotify()
+            except OSError as exc:
+                logger.debug("inotify unavailable for heartbeats (%s); stat-scanning", exc)
+        self.stats = {"refreshes": 0, "parsed": 0}
+
+    # -- refresh ------------------------------------------------------------
+
+    def refresh(self) -> None:
+        """Bring the cache up to date and notify subscribers of transitions."""
+        with self._lock:
+            self.stats["refreshes"] += 1
+            names = self._changed_names()
+            if names is None:
+                self._full_scan()
+            else:
+                for name in names:
+                    self._update(name)
+            transitions = self._transitions(time.time())
+            subscribers = list(self._subscribers)
+        for event, peer in transitions:
+            for callback in subscribers:
+                try:
+                    callback(event, peer)
+                except Exception as exc:
+                    logger.warning("Peer %s callback failed: %s", event, exc)
+
+    def _changed_names(self) -> Optional[set[str]]:
+        """File names to revisit, or None when everything must be rescanned."""
+        if self._inotify is None or not self._scanned:
+            return None
+        names = {n for n, (sig, _) in self._entries.items() if sig is None}
+        for path, mask in self._inotify.read_events():
+            if mask & IN_Q_OVERFLOW or path == self.directory:
+                return None  # overflow, or the directory itself moved/vanished
+            names.add(path.name)
+        return names
+
+    def _full_scan(self) -> None:
+        if self._inotify is not None and self.directory not in self._inotify.watched():
+            self._inotify.add(self.directory)
+        seen: set[str] = set()
+        try:
+            with os.scandir(self.directory) as it:
+                names = [e.name for e in it if e.name.endswith(".json")]
+        except OSError:
+            names = []
+        for name in names:
+            seen.add(name)
+            self._update(name)
+        for name in set(self._entries) - seen:
+            self._forget(name)
+        self._scanned = True
+
+    def _update(self, name: str) -> None:
+        if not name.endswith(".json"):
+            return
+        path = self.directory / name
+        try:
+            st = path.stat()
+        except OSError:
+            self._forget(name)
+            return
+        sig = stable_signature(st)
+        old = self._entries.get(name)
+        if old is not None and sig is not None and old[0] == sig:
+            return
+        try:
+            hb: Optional[Heartbeat] = Heartbeat.model_validate_json(
+                path.read_text(encoding="utf-8")
+            )
+        except FileNotFoundError:
+            self._forget(name)
+            return
+        except Exception as exc:
+            logger.warning("Cannot parse heartbeat %s: %s", name, exc)
+            hb = None
+        self.stats["parsed"] += 1
+        self._forget(name)
+        self._entries[name] = (sig, hb)
+        if hb is not None:
+            for cap in hb.capabilities:
+                if cap.enabled:
+                    self._by_capability.setdefault(cap.name, set()).add(name)
+
+    def _forget(self, name: str) -> None:
+        old = self._entries.pop(name, None)
+        if old is None or old[1] is None:
+            return
+        for cap in old[1].capabilities:
+            holders = self._by_capability.get(cap.name)
+            if holders is not None:
+                holders.discard(name)
+                if not holders:
+                    del self._by_capability[cap.name]
+
+    def _transitions(self, now: float) -> list[tuple[str, PeerInfo]]:
+        out: list[tuple[str, PeerInfo]] = []
+        for name in sorted(set(self._up) | set(self._entries)):
+            hb = self._entries.get(name, (None, None))[1]
+            up = _reachable(hb, now)
+            if up != self._up.get(name, False):
+                if hb is not None:
+                    peer = _peer_info(hb, now)
+                else:
+                    peer = PeerInfo(
+                        agent_name=name[: -len(".json")],
+                        status="offline",
+                        alive=False,
+                        age_seconds=0.0,
+                    )
+                out.append(("up" if up else "down", peer))
+            if up:
+                self._up[name] = True
+            else:
+                self._up.pop(name, None)
+        return out
+
+    # -- reads --------------------------------------------------------------
+
+    def heartbeats(self) -> list[tuple[str, Heartbeat]]:
+        """(file stem, heartbeat) for every parseable file, in file-name order."""
+        with self._lock:
+            return [
+                (name[: -len(".json")], hb)
+                for name, (_, hb) in sorted(self._entries.items())
+                if hb is not None
+            ]
+
+    def holders(self, capability: str) -> list[Heartbeat]:
+        """Heartbeats advertising *capability* (enabled), in file-name order."""
+        with self._lock:
+            names = sorted(self._by_capability.get(capability, ()))
+            return [self._entries[n][1] for n in names]
+
+    def subscribe(self, callback: PeerCallback) -> Callable[[], None]:
+        with self._lock:
+            self._subscribers.append(callback)
+
+        def unsubscribe() -> None:
+            with self._lock:
+                if callback in self._subscribers:
+                    self._subscribers.remove(callback)
+
+        return unsubscribe
+
+    def close(self) -> None:
+        with self._lock:
+            if self._inotify is not None:
+                self._inotify.close()
+                self._inotify = None
+
+
+_peer_caches: dict[str, _PeerCache] = {}
+_peer_caches_lock = threading.Lock()
+
+
+def _peer_cache(directory: Path) -> _PeerCache:
+    key = str(directory.absolute())
+    with _peer_caches_lock:
+        cache = _peer_caches.get(key)
+        if cache is None:
+            cache = _peer_caches[key] = _PeerCache(directory)
+        return cache
+
+
+def clear_peer_caches() -> None:
+    """Drop every cached heartbeat directory (and its subscribers) in this process."""
+    with _peer_caches_lock:
+        for cache in _peer_caches.values():
+            cache.close()
+        _peer_caches.clear()
+
+
 # ---------------------------------------------------------------------------
 # HeartbeatBeacon
 # ---------------------------------------------------------------------------
@@ -175,6 +414,8 @@ class HeartbeatBeacon:
         home: Agent home directory (~/.skcapstone).
         agent_name: Name of the local agent.
         ttl_seconds: Heartbeat TTL before considered stale.
+        cache: Read peers through the process-wide peer cache. False
+            parses every heartbeat file on every call.
     """
 
     def __init__(
@@ -183,6 +424,7 @@ class HeartbeatBeacon:
         agent_name: str = "anonymous",
         ttl_seconds: int = DEFAULT_TTL_SECONDS,
         heartbeats_dir: Optional[Path] = None,
+        cache: bool = True,
     ) -> None:
         if not agent_name or not agent_name.strip():
             raise ValueError("agent_name must be a non-empty string, got %r" % agent_name)
@@ -191,6 +433,7 @@ class HeartbeatBeacon:
         self._ttl = ttl_seconds
         self._heartbeat_dir = Path(heartbeats_dir) if heartbeats_dir else home / "heartbeats"
         self._start_time = datetime.now(timezone.utc)
+        self._cache = cache
 
     def initialize(self) -> None:
         """Create the heartbeat directory."""
@@ -297,8 +540,17 @@ class HeartbeatBeacon:
             List of PeerInfo for all discovered agents.
         """
         self.initialize()
-        peers: list[PeerInfo] = []
+        if not self._cache:
+            return self._discover_uncached(include_self)
+        now = time.time()
+        return [
+            _peer_info(hb, now)
+            for stem, hb in self._peers().heartbeats()
+            if include_self or stem != self._agent
+        ]
 
+    def _discover_uncached(self, include_self: bool) -> list[PeerInfo]:
+        peers: list[PeerInfo] = []
         for f in sorted(self._heartbeat_dir.glob("*.json")):
             if f.name.endswith(".tmp"):
                 continue
@@ -309,25 +561,18 @@ class HeartbeatBeacon:
 
             try:
                 hb = Heartbeat.model_validate_json(f.read_text(encoding="utf-8"))
-                peers.append(
-                    PeerInfo(
-                        agent_name=hb.agent_name,
-                        status=hb.status if hb.is_alive else "offline",
-                        alive=hb.is_alive,
-                        age_seconds=round(hb.age_seconds, 1),
-                        hostname=hb.hostname,
-                        capabilities=[c.name for c in hb.capabilities if c.enabled],
-                        soul_active=hb.soul_active,
-                        claimed_tasks=len(hb.claimed_tasks),
-                        services=[s.name for s in hb.services],
-                        tailscale_ip=hb.tailscale_ip,
-                    )
-                )
+                peers.append(_peer_info(hb, time.time()))
             except Exception as exc:
                 logger.warning("Cannot parse heartbeat %s: %s", f.name, exc)
 
         return peers
 
+    def _peers(self) -> _PeerCache:
+        """The shared cache for this beacon's directory, refreshed."""
+        cache = _peer_cache(self._heartbeat_dir)
+        cache.refresh()
+        return cache
+
     def mesh_health(self) -> MeshHealth:
         """Get overall mesh health summary.
 
@@ -361,8 +606,30 @@ class HeartbeatBeacon:
         Returns:
             List of alive peers with the capability.
         """
-        peers = self.discover_peers(include_self=True)
-        return [p for p in peers if p.alive and capability in p.capabilities]
+        self.initialize()
+        if not self._cache:
+            peers = self._discover_uncached(include_self=True)
+            return [p for p in peers if p.alive and capability in p.capabilities]
+        now = time.time()
+        peers = [_peer_info(hb, now) for hb in self._peers().holders(capability)]
+        return [p for p in peers if p.alive]
+
+    def subscribe(self, callback: PeerCallback) -> Callable[[], None]:
+        """Call ``callback(event, peer)`` when a peer goes "up" or "down".
+
+        A peer is up while its heartbeat is within TTL and its status is
+        not "offline". Transitions are detected whenever this directory's
+        peer cache refreshes. That happens on every ``discover_peers``,
+        ``mesh_health`` and ``find_capable`` call from any beacon in the
+        process, such as the daemon's health loop. Peers already up when
+        subscribing are not announced.
+
+        Returns:
+            A function that removes the subscription.
+        """
+        self.initialize()
+        cache = self._peers()
+        return cache.subscribe(callback)
 
     def mark_offline(self) -> None:
         """Mark this agent as going offline.
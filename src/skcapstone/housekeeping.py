@@ -18,6 +18,12 @@ Prunes stale files that accumulate in the agent profile:
 These directories grow unbounded and can bloat a ~15MB profile to 300MB+.
 Run via daemon loop (hourly) or CLI: ``skcapstone housekeeping [--dry-run]``.
 
+All targets are handled by one :class:`HousekeepingSweep`. It lists each
+directory once with ``os.scandir``, offers the entries to every target's
+rule, and unlinks the losers through one directory fd. Each settled
+directory's mtime and next expiry time are remembered, so hourly runs skip
+directories that have not changed.
+
 Incident background (2026-06-16): a Framework 13 laptop overheated because
 ~/.skcapstone had grown to 462k files. Root cause was ~256k stale v1 broadcast
 envelopes accumulating in directories literally named ``*`` (a v1
@@ -28,14 +34,21 @@ swept, so they grew unbounded. :func:`prune_legacy_comms` sweeps those paths.
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
+import math
 import os
 import shutil
 import time
 from collections import defaultdict
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
+from .atomic_io import atomic_write_text
+from .file_watch import is_racy
+
 logger = logging.getLogger("skcapstone.housekeeping")
 
 DEFAULT_ACK_MAX_AGE_HOURS = 24
@@ -103,6 +116,671 @@ def _pid_is_alive(pidfile: Path) -> bool:
     return True
 
 
+# ---------------------------------------------------------------------------
+# Single-pass scanner
+# ---------------------------------------------------------------------------
+#
+# Every target below is a *rule* attached to a directory. One sweep walks each
+# tree once with os.scandir, hands the directory's files to every rule that
+# applies there, deletes what the rules claim through one directory fd, and
+# accumulates sizes for the report on the way - instead of measuring, counting
+# and pruning in three separate walks per target.
+
+#: Per-host scan state (dir mtimes + next-due times). ``.cache`` is in the
+#: default .stignore, so this never replicates.
+SCAN_STATE_RELPATH = Path(".cache") / "housekeeping-scan.json"
+
+#: Seconds between state checkpoints while a sweep is running, so a sweep cut
+#: short (daemon restart) resumes instead of starting over.
+_CHECKPOINT_SECONDS = 30.0
+
+_SCAN_STATE_VERSION = 1
+
+_SKC_SUFFIX = ".skc.json"
+
+
+@dataclass(frozen=True)
+class _File:
+    """A non-directory entry seen by the scanner (stat follows symlinks)."""
+
+    name: str
+    size: int
+    mtime: float
+    is_symlink: bool
+
+
+@dataclass(frozen=True)
+class _TTLRule:
+    """Delete files older than *max_age_hours*.
+
+    Attributes:
+        target: Report key the deletions are credited to.
+        max_age_hours: Age threshold.
+        skc_only: Only consider ``*.skc.json`` files.
+        skip_hidden: Ignore leading-dot names (in-flight writes).
+        skip_symlinks: Ignore symlinked files.
+        recursive: Apply to every subdirectory too.
+        prune_empty: Remove the directory once it is empty.
+    """
+
+    target: str
+    max_age_hours: float
+    skc_only: bool = False
+    skip_hidden: bool = False
+    skip_symlinks: bool = False
+    recursive: bool = False
+    prune_empty: bool = False
+
+    def _considers(self, f: _File) -> bool:
+        if self.skc_only and not f.name.endswith(_SKC_SUFFIX):
+            return False
+        if self.skip_hidden and f.name.startswith("."):
+            return False
+        return not (self.skip_symlinks and f.is_symlink)
+
+    def select(self, path: str, files: list[_File], now: float) -> list[_File]:
+        cutoff = now - self.max_age_hours * 3600
+        return [f for f in files if self._considers(f) and f.mtime < cutoff]
+
+    def next_due(self, files: list[_File]) -> float:
+        ages = [f.mtime for f in files if self._considers(f)]
+        return min(ages) + self.max_age_hours * 3600 if ages else math.inf
+
+    def removes_tree(self, name: str) -> bool:
+        return False
+
+    def child_rules(self, name: str) -> tuple:
+        return (self,) if self.recursive else ()
+
+
+@dataclass(frozen=True)
+class _KeepNewestRule:
+    """Keep the newest *keep* files per ``<agent>-`` name prefix (seed outboxes)."""
+
+    target: str
+    keep: int
+    recursive: bool = False
+    prune_empty: bool = False
+
+    def select(self, path: str, files: list[_File], now: float) -> list[_File]:
+        groups: dict[str, list[_File]] = defaultdict(list)
+        for f in files:
+            # Patterns: agent-1709123456.json, agent-1709123456.json.gpg
+            parts = f.name.rsplit("-", 1)
+            groups[parts[0] if len(parts) == 2 else "__unknown__"].append(f)
+        victims: list[_File] = []
+        for group in groups.values():
+            group.sort(key=lambda f: f.mtime, reverse=True)
+            victims.extend(group[self.keep :])
+        return victims
+
+    def next_due(self, files: list[_File]) -> float:
+        # Only a new file can push a group over the limit, and that changes
+        # the directory mtime.
+        return math.inf
+
+    def removes_tree(self, name: str) -> bool:
+        return False
+
+    def child_rules(self, name: str) -> tuple:
+        return ()
+
+
+@dataclass(frozen=True)
+class _PerSubdirRule:
+    """Apply *child* inside every subdirectory (one level), not here."""
+
+    child: _TTLRule
+    recursive: bool = False
+    prune_empty: bool = False
+
+    @property
+    def target(self) -> str:
+        return self.child.target
+
+    def select(self, path: str, files: list[_File], now: float) -> list[_File]:
+        return []
+
+    def next_due(self, files: list[_File]) -> float:
+        return math.inf
+
+    def removes_tree(self, name: str) -> bool:
+        return False
+
+    def child_rules(self, name: str) -> tuple:
+        return (self.child,)
+
+
+@dataclass(frozen=True)
+class _LegacyOutboxRule:
+    """v1 outbox root: TTL inside recipient subdirs, ``*`` subdirs removed whole.
+
+    The root itself is removed only when it held nothing but recipient
+    subdirs and all of them are gone (flat files belong to the flat sweep).
+    """
+
+    max_age_hours: float
+    target: str = "legacy_comms"
+    recursive: bool = False
+    prune_empty: bool = False
+    prune_if_only_subdirs: bool = True
+    counts_tree_files: bool = True
+
+    def select(self, path: str, files: list[_File], now: float) -> list[_File]:
+        return []
+
+    def next_due(self, files: list[_File]) -> float:
+        return math.inf
+
+    def removes_tree(self, name: str) -> bool:
+        return name == "*"
+
+    def child_rules(self, name: str) -> tuple:
+        return (
+            _TTLRule(
+                self.target,
+                self.max_age_hours,
+                skc_only=True,
+                skip_symlinks=True,
+                prune_empty=True,
+            ),
+        )
+
+
+@dataclass(frozen=True)
+class _DerivedJunkRule:
+    """``chroma.bak*`` anywhere (dirs removed whole) and dead ``*.pid`` files."""
+
+    target: str = "derived_junk"
+    recursive: bool = True
+    prune_empty: bool = False
+    counts_tree_files: bool = False
+
+    def select(self, path: str, files: list[_File], now: float) -> list[_File]:
+        victims = []
+        for f in files:
+            if f.is_symlink:
+                continue
+            if f.name.startswith("chroma.bak"):
+                victims.append(f)
+            elif f.name.endswith(".pid") and not _pid_is_alive(Path(path, f.name)):
+                victims.append(f)
+        return victims
+
+    def next_due(self, files: list[_File]) -> float:
+        # A process dying does not touch the directory, so a dir holding a
+        # pidfile is never considered settled.
+        return 0.0 if any(f.name.endswith(".pid") for f in files) else math.inf
+
+    def removes_tree(self, name: str) -> bool:
+        return name.startswith("chroma.bak")
+
+    def child_rules(self, name: str) -> tuple:
+        return (self,)
+
+
+@dataclass
+class TargetStats:
+    """Outcome of one sweep for one report target.
+
+    Attributes:
+        matched: Items the rules selected (files, or whole trees for junk).
+        matched_bytes: Bytes held by the selected items.
+        deleted: Items actually removed (0 on a dry run).
+        freed: Bytes actually removed.
+    """
+
+    matched: int = 0
+    matched_bytes: int = 0
+    deleted: int = 0
+    freed: int = 0
+
+
+@dataclass
+class SweepReport:
+    """What a :class:`HousekeepingSweep` saw and did."""
+
+    targets: dict[str, TargetStats] = field(default_factory=lambda: defaultdict(TargetStats))
+    sizes: dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    removed_under: dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    files_scanned: int = 0
+    dirs_scanned: int = 0
+    dirs_skipped: int = 0
+    elapsed: float = 0.0
+
+    def target(self, name: str) -> TargetStats:
+        """Stats for *name* (zeroes when nothing matched)."""
+        return self.targets[name]
+
+    def as_dict(self) -> dict:
+        """Serializable scan counters, including files scanned per second."""
+        return {
+            "files_scanned": self.files_scanned,
+            "dirs_scanned": self.dirs_scanned,
+            "dirs_skipped": self.dirs_skipped,
+            "elapsed_seconds": round(self.elapsed, 3),
+            "files_per_second": (
+                round(self.files_scanned / self.elapsed) if self.elapsed > 0 else None
+            ),
+        }
+
+
+class HousekeepingSweep:
+    """One ``os.scandir`` pass over every directory the registered rules cover.
+
+    Register rules with :meth:`add` (and report paths with :meth:`measure`),
+    then call :meth:`run` once. Each directory is listed once; its files are
+    offered to every rule that applies there, in registration order, and a
+    file claimed by one rule is not offered to the next. Claimed files are
+    unlinked together through one directory fd after the listing closes.
+
+    With *state_path*, each settled directory's mtime and the earliest time
+    any of its files can expire (the high-water mark) are persisted. A later
+    sweep skips listing a directory whose mtime is unchanged and whose
+    deadline has not passed, reusing the recorded size, so an hourly run over
+    a large, mostly fresh tree touches only the directories that changed.
+
+    Args:
+        dry_run: Count and size what would be removed without removing it.
+        state_path: Optional JSON file for the per-directory high-water marks
+            (never written on a dry run).
+        now: Reference epoch time for TTL checks (defaults to ``time.time()``).
+    """
+
+    def __init__(
+        self,
+        dry_run: bool = False,
+        state_path: Optional[Path] = None,
+        now: Optional[float] = None,
+    ) -> None:
+        self.dry_run = dry_run
+        self._state_path = state_path
+        self._now = time.time() if now is None else now
+        self._rules: dict[str, list] = defaultdict(list)
+        self._measures: dict[str, list[str]] = defaultdict(list)
+        self._ancestors: set[str] = set()
+        self._state: dict[str, list] = {}
+        self._new_state: dict[str, list] = {}
+        self._last_checkpoint = 0.0
+        self.report = SweepReport()
+
+    # ------------------------------------------------------------------
+    # Setup
+    # ------------------------------------------------------------------
+
+    def add(self, directory: Path, rule) -> None:
+        """Attach *rule* to *directory* (ignored at run time if it is missing)."""
+        key = os.fspath(directory)
+        self._rules[key].append(rule)
+        self._note_ancestors(key)
+
+    def measure(self, directory: Path, name: str) -> None:
+        """Report the total bytes under *directory* as ``sizes[name]``."""
+        key = os.fspath(directory)
+        self._measures[key].append(name)
+        self._note_ancestors(key)
+
+    def _note_ancestors(self, key: str) -> None:
+        parent = os.path.dirname(key)
+        while parent and parent not in self._ancestors and parent != key:
+            self._ancestors.add(parent)
+            key, parent = parent, os.path.dirname(parent)
+
+    @staticmethod
+    def _rules_key(rules: tuple) -> str:
+        # Stored with each record so a changed threshold or a newly registered
+        # target invalidates exactly the directories it applies to.
+        return hashlib.blake2s(repr(rules).encode(), digest_size=8).hexdigest()
+
+    # ------------------------------------------------------------------
+    # Run
+    # ------------------------------------------------------------------
+
+    def run(self) -> SweepReport:
+        """Walk every registered tree once and return the report."""
+        started = time.monotonic()
+        self._last_checkpoint = started
+        self._load_state()
+        registered = set(self._rules) | set(self._measures)
+        for root in sorted(registered):
+            if self._has_registered_ancestor(root, registered):
+                continue
+            if os.path.isdir(root):
+                self._visit(root, (), ())
+        self.report.elapsed = time.monotonic() - started
+        self._save_state()
+        return self.report
+
+    def _has_registered_ancestor(self, path: str, registered: set[str]) -> bool:
+        parent = os.path.dirname(path)
+        while parent and parent != path:
+            if parent in registered:
+                return True
+            path, parent = parent, os.path.dirname(parent)
+        return False
+
+    def _visit(self, path: str, inherited: tuple, measures: tuple) -> bool:
+        """Process one directory, then its subdirectories.
+
+        Returns:
+            True if the directory was removed because it ended up empty.
+        """
+        # Rules registered here go before inherited ones (derived junk), so a
+        # file both could claim is credited to the specific target.
+        rules = tuple(self._rules.get(path, ())) + inherited
+        measures = measures + tuple(self._measures.get(path, ()))
+        try:
+            st = os.stat(path)
+        except OSError:
+            return False
+
+        record = self._state.get(path)
+        if (
+            record
+            and record[0] == st.st_mtime_ns
+            and self._now < record[1]
+            and record[5] == self._rules_key(rules)
+        ):
+            self.report.dirs_skipped += 1
+            _, _, size, entries, subdirs, _ = record
+            self._new_state[path] = record
+            for name in measures:
+                self.report.sizes[name] += size
+            kept = self._descend(path, rules, measures, subdirs)
+            if len(kept) != len(subdirs):
+                self._new_state.pop(path, None)  # a child went away; relist next time
+            return self._prune_if_empty(path, rules, entries, entries, len(kept))
+
+        files, subdirs, others = self._list(path)
+        if files is None:
+            return False
+        self.report.dirs_scanned += 1
+        self.report.files_scanned += len(files)
+
+        # Offer files to each rule in order; the first rule to claim a file
+        # owns it.
+        claims: list[tuple[object, _File]] = []
+        unclaimed = files
+        for rule in rules:
+            chosen = rule.select(path, unclaimed, self._now)
+            if chosen:
+                names = {f.name for f in chosen}
+                claims.extend((rule, f) for f in chosen)
+                unclaimed = [f for f in unclaimed if f.name not in names]
+        trees = []
+        for name in subdirs:
+            owner = next((r for r in rules if r.removes_tree(name)), None)
+            if owner is not None:
+                trees.append((owner, name))
+        tree_names = {name for _, name in trees}
+
+        removed = self._unlink(path, claims, measures)
+        tree_bytes, trees_left = self._remove_trees(path, trees, measures)
+        for name in measures:
+            self.report.sizes[name] += sum(f.size for f in files) + tree_bytes
+
+        kept = self._descend(path, rules, measures, [n for n in subdirs if n not in tree_names])
+        entries = len(files) + others
+        if self._prune_if_empty(
+            path, rules, entries - len(removed), entries, len(kept) + trees_left
+        ):
+            return True
+        if not self.dry_run and not trees_left:
+            survivors = [f for f in files if f.name not in removed]
+            self._record(path, rules, survivors, others, kept)
+        return False
+
+    def _list(self, path: str) -> tuple[Optional[list[_File]], list[str], int]:
+        files: list[_File] = []
+        subdirs: list[str] = []
+        others = 0
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.name)
+                        elif entry.is_file():
+                            est = entry.stat()
+                            files.append(
+                                _File(entry.name, est.st_size, est.st_mtime, entry.is_symlink())
+                            )
+                        else:
+                            others += 1
+                    except OSError:
+                        others += 1
+        except OSError as exc:
+            logger.warning("Failed to scan %s: %s", path, exc)
+            return None, [], 0
+        return files, subdirs, others
+
+    def _unlink(self, path: str, claims: list, measures: tuple) -> set[str]:
+        """Credit (and unless dry-run, delete) claimed files; return names removed."""
+        for rule, f in claims:
+            stats = self.report.targets[rule.target]
+            stats.matched += 1
+            stats.matched_bytes += f.size
+        removed: set[str] = set()
+        if self.dry_run or not claims:
+            return removed
+        try:
+            dir_fd = os.open(path, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+        except OSError as exc:
+            logger.warning("Failed to open %s for pruning: %s", path, exc)
+            return removed
+        try:
+            for rule, f in claims:
+                try:
+                    os.unlink(f.name, dir_fd=dir_fd)
+                except FileNotFoundError:
+                    removed.add(f.name)
+                    continue
+                except OSError as exc:
+                    logger.warning(
+                        "Failed to delete %s file %s: %s", rule.target, Path(path, f.name), exc
+                    )
+                    continue
+                removed.add(f.name)
+                stats = self.report.targets[rule.target]
+                stats.deleted += 1
+                stats.freed += f.size
+                for name in measures:
+                    self.report.removed_under[name] += f.size
+        finally:
+            os.close(dir_fd)
+        return removed
+
+    def _remove_trees(self, path: str, trees: list, measures: tuple) -> tuple[int, int]:
+        """Credit (and unless dry-run, remove) whole subtrees.
+
+        Returns:
+            ``(bytes held by the trees, number of trees still present)``.
+        """
+        total = left = 0
+        for rule, name in trees:
+            tree = os.path.join(path, name)
+            count, size = _tree_usage(tree)
+            total += size
+            items = count if rule.counts_tree_files else 1
+            stats = self.report.targets[rule.target]
+            stats.matched += items
+            stats.matched_bytes += size
+            if self.dry_run:
+                left += 1
+                continue
+            try:
+                shutil.rmtree(tree)
+            except OSError as exc:
+                logger.warning("Failed to remove %s tree %s: %s", rule.target, tree, exc)
+                left += 1
+                continue
+            logger.info("Removed %s tree %s (%d files)", rule.target, tree, count)
+            stats.deleted += items
+            stats.freed += size
+            for m in measures:
+                self.report.removed_under[m] += size
+        return total, left
+
+    def _descend(self, path: str, rules: tuple, measures: tuple, subdirs: list[str]) -> list[str]:
+        """Visit subdirectories that anything applies to; return those still present."""
+        kept = []
+        for name in subdirs:
+            child = os.path.join(path, name)
+            child_rules = tuple(c for rule in rules for c in rule.child_rules(name))
+            relevant = (
+                child_rules
+                or measures
+                or child in self._rules
+                or child in self._measures
+                or child in self._ancestors
+            )
+            if relevant and self._visit(child, child_rules, measures):
+                continue
+            kept.append(name)
+        return kept
+
+    def _prune_if_empty(
+        self,
+        path: str,
+        rules: tuple,
+        entries_left: int,
+        entries_before: int,
+        subdirs_left: int,
+    ) -> bool:
+        """Remove *path* if it is empty now and a rule asks for that."""
+        if self.dry_run or entries_left or subdirs_left:
+            return False
+        wanted = any(r.prune_empty for r in rules) or (
+            entries_before == 0 and any(getattr(r, "prune_if_only_subdirs", False) for r in rules)
+        )
+        if not wanted:
+            return False
+        try:
+            os.rmdir(path)
+        except OSError:
+            return False
+        self._new_state.pop(path, None)
+        return True
+
+    # ------------------------------------------------------------------
+    # High-water marks
+    # ------------------------------------------------------------------
+
+    def _record(
+        self,
+        path: str,
+        rules: tuple,
+        files: list[_File],
+        others: int,
+        subdirs: list[str],
+    ) -> None:
+        if self._state_path is None:
+            return
+        due = min((rule.next_due(files) for rule in rules), default=math.inf)
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            return
+        if due <= self._now or is_racy(mtime_ns):
+            self._new_state.pop(path, None)
+        else:
+            size = sum(f.size for f in files)
+            entries = others + len(files)
+            key = self._rules_key(rules)
+            self._new_state[path] = [mtime_ns, due, size, entries, subdirs, key]
+        if time.monotonic() - self._last_checkpoint >= _CHECKPOINT_SECONDS:
+            self._save_state(partial=True)
+            self._last_checkpoint = time.monotonic()
+
+    def _load_state(self) -> None:
+        if self._state_path is None:
+            return
+        try:
+            data = json.loads(self._state_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if data.get("version") == _SCAN_STATE_VERSION:
+            self._state = {
+                k: [v[0], v[1] if v[1] is not None else math.inf, *v[2:]]
+                for k, v in data.get("dirs", {}).items()
+            }
+
+    def _save_state(self, partial: bool = False) -> None:
+        if self._state_path is None or self.dry_run:
+            return
+        dirs = dict(self._state) if partial else {}
+        dirs.update(self._new_state)
+        payload = {
+            "version": _SCAN_STATE_VERSION,
+            "dirs": {
+                k: [v[0], None if v[1] == math.inf else v[1], *v[2:]] for k, v in dirs.items()
+            },
+        }
+        try:
+            self._state_path.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write_text(self._state_path, json.dumps(payload))
+        except OSError as exc:
+            logger.warning("Failed to save housekeeping scan state: %s", exc)
+
+
+def _tree_usage(root: str) -> tuple[int, int]:
+    """Count and total the files under *root* without following symlinks."""
+    count = size = 0
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file():
+                            count += 1
+                            size += entry.stat().st_size
+                    except OSError:
+                        pass
+        except OSError:
+            pass
+    return count, size
+
+
+def _sweep_one(directory: Path, rule, dry_run: bool = False) -> TargetStats:
+    """Run a single rule over *directory* (the standalone ``prune_*`` path)."""
+    sweep = HousekeepingSweep(dry_run=dry_run)
+    sweep.add(directory, rule)
+    return sweep.run().target(rule.target)
+
+
+def _acks_rule(max_age_hours: float) -> _TTLRule:
+    return _TTLRule("acks", max_age_hours)
+
+
+def _comms_outbox_rule(max_age_hours: float) -> _PerSubdirRule:
+    return _PerSubdirRule(_TTLRule("comms_outbox", max_age_hours, prune_empty=True))
+
+
+def _skc_tree_rule(target: str, max_age_hours: float) -> _TTLRule:
+    return _TTLRule(
+        target,
+        max_age_hours,
+        skc_only=True,
+        skip_hidden=True,
+        skip_symlinks=True,
+        recursive=True,
+    )
+
+
+def _flat_outbox_rule(max_age_hours: float) -> _TTLRule:
+    # Only flat envelope files; recipient subdirs belong to the legacy rule.
+    return _TTLRule(
+        "comms_outbox_flat",
+        max_age_hours,
+        skc_only=True,
+        skip_hidden=True,
+        skip_symlinks=True,
+    )
+
+
 def prune_acks(skcomms_home: Path, max_age_hours: int = DEFAULT_ACK_MAX_AGE_HOURS) -> int:
     """Remove ACK files older than max_age_hours.
 
@@ -117,22 +795,7 @@ def prune_acks(skcomms_home: Path, max_age_hours: int = DEFAULT_ACK_MAX_AGE_HOUR
         Number of files deleted.
     """
     acks_dir = skcomms_home / "acks"
-    if not acks_dir.is_dir():
-        return 0
-
-    cutoff = time.time() - (max_age_hours * 3600)
-    deleted = 0
-
-    for path in acks_dir.iterdir():
-        if not path.is_file():
-            continue
-        try:
-            if path.stat().st_mtime < cutoff:
-                path.unlink()
-                deleted += 1
-        except OSError as exc:
-            logger.warning("Failed to delete ACK %s: %s", path.name, exc)
-
+    deleted = _sweep_one(acks_dir, _acks_rule(max_age_hours)).deleted
     if deleted:
         logger.info("Pruned %d ACK files from %s", deleted, acks_dir)
     return deleted
@@ -143,7 +806,7 @@ def prune_comms_outbox(sync_dir: Path, max_age_hours: int = DEFAULT_COMMS_MAX_AG
 
     The comms outbox at ~/.skcapstone/sync/comms/outbox/<agent>/
     stores serialized envelopes for Syncthing delivery. Once synced,
-    they linger indefinitely.
+    they linger indefinitely. Agent directories left empty are removed.
 
     Args:
         sync_dir: Path to ~/.skcapstone/sync.
@@ -153,32 +816,7 @@ def prune_comms_outbox(sync_dir: Path, max_age_hours: int = DEFAULT_COMMS_MAX_AG
         Number of files deleted.
     """
     outbox_dir = sync_dir / "comms" / "outbox"
-    if not outbox_dir.is_dir():
-        return 0
-
-    cutoff = time.time() - (max_age_hours * 3600)
-    deleted = 0
-
-    for agent_dir in outbox_dir.iterdir():
-        if not agent_dir.is_dir():
-            continue
-        for path in agent_dir.iterdir():
-            if not path.is_file():
-                continue
-            try:
-                if path.stat().st_mtime < cutoff:
-                    path.unlink()
-                    deleted += 1
-            except OSError as exc:
-                logger.warning("Failed to delete envelope %s: %s", path.name, exc)
-
-        # Remove empty agent directories
-        try:
-            if agent_dir.is_dir() and not any(agent_dir.iterdir()):
-                agent_dir.rmdir()
-        except OSError:
-            pass
-
+    deleted = _sweep_one(outbox_dir, _comms_outbox_rule(max_age_hours)).deleted
     if deleted:
         logger.info("Pruned %d comms outbox files from %s", deleted, outbox_dir)
     return deleted
@@ -199,36 +837,7 @@ def prune_seeds(outbox_dir: Path, keep_per_agent: int = DEFAULT_SEEDS_KEEP_PER_A
     Returns:
         Number of files deleted.
     """
-    if not outbox_dir.is_dir():
-        return 0
-
-    # Group seed files by agent prefix
-    agent_files: dict[str, list[Path]] = defaultdict(list)
-
-    for path in outbox_dir.iterdir():
-        if not path.is_file():
-            continue
-        # Extract agent name: everything before the last dash-timestamp
-        name = path.name
-        # Patterns: agent-1709123456.json, agent-1709123456.json.gpg
-        parts = name.rsplit("-", 1)
-        if len(parts) == 2:
-            agent_name = parts[0]
-        else:
-            agent_name = "__unknown__"
-        agent_files[agent_name].append(path)
-
-    deleted = 0
-    for agent, files in agent_files.items():
-        # Sort by mtime descending (newest first)
-        files.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-        for old_file in files[keep_per_agent:]:
-            try:
-                old_file.unlink()
-                deleted += 1
-            except OSError as exc:
-                logger.warning("Failed to delete seed %s: %s", old_file.name, exc)
-
+    deleted = _sweep_one(outbox_dir, _KeepNewestRule("seed_outbox", keep_per_agent)).deleted
     if deleted:
         logger.info("Pruned %d seed files from %s", deleted, outbox_dir)
     return deleted
@@ -318,8 +927,8 @@ def prune_legacy_comms(
 
     Special case: a recipient subdir literally named ``*`` is a v1
     ``recipient="*"`` broadcast artifact (never valid v2). The entire dir tree
-    is removed regardless of age via :func:`shutil.rmtree`, guarded against
-    symlink escape and confined to the outbox dir.
+    is removed regardless of age via :func:`shutil.rmtree`. Symlinked
+    recipients are never followed, so the sweep stays inside the outbox dir.
 
     Now-empty recipient and outbox directories are removed afterward.
 
@@ -330,66 +939,10 @@ def prune_legacy_comms(
     Returns:
         Number of files deleted.
     """
-    cutoff = time.time() - (max_age_hours * 3600)
-    deleted = 0
-
+    sweep = HousekeepingSweep()
     for outbox_dir in _legacy_outbox_dirs(skcapstone_home):
-        try:
-            recipient_dirs = list(outbox_dir.iterdir())
-        except OSError as exc:
-            logger.warning("Failed to scan legacy outbox %s: %s", outbox_dir, exc)
-            continue
-
-        for recipient in recipient_dirs:
-            # Never follow symlinks - stay inside skcapstone_home.
-            if recipient.is_symlink():
-                continue
-
-            # v1 broadcast artifact: a subdir literally named "*". Remove whole
-            # tree regardless of age (never valid v2).
-            if recipient.is_dir() and recipient.name == "*":
-                try:
-                    file_count = sum(1 for p in recipient.rglob("*") if p.is_file())
-                    shutil.rmtree(recipient)
-                    deleted += file_count
-                    logger.info(
-                        "Removed v1 broadcast dir %s (%d files)",
-                        recipient,
-                        file_count,
-                    )
-                except OSError as exc:
-                    logger.warning("Failed to remove broadcast dir %s: %s", recipient, exc)
-                continue
-
-            if not recipient.is_dir():
-                continue
-
-            for path in recipient.iterdir():
-                if not path.is_file() or path.is_symlink():
-                    continue
-                if not path.name.endswith(".skc.json"):
-                    continue
-                try:
-                    if path.stat().st_mtime < cutoff:
-                        path.unlink()
-                        deleted += 1
-                except OSError as exc:
-                    logger.warning("Failed to delete legacy envelope %s: %s", path, exc)
-
-            # Remove now-empty recipient directory
-            try:
-                if recipient.is_dir() and not any(recipient.iterdir()):
-                    recipient.rmdir()
-            except OSError:
-                pass
-
-        # Remove now-empty outbox directory
-        try:
-            if outbox_dir.is_dir() and not any(outbox_dir.iterdir()):
-                outbox_dir.rmdir()
-        except OSError:
-            pass
-
+        sweep.add(outbox_dir, _LegacyOutboxRule(max_age_hours))
+    deleted = sweep.run().target("legacy_comms").deleted
     if deleted:
         logger.info("Pruned %d legacy comms files from %s", deleted, skcapstone_home)
     return deleted
@@ -398,9 +951,9 @@ def prune_legacy_comms(
 def _prune_skc_tree_by_ttl(root: Path, max_age_hours: int, label: str) -> int:
     """Recursively delete ``*.skc.json`` files older than *max_age_hours* under *root*.
 
-    Symlink-safe (symlinked files skipped; ``rglob`` does not descend into
-    symlinked directories) and dotfile/.tmp-safe (``*.skc.json`` never matches a
-    ``.tmp`` file, and leading-dot names are skipped explicitly).
+    Symlink-safe (symlinked files skipped; symlinked directories are never
+    descended) and dotfile/.tmp-safe (``*.skc.json`` never matches a ``.tmp``
+    file, and leading-dot names are skipped explicitly).
 
     Args:
         root: Directory tree to sweep.
@@ -410,24 +963,7 @@ def _prune_skc_tree_by_ttl(root: Path, max_age_hours: int, label: str) -> int:
     Returns:
         Number of files deleted.
     """
-    if not root.is_dir():
-        return 0
-
-    cutoff = time.time() - (max_age_hours * 3600)
-    deleted = 0
-
-    for path in root.rglob("*.skc.json"):
-        if not path.is_file() or path.is_symlink():
-            continue
-        if path.name.startswith("."):
-            continue
-        try:
-            if path.stat().st_mtime < cutoff:
-                path.unlink()
-                deleted += 1
-        except OSError as exc:
-            logger.warning("Failed to delete %s envelope %s: %s", label, path, exc)
-
+    deleted = _sweep_one(root, _skc_tree_rule(label, max_age_hours)).deleted
     if deleted:
         logger.info("Pruned %d stale %s envelopes under %s", deleted, label, root)
     return deleted
@@ -503,37 +1039,7 @@ def prune_derived_junk(skcapstone_home: Path) -> int:
     Returns:
         Number of top-level junk items removed.
     """
-    if not skcapstone_home.is_dir():
-        return 0
-
-    removed = 0
-
-    for path in skcapstone_home.rglob("chroma.bak*"):
-        if path.is_symlink():
-            continue
-        try:
-            if path.is_dir():
-                shutil.rmtree(path)
-            elif path.exists():
-                path.unlink()
-            else:
-                continue
-            removed += 1
-        except OSError as exc:
-            logger.warning("Failed to remove chroma backup %s: %s", path, exc)
-
-    for path in skcapstone_home.rglob("*.pid"):
-        if path.is_symlink() or not path.is_file():
-            continue
-        # NEVER delete a live daemon's pidfile - only stale/garbage ones.
-        if _pid_is_alive(path):
-            continue
-        try:
-            path.unlink()
-            removed += 1
-        except OSError as exc:
-            logger.warning("Failed to remove pidfile %s: %s", path, exc)
-
+    removed = _sweep_one(skcapstone_home, _DerivedJunkRule()).deleted
     if removed:
         logger.info("Removed %d derived-junk items under %s", removed, skcapstone_home)
     return removed
@@ -635,31 +1141,10 @@ def prune_comms_outbox_flat(
     Returns:
         Number of files deleted.
     """
-    cutoff = time.time() - (max_age_hours * 3600)
-    deleted = 0
-
+    sweep = HousekeepingSweep()
     for outbox_dir in _legacy_outbox_dirs(skcapstone_home):
-        try:
-            entries = list(outbox_dir.iterdir())
-        except OSError as exc:
-            logger.warning("Failed to scan outbox %s: %s", outbox_dir, exc)
-            continue
-
-        for path in entries:
-            # Only flat envelope files; recipient subdirs belong to legacy prune.
-            if not path.is_file() or path.is_symlink():
-                continue
-            if path.name.startswith("."):
-                continue
-            if not path.name.endswith(".skc.json"):
-                continue
-            try:
-                if path.stat().st_mtime < cutoff:
-                    path.unlink()
-                    deleted += 1
-            except OSError as exc:
-                logger.warning("Failed to delete outbox envelope %s: %s", path, exc)
-
+        sweep.add(outbox_dir, _flat_outbox_rule(max_age_hours))
+    deleted = sweep.run().target("comms_outbox_flat").deleted
     if deleted:
         logger.info("Pruned %d flat comms-outbox envelopes under %s", deleted, skcapstone_home)
     return deleted
@@ -669,21 +1154,31 @@ def run_housekeeping(
     skcapstone_home: Optional[Path] = None,
     skcomms_home: Optional[Path] = None,
     dry_run: bool = False,
+    state_path: Optional[Path] = None,
 ) -> dict:
-    """Run all housekeeping tasks.
+    """Run all housekeeping tasks in one :class:`HousekeepingSweep`.
 
-    The ``legacy_comms`` target's reported size/path is the v1 root outbox
-    (``<home>/comms/outbox``) for display only - :func:`prune_legacy_comms`
-    additionally sweeps every ``<home>/agents/<agent>/comms/outbox`` and
+    Every target's rule is registered on one sweep, so each tree is listed
+    once: sizes, dry-run counts and deletions all come out of the same pass.
+    Per-directory high-water marks are kept in *state_path* (default
+    ``<home>/.cache/housekeeping-scan.json``) so the next run skips
+    directories that have not changed and hold nothing old enough to expire.
+
+    The ``legacy_comms`` and ``comms_outbox_flat`` targets both report the
+    v1 root outbox (``<home>/comms/outbox``) as their path. Both sweeps also
+    cover every ``<home>/agents/<agent>/comms/outbox``. The legacy sweep also
     removes any v1 broadcast subdir literally named ``*``.
 
     Args:
         skcapstone_home: Path to ~/.skcapstone. Defaults to AGENT_HOME.
         skcomms_home: Path to ~/.skcomms. Defaults to ~/.skcomms.
         dry_run: If True, report what would be deleted without deleting.
+        state_path: Where to keep the scan high-water marks.
 
     Returns:
-        Dict with counts per target and total bytes freed.
+        Dict with counts and bytes per target (``deleted``/``freed``, or
+        ``would_delete``/``would_free`` on a dry run), a ``scan`` entry with
+        files scanned per second, and (when not a dry run) a ``summary``.
     """
     from . import AGENT_HOME
 
@@ -697,10 +1192,10 @@ def run_housekeeping(
         # from skcapstone_home so a custom shared_root stays consistent.
         env_home = os.environ.get("SKCOMMS_HOME")
         skcomms_home = Path(env_home).expanduser() if env_home else skcapstone_home / "skcomms"
+    if state_path is None and skcapstone_home.is_dir():
+        state_path = skcapstone_home / SCAN_STATE_RELPATH
 
-    results: dict[str, dict] = {}
-
-    # Measure sizes before pruning
+    # Paths reported per target (sizes are measured under these).
     targets = {
         "acks": skcomms_home / "acks",
         "comms_outbox": skcapstone_home / "sync" / "comms" / "outbox",
@@ -721,328 +1216,92 @@ def run_housekeeping(
         "comms_outbox_flat": skcapstone_home / "comms" / "outbox",
     }
 
+    sweep = HousekeepingSweep(dry_run=dry_run, state_path=state_path)
+    for key, path in targets.items():
+        sweep.measure(path, key)
+
+    # Registration order is claim order when two rules see the same file.
+    sweep.add(targets["acks"], _acks_rule(DEFAULT_ACK_MAX_AGE_HOURS))
+    sweep.add(targets["comms_outbox"], _comms_outbox_rule(DEFAULT_COMMS_MAX_AGE_HOURS))
+    for seed_dir in _seed_outbox_dirs(skcapstone_home):
+        sweep.add(seed_dir, _KeepNewestRule("seed_outbox", DEFAULT_SEEDS_KEEP_PER_AGENT))
+    for outbox_dir in _legacy_outbox_dirs(skcapstone_home):
+        sweep.add(outbox_dir, _LegacyOutboxRule(DEFAULT_LEGACY_COMMS_MAX_AGE_HOURS))
+        sweep.add(outbox_dir, _flat_outbox_rule(DEFAULT_OUTBOX_FLAT_MAX_AGE_HOURS))
+    sweep.add(targets["inbox"], _skc_tree_rule("inbox", DEFAULT_INBOX_MAX_AGE_HOURS))
+    sweep.add(
+        targets["deadletter"], _skc_tree_rule("deadletter", DEFAULT_DEADLETTER_MAX_AGE_HOURS)
+    )
+    sweep.add(
+        targets["skcomms_inbox"],
+        _skc_tree_rule("skcomms_inbox", DEFAULT_SKCOMMS_INBOX_MAX_AGE_HOURS),
+    )
+    archive_rule = _skc_tree_rule("comms_archive", DEFAULT_COMMS_ARCHIVE_MAX_AGE_HOURS)
+    sweep.add(targets["comms_archive"], archive_rule)
+    agents_dir = skcapstone_home / "agents"
+    if agents_dir.is_dir():
+        for agent_dir in sorted(agents_dir.iterdir()):
+            sweep.add(agent_dir / "comms" / "archive", archive_rule)
+    # derived_junk is a scattered match (chroma.bak* + *.pid) over the whole
+    # profile, so it rides along on every directory the sweep lists.
+    sweep.add(skcapstone_home, _DerivedJunkRule())
+
+    report = sweep.run()
+
+    results: dict[str, dict] = {}
     for key, path in targets.items():
         results[key] = {
             "path": str(path),
             "exists": path.is_dir(),
-            "size_before": _dir_size(path),
+            "size_before": report.sizes.get(key, 0),
         }
-
-    # derived_junk is a scattered glob (chroma.bak* + *.pid), not a single dir,
-    # so it is tracked outside the generic targets loop.
     results["derived_junk"] = {
         "path": str(skcapstone_home),
         "exists": skcapstone_home.is_dir(),
-        "size_before": _derived_junk_size(skcapstone_home),
+        "size_before": report.target("derived_junk").matched_bytes,
     }
+    keys = [*targets, "derived_junk"]
 
     if dry_run:
-        # Count what would be deleted without deleting
-        results["acks"]["would_delete"] = _count_stale_files(
-            targets["acks"], DEFAULT_ACK_MAX_AGE_HOURS
-        )
-        results["comms_outbox"]["would_delete"] = _count_stale_comms(
-            targets["comms_outbox"], DEFAULT_COMMS_MAX_AGE_HOURS
-        )
-        results["seed_outbox"]["would_delete"] = sum(
-            _count_excess_seeds(seed_dir, DEFAULT_SEEDS_KEEP_PER_AGENT)
-            for seed_dir in _seed_outbox_dirs(skcapstone_home)
-        )
-        results["legacy_comms"]["would_delete"] = _count_stale_legacy_comms(
-            skcapstone_home, DEFAULT_LEGACY_COMMS_MAX_AGE_HOURS
-        )
-        results["inbox"]["would_delete"] = _count_stale_inbox(
-            skcapstone_home, DEFAULT_INBOX_MAX_AGE_HOURS
-        )
-        results["deadletter"]["would_delete"] = _count_stale_deadletter(
-            skcapstone_home, DEFAULT_DEADLETTER_MAX_AGE_HOURS
-        )
-        results["skcomms_inbox"]["would_delete"] = _count_stale_skc_tree(
-            skcapstone_home / "skcomms" / "inbox", DEFAULT_SKCOMMS_INBOX_MAX_AGE_HOURS
-        )
-        results["comms_archive"]["would_delete"] = _count_stale_comms_archive(
-            skcapstone_home, DEFAULT_COMMS_ARCHIVE_MAX_AGE_HOURS
-        )
-        results["comms_outbox_flat"]["would_delete"] = _count_stale_outbox_flat(
-            skcapstone_home, DEFAULT_OUTBOX_FLAT_MAX_AGE_HOURS
-        )
-        results["derived_junk"]["would_delete"] = _count_derived_junk(skcapstone_home)
+        for key in keys:
+            stats = report.target(key)
+            results[key]["would_delete"] = stats.matched
+            results[key]["would_free"] = stats.matched_bytes
+        results["scan"] = report.as_dict()
         results["dry_run"] = True
         return results
 
-    # Actually prune
-    results["acks"]["deleted"] = prune_acks(skcomms_home)
-    results["comms_outbox"]["deleted"] = prune_comms_outbox(skcapstone_home / "sync")
-    results["seed_outbox"]["deleted"] = sum(
-        prune_seeds(seed_dir) for seed_dir in _seed_outbox_dirs(skcapstone_home)
-    )
-    results["legacy_comms"]["deleted"] = prune_legacy_comms(skcapstone_home)
-    results["inbox"]["deleted"] = prune_inbox(skcapstone_home)
-    results["deadletter"]["deleted"] = prune_deadletter(skcapstone_home)
-    results["skcomms_inbox"]["deleted"] = prune_skcomms_inbox(skcapstone_home)
-    results["comms_archive"]["deleted"] = prune_comms_archive(skcapstone_home)
-    results["comms_outbox_flat"]["deleted"] = prune_comms_outbox_flat(skcapstone_home)
-    results["derived_junk"]["deleted"] = prune_derived_junk(skcapstone_home)
-
-    # Measure sizes after
-    for key, path in targets.items():
-        results[key]["size_after"] = _dir_size(path)
-        before = results[key]["size_before"]
-        after = results[key]["size_after"]
-        results[key]["freed"] = max(0, before - after)
-
-    # derived_junk size is measured over the scattered glob, not a single dir.
-    dj_after = _derived_junk_size(skcapstone_home)
-    results["derived_junk"]["size_after"] = dj_after
-    results["derived_junk"]["freed"] = max(0, results["derived_junk"]["size_before"] - dj_after)
-
-    total_freed = sum(r.get("freed", 0) for r in results.values() if isinstance(r, dict))
-    total_deleted = sum(r.get("deleted", 0) for r in results.values() if isinstance(r, dict))
+    for key in keys:
+        stats = report.target(key)
+        info = results[key]
+        info["deleted"] = stats.deleted
+        info["freed"] = stats.freed
+        removed = stats.freed if key == "derived_junk" else report.removed_under.get(key, 0)
+        info["size_after"] = max(0, info["size_before"] - removed)
+
+    total_freed = sum(results[key]["freed"] for key in keys)
+    results["scan"] = report.as_dict()
     results["summary"] = {
-        "total_deleted": total_deleted,
+        "total_deleted": sum(results[key]["deleted"] for key in keys),
         "total_freed_bytes": total_freed,
         "total_freed_mb": round(total_freed / (1024 * 1024), 1),
+        "files_scanned": report.files_scanned,
+        "files_per_second": results["scan"]["files_per_second"],
     }
-
+    logger.info(
+        "Housekeeping sweep: %d files in %d dirs (%d unchanged dirs skipped) in %.2fs",
+        report.files_scanned,
+        report.dirs_scanned,
+        report.dirs_skipped,
+        report.elapsed,
+    )
     return results
 
 
-def _dir_size(path: Path) -> int:
-    """Calculate total size of all files in a directory tree."""
-    if not path.is_dir():
-        return 0
-    total = 0
-    for f in path.rglob("*"):
-        if f.is_file():
-            try:
-                total += f.stat().st_size
-            except OSError:
-                pass
-    return total
-
-
-def _count_stale_files(directory: Path, max_age_hours: int) -> int:
-    """Count files older than max_age_hours (for dry-run)."""
-    if not directory.is_dir():
-        return 0
-    cutoff = time.time() - (max_age_hours * 3600)
-    return sum(1 for p in directory.iterdir() if p.is_file() and p.stat().st_mtime < cutoff)
-
-
-def _count_stale_comms(outbox_dir: Path, max_age_hours: int) -> int:
-    """Count stale comms outbox files (for dry-run)."""
-    if not outbox_dir.is_dir():
-        return 0
-    cutoff = time.time() - (max_age_hours * 3600)
-    count = 0
-    for agent_dir in outbox_dir.iterdir():
-        if not agent_dir.is_dir():
-            continue
-        for p in agent_dir.iterdir():
-            if p.is_file() and p.stat().st_mtime < cutoff:
-                count += 1
-    return count
-
-
-def _count_excess_seeds(outbox_dir: Path, keep_per_agent: int) -> int:
-    """Count excess seed files beyond keep_per_agent (for dry-run)."""
-    if not outbox_dir.is_dir():
-        return 0
-
-    agent_files: dict[str, list[Path]] = defaultdict(list)
-    for path in outbox_dir.iterdir():
-        if not path.is_file():
-            continue
-        parts = path.name.rsplit("-", 1)
-        agent_name = parts[0] if len(parts) == 2 else "__unknown__"
-        agent_files[agent_name].append(path)
-
-    count = 0
-    for files in agent_files.values():
-        excess = len(files) - keep_per_agent
-        if excess > 0:
-            count += excess
-    return count
-
-
-def _count_stale_legacy_comms(skcapstone_home: Path, max_age_hours: int) -> int:
-    """Count legacy comms files that would be deleted (for dry-run).
-
-    Mirrors :func:`prune_legacy_comms`: counts stale ``*.skc.json`` envelopes
-    older than *max_age_hours* across all legacy outbox roots, plus *every*
-    file under any recipient subdir literally named ``*`` (those are removed
-    wholesale regardless of age).
-
-    Args:
-        skcapstone_home: Path to ~/.skcapstone.
-        max_age_hours: Age threshold matching the prune default.
-
-    Returns:
-        Number of files that would be deleted.
-    """
-    cutoff = time.time() - (max_age_hours * 3600)
-    count = 0
-
-    for outbox_dir in _legacy_outbox_dirs(skcapstone_home):
-        try:
-            recipient_dirs = list(outbox_dir.iterdir())
-        except OSError:
-            continue
-
-        for recipient in recipient_dirs:
-            if recipient.is_symlink():
-                continue
-
-            if recipient.is_dir() and recipient.name == "*":
-                count += sum(1 for p in recipient.rglob("*") if p.is_file())
-                continue
-
-            if not recipient.is_dir():
-                continue
-
-            for path in recipient.iterdir():
-                if not path.is_file() or path.is_symlink():
-                    continue
-                if not path.name.endswith(".skc.json"):
-                    continue
-                try:
-                    if path.stat().st_mtime < cutoff:
-                        count += 1
-                except OSError:
-                    pass
-
-    return count
-
-
-def _count_stale_skc_tree(root: Path, max_age_hours: int) -> int:
-    """Count ``*.skc.json`` files older than *max_age_hours* under *root* (dry-run)."""
-    if not root.is_dir():
-        return 0
-    cutoff = time.time() - (max_age_hours * 3600)
-    count = 0
-    for path in root.rglob("*.skc.json"):
-        if not path.is_file() or path.is_symlink():
-            continue
-        if path.name.startswith("."):
-            continue
-        try:
-            if path.stat().st_mtime < cutoff:
-                count += 1
-        except OSError:
-            pass
-    return count
-
-
-def _count_stale_inbox(skcapstone_home: Path, max_age_hours: int) -> int:
-    """Count inbox envelopes that would be pruned (for dry-run).
-
-    Mirrors :func:`prune_inbox`: recursive ``*.skc.json`` under
-    ``sync/comms/inbox`` older than *max_age_hours*.
-    """
-    return _count_stale_skc_tree(skcapstone_home / "sync" / "comms" / "inbox", max_age_hours)
-
-
-def _count_stale_deadletter(skcapstone_home: Path, max_age_hours: int) -> int:
-    """Count deadletter envelopes that would be pruned (for dry-run).
-
-    Mirrors :func:`prune_deadletter`: recursive ``*.skc.json`` under
-    ``sync/comms/deadletter`` older than *max_age_hours*.
-    """
-    return _count_stale_skc_tree(skcapstone_home / "sync" / "comms" / "deadletter", max_age_hours)
-
-
-def _count_stale_comms_archive(skcapstone_home: Path, max_age_hours: int) -> int:
-    """Count consumed-archive envelopes that would be pruned (for dry-run).
-
-    Mirrors :func:`prune_comms_archive`: recursive ``*.skc.json`` under
-    ``{home}/comms/archive`` plus every ``agents/<agent>/comms/archive``.
-    """
-    count = _count_stale_skc_tree(skcapstone_home / "comms" / "archive", max_age_hours)
-    agents_dir = skcapstone_home / "agents"
-    if agents_dir.is_dir():
-        for agent_dir in agents_dir.iterdir():
-            if agent_dir.is_dir():
-                count += _count_stale_skc_tree(agent_dir / "comms" / "archive", max_age_hours)
-    return count
-
-
-def _count_stale_outbox_flat(skcapstone_home: Path, max_age_hours: int) -> int:
-    """Count flat outbox envelopes that would be pruned (for dry-run).
-
-    Mirrors :func:`prune_comms_outbox_flat`: FLAT ``*.skc.json`` files directly
-    in each outbox root (``{home}/comms/outbox`` + every
-    ``agents/<agent>/comms/outbox``), NOT descending into recipient subdirs.
-    """
-    cutoff = time.time() - (max_age_hours * 3600)
-    count = 0
-    for outbox_dir in _legacy_outbox_dirs(skcapstone_home):
-        try:
-            entries = list(outbox_dir.iterdir())
-        except OSError:
-            continue
-        for path in entries:
-            if not path.is_file() or path.is_symlink():
-                continue
-            if path.name.startswith("."):
-                continue
-            if not path.name.endswith(".skc.json"):
-                continue
-            try:
-                if path.stat().st_mtime < cutoff:
-                    count += 1
-            except OSError:
-                pass
-    return count
-
-
 def _count_derived_junk(skcapstone_home: Path) -> int:
     """Count derived-junk items that would be removed (for dry-run).
 
     Mirrors :func:`prune_derived_junk`: ``**/chroma.bak*`` entries plus
-    ``**/*.pid`` files.
-
-    Args:
-        skcapstone_home: Path to ~/.skcapstone.
-
-    Returns:
-        Number of items that would be removed.
+    ``**/*.pid`` files whose process is not alive.
     """
-    if not skcapstone_home.is_dir():
-        return 0
-
-    count = 0
-    for path in skcapstone_home.rglob("chroma.bak*"):
-        if not path.is_symlink():
-            count += 1
-    for path in skcapstone_home.rglob("*.pid"):
-        if path.is_file() and not path.is_symlink() and not _pid_is_alive(path):
-            count += 1
-    return count
-
-
-def _derived_junk_size(skcapstone_home: Path) -> int:
-    """Total bytes held by derived junk (chroma.bak* + *.pid), for freed calc."""
-    if not skcapstone_home.is_dir():
-        return 0
-
-    total = 0
-    for path in skcapstone_home.rglob("chroma.bak*"):
-        if path.is_symlink():
-            continue
-        if path.is_dir():
-            total += _dir_size(path)
-        elif path.is_file():
-            try:
-                total += path.stat().st_size
-            except OSError:
-                pass
-    for path in skcapstone_home.rglob("*.pid"):
-        if path.is_symlink() or not path.is_file():
-            continue
-        if _pid_is_alive(path):
-            continue  # live pidfile is not junk - do not count its bytes as freeable
-        try:
-            total += path.stat().st_size
-        except OSError:
-            pass
-    return total
+    return _sweep_one(skcapstone_home, _DerivedJunkRule(), dry_run=True).matched
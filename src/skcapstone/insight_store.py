@@ -0,0 +1,313 @@
+"""Persisted keyword sets and MinHash signatures of recent dream insights.
+
+The dreaming dedup gate drops a new insight whose keyword set overlaps a
+recent one by at least a Jaccard threshold. Checking that against every
+insight of the lookback window, re-extracting keywords from both sides of
+each pair after re-reading the whole dream log, is linear in the window
+and capped by the log's 50-entry retention. InsightStore keeps, per
+recorded dream, each insight's text, keyword set and MinHash signature in
+``memory/dream-insights.jsonl`` (one line per dream, appended as dreams
+are recorded) and indexes the window in LSH buckets, so a lookup verifies
+only the few insights sharing a bucket with the query.
+
+Windows of up to ``EXACT_SCAN_MAX`` insights are still compared pair by
+pair, which keeps small windows exact; past that, LSH may miss a pair
+right at the threshold (under 1% of the time, see ``minhash.lsh_params``)
+but never reports one below it. Lines appended by another process are
+picked up by reading the file from the last known offset; the file is
+compacted to the window once stale dreams outnumber live ones.
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import logging
+import os
+import threading
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+from .atomic_io import atomic_write_text
+from .minhash import (
+    NUM_PERM,
+    LSHIndex,
+    Signature,
+    jaccard,
+    minhash,
+    signature_from_hex,
+    signature_to_hex,
+)
+
+logger = logging.getLogger("skcapstone.insight_store")
+
+INSIGHT_STORE_NAME = "dream-insights.jsonl"
+_STORE_VERSION = 2
+# Windows up to this many insights are compared pair by pair.
+EXACT_SCAN_MAX = 256
+# Compact once stale records exceed the live window by this many.
+_COMPACT_SLACK = 64
+
+
+@dataclass(frozen=True)
+class StoredInsight:
+    """One insight of a recorded dream.
+
+    Attributes:
+        dream: Sequence number of the dream that produced it.
+        text: The insight.
+        keywords: Its keyword set.
+        signature: MinHash signature of *keywords* (empty when there are none).
+    """
+
+    dream: int
+    text: str
+    keywords: frozenset[str]
+    signature: Signature
+
+
+class InsightStore:
+    """Windowed, LSH-indexed history of dream insights.
+
+    Args:
+        path: The JSONL file backing the store.
+        lookback: Number of most recent dreams the window covers.
+        threshold: Jaccard similarity ``match`` looks for.
+        persist: Read and append *path* (default True).
+    """
+
+    def __init__(self, path: Path, lookback: int, threshold: float, persist: bool = True) -> None:
+        self.path = path
+        self.lookback = max(1, lookback)
+        self._persist = persist
+        self._lock = threading.Lock()
+        self._records: list[StoredInsight] = []
+        self._dreams: list[int] = []  # parallel to _records, for bisecting the window
+        self._last_dream = 0
+        self._threshold = threshold
+        self._lsh = LSHIndex(threshold)
+        self._file: Optional[tuple[int, int]] = None  # (st_ino, bytes consumed)
+        self._sigs_valid = True
+        self.stats = {"loads": 0, "tail_reads": 0, "compactions": 0, "verified": 0}
+
+    @property
+    def needs_seed(self) -> bool:
+        """True when there is no backing file yet (seed it from the dream log)."""
+        return self._persist and self._file is None
+
+    def set_window(self, lookback: int, threshold: float) -> None:
+        """Adopt new window settings, re-bucketing if the threshold moved."""
+        with self._lock:
+            self.lookback = max(1, lookback)
+            if threshold != self._threshold:
+                self._threshold = threshold
+                self._reindex()
+
+    def refresh(self) -> None:
+        """Pick up dreams appended to the file by another process."""
+        if not self._persist:
+            return
+        with self._lock:
+            try:
+                st = os.stat(self.path)
+            except OSError:
+                self._reset()
+                self._file = None
+                return
+            if self._file is not None and self._file[0] == st.st_ino:
+                if st.st_size == self._file[1]:
+                    return
+                if st.st_size > self._file[1]:
+                    self.stats["tail_reads"] += 1
+                    self._read_from(self._file[1], st.st_ino)
+                    return
+            self.stats["loads"] += 1
+            self._reset()
+            self._sigs_valid = True
+            self._read_from(0, st.st_ino)
+
+    def recent_texts(self) -> list[str]:
+        """Insights of the window, oldest first."""
+        with self._lock:
+            return [r.text for r in self._records[self._window_start() :]]
+
+    def window_size(self) -> int:
+        """Number of insights in the window."""
+        with self._lock:
+            return len(self._records) - self._window_start()
+
+    def match(self, keywords: Iterable[str]) -> Optional[tuple[StoredInsight, float]]:
+        """A windowed insight overlapping *keywords* by at least the threshold.
+
+        Returns:
+            ``(insight, overlap)`` for the first match found, or None.
+        """
+        kw = frozenset(keywords)
+        if not kw:
+            return None
+        with self._lock:
+            start = self._window_start()
+            if len(self._records) - start <= EXACT_SCAN_MAX:
+                positions: Iterable[int] = range(start, len(self._records))
+            else:
+                positions = sorted(p for p in self._lsh.candidates(minhash(kw)) if p >= start)
+            for pos in positions:
+                record = self._records[pos]
+                self.stats["verified"] += 1
+                overlap = jaccard(kw, record.keywords)
+                if overlap >= self._threshold:
+                    return record, overlap
+        return None
+
+    def append(self, insights: Sequence[tuple[str, Iterable[str]]]) -> None:
+        """Record one dream's ``(text, keywords)`` insights (may be empty)."""
+        self.extend([insights])
+
+    def extend(self, dreams: Sequence[Sequence[tuple[str, Iterable[str]]]]) -> None:
+        """Record several dreams, oldest first, with a single write."""
+        with self._lock:
+            lines = []
+            for insights in dreams:
+                self._last_dream += 1
+                dream = self._last_dream
+                row = []
+                for text, keywords in insights:
+                    record = self._add(dream, text, frozenset(keywords), None)
+                    row.append([text, sorted(record.keywords), signature_to_hex(record.signature)])
+                lines.append(json.dumps({"dream": dream, "insights": row}) + "\n")
+            if not self._persist:
+                return
+            try:
+                stale = self._window_start()
+                if stale > len(self._records) - stale + _COMPACT_SLACK:
+                    self._compact()
+                else:
+                    self._write(lines)
+            except OSError as exc:
+                logger.warning("Cannot persist dream insights: %s", exc)
+
+    # -- internals ----------------------------------------------------------
+
+    def _window_start(self) -> int:
+        return bisect.bisect_right(self._dreams, self._last_dream - self.lookback)
+
+    def _add(
+        self, dream: int, text: str, keywords: frozenset[str], sig: Optional[Signature]
+    ) -> StoredInsight:
+        if sig is None or (keywords and len(sig) != NUM_PERM):
+            sig = minhash(keywords)
+        record = StoredInsight(dream=dream, text=text, keywords=keywords, signature=sig)
+        self._lsh.add(len(self._records), sig)
+        self._records.append(record)
+        self._dreams.append(dream)
+        self._last_dream = max(self._last_dream, dream)
+        return record
+
+    def _reset(self) -> None:
+        self._records = []
+        self._dreams = []
+        self._last_dream = 0
+        self._lsh = LSHIndex(self._threshold)
+
+    def _reindex(self) -> None:
+        self._lsh = LSHIndex(self._threshold)
+        for pos, record in enumerate(self._records):
+            self._lsh.add(pos, record.signature)
+
+    def _read_from(self, offset: int, ino: int) -> None:
+        try:
+            with open(self.path, "rb") as fh:
+                fh.seek(offset)
+                data = fh.read()
+        except OSError:
+            self._file = None
+            return
+        # Only whole lines; a partial last line is read again next time.
+        end = data.rfind(b"\n") + 1
+        for raw in data[:end].splitlines():
+            self._parse_line(raw)
+        self._file = (ino, offset + end)
+
+    def _parse_line(self, raw: bytes) -> None:
+        try:
+            entry: Any = json.loads(raw)
+        except ValueError:
+            return
+        if not isinstance(entry, dict):
+            return
+        if "version" in entry:
+            # Signatures of another layout are recomputed from the keywords.
+            self._sigs_valid = (
+                entry.get("version") == _STORE_VERSION and entry.get("num_perm") == NUM_PERM
+            )
+            return
+        dream = entry.get("dream")
+        if not isinstance(dream, int) or dream <= self._last_dream:
+            return
+        for item in entry.get("insights", []):
+            if not (isinstance(item, list) and len(item) == 3 and isinstance(item[0], str)):
+                continue
+            try:
+                sig = signature_from_hex(item[2]) if self._sigs_valid else None
+            except (TypeError, ValueError):
+                sig = None
+            self._add(dream, item[0], frozenset(w for w in item[1] if isinstance(w, str)), sig)
+        self._last_dream = dream
+
+    def _header(self) -> str:
+        return json.dumps({"version": _STORE_VERSION, "num_perm": NUM_PERM}) + "\n"
+
+    def _write(self, lines: list[str]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as fh:
+            if fh.tell() == 0:
+                fh.write(self._header())
+            fh.writelines(lines)
+            fh.flush()
+            size = fh.tell()
+        self._file = (os.stat(self.path).st_ino, size)
+
+    def _compact(self) -> None:
+        """Rewrite the file with just the window and rebuild the buckets."""
+        self.stats["compactions"] += 1
+        last = self._last_dream
+        first = max(1, last - self.lookback + 1)
+        live = self._records[self._window_start() :]
+        self._reset()
+        rows: dict[int, list] = {dream: [] for dream in range(first, last + 1)}
+        for record in live:
+            self._add(record.dream, record.text, record.keywords, record.signature)
+            rows[record.dream].append(
+                [record.text, sorted(record.keywords), signature_to_hex(record.signature)]
+            )
+        self._last_dream = last
+        # Dreams without insights are kept too: they count towards the window.
+        lines = [self._header()]
+        lines.extend(json.dumps({"dream": d, "insights": row}) + "\n" for d, row in rows.items())
+        atomic_write_text(self.path, "".join(lines))
+        st = os.stat(self.path)
+        self._file = (st.st_ino, st.st_size)
+
+
+_stores: dict[str, InsightStore] = {}
+_stores_lock = threading.Lock()
+
+
+def insight_store(path: Path, lookback: int, threshold: float) -> InsightStore:
+    """The process-wide, refreshed InsightStore backed by *path*."""
+    key = str(path)
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = _stores[key] = InsightStore(path, lookback, threshold)
+    store.set_window(lookback, threshold)
+    store.refresh()
+    return store
+
+
+def clear_insight_stores() -> None:
+    """Drop all open stores so the next lookup re-reads its file."""
+    with _stores_lock:
+        _stores.clear()
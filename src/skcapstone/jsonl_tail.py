@@ -0,0 +1,291 @@
+"""
+Tail-indexed reads for append-only JSONL logs.
+
+Several stores (the joule wallet ledger, the fleet event log, MCP session
+recordings) are append-only JSONL files whose readers almost always want
+the *end* of the file: the last N entries, everything since a timestamp,
+or the last N entries matching a filter. Loading the whole file and
+slicing ``[-limit:]`` makes those reads cost O(log size); the helpers here
+make them cost O(answer).
+
+Two primitives:
+
+    iter_lines_reversed  -- yield lines newest-first by reading fixed-size
+                            blocks backwards from EOF.
+    SparseIndex          -- a checkpoint every ``stride`` lines recording
+                            (byte offset, key value), extended incrementally
+                            as the file grows, so "since <key>" reads can
+                            bisect to a nearby offset and scan forward.
+
+and two convenience readers built on them, ``tail_records`` and
+``read_since``. Both accept either one path or a sequence of segment
+paths ordered oldest-to-newest (e.g. ``events.jsonl.1`` then
+``events.jsonl``), and both skip lines that fail to parse, matching the
+tolerance every existing reader already had.
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import os
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional, Sequence, Union
+
+#: Bytes read per backwards step. Large enough that a typical "last 50"
+#: query is one read, small enough that it never matters for memory.
+DEFAULT_CHUNK = 64 * 1024
+
+#: Lines between SparseIndex checkpoints. 1M lines -> ~1k checkpoints.
+DEFAULT_STRIDE = 1024
+
+PathArg = Union[Path, str, Sequence[Union[Path, str]]]
+Parser = Callable[[str], Any]
+Predicate = Callable[[Any], bool]
+
+
+def _segments(path: PathArg) -> list[Path]:
+    if isinstance(path, (str, os.PathLike)):
+        return [Path(path)]
+    return [Path(p) for p in path]
+
+
+def _key_of(record: Any, key: str) -> Any:
+    if isinstance(record, dict):
+        return record.get(key)
+    return getattr(record, key, None)
+
+
+def iter_lines_reversed(path: Path, chunk_size: int = DEFAULT_CHUNK) -> Iterator[str]:
+    """Yield the non-blank lines of *path* newest-first.
+
+    Reads ``chunk_size`` blocks backwards from EOF, so stopping after N
+    lines touches only the tail of the file. A missing file yields nothing.
+    """
+    try:
+        fh = open(path, "rb")
+    except FileNotFoundError:
+        return
+    with fh:
+        fh.seek(0, os.SEEK_END)
+        pos = fh.tell()
+        carry = b""
+        while pos > 0:
+            step = min(chunk_size, pos)
+            pos -= step
+            fh.seek(pos)
+            parts = (fh.read(step) + carry).split(b"\n")
+            # parts[0] may be the back half of a line that starts in an
+            # earlier block; hold it until that block has been read.
+            carry = parts[0]
+            for raw in reversed(parts[1:]):
+                if raw.strip():
+                    yield raw.decode("utf-8", errors="replace")
+        if carry.strip():
+            yield carry.decode("utf-8", errors="replace")
+
+
+def tail_records(
+    path: PathArg,
+    limit: int,
+    *,
+    predicate: Optional[Predicate] = None,
+    parse: Parser = json.loads,
+    since: Any = None,
+    key: str = "ts",
+) -> list[Any]:
+    """Return up to *limit* parsed records from the end of a log, newest first.
+
+    Args:
+        path: A log file, or segments ordered oldest-to-newest.
+        limit: Maximum number of records to return.
+        predicate: Optional filter applied to each parsed record; only
+            matches count toward *limit*.
+        parse: Line parser. Lines raising ``ValueError`` (which covers
+            ``json.JSONDecodeError`` and pydantic validation errors) are
+            skipped.
+        since: When set, stop at the first record whose *key* sorts below
+            it. Append-only logs are written in key order, so this bounds
+            the scan to the answer.
+        key: Record field compared against *since*.
+
+    Returns:
+        Parsed records, most recent first.
+    """
+    out: list[Any] = []
+    if limit <= 0:
+        return out
+    for seg in reversed(_segments(path)):
+        for line in iter_lines_reversed(seg):
+            try:
+                record = parse(line)
+            except ValueError:
+                continue
+            if since is not None:
+                value = _key_of(record, key)
+                if value is not None and value < since:
+                    return out
+            if predicate is not None and not predicate(record):
+                continue
+            out.append(record)
+            if len(out) >= limit:
+                return out
+    return out
+
+
+@dataclass
+class _Checkpoint:
+    offset: int
+    value: Any
+
+
+@dataclass
+class SparseIndex:
+    """Every-``stride``-lines offset index over one append-only JSONL file.
+
+    ``refresh()`` scans only bytes appended since the last refresh; a file
+    that shrank or was replaced (new inode, e.g. after rotation) is
+    re-indexed from scratch. A trailing line without its newline is left
+    for the next refresh so a concurrent writer is never half-indexed.
+    """
+
+    path: Path
+    key: str = "ts"
+    stride: int = DEFAULT_STRIDE
+    lines: int = 0
+    _checkpoints: list[_Checkpoint] = field(default_factory=list)
+    _values: list[Any] = field(default_factory=list)
+    _end: int = 0
+    _inode: Optional[int] = None
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def _reset(self, inode: Optional[int]) -> None:
+        self.lines = 0
+        self._checkpoints = []
+        self._values = []
+        self._end = 0
+        self._inode = inode
+
+    def refresh(self) -> None:
+        """Index any lines appended since the previous refresh."""
+        with self._lock:
+            try:
+                st = self.path.stat()
+            except FileNotFoundError:
+                self._reset(None)
+                return
+            if st.st_ino != self._inode or st.st_size < self._end:
+                self._reset(st.st_ino)
+            if st.st_size == self._end:
+                return
+            with open(self.path, "rb") as fh:
+                fh.seek(self._end)
+                offset = self._end
+                for raw in fh:
+                    if not raw.endswith(b"\n"):
+                        break
+                    if raw.strip():
+                        if self.lines % self.stride == 0:
+                            self._add_checkpoint(offset, raw)
+                        self.lines += 1
+                    offset += len(raw)
+                self._end = offset
+
+    def _add_checkpoint(self, offset: int, raw: bytes) -> None:
+        try:
+            value = _key_of(json.loads(raw), self.key)
+        except ValueError:
+            value = None
+        # Only ordered, comparable checkpoints are bisectable; an unkeyed
+        # or out-of-order line just means a longer forward scan.
+        if value is None or (self._values and value < self._values[-1]):
+            return
+        self._checkpoints.append(_Checkpoint(offset, value))
+        self._values.append(value)
+
+    def offset_for(self, since: Any) -> int:
+        """Byte offset from which a forward scan sees every line >= *since*."""
+        i = bisect.bisect_left(self._values, since)
+        return self._checkpoints[i - 1].offset if i > 0 else 0
+
+    def iter_from(self, offset: int) -> Iterator[str]:
+        """Yield indexed, non-blank lines from *offset* forward."""
+        try:
+            fh = open(self.path, "rb")
+        except FileNotFoundError:
+            return
+        with fh:
+            fh.seek(offset)
+            pos = offset
+            for raw in fh:
+                pos += len(raw)
+                if pos > self._end:
+                    return
+                if raw.strip():
+                    yield raw.decode("utf-8", errors="replace")
+
+
+_index_lock = threading.Lock()
+_indexes: dict[tuple[str, str, int], SparseIndex] = {}
+
+
+def index_for(path: Path, key: str = "ts", stride: int = DEFAULT_STRIDE) -> SparseIndex:
+    """Return the process-wide, refreshed SparseIndex for *path*."""
+    cache_key = (str(Path(path).resolve()), key, stride)
+    with _index_lock:
+        idx = _indexes.get(cache_key)
+        if idx is None:
+            idx = _indexes[cache_key] = SparseIndex(Path(path), key=key, stride=stride)
+    idx.refresh()
+    return idx
+
+
+def reset_indexes() -> None:
+    """Drop every cached SparseIndex (tests, daemon restart)."""
+    with _index_lock:
+        _indexes.clear()
+
+
+def read_since(
+    path: PathArg,
+    since: Any,
+    *,
+    key: str = "ts",
+    predicate: Optional[Predicate] = None,
+    parse: Parser = json.loads,
+    limit: Optional[int] = None,
+) -> list[Any]:
+    """Return parsed records whose *key* is >= *since*, oldest first.
+
+    Each segment's SparseIndex bisects to the checkpoint just before
+    *since*, so only about ``stride`` lines before the answer are read.
+    The first call on a file builds its index with one forward pass;
+    later calls index only the bytes appended since.
+
+    Args:
+        path: A log file, or segments ordered oldest-to-newest.
+        since: Lower bound (inclusive) on each record's *key*.
+        key: Record field compared against *since*.
+        predicate: Optional filter applied to each parsed record.
+        parse: Line parser; lines raising ``ValueError`` are skipped.
+        limit: When set, keep only the newest *limit* matches.
+    """
+    out: list[Any] = []
+    for seg in _segments(path):
+        idx = index_for(seg, key=key)
+        for line in idx.iter_from(idx.offset_for(since)):
+            try:
+                record = parse(line)
+            except ValueError:
+                continue
+            value = _key_of(record, key)
+            if value is None or value < since:
+                continue
+            if predicate is not None and not predicate(record):
+                continue
+            out.append(record)
+    if limit is not None:
+        out = out[-limit:] if limit > 0 else []
+    return out
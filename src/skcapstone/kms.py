@@ -7,6 +7,12 @@ label-based lookup, and key expiry management.
 
 Every operation is logged to the security audit trail.
 
+Parsed keystore records are cached per process and revalidated against the
+file's inode, size and mtime on every lookup, so fresh ``KeyStore``
+instances on hot paths share one parse. Unwrapped key material is kept in
+a small TTL'd cache backed by an mlock()ed arena where the platform allows
+it, and zeroed on eviction.
+
 Key hierarchy:
     Agent identity key (PGP, managed by CapAuth)
     └── Master KMS key (derived via HKDF from identity fingerprint)
@@ -40,11 +46,17 @@ Usage:
 
 from __future__ import annotations
 
+import ctypes
+import ctypes.util
 import hashlib
 import json
 import logging
+import mmap
 import os
 import secrets
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 from enum import Enum
 from pathlib import Path
@@ -52,9 +64,15 @@ from typing import Any, Optional
 
 from pydantic import BaseModel, Field
 
-logger = logging.getLogger("skcapstone.kms")
+from .atomic_io import atomic_write_text
+from .file_watch import is_racy
 
+logger = logging.getLogger("skcapstone.kms")
 
+# Unwrapped key material cache: entries, seconds to live, bytes per slot.
+MATERIAL_CACHE_SIZE = 64
+MATERIAL_CACHE_TTL = 300.0
+_MATERIAL_SLOT = 64
 # ---------------------------------------------------------------------------
 # sksecurity backend integration
 # ---------------------------------------------------------------------------
@@ -270,6 +288,125 @@ def _key_id(label: str, key_type: KeyType, version: int = 1) -> str:
     return hashlib.sha256(data.encode()).hexdigest()[:16]
 
 
+# ---------------------------------------------------------------------------
+# In-process caches
+# ---------------------------------------------------------------------------
+
+
+def _stat_signature(path: Path) -> Optional[tuple[int, int, int, int]]:
+    """(device, inode, mtime_ns, size) of *path*, or None if it is missing."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def _lock_memory(arena: mmap.mmap) -> bool:
+    """mlock() *arena* and exclude it from core dumps where supported."""
+    if hasattr(mmap, "MADV_DONTDUMP"):
+        try:
+            arena.madvise(mmap.MADV_DONTDUMP)
+        except OSError:
+            pass
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        buf = (ctypes.c_char * len(arena)).from_buffer(arena)
+        if libc.mlock(ctypes.addressof(buf), ctypes.c_size_t(len(arena))) == 0:
+            return True
+        logger.debug("mlock failed (errno %d); key material cache is pageable", ctypes.get_errno())
+    except (AttributeError, OSError, TypeError, ValueError) as exc:
+        logger.debug("mlock unavailable (%s); key material cache is pageable", exc)
+    return False
+
+
+class _KeyMaterialCache:
+    """Bounded, TTL'd LRU cache of unwrapped key material.
+
+    Material lives in fixed-size slots of one anonymous mmap arena that is
+    mlock()ed when RLIMIT_MEMLOCK allows, so cached keys are not swapped
+    out. Slots are zeroed on eviction and expiry.
+    """
+
+    def __init__(self, maxsize: int = MATERIAL_CACHE_SIZE, ttl: float = MATERIAL_CACHE_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._arena = mmap.mmap(-1, max(1, maxsize) * _MATERIAL_SLOT)
+        self.locked = _lock_memory(self._arena)
+        self._free = list(range(maxsize))
+        self._entries: OrderedDict[tuple, tuple[int, int, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            slot, length, expires = entry
+            if time.monotonic() >= expires:
+                self._evict(key)
+                return None
+            self._entries.move_to_end(key)
+            offset = slot * _MATERIAL_SLOT
+            return self._arena[offset : offset + length]
+
+    def put(self, key: tuple, material: bytes) -> None:
+        if self.maxsize <= 0 or len(material) > _MATERIAL_SLOT:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._evict(key)
+            if not self._free:
+                self._evict(next(iter(self._entries)))
+            slot = self._free.pop()
+            offset = slot * _MATERIAL_SLOT
+            self._arena[offset : offset + len(material)] = material
+            self._entries[key] = (slot, len(material), time.monotonic() + self.ttl)
+
+    def discard(self, store: str, key_id: Optional[str] = None) -> None:
+        """Drop entries for one keystore, or one key in it."""
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == store]:
+                if key_id is None or key[1] == key_id:
+                    self._evict(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            for key in list(self._entries):
+                self._evict(key)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _evict(self, key: tuple) -> None:
+        slot, _, _ = self._entries.pop(key)
+        offset = slot * _MATERIAL_SLOT
+        self._arena[offset : offset + _MATERIAL_SLOT] = bytes(_MATERIAL_SLOT)
+        self._free.append(slot)
+
+
+_records_lock = threading.Lock()
+_record_cache: dict[str, tuple[tuple[int, int, int, int], tuple[KeyRecord, ...]]] = {}
+_material_cache: Optional[_KeyMaterialCache] = None
+
+
+def _get_material_cache() -> _KeyMaterialCache:
+    global _material_cache
+    if _material_cache is None:
+        with _records_lock:
+            if _material_cache is None:
+                _material_cache = _KeyMaterialCache()
+    return _material_cache
+
+
+def clear_caches() -> None:
+    """Drop all cached keystore records and key material in this process."""
+    with _records_lock:
+        _record_cache.clear()
+    if _material_cache is not None:
+        _material_cache.clear()
+
+
 # ---------------------------------------------------------------------------
 # KeyStore
 # ---------------------------------------------------------------------------
@@ -289,9 +426,11 @@ class KeyStore:
 
     Args:
         home: Agent home directory (~/.skcapstone).
+        cache: Share parsed records and unwrapped key material through the
+            process-wide caches. False reads and unwraps from disk every time.
     """
 
-    def __init__(self, home: Path) -> None:
+    def __init__(self, home: Path, cache: bool = True) -> None:
         self._home = home
         self._kms_dir = home / "security" / "kms"
         self._keys_dir = self._kms_dir / "keys"
@@ -299,6 +438,8 @@ class KeyStore:
         self._rotation_log = self._kms_dir / "rotation-log.json"
         self._master_material: Optional[bytes] = None
         self._backend_kms: Optional[Any] = None
+        self._cache = cache
+        self._cache_key = str(self._keystore_file.absolute())
 
     @property
     def backend(self) -> Optional[Any]:
@@ -324,10 +465,10 @@ class KeyStore:
         self._kms_dir.mkdir(parents=True, exist_ok=True)
         self._keys_dir.mkdir(exist_ok=True)
 
-        existing = self._load_records()
+        existing = self._records()
         master = next((r for r in existing if r.key_type == KeyType.MASTER), None)
         if master and master.status == KeyStatus.ACTIVE:
-            self._master_material = self._load_key_material(master.key_id)
+            self._master_material = self._material(master)
             self._init_backend()
             return master
 
@@ -413,7 +554,7 @@ class KeyStore:
             parent = self.get_key(parent_label)
             if not parent:
                 raise ValueError(f"Parent key '{parent_label}' not found")
-            parent_material = self._load_key_material(parent.key_id)
+            parent_material = self._material(parent)
             parent_id = parent.key_id
         else:
             self._ensure_master()
@@ -640,6 +781,8 @@ class KeyStore:
         key_file = self._keys_dir / f"{key_id}.key.enc"
         if key_file.exists():
             key_file.unlink()
+        if self._cache:
+            _get_material_cache().discard(self._cache_key, key_id)
 
         self._audit(
             "KEY_REVOKE",
@@ -663,17 +806,16 @@ class KeyStore:
         Returns:
             KeyRecord if found, None otherwise.
         """
-        records = self._load_records()
         matches = [
             r
-            for r in records
+            for r in self._records()
             if r.label == label
             and r.status == KeyStatus.ACTIVE
             and (key_type is None or r.key_type == key_type)
         ]
         if not matches:
             return None
-        return max(matches, key=lambda r: r.version)
+        return max(matches, key=lambda r: r.version).model_copy(deep=True)
 
     def list_keys(
         self,
@@ -710,7 +852,7 @@ class KeyStore:
             ValueError: If key not found.
             PermissionError: If agent not in team ACL.
         """
-        record = self._get_record_by_id(key_id)
+        record = self._find_record(key_id)
         if not record:
             raise ValueError(f"Key '{key_id}' not found")
 
@@ -726,7 +868,7 @@ class KeyStore:
                 )
                 raise PermissionError(f"Agent '{agent_name}' not in team '{record.label}' members")
 
-        material = self._load_key_material(key_id)
+        material = self._material(record)
         self._audit(
             "KEY_ACCESS",
             f"Key material accessed: '{record.label}' ({key_id})",
@@ -796,9 +938,12 @@ class KeyStore:
         """Ensure the master key is loaded."""
         if self._master_material is None:
             return self.initialize()
-        records = self._load_records()
         master = next(
-            (r for r in records if r.key_type == KeyType.MASTER and r.status == KeyStatus.ACTIVE),
+            (
+                r
+                for r in self._records()
+                if r.key_type == KeyType.MASTER and r.status == KeyStatus.ACTIVE
+            ),
             None,
         )
         if master is None:
@@ -866,8 +1011,30 @@ class KeyStore:
         logger.warning("No identity found for KMS - using random master seed")
         return secrets.token_bytes(64)
 
-    def _load_records(self) -> list[KeyRecord]:
-        """Load all key records from disk."""
+    def _records(self) -> tuple[KeyRecord, ...]:
+        """All key records, shared with the process cache - do not mutate.
+
+        The cached parse is reused while the keystore's (device, inode,
+        mtime, size) signature is unchanged and its mtime is outside the
+        racy window; otherwise the file is re-read.
+        """
+        if not self._cache:
+            return tuple(self._read_records())
+        sig = _stat_signature(self._keystore_file)
+        if sig is None:
+            return ()
+        with _records_lock:
+            hit = _record_cache.get(self._cache_key)
+        if hit is not None and hit[0] == sig and not is_racy(sig[2]):
+            return hit[1]
+        records = self._read_records()
+        if records:
+            with _records_lock:
+                _record_cache[self._cache_key] = (sig, tuple(records))
+        return tuple(records)
+
+    def _read_records(self) -> list[KeyRecord]:
+        """Parse all key records from disk."""
         if not self._keystore_file.exists():
             return []
         try:
@@ -877,11 +1044,17 @@ class KeyStore:
             logger.warning("Failed to load keystore: %s", exc)
             return []
 
+    def _load_records(self) -> list[KeyRecord]:
+        """Load all key records as private, mutable copies."""
+        return [r.model_copy(deep=True) for r in self._records()]
+
     def _save_records(self, records: list[KeyRecord]) -> None:
         """Write all key records to disk."""
         self._kms_dir.mkdir(parents=True, exist_ok=True)
         data = [r.model_dump(mode="json") for r in records]
-        self._keystore_file.write_text(json.dumps(data, indent=2, default=str), encoding="utf-8")
+        atomic_write_text(self._keystore_file, json.dumps(data, indent=2, default=str))
+        with _records_lock:
+            _record_cache.pop(self._cache_key, None)
 
     def _append_record(self, record: KeyRecord) -> None:
         """Add a new record to the keystore."""
@@ -898,11 +1071,31 @@ class KeyStore:
                 break
         self._save_records(records)
 
+    def _find_record(self, key_id: str) -> Optional[KeyRecord]:
+        """Find the shared (read-only) record for key_id."""
+        matches = [r for r in self._records() if r.key_id == key_id]
+        return matches[-1] if matches else None
+
     def _get_record_by_id(self, key_id: str) -> Optional[KeyRecord]:
         """Find a record by key_id."""
-        records = self._load_records()
-        matches = [r for r in records if r.key_id == key_id]
-        return matches[-1] if matches else None
+        record = self._find_record(key_id)
+        return record.model_copy(deep=True) if record else None
+
+    def _material(self, record: KeyRecord) -> bytes:
+        """Unwrapped material for *record*, via the key material cache.
+
+        Entries are keyed by keystore, key ID and fingerprint, so rotated
+        or re-derived material never matches a stale entry.
+        """
+        if not self._cache:
+            return self._load_key_material(record.key_id)
+        cache = _get_material_cache()
+        key = (self._cache_key, record.key_id, record.fingerprint)
+        material = cache.get(key)
+        if material is None:
+            material = self._load_key_material(record.key_id)
+            cache.put(key, material)
+        return material
 
     def _save_key_material(self, key_id: str, raw: bytes) -> None:
         """Encrypt and save raw key material to disk using AES-256-GCM."""
@@ -0,0 +1,460 @@
+"""
+Shared, change-driven tailing of log files for streaming endpoints.
+
+Before this module every ``/api/v1/logs`` WebSocket client ran its own
+tail loop: reopen ``daemon.log`` every 0.5 s, read whatever was new, send
+one frame per line. With several dashboards open that was N wakeups and
+N reads of the same bytes per interval.
+
+``tailer_for(path)`` returns the one ``LogTailer`` for a file. Its single
+thread sleeps until the log directory changes (inotify through
+``file_watch.PathWatcher`` when watchdog is installed, a 0.5 s poll
+otherwise), reads the new bytes once, and offers them as a ``LogBatch``
+to every ``Subscription``:
+
+    * Queues are bounded. A subscriber that is not draining them loses
+      batches instead of stalling the tailer; the number of lost lines is
+      reported on the next batch it does receive (``LogBatch.dropped``).
+    * Subscriptions may carry a ``LineFilter`` (minimum level and logger
+      name prefixes) so filtering happens server-side. The JSON lines
+      ``log_config.JsonFormatter`` writes and the plain
+      ``[logger] LEVEL:`` console format are both understood.
+    * Rotation (``RotatingFileHandler`` renaming ``daemon.log`` to
+      ``daemon.log.1``) and truncation are detected by inode and size; the
+      old file is drained before the new one is followed from the start.
+
+The thread starts with the first subscriber and exits with the last. The
+end of the last line fanned out is saved after every batch; a thread
+started while its predecessor is still winding down resumes from there,
+and the old thread emits nothing more, so no line reaches a subscriber
+twice.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import queue
+import re
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Optional
+
+from .file_watch import PathWatcher
+from .jsonl_tail import iter_lines_reversed
+
+logger = logging.getLogger("skcapstone.log_tailer")
+
+DEFAULT_QUEUE_BATCHES = 256
+MAX_BATCH_LINES = 500
+POLL_INTERVAL = 0.5
+SAFETY_POLL_INTERVAL = 5.0
+
+_LEVELS = {"DEBUG": 10, "INFO": 20, "WARNING": 30, "WARN": 30, "ERROR": 40, "CRITICAL": 50}
+_TEXT_LINE = re.compile(r"\[(?P<logger>[^\]]+)\] (?P<level>[A-Z]+):")
+
+
+def _line_meta(line: str) -> tuple[Optional[str], Optional[str]]:
+    """Return ``(level, logger)`` parsed from a log line, or Nones."""
+    if line.startswith("{"):
+        try:
+            rec = json.loads(line)
+            return rec.get("level"), rec.get("logger")
+        except (ValueError, AttributeError):
+            pass
+    m = _TEXT_LINE.search(line)
+    if m:
+        return m.group("level"), m.group("logger")
+    return None, None
+
+
+@dataclass(frozen=True)
+class LineFilter:
+    """Server-side filter for a subscription.
+
+    Lines whose level or logger cannot be parsed are kept, so unusual
+    output (a traceback printed by a library) is never silently hidden.
+
+    Attributes:
+        min_level: Minimum numeric level (``logging.WARNING`` etc.).
+        loggers: Logger name prefixes to keep; empty keeps all.
+    """
+
+    min_level: int = 0
+    loggers: tuple[str, ...] = ()
+
+    @classmethod
+    def from_params(
+        cls, level: Optional[str] = None, loggers: Optional[str] = None
+    ) -> Optional["LineFilter"]:
+        """Build a filter from query-string values, or None if both are empty.
+
+        Args:
+            level: Level name such as ``"WARNING"`` (case-insensitive).
+            loggers: Comma-separated logger name prefixes.
+
+        Raises:
+            ValueError: If *level* is not a known level name.
+        """
+        min_level = 0
+        if level:
+            try:
+                min_level = _LEVELS[level.strip().upper()]
+            except KeyError:
+                raise ValueError(f"unknown log level: {level!r}") from None
+        prefixes = tuple(p.strip() for p in (loggers or "").split(",") if p.strip())
+        if not min_level and not prefixes:
+            return None
+        return cls(min_level=min_level, loggers=prefixes)
+
+    def matches(self, level: Optional[str], name: Optional[str]) -> bool:
+        """True if a line with *level* and logger *name* passes."""
+        if self.min_level and level is not None:
+            if _LEVELS.get(level.upper(), 0) < self.min_level:
+                return False
+        if self.loggers and name is not None:
+            if not any(name == p or name.startswith(p + ".") for p in self.loggers):
+                return False
+        return True
+
+
+@dataclass
+class LogBatch:
+    """New lines for one subscriber.
+
+    Attributes:
+        lines: Log lines without trailing newlines, oldest first.
+        dropped: Lines this subscriber lost to a full queue since the
+            previous batch it received.
+    """
+
+    lines: list[str]
+    dropped: int = 0
+
+
+def ws_messages(batch: LogBatch, batched: bool = False) -> list[dict]:
+    """JSON messages for a ``/api/v1/logs`` client.
+
+    Args:
+        batch: The batch to encode.
+        batched: One ``{"type": "lines", "lines": [...]}`` message instead
+            of one ``{"type": "line", "line": ...}`` message per line.
+    """
+    out: list[dict] = []
+    if batch.dropped:
+        out.append({"type": "dropped", "count": batch.dropped})
+    if batched:
+        if batch.lines:
+            out.append({"type": "lines", "lines": batch.lines})
+    else:
+        out.extend({"type": "line", "line": ln} for ln in batch.lines)
+    return out
+
+
+class Subscription:
+    """A bounded, thread-consumed feed of ``LogBatch`` objects."""
+
+    def __init__(self, tailer: "LogTailer", line_filter: Optional[LineFilter], maxsize: int):
+        self._tailer = tailer
+        self.line_filter = line_filter
+        self._queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self._pending_dropped = 0
+        self.dropped_total = 0
+        self.closed = False
+
+    def get(self, timeout: Optional[float] = None) -> Optional[LogBatch]:
+        """Next batch, or None if *timeout* expired first."""
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def close(self) -> None:
+        """Stop receiving batches."""
+        self.closed = True
+        self._tailer.unsubscribe(self)
+
+    def __enter__(self) -> "Subscription":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _offer(self, lines: list[str]) -> None:
+        batch = LogBatch(lines, self._pending_dropped)
+        if self._full():
+            self._pending_dropped += len(lines)
+            self.dropped_total += len(lines)
+            return
+        self._pending_dropped = 0
+        self._put(batch)
+
+    def _full(self) -> bool:
+        return self._queue.full()
+
+    def _put(self, batch: LogBatch) -> None:
+        try:
+            self._queue.put_nowait(batch)
+        except queue.Full:  # raced with another producer; count it as dropped
+            self._pending_dropped += len(batch.lines)
+            self.dropped_total += len(batch.lines)
+
+
+class AsyncSubscription(Subscription):
+    """A subscription consumed from an asyncio event loop."""
+
+    def __init__(
+        self,
+        tailer: "LogTailer",
+        line_filter: Optional[LineFilter],
+        maxsize: int,
+        loop: asyncio.AbstractEventLoop,
+    ):
+        super().__init__(tailer, line_filter, maxsize)
+        self._loop = loop
+        self._aqueue: asyncio.Queue[LogBatch] = asyncio.Queue(maxsize=maxsize)
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[LogBatch]:  # type: ignore[override]
+        """Next batch, or None if *timeout* expired first."""
+        try:
+            return await asyncio.wait_for(self._aqueue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def _full(self) -> bool:
+        return self._aqueue.full()
+
+    def _put(self, batch: LogBatch) -> None:
+        try:
+            self._loop.call_soon_threadsafe(self._deliver, batch)
+        except RuntimeError:  # loop closed; the owner is gone
+            self.close()
+
+    def _deliver(self, batch: LogBatch) -> None:
+        try:
+            self._aqueue.put_nowait(batch)
+        except asyncio.QueueFull:
+            self._pending_dropped += len(batch.lines)
+            self.dropped_total += len(batch.lines)
+
+
+@dataclass
+class _Cursor:
+    fh: Optional[IO[bytes]] = None
+    ino: Optional[int] = None
+    partial: bytes = b""
+    start_at_end: bool = True
+    resume: Optional[tuple[int, int]] = None
+    lines: list[str] = field(default_factory=list)
+
+    def consumed(self) -> Optional[tuple[int, int]]:
+        """``(inode, offset)`` just past the last complete line read."""
+        if self.fh is None or self.ino is None:
+            return None
+        return self.ino, self.fh.tell() - len(self.partial)
+
+
+class LogTailer:
+    """One reader thread per log file, fanning new lines out to subscribers.
+
+    Args:
+        path: The log file (need not exist yet).
+        watcher: PathWatcher used to wake on changes to the file's
+            directory; polling every ``POLL_INTERVAL`` when None or when
+            inotify is unavailable.
+    """
+
+    def __init__(self, path: Path, watcher: Optional[PathWatcher] = None) -> None:
+        self.path = Path(path)
+        self._watcher = watcher
+        self._subs: list[Subscription] = []
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._watching = False
+        # Serialises fan-out with the hand-over to a restarted thread.
+        self._emit_lock = threading.Lock()
+        self._emitted: Optional[tuple[int, int]] = None
+        self.reads = 0
+
+    # ------------------------------------------------------------------
+    # Subscribers
+    # ------------------------------------------------------------------
+
+    def subscribe(
+        self,
+        line_filter: Optional[LineFilter] = None,
+        *,
+        maxsize: int = DEFAULT_QUEUE_BATCHES,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+    ) -> Subscription:
+        """Receive every line appended from now on.
+
+        Args:
+            line_filter: Optional server-side filter.
+            maxsize: Queue bound, in batches.
+            loop: Deliver to this event loop (returns an AsyncSubscription).
+        """
+        if loop is not None:
+            sub: Subscription = AsyncSubscription(self, line_filter, maxsize, loop)
+        else:
+            sub = Subscription(self, line_filter, maxsize)
+        with self._lock:
+            self._subs.append(sub)
+            if self._thread is None or self._stop.is_set():
+                self._start()
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        """Remove *sub*; the reader thread exits with the last subscriber."""
+        with self._lock:
+            if sub in self._subs:
+                self._subs.remove(sub)
+            if not self._subs:
+                self._stop.set()
+                self._wake.set()
+
+    def recent(self, n: int = 50, line_filter: Optional[LineFilter] = None) -> list[str]:
+        """The last *n* lines currently in the file (oldest first)."""
+        out: list[str] = []
+        if n <= 0:
+            return out
+        for line in iter_lines_reversed(self.path):
+            if line_filter is None or line_filter.matches(*_line_meta(line)):
+                out.append(line)
+                if len(out) >= n:
+                    break
+        out.reverse()
+        return out
+
+    # ------------------------------------------------------------------
+    # Reader thread
+    # ------------------------------------------------------------------
+
+    def _start(self) -> None:
+        # A predecessor still running may have read lines it will now never
+        # emit; resume from what it did emit instead of jumping to the end.
+        resume = self._thread is not None and self._thread.is_alive()
+        self._stop = threading.Event()
+        if not self._watching and self._watcher is not None:
+            self._watching = self._watcher.subscribe(self.path.parent, self._on_change)
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(self._stop, resume),
+            name=f"log-tail-{self.path.name}",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def _on_change(self, changed: Path) -> None:
+        if changed.name.startswith(self.path.name):
+            self._wake.set()
+
+    def _run(self, stop: threading.Event, resume: bool = False) -> None:
+        cursor = _Cursor()
+        if resume:
+            with self._emit_lock:
+                cursor.resume = self._emitted
+        try:
+            while not stop.is_set():
+                self._wake.clear()
+                self._read(cursor)
+                with self._emit_lock:
+                    if stop.is_set():
+                        break  # a successor owns the stream from _emitted on
+                    if cursor.lines:
+                        lines, cursor.lines = cursor.lines, []
+                        for i in range(0, len(lines), MAX_BATCH_LINES):
+                            self._fan_out(lines[i : i + MAX_BATCH_LINES])
+                    self._emitted = cursor.consumed()
+                interval = SAFETY_POLL_INTERVAL if self._watching else POLL_INTERVAL
+                self._wake.wait(timeout=interval)
+        finally:
+            if cursor.fh is not None:
+                cursor.fh.close()
+
+    def _read(self, cursor: _Cursor) -> None:
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            st = None
+        except OSError as exc:
+            logger.warning("Cannot stat %s: %s", self.path, exc)
+            return
+        if cursor.fh is not None:
+            self._drain(cursor)
+            rotated = st is None or st.st_ino != cursor.ino
+            truncated = st is not None and not rotated and st.st_size < cursor.fh.tell()
+            if not (rotated or truncated):
+                return
+            cursor.fh.close()
+            cursor.fh = None
+            cursor.partial = b""
+            cursor.start_at_end = False
+        if st is None:
+            cursor.start_at_end = False  # whatever appears next is new
+            return
+        try:
+            cursor.fh = open(self.path, "rb")
+        except OSError as exc:
+            logger.warning("Cannot open %s: %s", self.path, exc)
+            return
+        cursor.ino = os.fstat(cursor.fh.fileno()).st_ino
+        if cursor.resume is not None and cursor.resume[0] == cursor.ino:
+            cursor.fh.seek(cursor.resume[1])
+        elif cursor.start_at_end:
+            cursor.fh.seek(0, os.SEEK_END)
+        cursor.resume = None
+        cursor.start_at_end = False
+        self._drain(cursor)
+
+    def _drain(self, cursor: _Cursor) -> None:
+        assert cursor.fh is not None
+        data = cursor.fh.read()
+        if not data:
+            return
+        self.reads += 1
+        data = cursor.partial + data
+        *complete, cursor.partial = data.split(b"\n")
+        cursor.lines.extend(
+            ln.decode("utf-8", errors="replace").rstrip("\r") for ln in complete if ln.strip()
+        )
+
+    def _fan_out(self, lines: list[str]) -> None:
+        with self._lock:
+            subs = list(self._subs)
+        if not subs:
+            return
+        meta: Optional[list[tuple[Optional[str], Optional[str]]]] = None
+        for sub in subs:
+            if sub.line_filter is None:
+                sub._offer(lines)
+                continue
+            if meta is None:
+                meta = [_line_meta(ln) for ln in lines]
+            flt = sub.line_filter
+            kept = [ln for ln, m in zip(lines, meta) if flt.matches(*m)]
+            if kept:
+                sub._offer(kept)
+
+
+_tailers: dict[Path, LogTailer] = {}
+_tailers_lock = threading.Lock()
+_watcher: Optional[PathWatcher] = None
+
+
+def tailer_for(path: Path) -> LogTailer:
+    """Return the process-wide tailer for *path*."""
+    global _watcher
+    key = Path(path).expanduser().resolve()
+    with _tailers_lock:
+        tailer = _tailers.get(key)
+        if tailer is None:
+            if _watcher is None:
+                _watcher = PathWatcher()
+            tailer = _tailers[key] = LogTailer(key, _watcher)
+        return tailer
@@ -30,6 +30,14 @@ TOOLS: list[Tool] = [
                     "type": "boolean",
                     "description": "Whether to encrypt chunks (default: true)",
                 },
+                "chunking": {
+                    "type": "string",
+                    "enum": ["fixed", "cdc"],
+                    "description": (
+                        "'cdc' cuts content-defined chunks and skips chunks the "
+                        "recipient already has (default: fixed)"
+                    ),
+                },
             },
             "required": ["file_path", "recipient"],
         },
@@ -94,6 +102,7 @@ async def _handle_file_send(args: dict) -> list[TextContent]:
         file_path,
         recipient=args["recipient"],
         encrypt=args.get("encrypt", True),
+        chunking=args.get("chunking", "fixed"),
     )
     return _json_response(
         {
@@ -101,6 +110,7 @@ async def _handle_file_send(args: dict) -> list[TextContent]:
             "filename": manifest.filename,
             "file_size": manifest.file_size,
             "total_chunks": manifest.total_chunks,
+            "bytes_written": sum(c.size for c in manifest.chunks if c.stored),
             "sender": manifest.sender,
             "recipient": manifest.recipient,
             "file_sha256": manifest.file_sha256[:16] + "...",
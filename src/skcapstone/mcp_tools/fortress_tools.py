@@ -11,7 +11,7 @@ TOOLS: list[Tool] = [
         name="fortress_verify",
         description=(
             "Verify integrity of all memories in a layer. Checks HMAC-SHA256 seals to detect "
-            "tampering."
+            "tampering. Incremental sweeps only re-check memories changed since the last one."
         ),
         inputSchema={
             "properties": {
@@ -20,7 +20,11 @@ TOOLS: list[Tool] = [
                         "Memory layer: short-term, mid-term, or long-term (omit for all)"
                     ),
                     "type": "string",
-                }
+                },
+                "incremental": {
+                    "description": "Skip memories unchanged since the last sweep",
+                    "type": "boolean",
+                },
             },
             "required": [],
             "type": "object",
@@ -54,32 +58,23 @@ async def _handle_fortress_verify(args: dict) -> list[TextContent]:
     fortress.initialize()
 
     layer = args.get("layer")
-    if layer:
-        layer_dir = home / "memory" / layer
-        if not layer_dir.is_dir():
-            return _error_response(f"Layer directory not found: {layer}")
-        results = []
-        for f in sorted(layer_dir.glob("*.json")):
-            _, seal_result = fortress.verify_and_load(f)
-            results.append(
-                {
-                    "memory_id": seal_result.memory_id,
-                    "verified": seal_result.verified,
-                    "tampered": seal_result.tampered,
-                    "sealed": seal_result.sealed,
-                }
-            )
-    else:
-        seal_results = fortress.verify_all(home)
-        results = [
-            {
-                "memory_id": r.memory_id,
-                "verified": r.verified,
-                "tampered": r.tampered,
-                "sealed": r.sealed,
-            }
-            for r in seal_results
-        ]
+    if layer and not (home / "memory" / layer).is_dir():
+        return _error_response(f"Layer directory not found: {layer}")
+
+    seal_results = fortress.verify_all(
+        home,
+        incremental=bool(args.get("incremental", False)),
+        layers=[layer] if layer else None,
+    )
+    results = [
+        {
+            "memory_id": r.memory_id,
+            "verified": r.verified,
+            "tampered": r.tampered,
+            "sealed": r.sealed,
+        }
+        for r in seal_results
+    ]
 
     tampered = sum(1 for r in results if r.get("tampered"))
     verified = sum(1 for r in results if r.get("verified"))
@@ -89,6 +84,8 @@ async def _handle_fortress_verify(args: dict) -> list[TextContent]:
             "verified": verified,
             "tampered": tampered,
             "unsealed": len(results) - verified - tampered,
+            "checked": fortress.last_scan.get("checked", 0),
+            "memories_per_second": fortress.last_scan.get("memories_per_second"),
             "details": results,
         }
     )
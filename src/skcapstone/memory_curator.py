@@ -24,11 +24,13 @@ import re
 from dataclasses import dataclass, field
 from pathlib import Path
 
+from .memory_dedup import DEFAULT_SIMILARITY, merge_into, text_tokens
 from .memory_engine import (
     _entry_path,
     _save_entry,
     list_memories,
 )
+from .minhash import LSHIndex, jaccard, minhash
 from .models import MemoryEntry, MemoryLayer
 
 
@@ -77,10 +79,13 @@ class MemoryCurator:
 
     Args:
         home: Agent home directory (~/.skcapstone).
+        dedup_similarity: Word-set Jaccard similarity at which the
+            dedupe pass treats two memories as duplicates.
     """
 
-    def __init__(self, home: Path) -> None:
+    def __init__(self, home: Path, dedup_similarity: float = DEFAULT_SIMILARITY) -> None:
         self.home = home
+        self.dedup_similarity = dedup_similarity
 
     def curate(
         self,
@@ -155,8 +160,16 @@ class MemoryCurator:
     def _pass_dedupe(
         self, memories: list[MemoryEntry], result: CurationResult, dry_run: bool
     ) -> None:
-        """Identify and remove near-duplicate memories."""
-        seen: dict[str, str] = {}
+        """Identify and remove duplicate and near-duplicate memories.
+
+        Exact copies are caught by normalized content hash, rewordings by
+        a MinHash/LSH lookup of their word set against the memories kept
+        so far. The kept memory absorbs each duplicate's tags and importance.
+        """
+        seen: dict[str, MemoryEntry] = {}
+        lsh = LSHIndex(self.dedup_similarity)
+        kept: list[tuple[MemoryEntry, frozenset[str]]] = []
+        merged: dict[str, MemoryEntry] = {}
 
         sorted_memories = sorted(
             memories,
@@ -169,16 +182,32 @@ class MemoryCurator:
 
         for entry in sorted_memories:
             content_hash = _content_hash(entry.content)
-
-            if content_hash in seen:
+            words = text_tokens(entry.content)
+            signature = minhash(words)
+            survivor = seen.get(content_hash)
+            if survivor is None:
+                for pos in sorted(lsh.candidates(signature)):
+                    other, other_words = kept[pos]
+                    if jaccard(words, other_words) >= self.dedup_similarity:
+                        survivor = other
+                        break
+
+            if survivor is not None:
                 result.deduped.append(entry.memory_id)
                 if not dry_run:
+                    if merge_into(survivor, entry):
+                        merged[survivor.memory_id] = survivor
                     path = _entry_path(self.home, entry)
                     if path.exists():
                         path.unlink()
                 continue
 
-            seen[content_hash] = entry.memory_id
+            seen[content_hash] = entry
+            lsh.add(len(kept), signature)
+            kept.append((entry, words))
+
+        for survivor in merged.values():
+            _save_entry(self.home, survivor)
 
     def get_stats(self) -> dict:
         """Get curation-oriented statistics.
@@ -0,0 +1,274 @@
+"""Near-duplicate detection across the memory tiers.
+
+Two memories are near-duplicates when the Jaccard similarity of their word
+sets (``text_tokens`` of the content) reaches a threshold - 1.0 for exact
+copies, less for rewordings that keep most of the vocabulary. Each memory
+is read once to compute a MinHash signature of that set, and the
+signature is cached per file by ``(mtime_ns, size)`` in a
+``MemoryMetaIndex`` persisted as ``memory/dedup-signatures.json``
+(node-local, not synced), so a later pass only stats unchanged files.
+Candidate pairs come from LSH buckets (``skcapstone.minhash``) and are
+confirmed with the exact similarity, which re-reads just those files.
+
+Survivors are chosen highest tier first, then newest: each memory is
+checked against the survivors chosen so far and either becomes one or is
+reported as a duplicate of its most similar match. ``SignatureCache``
+keeps the last result until a refresh sees a file change.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import re
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+from .memory_index import MemoryMetaIndex
+from .minhash import LSHIndex, Signature, jaccard, minhash, signature_from_hex, signature_to_hex
+from .models import MemoryEntry, MemoryLayer
+
+logger = logging.getLogger("skcapstone.memory_dedup")
+
+SIGNATURE_CACHE_NAME = "dedup-signatures.json"
+DEFAULT_SIMILARITY = 0.85
+_TIER_RANK = {"long-term": 0, "mid-term": 1, "short-term": 2}
+_WORD = re.compile(r"[a-z0-9]+")
+
+
+def text_tokens(text: str) -> frozenset[str]:
+    """The lowercase word set of *text*, as compared by every dedup pass."""
+    return frozenset(_WORD.findall(text.lower()))
+
+
+def memory_tokens(data: Any) -> frozenset[str]:
+    """``text_tokens`` of a memory's content, from its parsed JSON."""
+    content = data.get("content") if isinstance(data, dict) else None
+    return text_tokens(content) if isinstance(content, str) else frozenset()
+
+
+def _read_tokens(path: Path) -> frozenset[str]:
+    try:
+        return memory_tokens(json.loads(path.read_text(encoding="utf-8")))
+    except (OSError, ValueError):
+        return frozenset()
+
+
+def _signature_payload(data: dict) -> str:
+    """Per-file payload of the signature cache: the content's MinHash, hex-encoded."""
+    return signature_to_hex(minhash(memory_tokens(data)))
+
+
+@dataclass(frozen=True)
+class MemorySignature:
+    """Cached dedup fields of one memory file.
+
+    Attributes:
+        directory: The tier directory holding the file.
+        name: The file name.
+        memory_id: Its id.
+        layer: Tier value.
+        importance: Importance score.
+        created: ``created_at`` as epoch seconds.
+        signature: MinHash of its word set (empty when it has no words).
+    """
+
+    directory: Path
+    name: str
+    memory_id: str
+    layer: str
+    importance: float
+    created: float
+    signature: Signature
+
+    @property
+    def path(self) -> Path:
+        """The memory's JSON file."""
+        return self.directory / self.name
+
+
+@dataclass(frozen=True)
+class DuplicateCandidate:
+    """A memory found to near-duplicate a survivor.
+
+    Attributes:
+        memory_id: The duplicate's id.
+        path: The duplicate's file.
+        duplicate_of: The survivor's id.
+        survivor_path: The survivor's file.
+        similarity: Jaccard similarity of their word sets.
+    """
+
+    memory_id: str
+    path: Path
+    duplicate_of: str
+    survivor_path: Path
+    similarity: float
+
+
+class SignatureCache:
+    """Per-file MinHash signatures of one memory directory, refreshed incrementally.
+
+    A ``memory_index.MemoryMetaIndex`` persisted as ``dedup-signatures.json``
+    whose per-file payload is the signature, so a refresh re-reads only
+    changed files. Decoded signatures and the last duplicate scan are
+    reused until a refresh changes a record.
+
+    Args:
+        mem_dir: The memory directory holding the tier subdirectories.
+        persist: Load and save ``dedup-signatures.json`` (default True).
+    """
+
+    def __init__(self, mem_dir: Path, persist: bool = True) -> None:
+        self.mem_dir = mem_dir
+        self._index = MemoryMetaIndex(
+            mem_dir, persist, name=SIGNATURE_CACHE_NAME, payload=_signature_payload
+        )
+        self._lock = threading.Lock()
+        # Signatures decoded from the payload (by identity) they were built from.
+        self._decoded: dict[tuple[str, str], tuple[str, MemorySignature]] = {}
+        self._found: Optional[tuple[tuple[int, float], list[DuplicateCandidate]]] = None
+        self.stats = self._index.stats
+        self.stats["scans"] = 0
+
+    @property
+    def path(self) -> Path:
+        """Where the cache is persisted."""
+        return self._index.path
+
+    def refresh(self) -> None:
+        """Bring every tier up to date, re-reading only changed files."""
+        self._index.refresh()
+
+    def entries(self) -> list[MemorySignature]:
+        """Every cached memory as of the last refresh."""
+        out: list[MemorySignature] = []
+        with self._lock:
+            decoded: dict[tuple[str, str], tuple[str, MemorySignature]] = {}
+            for layer in MemoryLayer:
+                for meta in self._index.entries(layer):
+                    key = (meta.layer, meta.name)
+                    prior = self._decoded.get(key)
+                    if prior is None or prior[0] is not meta.payload:
+                        try:
+                            sig = signature_from_hex(meta.payload)
+                        except (TypeError, ValueError):
+                            continue
+                        prior = (
+                            meta.payload,
+                            MemorySignature(
+                                directory=meta.directory,
+                                name=meta.name,
+                                memory_id=meta.memory_id,
+                                layer=meta.layer,
+                                importance=meta.importance,
+                                created=meta.created,
+                                signature=sig,
+                            ),
+                        )
+                    decoded[key] = prior
+                    out.append(prior[1])
+            self._decoded = decoded
+        return out
+
+    def duplicates(self, threshold: float = DEFAULT_SIMILARITY) -> list[DuplicateCandidate]:
+        """``find_near_duplicates`` over ``entries()``, reused until a file changes."""
+        with self._lock:
+            key = (self._index.generation, threshold)
+            if self._found is not None and self._found[0] == key:
+                return list(self._found[1])
+        self.stats["scans"] += 1
+        found = find_near_duplicates(self.entries(), threshold)
+        with self._lock:
+            self._found = (key, found)
+        return list(found)
+
+
+def find_near_duplicates(
+    memories: list[MemorySignature],
+    threshold: float = DEFAULT_SIMILARITY,
+    tokens_of: Callable[[Path], frozenset[str]] = _read_tokens,
+) -> list[DuplicateCandidate]:
+    """Pair every near-duplicate memory with the survivor it duplicates.
+
+    Args:
+        memories: The memories to check, typically ``SignatureCache.entries()``.
+        threshold: Minimum Jaccard similarity of word sets.
+        tokens_of: Word set of a memory file, for confirming LSH candidates.
+
+    Returns:
+        One DuplicateCandidate per memory that is not kept, in check order.
+    """
+    order = sorted(memories, key=lambda m: (_TIER_RANK.get(m.layer, 3), -m.created, m.name))
+    lsh = LSHIndex(threshold)
+    survivors: list[MemorySignature] = []
+    tokens: dict[Path, frozenset[str]] = {}
+
+    def words(m: MemorySignature) -> frozenset[str]:
+        found = tokens.get(m.path)
+        if found is None:
+            found = tokens[m.path] = tokens_of(m.path)
+        return found
+
+    out: list[DuplicateCandidate] = []
+    for memory in order:
+        best: Optional[tuple[float, MemorySignature]] = None
+        for pos in sorted(lsh.candidates(memory.signature)):
+            survivor = survivors[pos]
+            similarity = jaccard(words(memory), words(survivor))
+            if similarity >= threshold and (best is None or similarity > best[0]):
+                best = (similarity, survivor)
+        if best is None:
+            lsh.add(len(survivors), memory.signature)
+            survivors.append(memory)
+            continue
+        out.append(
+            DuplicateCandidate(
+                memory_id=memory.memory_id,
+                path=memory.path,
+                duplicate_of=best[1].memory_id,
+                survivor_path=best[1].path,
+                similarity=best[0],
+            )
+        )
+        tokens.pop(memory.path, None)  # never a survivor, not needed again
+    return out
+
+
+def merge_into(survivor: MemoryEntry, duplicate: MemoryEntry) -> bool:
+    """Fold a duplicate's tags and importance into its survivor.
+
+    Returns:
+        True when *survivor* changed.
+    """
+    tags = survivor.tags + [t for t in duplicate.tags if t not in survivor.tags]
+    importance = max(survivor.importance, duplicate.importance)
+    if tags == survivor.tags and importance == survivor.importance:
+        return False
+    survivor.tags = tags
+    survivor.importance = importance
+    return True
+
+
+_caches: dict[str, SignatureCache] = {}
+_caches_lock = threading.Lock()
+
+
+def signature_cache(mem_dir: Path) -> SignatureCache:
+    """The process-wide, refreshed SignatureCache for *mem_dir*."""
+    key = str(mem_dir)
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = _caches[key] = SignatureCache(mem_dir)
+    cache.refresh()
+    return cache
+
+
+def clear_signature_caches() -> None:
+    """Drop all signature caches; each is rebuilt from disk on next use."""
+    with _caches_lock:
+        _caches.clear()
@@ -482,7 +482,9 @@ def gc_expired(home: Path) -> int:
     return removed
 
 
-def export_for_seed(home: Path, max_entries: int = 50) -> list[dict]:
+def export_for_seed(
+    home: Path, max_entries: int = 50, modified_since: Optional[int] = None
+) -> list[dict]:
     """Export memory summaries for inclusion in a sync seed.
 
     Prioritizes long-term and high-importance memories.
@@ -490,6 +492,8 @@ def export_for_seed(home: Path, max_entries: int = 50) -> list[dict]:
     Args:
         home: Agent home directory.
         max_entries: Maximum entries to include.
+        modified_since: When set, only entries among the top *max_entries*
+            whose file mtime (ns) is newer than this are returned (delta seeds).
 
     Returns:
         List of dicts suitable for JSON serialization.
@@ -517,9 +521,37 @@ def export_for_seed(home: Path, max_entries: int = 50) -> list[dict]:
             "source": e.source,
         }
         for e in all_entries[:max_entries]
+        if modified_since is None or _entry_mtime_ns(home, e) > modified_since
     ]
 
 
+def last_modified_ns(home: Path) -> int:
+    """Return the newest mtime (ns) of any stored memory file, or 0 if none.
+
+    Used as the memory high-water mark of a sync seed.
+
+    Args:
+        home: Agent home directory.
+
+    Returns:
+        Nanosecond timestamp.
+    """
+    newest = 0
+    mem_dir = _memory_dir(home)
+    for lyr in MemoryLayer:
+        try:
+            with os.scandir(mem_dir / lyr.value) as it:
+                for entry in it:
+                    if entry.name.endswith(".json"):
+                        try:
+                            newest = max(newest, entry.stat().st_mtime_ns)
+                        except OSError:
+                            continue
+        except OSError:
+            continue
+    return newest
+
+
 def import_from_seed(home: Path, seed_memories: list[dict]) -> int:
     """Import memories from a sync seed, skipping duplicates.
 
@@ -557,6 +589,15 @@ def import_from_seed(home: Path, seed_memories: list[dict]) -> int:
 # --- Internal helpers ---
 
 
+def _entry_mtime_ns(home: Path, entry: MemoryEntry) -> int:
+    """Return the mtime (ns) of an entry's file, or 0 if it is gone."""
+    path = _memory_dir(home) / entry.layer.value / f"{entry.memory_id}.json"
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
 def _find_by_id(home: Path, memory_id: str) -> Optional[MemoryEntry]:
     """Find a memory entry by ID across all layers."""
     try:
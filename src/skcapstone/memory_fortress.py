@@ -11,7 +11,15 @@ Architecture:
     1. Auto-seal: HMAC-SHA256 integrity hash on every write.
     2. At-rest encryption: Fernet (AES-128-CBC + HMAC) via KMS service key.
     3. Tamper alerts: integrity verification on every read.
-    4. Audit trail: every access, seal, and violation logged.
+    4. Audit trail: every access, seal, and violation logged; a sweep
+       (verify_all) writes one summary record instead of one per memory.
+
+Sweeps keep a Merkle tree of per-memory seals: each layer's leaves
+(file name, seal, size and mtime) roll up into an HMAC-keyed layer root,
+and the layer roots into one fortress root. An incremental sweep trusts
+leaves whose file is unchanged and re-checks everything else; a layer
+whose recorded root does not match its recorded leaves is re-checked in
+full. Full sweeps can fan out over a process pool.
 
 Storage layout:
     ~/.skcapstone/memory/
@@ -19,7 +27,8 @@ Storage layout:
     │   └── abc123def456.json     # Sealed (and optionally encrypted)
     ├── mid-term/
     ├── long-term/
-    └── fortress.json             # Fortress configuration
+    ├── fortress.json             # Fortress configuration
+    └── fortress-merkle.json      # Sweep state (node-local, not synced)
 """
 
 from __future__ import annotations
@@ -28,12 +37,17 @@ import hashlib
 import hmac
 import json
 import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Optional
 
 from pydantic import BaseModel
 
+from .atomic_io import atomic_write_text
+from .file_watch import is_racy
 from .models import MemoryEntry
 
 logger = logging.getLogger("skcapstone.memory_fortress")
@@ -44,6 +58,11 @@ _ENCRYPTED_FIELD = "__fortress_encrypted"
 _SEALED_AT_FIELD = "__fortress_sealed_at"
 _KEY_ID_FIELD = "__fortress_key_id"
 
+MERKLE_STATE_NAME = "fortress-merkle.json"
+_MERKLE_STATE_VERSION = 1
+# Tampered memory IDs listed in a sweep's aggregated audit records.
+_AUDIT_ID_LIMIT = 100
+
 
 # ---------------------------------------------------------------------------
 # Models
@@ -70,6 +89,62 @@ class SealResult(BaseModel):
     error: Optional[str] = None
 
 
+def _canonical_seal(key: bytes, data: dict[str, Any]) -> str:
+    """HMAC-SHA256 over the canonical JSON form of *data*."""
+    canonical = json.dumps(data, sort_keys=True, separators=(",", ":"), default=str)
+    return hmac.new(key, canonical.encode("utf-8"), hashlib.sha256).hexdigest()
+
+
+def _check_file(path: str, key: bytes) -> tuple[str, str, Optional[str], Optional[str]]:
+    """Verify one memory file's seal without decrypting it.
+
+    Module-level so a process pool can run it.
+
+    Returns:
+        (memory_id, status, seal, error) where status is one of
+        ``verified``, ``unsealed``, ``tampered`` or ``error``.
+    """
+    stem = Path(path).stem
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError) as exc:
+        return stem, "error", None, f"Cannot read: {exc}"
+    if not isinstance(data, dict):
+        return stem, "error", None, "Cannot read: not a JSON object"
+
+    memory_id = data.get("memory_id", stem)
+    stored_seal = data.pop(_SEAL_FIELD, None)
+    data.pop(_SEALED_AT_FIELD, None)
+    data.pop(_KEY_ID_FIELD, None)
+    if stored_seal is None:
+        try:
+            MemoryEntry(**data)
+        except Exception as exc:
+            return memory_id, "error", None, str(exc)
+        return memory_id, "unsealed", None, None
+    if not hmac.compare_digest(str(stored_seal), _canonical_seal(key, data)):
+        return memory_id, "tampered", stored_seal, "Integrity seal mismatch - possible tampering"
+    data.pop(_ENCRYPTED_FIELD, None)
+    try:
+        MemoryEntry(**data)
+    except Exception as exc:
+        return memory_id, "verified", stored_seal, f"Parse error after verification: {exc}"
+    return memory_id, "verified", stored_seal, None
+
+
+def _seal_result(memory_id: str, status: str, error: Optional[str]) -> SealResult:
+    if status == "verified":
+        return SealResult(memory_id=memory_id, sealed=True, verified=True, error=error)
+    if status == "tampered":
+        return SealResult(
+            memory_id=memory_id, sealed=True, verified=False, tampered=True, error=error
+        )
+    if status == "unsealed":
+        return SealResult(memory_id=memory_id, sealed=False, verified=None)
+    return SealResult(memory_id=memory_id, sealed=False, error=error)
+
+
 # ---------------------------------------------------------------------------
 # MemoryFortress
 # ---------------------------------------------------------------------------
@@ -99,6 +174,7 @@ class MemoryFortress:
         self._encryption_enabled = encryption_enabled
         self._config: Optional[FortressConfig] = None
         self._kms_key_id: Optional[str] = None
+        self.last_scan: dict[str, Any] = {}
 
     def initialize(self) -> FortressConfig:
         """Initialize the memory fortress.
@@ -174,11 +250,15 @@ class MemoryFortress:
 
         return data
 
-    def verify_and_load(self, path: Path) -> tuple[Optional[MemoryEntry], SealResult]:
+    def verify_and_load(
+        self, path: Path, audit: bool = True
+    ) -> tuple[Optional[MemoryEntry], SealResult]:
         """Load a memory file, verify its integrity seal, and decrypt.
 
         Args:
             path: Path to the memory JSON file.
+            audit: Write per-memory audit events. Callers that load in bulk
+                pass False and record one summary themselves.
 
         Returns:
             Tuple of (MemoryEntry or None, SealResult).
@@ -218,16 +298,17 @@ class MemoryFortress:
         # Verify integrity
         expected_seal = self._compute_seal(data)
         if not hmac.compare_digest(stored_seal, expected_seal):
-            self._audit(
-                "MEMORY_TAMPER_ALERT",
-                f"TAMPERED: Memory {memory_id} failed integrity check",
-                metadata={
-                    "memory_id": memory_id,
-                    "expected_seal": expected_seal[:16] + "...",
-                    "actual_seal": stored_seal[:16] + "...",
-                    "path": str(path),
-                },
-            )
+            if audit:
+                self._audit(
+                    "MEMORY_TAMPER_ALERT",
+                    f"TAMPERED: Memory {memory_id} failed integrity check",
+                    metadata={
+                        "memory_id": memory_id,
+                        "expected_seal": expected_seal[:16] + "...",
+                        "actual_seal": stored_seal[:16] + "...",
+                        "path": str(path),
+                    },
+                )
             return None, SealResult(
                 memory_id=memory_id,
                 sealed=True,
@@ -252,7 +333,7 @@ class MemoryFortress:
             )
 
         config = self._get_config()
-        if config.audit_events:
+        if audit and config.audit_events:
             self._audit(
                 "MEMORY_VERIFIED",
                 f"Memory {memory_id} integrity verified",
@@ -294,11 +375,29 @@ class MemoryFortress:
 
         return path
 
-    def verify_all(self, home: Path) -> list[SealResult]:
+    def verify_all(
+        self,
+        home: Path,
+        incremental: bool = False,
+        processes: Optional[int] = None,
+        layers: Optional[list[str]] = None,
+    ) -> list[SealResult]:
         """Verify integrity of all memories across all layers.
 
+        Every sweep refreshes the Merkle state in ``fortress-merkle.json``
+        and writes a single ``FORTRESS_SCAN`` audit record (plus one
+        aggregated ``MEMORY_TAMPER_ALERT`` if anything failed), not one
+        event per memory. Throughput and counts are also left in
+        ``self.last_scan``.
+
         Args:
             home: Agent home directory.
+            incremental: Trust memories whose size and mtime match the
+                last sweep's leaf; re-check the rest. A layer whose stored
+                root does not match its stored leaves is re-checked in full.
+            processes: Check files on a process pool of this size
+                (full sweeps of large stores). None checks in-process.
+            layers: Restrict the sweep to these layer names.
 
         Returns:
             List of SealResult for every memory file.
@@ -310,37 +409,195 @@ class MemoryFortress:
         if not mem_dir.is_dir():
             return results
 
-        tampered_count = 0
-        verified_count = 0
-        unsealed_count = 0
+        started = time.monotonic()
+        key = self._get_seal_key()
+        state = self._load_merkle_state(home, key) if incremental else {}
+        now_ns = time.time_ns()
 
+        listing: dict[str, list[tuple[str, int, int]]] = {}
         for layer in MemoryLayer:
+            if layers is not None and layer.value not in layers:
+                continue
             layer_dir = mem_dir / layer.value
             if not layer_dir.is_dir():
                 continue
-            for f in sorted(layer_dir.glob("*.json")):
-                _, result = self.verify_and_load(f)
-                results.append(result)
-                if result.tampered:
-                    tampered_count += 1
-                elif result.verified:
-                    verified_count += 1
-                elif not result.sealed:
-                    unsealed_count += 1
+            entries = []
+            with os.scandir(layer_dir) as it:
+                for e in it:
+                    if not e.name.endswith(".json") or not e.is_file():
+                        continue
+                    st = e.stat()
+                    entries.append((e.name, st.st_mtime_ns, st.st_size))
+            entries.sort()
+            listing[layer.value] = entries
+
+        # Decide what needs checking.
+        to_check: list[tuple[str, str]] = []
+        trusted: dict[tuple[str, str], list] = {}
+        for layer_name, entries in listing.items():
+            leaves = state.get(layer_name, {})
+            for name, mtime_ns, size in entries:
+                leaf = leaves.get(name)
+                if leaf is not None and leaf[0] == mtime_ns and leaf[1] == size:
+                    trusted[(layer_name, name)] = leaf
+                else:
+                    to_check.append((layer_name, name))
+
+        checked: dict[tuple[str, str], tuple] = {}
+        paths = [str(mem_dir / layer_name / name) for layer_name, name in to_check]
+        if processes and len(paths) > 1:
+            with ProcessPoolExecutor(max_workers=processes) as pool:
+                outcomes = pool.map(
+                    _check_file,
+                    paths,
+                    [key] * len(paths),
+                    chunksize=max(1, len(paths) // (processes * 8)),
+                )
+                checked = dict(zip(to_check, outcomes))
+        else:
+            checked = {k: _check_file(p, key) for k, p in zip(to_check, paths)}
+
+        # Assemble results in layer/file order and build the new tree.
+        counts = {"verified": 0, "tampered": 0, "unsealed": 0, "error": 0}
+        tampered_ids: list[str] = []
+        new_state: dict[str, dict[str, list]] = {}
+        for layer_name, entries in listing.items():
+            leaves: dict[str, list] = {}
+            for name, mtime_ns, size in entries:
+                k = (layer_name, name)
+                if k in trusted:
+                    leaf = trusted[k]
+                    memory_id, status, error = leaf[2], leaf[4], None
+                    seal = leaf[3]
+                else:
+                    memory_id, status, seal, error = checked[k]
+                results.append(_seal_result(memory_id, status, error))
+                counts[status] += 1
+                if status == "tampered":
+                    tampered_ids.append(memory_id)
+                elif error is None and not is_racy(mtime_ns, now_ns):
+                    leaves[name] = [mtime_ns, size, memory_id, seal, status]
+            new_state[layer_name] = leaves
+
+        roots = self._save_merkle_state(home, key, new_state)
+        elapsed = time.monotonic() - started
+        self.last_scan = {
+            "total": len(results),
+            "verified": counts["verified"],
+            "tampered": counts["tampered"],
+            "unsealed": counts["unsealed"],
+            "errors": counts["error"],
+            "checked": len(to_check),
+            "skipped": len(trusted),
+            "incremental": incremental,
+            "processes": processes or 0,
+            "seconds": round(elapsed, 3),
+            "memories_per_second": round(len(results) / elapsed, 1) if elapsed > 0 else None,
+            "root": roots["root"],
+        }
 
+        if tampered_ids:
+            self._audit(
+                "MEMORY_TAMPER_ALERT",
+                f"TAMPERED: {len(tampered_ids)} memories failed integrity check",
+                metadata={
+                    "count": len(tampered_ids),
+                    "memory_ids": tampered_ids[:_AUDIT_ID_LIMIT],
+                },
+            )
         self._audit(
             "FORTRESS_SCAN",
-            "Full memory integrity scan completed",
-            metadata={
-                "total": len(results),
-                "verified": verified_count,
-                "tampered": tampered_count,
-                "unsealed": unsealed_count,
-            },
+            "Full memory integrity scan completed"
+            if not incremental
+            else "Incremental memory integrity scan completed",
+            metadata=self.last_scan,
         )
 
         return results
 
+    def _merkle_path(self, home: Path) -> Path:
+        return home / "memory" / MERKLE_STATE_NAME
+
+    @staticmethod
+    def _layer_root(key: bytes, leaves: dict[str, list]) -> str:
+        """HMAC-keyed root over a layer's leaves, in name order."""
+        mac = hmac.new(key, b"fortress-layer", hashlib.sha256)
+        for name in sorted(leaves):
+            mtime_ns, size, memory_id, seal, status = leaves[name]
+            mac.update(f"{name}\0{mtime_ns}\0{size}\0{memory_id}\0{seal}\0{status}\n".encode())
+        return mac.hexdigest()
+
+    @staticmethod
+    def _key_tag(key: bytes) -> str:
+        return hmac.new(key, b"fortress-merkle", hashlib.sha256).hexdigest()[:16]
+
+    def _load_merkle_state(self, home: Path, key: bytes) -> dict[str, dict[str, list]]:
+        """Load per-layer leaves whose recorded root still checks out."""
+        try:
+            data = json.loads(self._merkle_path(home).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != _MERKLE_STATE_VERSION
+            or data.get("key") != self._key_tag(key)
+        ):
+            return {}
+        trusted: dict[str, dict[str, list]] = {}
+        for layer_name, layer in (data.get("layers") or {}).items():
+            try:
+                leaves = layer["leaves"]
+                ok = hmac.compare_digest(layer["root"], self._layer_root(key, leaves))
+            except (KeyError, TypeError, ValueError):
+                ok = False
+            if ok:
+                trusted[layer_name] = leaves
+            else:
+                logger.warning(
+                    "Fortress Merkle root mismatch for %s; re-checking layer", layer_name
+                )
+        return trusted
+
+    def _save_merkle_state(
+        self, home: Path, key: bytes, layers: dict[str, dict[str, list]]
+    ) -> dict[str, str]:
+        """Persist leaves and roots; returns the layer roots and the overall root."""
+        path = self._merkle_path(home)
+        previous: dict[str, Any] = {}
+        try:
+            previous = json.loads(path.read_text(encoding="utf-8")).get("layers") or {}
+        except (OSError, ValueError, AttributeError):
+            previous = {}
+        out = {}
+        # A partial sweep (``layers=``) keeps the other layers' recorded trees.
+        for layer_name, layer in previous.items():
+            if layer_name not in layers and isinstance(layer, dict):
+                out[layer_name] = layer
+        for layer_name, leaves in layers.items():
+            out[layer_name] = {"root": self._layer_root(key, leaves), "leaves": leaves}
+        mac = hmac.new(key, b"fortress-root", hashlib.sha256)
+        for layer_name in sorted(out):
+            mac.update(f"{layer_name}\0{out[layer_name].get('root', '')}\n".encode())
+        root = mac.hexdigest()
+        try:
+            atomic_write_text(
+                path,
+                json.dumps(
+                    {
+                        "version": _MERKLE_STATE_VERSION,
+                        "key": self._key_tag(key),
+                        "root": root,
+                        "layers": out,
+                    },
+                    separators=(",", ":"),
+                ),
+            )
+        except OSError as exc:
+            logger.warning("Cannot persist fortress Merkle state: %s", exc)
+        roots = {name: layer.get("root", "") for name, layer in out.items()}
+        roots["root"] = root
+        return roots
+
     def seal_existing(self, home: Path) -> int:
         """Seal all existing unsealed memories (migration).
 
@@ -419,10 +676,8 @@ class MemoryFortress:
         Returns:
             Hex-encoded HMAC-SHA256 digest.
         """
-        key = self._get_seal_key()
         # Canonical JSON serialization for deterministic hashing
-        canonical = json.dumps(data, sort_keys=True, separators=(",", ":"), default=str)
-        return hmac.new(key, canonical.encode("utf-8"), hashlib.sha256).hexdigest()
+        return _canonical_seal(self._get_seal_key(), data)
 
     def _get_seal_key(self) -> bytes:
         """Get the HMAC seal key, deriving from KMS if needed."""
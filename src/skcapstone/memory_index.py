@@ -0,0 +1,271 @@
+"""Lightweight metadata index of the memory tiers.
+
+Code that only needs to *choose* memories - dreaming keeps the newest
+short-term and the most important mid/long-term ones - used to glob every
+tier, parse each file into a MemoryEntry and sort, just to keep a handful.
+MemoryMetaIndex records, per file, the few fields such choices need
+(memory id, importance, created_at) next to the file's ``(mtime_ns, size)``.
+A refresh stats every file but re-reads only those whose signature moved,
+with plain ``json.loads`` rather than a pydantic parse; callers then load
+full entries for the memories they picked.
+
+The index persists to ``memory/meta-index.json`` (node-local, rebuilt from
+the tiers whenever it is missing or unreadable), so a new process starts
+warm. Files modified within the racy window are re-read on the next
+refresh, since a same-size rewrite in the same mtime tick is invisible to
+the signature.
+
+Derived indexes reuse the same machinery with a *payload*: a per-file value
+computed from the parsed JSON in the same read as the index fields and
+persisted to a file of their own (``memory_dedup.SignatureCache`` keeps
+MinHash signatures this way).
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional
+
+from .atomic_io import atomic_write_text
+from .file_watch import is_racy
+from .memory_engine import _NON_MEMORY_SIDECARS
+from .models import MemoryLayer
+
+logger = logging.getLogger("skcapstone.memory_index")
+
+META_INDEX_NAME = "meta-index.json"
+_META_INDEX_VERSION = 1
+
+
+@dataclass(frozen=True)
+class MemoryMeta:
+    """What the index knows about one memory file.
+
+    Attributes:
+        directory: The tier directory holding the file.
+        name: The file name.
+        memory_id: Its id.
+        layer: Tier value (``short-term``, ``mid-term``, ``long-term``).
+        importance: Importance score (0.5 when the file has none).
+        created: ``created_at`` as epoch seconds (the mtime when absent).
+        mtime_ns: File mtime.
+        payload: The index's per-file payload value (None without one).
+    """
+
+    directory: Path
+    name: str
+    memory_id: str
+    layer: str
+    importance: float
+    created: float
+    mtime_ns: int
+    payload: Any = None
+
+    @property
+    def path(self) -> Path:
+        """The memory's JSON file."""
+        return self.directory / self.name
+
+
+def _parse_meta(
+    path: Path, mtime_ns: int, payload: Optional[Callable[[dict], Any]] = None
+) -> Optional[list]:
+    """Index fields of a memory file, None when it is not a loadable memory."""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    fields = _meta_fields(data, mtime_ns)
+    if fields is not None and payload is not None:
+        fields.append(payload(data))
+    return fields
+
+
+def _meta_fields(data: Any, mtime_ns: int) -> Optional[list]:
+    """``[memory_id, importance, created]`` of parsed memory JSON, None when not a memory."""
+    # Unified SKMemory records ("id", no "memory_id") are skipped, as in _load_entry.
+    if not isinstance(data, dict) or "memory_id" not in data:
+        return None
+    memory_id = data.get("memory_id")
+    if not isinstance(memory_id, str) or not memory_id.strip():
+        return None
+    try:
+        importance = float(data.get("importance", 0.5))
+    except (TypeError, ValueError):
+        importance = 0.5
+    created = mtime_ns / 1e9
+    raw = data.get("created_at")
+    if isinstance(raw, str) and raw:
+        try:
+            created = datetime.fromisoformat(raw).timestamp()
+        except ValueError:
+            pass
+    return [memory_id.strip(), importance, created]
+
+
+class MemoryMetaIndex:
+    """Per-file metadata of one memory directory, refreshed incrementally.
+
+    Records map ``layer -> file name -> [mtime_ns, size, fields, racy]``
+    where *fields* is ``[memory_id, importance, created]`` (plus the
+    payload value, when the index has one) or None for a file that is not
+    a loadable memory (so it is not re-read until it changes), and *racy*
+    marks a record read inside the racy window, which the next refresh
+    re-reads regardless of its signature.
+
+    Args:
+        mem_dir: The memory directory holding the tier subdirectories.
+        persist: Load and save the index file (default True).
+        name: File name of the persisted index under *mem_dir*.
+        payload: Optional per-file value derived from a memory's parsed
+            JSON; must be JSON-serialisable. Exposed as ``MemoryMeta.payload``.
+    """
+
+    def __init__(
+        self,
+        mem_dir: Path,
+        persist: bool = True,
+        *,
+        name: str = META_INDEX_NAME,
+        payload: Optional[Callable[[dict], Any]] = None,
+    ) -> None:
+        self.mem_dir = mem_dir
+        self._persist = persist
+        self._name = name
+        self._payload = payload
+        self._lock = threading.Lock()
+        self._records: dict[str, dict[str, list]] = {}
+        self._loaded = False
+        self.generation = 0  # bumped by every refresh that changes a record
+        self.stats = {"refreshes": 0, "parsed": 0}
+
+    @property
+    def path(self) -> Path:
+        """Where the index is persisted."""
+        return self.mem_dir / self._name
+
+    def refresh(self) -> None:
+        """Bring every tier up to date, re-reading only changed files."""
+        with self._lock:
+            if not self._loaded:
+                self._records = self._load() if self._persist else {}
+                self._loaded = True
+            self.stats["refreshes"] += 1
+            changed = False
+            for layer in MemoryLayer:
+                changed |= self._refresh_layer(layer.value)
+            if changed:
+                self.generation += 1
+                if self._persist:
+                    self._save()
+
+    def entries(self, layer: MemoryLayer | str) -> list[MemoryMeta]:
+        """Indexed memories of *layer* as of the last refresh, in file-name order."""
+        value = layer.value if isinstance(layer, MemoryLayer) else layer
+        layer_dir = self.mem_dir / value
+        with self._lock:
+            records = self._records.get(value, {})
+            return [
+                MemoryMeta(
+                    directory=layer_dir,
+                    name=name,
+                    memory_id=fields[0],
+                    layer=value,
+                    importance=fields[1],
+                    created=fields[2],
+                    mtime_ns=rec[0],
+                    payload=fields[3] if len(fields) > 3 else None,
+                )
+                for name, rec in sorted(records.items())
+                if (fields := rec[2]) is not None
+            ]
+
+    # -- internals ----------------------------------------------------------
+
+    def _refresh_layer(self, layer: str) -> bool:
+        layer_dir = self.mem_dir / layer
+        old = self._records.get(layer, {})
+        new: dict[str, list] = {}
+        changed = False
+        now = time.time_ns()
+        try:
+            with os.scandir(layer_dir) as it:
+                found = [
+                    (e.name, e.stat())
+                    for e in it
+                    if e.name.endswith(".json")
+                    and e.name not in _NON_MEMORY_SIDECARS
+                    and e.is_file()
+                ]
+        except OSError:
+            found = []
+        for name, st in found:
+            rec = old.get(name)
+            if rec is not None and not rec[3] and rec[:2] == [st.st_mtime_ns, st.st_size]:
+                new[name] = rec
+                continue
+            fields = None
+            if st.st_size > 0:
+                fields = _parse_meta(layer_dir / name, st.st_mtime_ns, self._payload)
+                self.stats["parsed"] += 1
+            new[name] = [st.st_mtime_ns, st.st_size, fields, is_racy(st.st_mtime_ns, now)]
+            changed = True
+        changed |= len(new) != len(old)
+        self._records[layer] = new
+        return changed
+
+    def _load(self) -> dict[str, dict[str, list]]:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != _META_INDEX_VERSION:
+            return {}
+        layers = data.get("layers")
+        if not isinstance(layers, dict):
+            return {}
+        out: dict[str, dict[str, list]] = {}
+        for layer, records in layers.items():
+            if isinstance(records, dict):
+                out[layer] = {
+                    name: rec
+                    for name, rec in records.items()
+                    if isinstance(rec, list) and len(rec) == 4
+                }
+        return out
+
+    def _save(self) -> None:
+        payload: dict[str, Any] = {"version": _META_INDEX_VERSION, "layers": self._records}
+        try:
+            atomic_write_text(self.path, json.dumps(payload, separators=(",", ":")))
+        except OSError as exc:
+            logger.warning("Cannot persist memory index %s: %s", self._name, exc)
+
+
+_indexes: dict[str, MemoryMetaIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def meta_index(mem_dir: Path) -> MemoryMetaIndex:
+    """The process-wide, refreshed MemoryMetaIndex for *mem_dir*."""
+    key = str(mem_dir)
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = _indexes[key] = MemoryMetaIndex(mem_dir)
+    index.refresh()
+    return index
+
+
+def clear_meta_indexes() -> None:
+    """Drop all cached indexes; ``backup.restore_backup`` calls this."""
+    with _indexes_lock:
+        _indexes.clear()
@@ -33,12 +33,12 @@ import json
 import logging
 import re
 import shutil
-from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Optional
 
+from .memory_dedup import DuplicateCandidate, merge_into, signature_cache
 from .memory_engine import (
     _load_entry,
     _memory_dir,
@@ -104,6 +104,8 @@ class PromotionThresholds:
         emotion_weight: Weight for emotional intensity.
         age_weight: Weight for age-based maturity.
         tag_weight: Weight for tag richness.
+        dedup_similarity: Word-set Jaccard similarity at which two
+            memories count as near-duplicates.
     """
 
     short_to_mid: float = 0.5
@@ -113,6 +115,7 @@ class PromotionThresholds:
     emotion_weight: float = 0.15
     age_weight: float = 0.15
     tag_weight: float = 0.15
+    dedup_similarity: float = 0.85
 
 
 @dataclass
@@ -299,97 +302,82 @@ class PromotionEngine:
     # Dedup / Compress / Archive
     # -------------------------------------------------------------------
 
-    def dedup_memories(self) -> int:
-        """Scan all memory tiers for duplicate and near-duplicate memories.
+    def find_duplicates(self, threshold: Optional[float] = None) -> list[DuplicateCandidate]:
+        """Find near-duplicate memories across all tiers without changing anything.
 
-        Duplicates are detected by:
-        - Exact title match (case-insensitive), using the raw JSON ``title``
-          field or falling back to the first line of ``content``.
-        - Near-duplicate: first 50 characters of the title match.
+        Word-set MinHash signatures are cached per file by mtime, so only
+        new or changed memories are read, and the result is reused until a
+        memory changes; LSH candidates are confirmed with the exact
+        similarity. The highest-tier, then newest, copy of each group
+        survives.
 
-        When duplicates are found, the newest memory (by ``created_at``) is
-        kept and the rest are moved to an ``archive/deduped/`` directory.
+        Args:
+            threshold: Minimum similarity (default ``thresholds.dedup_similarity``).
 
         Returns:
-            Number of duplicate memories removed.
+            One DuplicateCandidate per memory that would be archived.
         """
-        mem_dir = _memory_dir(self._home)
-        removed = 0
+        if threshold is None:
+            threshold = self._thresholds.dedup_similarity
+        return signature_cache(_memory_dir(self._home)).duplicates(threshold)
 
-        # Collect all memories across tiers with their raw titles
-        entries_by_title: dict[str, list[tuple[Path, dict, MemoryEntry]]] = defaultdict(list)
+    def dedup_memories(self, dry_run: bool = False, threshold: Optional[float] = None) -> int:
+        """Archive near-duplicate memories, merging them into their survivors.
 
-        for lyr in MemoryLayer:
-            layer_dir = mem_dir / lyr.value
-            if not layer_dir.is_dir():
-                continue
-            for f in sorted(layer_dir.glob("*.json")):
-                try:
-                    raw = json.loads(f.read_text(encoding="utf-8"))
-                except (json.JSONDecodeError, OSError):
-                    continue
-                entry = _load_entry(f)
-                if entry is None:
-                    continue
-                # Use raw title if present, otherwise first line of content
-                title = raw.get("title", entry.content.split("\n", 1)[0])
-                norm_title = title.strip().lower()
-                entries_by_title[norm_title].append((f, raw, entry))
+        Each duplicate found by ``find_duplicates`` has its tags and
+        importance folded into the surviving memory and is moved to an
+        ``archive/deduped/`` directory.
 
-        # Phase 1: exact title duplicates
-        deduped_ids: list[str] = []
-        for title, group in entries_by_title.items():
-            if len(group) <= 1:
-                continue
-            # Sort by created_at descending - keep newest
-            group.sort(key=lambda g: g[2].created_at, reverse=True)
-            keeper = group[0]
-            for path, raw, entry in group[1:]:
-                self._archive_deduped(path, entry)
-                deduped_ids.append(entry.memory_id)
-                removed += 1
+        Args:
+            dry_run: Only log the candidates.
+            threshold: Minimum similarity (default ``thresholds.dedup_similarity``).
+
+        Returns:
+            Number of duplicate memories removed (or that would be).
+        """
+        candidates = self.find_duplicates(threshold)
+        if dry_run:
+            for c in candidates:
                 logger.info(
-                    "Dedup: archived %s (dup of %s, title='%s')",
-                    entry.memory_id,
-                    keeper[2].memory_id,
-                    title[:60],
+                    "Dedup (dry run): %s is a near-dup of %s (%.0f%%)",
+                    c.memory_id,
+                    c.duplicate_of,
+                    c.similarity * 100,
                 )
+            return len(candidates)
 
-        # Phase 2: near-duplicates (first 50 chars of title match)
-        # Re-collect surviving memories (exclude already-deduped)
-        prefix_groups: dict[str, list[tuple[Path, dict, MemoryEntry]]] = defaultdict(list)
-        for title, group in entries_by_title.items():
-            for path, raw, entry in group:
-                if entry.memory_id in deduped_ids:
-                    continue
-                if not path.exists():
-                    continue
-                prefix = title[:50]
-                prefix_groups[prefix].append((path, raw, entry))
-
-        for prefix, group in prefix_groups.items():
-            if len(group) <= 1:
+        deduped_ids: list[str] = []
+        survivors: dict[Path, Optional[MemoryEntry]] = {}
+        changed: set[Path] = set()
+        for c in candidates:
+            entry = _load_entry(c.path)
+            if entry is None:
                 continue
-            group.sort(key=lambda g: g[2].created_at, reverse=True)
-            keeper = group[0]
-            for path, raw, entry in group[1:]:
-                if entry.memory_id in deduped_ids:
-                    continue
-                self._archive_deduped(path, entry)
-                deduped_ids.append(entry.memory_id)
-                removed += 1
-                logger.info(
-                    "Dedup (near): archived %s (near-dup of %s, prefix='%s')",
-                    entry.memory_id,
-                    keeper[2].memory_id,
-                    prefix[:50],
-                )
+            if c.survivor_path not in survivors:
+                survivors[c.survivor_path] = _load_entry(c.survivor_path)
+            survivor = survivors[c.survivor_path]
+            if survivor is None:
+                continue  # the survivor vanished: keep its duplicate
+            if merge_into(survivor, entry):
+                changed.add(c.survivor_path)
+            self._archive_deduped(c.path, entry)
+            deduped_ids.append(entry.memory_id)
+            logger.info(
+                "Dedup: archived %s (near-dup of %s, %.0f%%)",
+                entry.memory_id,
+                c.duplicate_of,
+                c.similarity * 100,
+            )
+        for path in changed:
+            survivor = survivors[path]
+            _save_entry(self._home, survivor)
+            _update_index(self._home, survivor)
 
         # Log dedup actions to promotion-log.json
-        if removed > 0:
-            self._record_dedup(removed, deduped_ids)
+        if deduped_ids:
+            self._record_dedup(len(deduped_ids), deduped_ids)
 
-        return removed
+        return len(deduped_ids)
 
     def compress_memories(self) -> int:
         """Compress older memories by truncating content.
@@ -0,0 +1,141 @@
+"""MinHash signatures and LSH banding for near-duplicate lookup.
+
+Comparing a new text against every stored one by Jaccard similarity of
+their token sets is linear in the history. A MinHash signature is a short,
+fixed-length summary of a token set whose agreement rate with another
+signature estimates the Jaccard similarity of the two sets; cutting the
+signature into bands and hashing each band into a bucket (locality
+sensitive hashing) makes similar sets collide in at least one bucket with
+high probability, while dissimilar ones rarely do. A lookup then only has
+to verify the few sets sharing a bucket with the query.
+
+Banding trades recall for speed, so callers verify candidates with the
+exact Jaccard similarity and only ever miss, never invent, a match.
+``lsh_params`` picks the band layout for a similarity threshold so that
+pairs at the threshold are found at least 99% of the time, and pairs above
+it more often still.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import struct
+from collections.abc import Hashable, Iterable
+from typing import Any
+
+NUM_PERM = 64
+_MIN_RECALL = 0.99
+# Each token's SHAKE-128 digest supplies NUM_PERM independent 32-bit hash values.
+_HASHES = struct.Struct(f"<{NUM_PERM}I")
+
+Signature = tuple[int, ...]
+
+
+def minhash(tokens: Iterable[str]) -> Signature:
+    """The MinHash signature of a token set (empty tuple for no tokens)."""
+    size, unpack = _HASHES.size, _HASHES.unpack
+    rows = [unpack(hashlib.shake_128(t.encode("utf-8")).digest(size)) for t in set(tokens)]
+    if not rows:
+        return ()
+    return tuple(map(min, zip(*rows)))
+
+
+def signature_to_hex(sig: Signature) -> str:
+    """Compact text form of a signature, for JSON persistence."""
+    return struct.pack(f">{len(sig)}I", *sig).hex()
+
+
+def signature_from_hex(text: str) -> Signature:
+    """Inverse of ``signature_to_hex``.
+
+    Raises:
+        ValueError: *text* is not a hex-encoded signature.
+    """
+    raw = bytes.fromhex(text)
+    if len(raw) % 4:
+        raise ValueError("truncated signature")
+    return struct.unpack(f">{len(raw) // 4}I", raw)
+
+
+def jaccard(a: set | frozenset, b: set | frozenset) -> float:
+    """Exact Jaccard similarity of two sets (0.0 when either is empty)."""
+    if not a or not b:
+        return 0.0
+    inter = len(a & b)
+    return inter / (len(a) + len(b) - inter)
+
+
+def lsh_params(threshold: float, num_perm: int = NUM_PERM) -> tuple[int, int]:
+    """``(bands, rows)`` that find pairs at *threshold* with >= 99% probability.
+
+    Picks the most rows per band (the fewest spurious candidates) that still
+    meets the recall target; the chance two sets of similarity *s* share a
+    bucket is ``1 - (1 - s**rows) ** bands``.
+    """
+    t = min(max(threshold, 0.01), 1.0)
+    for rows in range(num_perm, 0, -1):
+        bands = num_perm // rows
+        if 1 - (1 - t**rows) ** bands >= _MIN_RECALL:
+            return bands, rows
+    return num_perm, 1
+
+
+class LSHIndex:
+    """Banded MinHash buckets mapping signatures to caller-chosen keys.
+
+    A bucket is keyed by the hash of its band and holds the one key filed
+    under it, or a list once several are; most buckets never collide, and
+    not allocating a list apiece keeps indexing large stores cheap. Two
+    bands hashing alike only add a spurious candidate, which callers verify
+    away anyway.
+
+    Args:
+        threshold: Jaccard similarity the caller will look for.
+        num_perm: Signature length.
+    """
+
+    def __init__(self, threshold: float, num_perm: int = NUM_PERM) -> None:
+        self.bands, self.rows = lsh_params(threshold, num_perm)
+        self._cuts = [slice(b * self.rows, (b + 1) * self.rows) for b in range(self.bands)]
+        self._buckets: list[dict[int, Any]] = [{} for _ in range(self.bands)]
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, key: Hashable, sig: Signature) -> None:
+        """Index *key* under *sig* (signatures of empty sets are ignored)."""
+        if not sig:
+            return
+        for buckets, cut in zip(self._buckets, self._cuts):
+            part = hash(sig[cut])
+            held = buckets.get(part, _EMPTY)
+            if held is _EMPTY:
+                buckets[part] = key
+            elif type(held) is _Bucket:
+                held.append(key)
+            else:
+                buckets[part] = _Bucket((held, key))
+        self._size += 1
+
+    def candidates(self, sig: Signature) -> set[Hashable]:
+        """Keys sharing at least one bucket with *sig*."""
+        found: set[Hashable] = set()
+        if not sig:
+            return found
+        for buckets, cut in zip(self._buckets, self._cuts):
+            held = buckets.get(hash(sig[cut]), _EMPTY)
+            if held is _EMPTY:
+                continue
+            if type(held) is _Bucket:
+                found.update(held)
+            else:
+                found.add(held)
+        return found
+
+
+class _Bucket(list):
+    """Keys sharing a bucket."""
+
+
+_EMPTY = object()
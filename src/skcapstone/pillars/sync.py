@@ -9,19 +9,35 @@ Transport stack:
     Agent -> collect_seed() -> gpg_encrypt() -> sync_folder/
     Syncthing (or git push) propagates to all peers
     Peer -> sync_folder/ -> gpg_decrypt() -> merge_seed()
+
+Seeds are deltas. Each one carries a sequence number and a clock with a
+high-water mark (newest file mtime) per section. Only sections and items
+newer than the base clock are included; a base recorded while a section was
+still inside the racy window is backed off by it, so a write in the same
+mtime tick as the clock read is sent again rather than lost. The base is the oldest seed that
+peers have acknowledged since the last full checkpoint. Peers acknowledge
+by echoing the last sequence they applied from each source in their own
+seeds. Every ``SEED_CHECKPOINT_INTERVAL`` seeds, a full snapshot is sent
+so a peer that missed deltas recovers.
 """
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
+import os
 import shutil
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
 from .. import SHARED_ROOT
+from ..atomic_io import atomic_write_text
+from ..file_watch import RACY_WINDOW_NS, is_racy
 from ..models import PillarStatus, SyncConfig, SyncState, SyncTransport
 
 logger = logging.getLogger("skcapstone.sync")
@@ -29,6 +45,18 @@ logger = logging.getLogger("skcapstone.sync")
 SEED_EXTENSION = ".seed.json"
 ENCRYPTED_EXTENSION = ".seed.json.gpg"
 
+#: A full snapshot is sent every this many seeds (an hour at the daemon's
+#: 5-minute push cadence), so a peer that missed deltas catches up.
+SEED_CHECKPOINT_INTERVAL = 12
+
+#: Node-local delta bookkeeping. ``.cache`` is in the default .stignore.
+SEED_STATE_RELPATH = Path(".cache") / "seed-clock.json"
+
+SEED_SECTIONS = ("identity", "trust", "febs", "memory", "manifest")
+
+#: Concurrent ``gpg --decrypt`` processes when pulling a backlog of seeds.
+DECRYPT_WORKERS = min(8, os.cpu_count() or 1)
+
 
 def initialize_sync(home: Path, config: Optional[SyncConfig] = None) -> SyncState:
     """Set up the sync directory structure.
@@ -76,15 +104,18 @@ def initialize_sync(home: Path, config: Optional[SyncConfig] = None) -> SyncStat
     return state
 
 
-def collect_seed(home: Path, agent_name: str) -> Path:
+def collect_seed(home: Path, agent_name: str, full: bool = False) -> Path:
     """Collect the agent's current state into a portable seed file.
 
     Gathers identity, memory stats, trust metrics, and connectors
-    into a single JSON blob ready for encryption and sync.
+    into a single JSON blob ready for encryption and sync. Unless a
+    checkpoint is due, only what changed since the delta base is included
+    (see the module docstring); memory stats are always present.
 
     Args:
         home: Agent home directory.
         agent_name: The agent's display name.
+        full: Force a full snapshot regardless of the checkpoint schedule.
 
     Returns:
         Path to the generated seed file in the outbox.
@@ -95,51 +126,96 @@ def collect_seed(home: Path, agent_name: str) -> Path:
 
     timestamp = datetime.now(timezone.utc)
     hostname = _get_hostname()
+    source_id = f"{agent_name}@{hostname}"
+
+    state = _load_seed_state(home)
+    seq = state["seq"] + 1
+    # Clock before content. A write right after the read can land in the
+    # same mtime tick and carry an mtime *equal* to the clock, which a
+    # strict "newer than the base" check would skip; see _trusted_clock.
+    clock = _section_clock(home)
+    read_ns = time.time_ns()
+    base_seq = None if full else _delta_base(state, seq)
+    base = state["history"].get(str(base_seq)) if base_seq is not None else None
+    if base is None:
+        base_seq = None
+
+    def changed(section: str) -> bool:
+        return base is None or clock.get(section, 0) > base.get(section, 0)
+
+    def since(section: str) -> Optional[int]:
+        return None if base is None else base.get(section, 0)
 
     seed = {
-        "schema_version": "1.0",
+        "schema_version": "1.0" if base is None else "1.1",
         "agent_name": agent_name,
         "source_host": hostname,
         "created_at": timestamp.isoformat(),
-        "seed_type": "state_snapshot",
+        "seed_type": "state_snapshot" if base is None else "state_delta",
+        "source_id": source_id,
+        "seq": seq,
+        "base_seq": base_seq,
+        "clock": clock,
+        "acks": state["applied"],
     }
 
     identity_file = home / "identity" / "identity.json"
-    if identity_file.exists():
+    if identity_file.exists() and changed("identity"):
         seed["identity"] = json.loads(identity_file.read_text(encoding="utf-8"))
 
     trust_file = home / "trust" / "trust.json"
     if trust_file.exists():
-        seed["trust"] = json.loads(trust_file.read_text(encoding="utf-8"))
-        try:
-            from .trust import export_febs_for_seed
+        if changed("trust"):
+            seed["trust"] = json.loads(trust_file.read_text(encoding="utf-8"))
+        if changed("febs"):
+            try:
+                from .trust import export_febs_for_seed
 
-            febs = export_febs_for_seed(home)
-            if febs:
-                seed["febs"] = febs
-        except Exception as exc:
-            logger.debug("Could not export FEBs for seed: %s", exc)
+                febs = export_febs_for_seed(home, modified_since=since("febs"))
+                if febs:
+                    seed["febs"] = febs
+            except Exception as exc:
+                logger.debug("Could not export FEBs for seed: %s", exc)
 
     memory_path = home / "memory"
     if memory_path.is_symlink() or memory_path.exists():
         resolved = memory_path.resolve()
         seed["memory"] = _collect_memory_stats(resolved)
-        try:
-            from ..memory_engine import export_for_seed
+        if changed("memory"):
+            try:
+                from ..memory_engine import export_for_seed
 
-            seed["memory_entries"] = export_for_seed(home, max_entries=50)
-        except Exception as exc:
-            logger.debug("Could not export memory entries for seed: %s", exc)
+                entries = export_for_seed(home, max_entries=50, modified_since=since("memory"))
+                if entries or base is None:
+                    seed["memory_entries"] = entries
+            except Exception as exc:
+                logger.debug("Could not export memory entries for seed: %s", exc)
 
     manifest_file = home / "manifest.json"
-    if manifest_file.exists():
+    if manifest_file.exists() and changed("manifest"):
         seed["manifest"] = json.loads(manifest_file.read_text(encoding="utf-8"))
 
-    seed_name = f"{agent_name}-{hostname}-{timestamp.strftime('%Y%m%dT%H%M%SZ')}{SEED_EXTENSION}"
+    # Microseconds keep two seeds in the same second apart; no extra "-" so
+    # housekeeping still groups seeds by the <agent>-<host> prefix.
+    stamp = timestamp.strftime("%Y%m%dT%H%M%S%fZ")
+    seed_name = f"{agent_name}-{hostname}-{stamp}{SEED_EXTENSION}"
     seed_path = outbox / seed_name
-    seed_path.write_text(json.dumps(seed, indent=2, default=str), encoding="utf-8")
-
-    logger.info("Seed collected: %s", seed_path.name)
+    seed_path.write_text(json.dumps(seed, separators=(",", ":"), default=str), encoding="utf-8")
+
+    state["source_id"] = source_id
+    state["seq"] = seq
+    if base is None:
+        state["last_full"] = seq
+    state["history"][str(seq)] = _trusted_clock(clock, read_ns)
+    _prune_seed_history(state)
+    _save_seed_state(home, state)
+
+    logger.info(
+        "Seed collected: %s (%s, seq %d)",
+        seed_path.name,
+        "full" if base is None else f"delta from {base_seq}",
+        seq,
+    )
     return seed_path
 
 
@@ -255,6 +331,35 @@ def gpg_decrypt(encrypted_path: Path, output_dir: Optional[Path] = None) -> Opti
         return None
 
 
+def gpg_decrypt_many(
+    encrypted_paths: list[Path],
+    output_dir: Optional[Path] = None,
+    workers: Optional[int] = None,
+) -> dict[Path, Optional[Path]]:
+    """Decrypt several seed files concurrently.
+
+    Each decryption is its own ``gpg`` process, so a small thread pool
+    driving :func:`gpg_decrypt` runs them in parallel processes without a
+    process pool of our own.
+
+    Args:
+        encrypted_paths: The .gpg files.
+        output_dir: Where to write the decrypted files. Defaults to each file's dir.
+        workers: Concurrent gpg processes. Defaults to ``DECRYPT_WORKERS``.
+
+    Returns:
+        Mapping of each input path to its decrypted path (None on failure).
+    """
+    if not encrypted_paths:
+        return {}
+    workers = max(1, min(workers or DECRYPT_WORKERS, len(encrypted_paths)))
+    if workers == 1:
+        return {p: gpg_decrypt(p, output_dir) for p in encrypted_paths}
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="seed-gpg") as pool:
+        results = pool.map(lambda p: gpg_decrypt(p, output_dir), encrypted_paths)
+        return dict(zip(encrypted_paths, results))
+
+
 def push_seed(home: Path, agent_name: str, encrypt: bool = True) -> Optional[Path]:
     """Collect current state, optionally encrypt, place in sync folder.
 
@@ -314,6 +419,13 @@ def pull_seeds(home: Path, decrypt: bool = True) -> list[dict]:
 
     Reads all seeds in inbox/, decrypts if needed, and returns
     the parsed seed data. Processed files move to archive/.
+    Encrypted seeds are decrypted up front in parallel
+    (:func:`gpg_decrypt_many`); a seed whose bytes match one already
+    seen in this pull (a Syncthing conflict copy) is archived unparsed.
+
+    A seed whose sequence this node has already applied from the same
+    source is archived without re-importing. Acknowledgements of this
+    node's own seeds are recorded as the per-peer delta base.
 
     Args:
         home: Agent home directory.
@@ -330,14 +442,19 @@ def pull_seeds(home: Path, decrypt: bool = True) -> list[dict]:
         return []
 
     seeds = []
+    seed_state = _load_seed_state(home)
+    state_dirty = False
+    seen: set[str] = set()
 
-    for f in sorted(inbox.iterdir()):
-        if f.name.startswith("."):
-            continue
+    entries = [f for f in sorted(inbox.iterdir()) if not f.name.startswith(".")]
+    decrypted_paths = (
+        gpg_decrypt_many([f for f in entries if f.suffix == ".gpg"]) if decrypt else {}
+    )
 
+    for f in entries:
         seed_path = f
         if decrypt and f.suffix == ".gpg":
-            decrypted = gpg_decrypt(f)
+            decrypted = decrypted_paths.get(f)
             if decrypted:
                 seed_path = decrypted
                 f.unlink()
@@ -347,10 +464,20 @@ def pull_seeds(home: Path, decrypt: bool = True) -> list[dict]:
 
         if seed_path.suffix == ".json" or seed_path.name.endswith(SEED_EXTENSION):
             try:
-                data = json.loads(seed_path.read_text(encoding="utf-8"))
+                raw = seed_path.read_bytes()
+                digest = hashlib.sha256(raw).hexdigest()
+                if digest in seen:
+                    logger.debug("Duplicate seed %s - archiving without import", seed_path.name)
+                    archive.mkdir(exist_ok=True)
+                    seed_path.rename(archive / seed_path.name)
+                    continue
+                seen.add(digest)
+                data = json.loads(raw)
                 seeds.append(data)
+                fresh = _note_seed(seed_state, data)
+                state_dirty = state_dirty or "seq" in data
 
-                if "memory_entries" in data:
+                if fresh and "memory_entries" in data:
                     try:
                         from ..memory_engine import import_from_seed
 
@@ -364,7 +491,7 @@ def pull_seeds(home: Path, decrypt: bool = True) -> list[dict]:
                             "Could not import memories from seed %s: %s", seed_path.name, exc
                         )
 
-                if "febs" in data:
+                if fresh and "febs" in data:
                     try:
                         from .trust import import_febs_from_seed
 
@@ -380,9 +507,11 @@ def pull_seeds(home: Path, decrypt: bool = True) -> list[dict]:
 
                 archive.mkdir(exist_ok=True)
                 seed_path.rename(archive / seed_path.name)
-            except (json.JSONDecodeError, OSError) as exc:
+            except (json.JSONDecodeError, UnicodeDecodeError, OSError) as exc:
                 logger.warning("Failed to process %s: %s", seed_path.name, exc)
 
+    if state_dirty:
+        _save_seed_state(home, seed_state)
     return seeds
 
 
@@ -428,6 +557,135 @@ def discover_sync(home: Path) -> SyncState:
     return state
 
 
+# --- Delta seed bookkeeping ---
+
+
+def _load_seed_state(home: Path) -> dict:
+    """Load this node's seed clock state (see ``SEED_STATE_RELPATH``).
+
+    Keys: ``source_id`` (this node), ``seq`` (last seed emitted),
+    ``last_full`` (seq of the last checkpoint), ``history`` (seq -> trusted
+    clock, see ``_trusted_clock``, for seeds that may still be a delta
+    base), ``peer_acks`` (peer source -> highest of our seqs it applied)
+    and ``applied`` (source -> highest seq we applied from it).
+    """
+    state = {
+        "source_id": None,
+        "seq": 0,
+        "last_full": None,
+        "history": {},
+        "peer_acks": {},
+        "applied": {},
+    }
+    try:
+        data = json.loads((home / SEED_STATE_RELPATH).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return state
+    if isinstance(data, dict):
+        state.update({k: v for k, v in data.items() if k in state})
+    return state
+
+
+def _save_seed_state(home: Path, state: dict) -> None:
+    path = home / SEED_STATE_RELPATH
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_text(path, json.dumps(state, separators=(",", ":")))
+    except OSError as exc:
+        logger.warning("Could not save seed clock state: %s", exc)
+
+
+def _section_clock(home: Path) -> dict[str, int]:
+    """Return the high-water mark (newest mtime, ns) of every seed section."""
+
+    def mtime(path: Path) -> int:
+        try:
+            return path.stat().st_mtime_ns
+        except OSError:
+            return 0
+
+    febs = home / "trust" / "febs"
+    clock = {
+        "identity": mtime(home / "identity" / "identity.json"),
+        "trust": mtime(home / "trust" / "trust.json"),
+        "febs": max((mtime(f) for f in febs.glob("*.feb")), default=0),
+        "memory": 0,
+        "manifest": mtime(home / "manifest.json"),
+    }
+    try:
+        from ..memory_engine import last_modified_ns
+
+        clock["memory"] = last_modified_ns(home)
+    except Exception as exc:
+        logger.debug("Could not read memory high-water mark: %s", exc)
+    return clock
+
+
+def _trusted_clock(clock: dict[str, int], read_ns: int) -> dict[str, int]:
+    """The clock as a delta base: racy high-water marks backed off by the window.
+
+    A section whose newest mtime was inside the racy window when the clock
+    was read may still gain files with that same mtime, so the next delta
+    re-sends that window of it instead of trusting it as delivered.
+    """
+    return {
+        section: value - RACY_WINDOW_NS if value and is_racy(value, read_ns) else value
+        for section, value in clock.items()
+    }
+
+
+def _delta_base(state: dict, seq: int) -> Optional[int]:
+    """Pick the seq this seed is a delta against, or None for a checkpoint.
+
+    One seed file reaches every peer, so the base is the oldest seed any
+    peer has acknowledged since the last checkpoint (or the checkpoint
+    itself before anyone has). A peer still behind the checkpoint waits
+    for the next one rather than dragging every delta back.
+    """
+    last_full = state["last_full"]
+    if last_full is None or seq - last_full >= SEED_CHECKPOINT_INTERVAL:
+        return None
+    acks = [a for a in state["peer_acks"].values() if a >= last_full]
+    return min(acks) if acks else last_full
+
+
+def _prune_seed_history(state: dict) -> None:
+    """Drop clocks that can no longer be a delta base."""
+    floor = state["last_full"] or state["seq"]
+    state["history"] = {k: v for k, v in state["history"].items() if int(k) >= floor}
+
+
+def _note_seed(state: dict, data: dict) -> bool:
+    """Record an incoming seed's sequence and acks.
+
+    Returns:
+        False if this seed was already applied (skip the import).
+    """
+    source = data.get("source_id")
+    seq = data.get("seq")
+    if not source or not isinstance(seq, int):
+        return True  # pre-delta seed: import as before
+    if source == state["source_id"]:
+        return False  # our own seed echoed back
+
+    own = state["source_id"]
+    acked = (data.get("acks") or {}).get(own) if own else None
+    if isinstance(acked, int) and acked > state["peer_acks"].get(source, 0):
+        state["peer_acks"][source] = acked
+
+    applied = state["applied"].get(source, 0)
+    if seq <= applied:
+        return False
+    base_seq = data.get("base_seq")
+    if base_seq is None or base_seq <= applied:
+        state["applied"][source] = seq
+    else:
+        # A delta past a gap: import what it carries but do not acknowledge
+        # it, so the sender keeps its base low until we have caught up.
+        logger.debug("Seed gap from %s: have %d, delta base %d", source, applied, base_seq)
+    return True
+
+
 # --- Private helpers ---
 
 
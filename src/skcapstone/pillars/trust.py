@@ -207,11 +207,13 @@ def list_febs(home: Path) -> list[dict]:
     return summaries
 
 
-def export_febs_for_seed(home: Path) -> list[dict]:
+def export_febs_for_seed(home: Path, modified_since: Optional[int] = None) -> list[dict]:
     """Export FEB data for inclusion in sync seeds.
 
     Args:
         home: Agent home directory.
+        modified_since: When set, only FEBs whose file mtime (ns) is newer
+            than this are exported (delta seeds).
 
     Returns:
         List of FEB dicts suitable for JSON serialization.
@@ -222,6 +224,12 @@ def export_febs_for_seed(home: Path) -> list[dict]:
 
     exported = []
     for f in febs_dir.glob("*.feb"):
+        if modified_since is not None:
+            try:
+                if f.stat().st_mtime_ns <= modified_since:
+                    continue
+            except OSError:
+                continue
         data = _read_feb_safe(f)
         if data is None:
             continue
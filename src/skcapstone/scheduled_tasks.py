@@ -1,8 +1,14 @@
 """
 Cron-like scheduler for recurring agent background tasks.
 
-Runs a single daemon thread that wakes up every TICK_INTERVAL seconds,
-checks which tasks are due, and fires their callbacks.
+Runs a single daemon thread that keeps the built-in tasks in a next-due
+min-heap and sleeps until the earliest deadline (or the next config-job
+check, every TICK_INTERVAL seconds). Due work is handed to a small, bounded
+worker pool with two lanes, so a slow hourly sweep can never delay the
+30-second heartbeat:
+
+    - critical - heartbeat_pulse, backend_reprobe (peers judge liveness by these)
+    - bulk     - every other built-in task and all jobs.yaml config jobs
 
 Built-in recurring tasks:
     - heartbeat_pulse        - every 30 seconds
@@ -21,14 +27,18 @@ Usage:
 
 from __future__ import annotations
 
+import heapq
+import itertools
 import logging
+import math
 import os
+import queue
 import random
 import shutil
 import subprocess
 import threading
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Callable, Optional
@@ -39,12 +49,64 @@ from .scheduler_state import SchedulerState
 
 logger = logging.getLogger("skcapstone.scheduled_tasks")
 
+#: Lane for tasks whose lateness peers can observe.
+LANE_CRITICAL = "critical"
+#: Lane for everything else (sweeps, reconciles, config jobs).
+LANE_BULK = "bulk"
+
+#: Built-in tasks routed to the critical lane when no lane is given.
+CRITICAL_TASKS = frozenset({"heartbeat_pulse", "backend_reprobe"})
+
+#: Worker threads per lane.
+LANE_WORKERS = {LANE_CRITICAL: 2, LANE_BULK: 4}
+
+#: Upper bounds (seconds) of the lateness / run-time histogram buckets.
+HISTOGRAM_BUCKETS = (0.01, 0.1, 0.5, 1.0, 5.0, 30.0, 60.0, 300.0)
+
 
 # ---------------------------------------------------------------------------
 # Core data structures
 # ---------------------------------------------------------------------------
 
 
+class DurationHistogram:
+    """Fixed-bucket histogram of durations in seconds.
+
+    Counts are per bucket (not cumulative); observations above the last
+    bound land in ``+Inf``.
+    """
+
+    def __init__(self, bounds: tuple[float, ...] = HISTOGRAM_BUCKETS) -> None:
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """Record one observation (negative values clamp to 0)."""
+        seconds = max(0.0, seconds)
+        for i, bound in enumerate(self.bounds):
+            if seconds <= bound:
+                self.counts[i] += 1
+                break
+        else:
+            self.counts[-1] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def to_dict(self) -> dict:
+        """Return ``{count, mean, max, buckets}`` with buckets keyed by bound."""
+        labels = [f"{b:g}" for b in self.bounds] + ["+Inf"]
+        return {
+            "count": self.count,
+            "mean": round(self.total / self.count, 6) if self.count else None,
+            "max": round(self.max, 6),
+            "buckets": dict(zip(labels, self.counts)),
+        }
+
+
 @dataclass
 class ScheduledTask:
     """A recurring task entry managed by TaskScheduler.
@@ -57,6 +119,9 @@ class ScheduledTask:
         last_error: String representation of the last exception, if any.
         run_count: Total number of successful (non-raising) executions.
         error_count: Total number of executions that raised an exception.
+        lane: Worker lane the scheduler dispatches this task to.
+        lateness: Seconds between the task falling due and starting to run.
+        runtime: Seconds each run took.
     """
 
     name: str
@@ -67,6 +132,9 @@ class ScheduledTask:
     run_count: int = 0
     error_count: int = 0
     delay_first_run: float = 0.0
+    lane: str = LANE_BULK
+    lateness: DurationHistogram = field(default_factory=DurationHistogram, repr=False)
+    runtime: DurationHistogram = field(default_factory=DurationHistogram, repr=False)
 
     def is_due(self, now: Optional[datetime] = None) -> bool:
         """Return True if the task interval has elapsed since last_run.
@@ -95,8 +163,10 @@ class ScheduledTask:
 
         On success: increments run_count, clears last_error.
         On failure: increments error_count, stores exception string in last_error.
-        In both cases last_run is updated so the interval resets.
+        In both cases last_run is updated so the interval resets, and the
+        elapsed time is recorded in ``runtime``.
         """
+        started = time.monotonic()
         try:
             self.callback()
             self.run_count += 1
@@ -108,6 +178,70 @@ class ScheduledTask:
             logger.error("Scheduled task '%s' failed: %s", self.name, exc)
         finally:
             self.last_run = datetime.now(timezone.utc)
+            self.runtime.observe(time.monotonic() - started)
+
+    def seconds_until_due(self, now: Optional[datetime] = None) -> float:
+        """Seconds until :meth:`is_due` turns true (0 when already due).
+
+        Args:
+            now: Reference time (defaults to UTC now).
+        """
+        reference = now or datetime.now(timezone.utc)
+        if self.last_run is None:
+            if self.delay_first_run <= 0:
+                return 0.0
+            if not hasattr(self, "_created_at"):
+                object.__setattr__(self, "_created_at", reference)
+            elapsed = (reference - self._created_at).total_seconds()
+            return max(0.0, self.delay_first_run - elapsed)
+        elapsed = (reference - self.last_run).total_seconds()
+        return max(0.0, self.interval_seconds - elapsed)
+
+
+class _Lane:
+    """Bounded pool of daemon worker threads fed from one FIFO queue.
+
+    Daemon threads (rather than ``ThreadPoolExecutor``) so a config job in
+    the middle of a 15-minute run never holds up interpreter exit. Workers
+    start on the first submit.
+    """
+
+    def __init__(self, name: str, workers: int) -> None:
+        self.name = name
+        self.workers = max(1, workers)
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._threads: list[threading.Thread] = []
+        self._lock = threading.Lock()
+
+    def submit(self, fn: Callable, *args) -> None:
+        """Queue ``fn(*args)`` for the next free worker."""
+        with self._lock:
+            if not self._threads:
+                for i in range(self.workers):
+                    thread = threading.Thread(
+                        target=self._work, name=f"sched-{self.name}-{i}", daemon=True
+                    )
+                    thread.start()
+                    self._threads.append(thread)
+        self._queue.put((fn, args))
+
+    def stop(self) -> None:
+        """Ask every worker to exit once its current item is done."""
+        with self._lock:
+            for _ in self._threads:
+                self._queue.put(None)
+            self._threads = []
+
+    def _work(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            fn, args = item
+            try:
+                fn(*args)
+            except Exception:  # noqa: BLE001 - a worker must outlive its items
+                logger.exception("Scheduler %s-lane item failed", self.name)
 
 
 # ---------------------------------------------------------------------------
@@ -118,14 +252,18 @@ class ScheduledTask:
 class TaskScheduler:
     """Cron-like scheduler that fires registered tasks on configurable intervals.
 
-    Runs one daemon thread (``daemon-scheduler``) that wakes up every
-    ``TICK_INTERVAL`` seconds, checks which tasks are due, and calls their
-    callbacks inline (serially, in registration order).
+    Runs one daemon thread (``daemon-scheduler``) that pops tasks off a
+    next-due min-heap, hands each to its lane's worker pool, and sleeps
+    until the earliest remaining deadline. A task is pushed back onto the
+    heap only after its run finishes, so it never overlaps itself and the
+    interval is measured from completion, as before.
 
     Args:
         home: Agent home directory.
         stop_event: Daemon stop event; scheduler thread exits when set.
-        tick_interval: How often (seconds) the scheduler loop wakes to check tasks.
+        tick_interval: Longest the loop sleeps; also how often config jobs
+            are checked.
+        lane_workers: Worker threads per lane (defaults to ``LANE_WORKERS``).
     """
 
     TICK_INTERVAL: float = 5.0
@@ -135,6 +273,7 @@ class TaskScheduler:
         home: Path,
         stop_event: threading.Event,
         tick_interval: float = TICK_INTERVAL,
+        lane_workers: Optional[dict[str, int]] = None,
     ) -> None:
         self._home = home
         self._stop_event = stop_event
@@ -146,6 +285,12 @@ class TaskScheduler:
         self._host_aliases: set[str] = set()
         self._state: Optional[SchedulerState] = None
         self._job_runner: Optional[JobRunner] = None
+        workers = {**LANE_WORKERS, **(lane_workers or {})}
+        self._lanes = {name: _Lane(name, n) for name, n in workers.items()}
+        self._heap: list[tuple[float, int, ScheduledTask]] = []
+        self._seq = itertools.count()
+        self._wake = threading.Event()
+        self._jobs_in_flight: set[str] = set()
 
     # ------------------------------------------------------------------
     # Public API
@@ -157,6 +302,7 @@ class TaskScheduler:
         interval_seconds: float,
         callback: Callable[[], None],
         delay_first_run: float = 0.0,
+        lane: Optional[str] = None,
     ) -> ScheduledTask:
         """Register a recurring task.
 
@@ -165,6 +311,8 @@ class TaskScheduler:
             interval_seconds: Minimum seconds between executions.
             callback: Zero-argument callable to invoke.
             delay_first_run: Seconds to wait before first execution (default 0 = immediate).
+            lane: ``LANE_CRITICAL`` or ``LANE_BULK``. Defaults to critical for
+                names in ``CRITICAL_TASKS`` and bulk otherwise.
 
         Returns:
             The created ScheduledTask (caller may inspect it at runtime).
@@ -174,9 +322,15 @@ class TaskScheduler:
             interval_seconds=interval_seconds,
             callback=callback,
             delay_first_run=delay_first_run,
+            lane=lane or (LANE_CRITICAL if name in CRITICAL_TASKS else LANE_BULK),
         )
+        if task.lane not in self._lanes:
+            raise ValueError(f"Unknown scheduler lane {task.lane!r} for task '{name}'")
         with self._lock:
             self._tasks.append(task)
+            if self._thread is not None:
+                self._push(task)
+        self._wake.set()
         logger.debug("Registered scheduled task '%s' every %.0fs", name, interval_seconds)
         return task
 
@@ -186,6 +340,9 @@ class TaskScheduler:
         Returns:
             The started daemon thread (for lifecycle management by caller).
         """
+        with self._lock:
+            for task in self._tasks:
+                self._push(task)
         self._thread = threading.Thread(
             target=self._run,
             name="daemon-scheduler",
@@ -193,23 +350,26 @@ class TaskScheduler:
         )
         self._thread.start()
         logger.info(
-            "Task scheduler started - %d task(s), tick=%.0fs",
+            "Task scheduler started - %d task(s), tick=%.0fs, lanes=%s",
             len(self._tasks),
             self._tick_interval,
+            ", ".join(f"{n}:{lane.workers}" for n, lane in self._lanes.items()),
         )
         return self._thread
 
     def stop(self, timeout: float = 5.0) -> None:
         """Stop the scheduler loop and join its thread (idempotent).
 
-        Sets the shared stop event so the tick loop exits, then waits up to
-        ``timeout`` seconds for the thread to finish.  Safe to call more than
-        once and safe to call when the scheduler was never started.
+        Sets the shared stop event so the loop exits, then waits up to
+        ``timeout`` seconds for the thread to finish and releases the lane
+        workers (runs already in progress finish on their own).  Safe to call
+        more than once and safe to call when the scheduler was never started.
 
         Args:
             timeout: Maximum seconds to wait for the scheduler thread to exit.
         """
         self._stop_event.set()
+        self._wake.set()
         thread = self._thread
         if thread is not None and thread.is_alive():
             thread.join(timeout=timeout)
@@ -217,13 +377,16 @@ class TaskScheduler:
                 logger.warning("Task scheduler thread did not stop within %.0fs", timeout)
             else:
                 logger.debug("Task scheduler stopped")
+        for lane in self._lanes.values():
+            lane.stop()
 
     def status(self) -> list[dict]:
         """Return serializable status for all registered tasks.
 
         Returns:
             List of dicts with: name, interval_seconds, last_run (ISO or None),
-            last_error, run_count, error_count.
+            last_error, run_count, error_count, lane, and the ``lateness`` and
+            ``runtime`` histograms (see :meth:`DurationHistogram.to_dict`).
         """
         with self._lock:
             return [
@@ -234,6 +397,9 @@ class TaskScheduler:
                     "last_error": t.last_error,
                     "run_count": t.run_count,
                     "error_count": t.error_count,
+                    "lane": t.lane,
+                    "lateness": t.lateness.to_dict(),
+                    "runtime": t.runtime.to_dict(),
                 }
                 for t in self._tasks
             ]
@@ -285,21 +451,15 @@ class TaskScheduler:
         Skips silently when no config jobs are loaded or state/runner are not
         initialised (i.e. :meth:`load_config_jobs` has not been called).
 
-        Each due job is dispatched to its own short-lived daemon thread so
-        the tick returns immediately.  Long-running jobs (e.g. ``agent``
-        type, timeout up to 900 s) therefore never block the scheduler daemon
-        thread - which also drives heartbeats and all built-in tasks.
-
-        The due-check is intentionally kept in the tick thread (it is cheap).
-        The overlap lock is acquired *inside* the worker thread so it spans
-        the actual run; :meth:`_run_config_job` handles lock + run + state.
+        Each due job is queued on the bulk lane so the tick returns
+        immediately.  Long-running jobs (e.g. ``agent`` type, timeout up to
+        900 s) therefore never block the scheduler thread, and the critical
+        lane keeps heartbeats on time however many jobs are running.
 
-        Note: because ``record_run`` is called asynchronously inside the
-        worker, the next tick may evaluate the same job as "due" before
-        ``record_run`` completes.  The per-job overlap lock prevents a second
-        concurrent execution in that window - the second worker acquires
-        ``got=False`` and returns immediately.  :class:`SchedulerState` uses
-        a ``threading.Lock`` so concurrent ``record_run`` calls are safe.
+        The due-check is intentionally kept in the scheduler thread (it is
+        cheap).  A job already queued or running is not queued again; the
+        per-job overlap lock acquired inside :meth:`_run_config_job` still
+        guards against a concurrent run from another process.
 
         Args:
             now: Reference UTC timestamp for due-checks.  Defaults to
@@ -311,18 +471,24 @@ class TaskScheduler:
         for job in self._config_jobs:
             if not is_due(job, self._state.last_run(job.name), now):
                 continue
-            threading.Thread(
-                target=self._run_config_job,
-                args=(job, now),
-                name=f"skjob-{job.name}",
-                daemon=True,
-            ).start()
+            with self._lock:
+                if job.name in self._jobs_in_flight:
+                    continue
+                self._jobs_in_flight.add(job.name)
+            self._lanes[LANE_BULK].submit(self._dispatch_config_job, job, now)
+
+    def _dispatch_config_job(self, job: JobSpec, fire_time: datetime) -> None:
+        """Lane worker body for a config job: run it, then clear in-flight."""
+        try:
+            self._run_config_job(job, fire_time)
+        finally:
+            with self._lock:
+                self._jobs_in_flight.discard(job.name)
 
     def _run_config_job(self, job: JobSpec, fire_time: datetime) -> None:
-        """Run a single config job in its own thread: lock, execute, record.
+        """Run a single config job on a lane worker: lock, execute, record.
 
-        This method is the body of the per-job daemon thread spawned by
-        :meth:`tick_config_jobs`.  It acquires the per-job overlap lock,
+        Called for each job :meth:`tick_config_jobs` queues.  It acquires the per-job overlap lock,
         runs the job via the configured :class:`~skcapstone.scheduler_runner.JobRunner`,
         then records the result via
         :class:`~skcapstone.scheduler_state.SchedulerState`.
@@ -416,20 +582,45 @@ class TaskScheduler:
     # Internal
     # ------------------------------------------------------------------
 
+    def _push(self, task: ScheduledTask) -> None:
+        """Add *task* to the heap at its next deadline (caller holds the lock)."""
+        due = time.monotonic() + task.seconds_until_due()
+        heapq.heappush(self._heap, (due, next(self._seq), task))
+
+    def _execute(self, task: ScheduledTask, due: float) -> None:
+        """Lane worker body: run *task*, then put it back on the heap."""
+        task.lateness.observe(time.monotonic() - due)
+        try:
+            task.run()
+        finally:
+            with self._lock:
+                heapq.heappush(
+                    self._heap,
+                    (time.monotonic() + task.interval_seconds, next(self._seq), task),
+                )
+            self._wake.set()
+
     def _run(self) -> None:
-        """Main scheduler loop - ticks every TICK_INTERVAL seconds."""
+        """Main scheduler loop - sleep until the next deadline, then dispatch."""
+        next_jobs_check = 0.0
         while not self._stop_event.is_set():
-            now = datetime.now(timezone.utc)
+            self._wake.clear()
+            now = time.monotonic()
             with self._lock:
-                tasks_snapshot = list(self._tasks)
+                while self._heap and self._heap[0][0] <= now:
+                    due, _, task = heapq.heappop(self._heap)
+                    self._lanes[task.lane].submit(self._execute, task, due)
+                next_due = self._heap[0][0] if self._heap else math.inf
 
-            for task in tasks_snapshot:
-                if task.is_due(now):
-                    task.run()
+            if now >= next_jobs_check:
+                self.tick_config_jobs()
+                next_jobs_check = now + self._tick_interval
 
-            self.tick_config_jobs(now)
-
-            self._stop_event.wait(timeout=self._tick_interval)
+            # Cap the sleep at one tick so an externally set stop event (the
+            # daemon shares it) is noticed promptly.
+            timeout = min(next_due, next_jobs_check) - time.monotonic()
+            if timeout > 0:
+                self._wake.wait(timeout=min(timeout, self._tick_interval))
 
 
 # ---------------------------------------------------------------------------
@@ -708,6 +899,9 @@ def build_scheduler(
     | profile_freshness_check  | 24 hours   |
     +--------------------------+------------+
 
+    ``heartbeat_pulse`` and ``backend_reprobe`` run on the critical lane;
+    the rest share the bulk lane with config jobs.
+
     Args:
         home: Agent home directory.
         stop_event: Daemon stop event - scheduler thread exits when set.
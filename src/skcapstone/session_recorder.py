@@ -25,6 +25,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Optional
 
+from .jsonl_tail import read_since, tail_records
+
 logger = logging.getLogger("skcapstone.session_recorder")
 
 _SESSIONS_KEEP = 5
@@ -193,8 +195,27 @@ def list_sessions(home: Path) -> list[Path]:
     )
 
 
-def load_session(path: Path) -> list[dict[str, Any]]:
-    """Parse a JSONL session file into a list of entries."""
+def load_session(
+    path: Path,
+    limit: Optional[int] = None,
+    since: Optional[str] = None,
+) -> list[dict[str, Any]]:
+    """Parse a JSONL session file into a list of entries, oldest first.
+
+    Args:
+        path:  Session file.
+        limit: When set, return only the last *limit* entries, read
+               backwards from EOF instead of parsing the whole session.
+        since: When set, return only entries whose ``ts`` is >= this ISO
+               timestamp, located through the file's sparse offset index.
+    """
+    if since is not None:
+        return read_since(path, since, limit=limit)
+    if limit is not None:
+        entries = tail_records(path, limit)
+        entries.reverse()
+        return entries
+
     entries: list[dict[str, Any]] = []
     with path.open(encoding="utf-8") as fh:
         for line in fh:
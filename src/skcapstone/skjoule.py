@@ -41,6 +41,7 @@ from pydantic import BaseModel, Field
 
 from . import AGENT_HOME, SHARED_ROOT
 from .atomic_io import atomic_write_text
+from .jsonl_tail import tail_records
 
 try:  # POSIX only; the fallback in settle_lock() covers everything else.
     import fcntl
@@ -786,21 +787,17 @@ class JouleWallet:
             logger.error("Failed to write wallet state for %s: %s", self._agent, exc)
 
     def _read_log(self, limit: int) -> list[Transaction]:
-        """Read the last N transactions from the JSONL log."""
-        if not self._log_path.exists():
-            return []
+        """Read the last N transactions from the JSONL log.
+
+        Reads backwards from EOF, so the cost tracks *limit* rather than
+        the lifetime size of the ledger.
+        """
         try:
-            lines = self._log_path.read_text(encoding="utf-8").strip().splitlines()
-            recent = lines[-limit:] if limit < len(lines) else lines
-            txns = []
-            for line in reversed(recent):
-                line = line.strip()
-                if line:
-                    try:
-                        txns.append(Transaction(**json.loads(line)))
-                    except (json.JSONDecodeError, ValueError):
-                        continue
-            return txns
+            return tail_records(
+                self._log_path,
+                limit,
+                parse=lambda line: Transaction(**json.loads(line)),
+            )
         except OSError as exc:
             logger.warning("Failed to read transaction log for %s: %s", self._agent, exc)
             return []
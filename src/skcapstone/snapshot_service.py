@@ -0,0 +1,276 @@
+"""
+In-memory snapshots of file-derived views, rebuilt only on change.
+
+The daemon dashboards poll every few seconds and, before this module,
+re-read ``identity.json``, sorted every conversation file by mtime,
+parsed the newest five, and re-read every household agent's identity
+and heartbeat on every request. ``SnapshotService`` keeps each such view
+in memory together with the change tokens (see ``file_watch``) of the
+files and directories it was built from; ``get()`` compares tokens and
+only rebuilds when one moved. With inotify available a hit costs a few
+dict lookups; without it, a handful of ``stat`` calls.
+
+``etag_for()`` and ``if_none_match()`` implement the HTTP side so
+handlers can answer an unchanged poll with ``304 Not Modified``.
+
+Views shared by the built-in daemon handler and the FastAPI app
+(``household_agents``, ``recent_conversations``, ``agent_identity``)
+are plain functions here so both servers build the same payload.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Hashable, Iterable, Optional, Sequence, Union
+
+from .file_watch import PathWatcher, file_token
+
+logger = logging.getLogger("skcapstone.snapshot_service")
+
+Files = Union[Sequence[Path], Callable[[], Iterable[Path]]]
+
+
+@dataclass(frozen=True)
+class DirDep:
+    """A directory a view depends on.
+
+    Attributes:
+        path: The directory.
+        contents: Rebuild on edits to existing children, not only on
+            additions/removals (a listing-only view can skip this).
+        recursive: Track the whole subtree.
+    """
+
+    path: Path
+    contents: bool = True
+    recursive: bool = False
+
+
+@dataclass
+class _View:
+    build: Callable[[], Any]
+    dirs: tuple[DirDep, ...]
+    files: Files
+    value: Any = None
+    token: Optional[Hashable] = None
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    builds: int = 0
+    hits: int = 0
+
+
+class SnapshotService:
+    """Registry of cached views keyed by name.
+
+    Args:
+        watcher: Shared PathWatcher; one is created when omitted.
+    """
+
+    def __init__(self, watcher: Optional[PathWatcher] = None) -> None:
+        self._owns_watcher = watcher is None
+        self._watcher = watcher or PathWatcher()
+        self._views: dict[str, _View] = {}
+
+    @property
+    def watcher(self) -> PathWatcher:
+        """The PathWatcher supplying change tokens."""
+        return self._watcher
+
+    def register(
+        self,
+        name: str,
+        build: Callable[[], Any],
+        *,
+        dirs: Sequence[DirDep] = (),
+        files: Files = (),
+    ) -> None:
+        """Register (or replace) a view.
+
+        Args:
+            name: View name used with get().
+            build: Zero-argument builder returning the view value. Treat the
+                returned object as read-only: every caller shares it.
+            dirs: Directories whose changes invalidate the view.
+            files: Files whose changes invalidate the view, or a callable
+                returning them (for dependency sets that grow, such as one
+                identity file per agent directory).
+        """
+        self._views[name] = _View(build=build, dirs=tuple(dirs), files=files)
+
+    def get(self, name: str) -> Any:
+        """Return the current value of view *name*, rebuilding if stale."""
+        view = self._views[name]
+        with view.lock:
+            token = self._token(view)
+            if view.builds and token == view.token:
+                view.hits += 1
+                return view.value
+            view.value = view.build()
+            view.token = token
+            view.builds += 1
+            return view.value
+
+    def invalidate(self, name: Optional[str] = None) -> None:
+        """Force the next get() of *name* (or of every view) to rebuild."""
+        for key, view in self._views.items():
+            if name is None or key == name:
+                with view.lock:
+                    view.builds = 0
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Per-view build and hit counters."""
+        return {k: {"builds": v.builds, "hits": v.hits} for k, v in self._views.items()}
+
+    def stop(self) -> None:
+        """Stop the watcher if this service created it."""
+        if self._owns_watcher:
+            self._watcher.stop()
+
+    def _token(self, view: _View) -> Hashable:
+        files = view.files() if callable(view.files) else view.files
+        return (
+            tuple(
+                self._watcher.token(d.path, contents=d.contents, recursive=d.recursive)
+                for d in view.dirs
+            ),
+            tuple((str(f), file_token(f)) for f in files),
+        )
+
+
+# ---------------------------------------------------------------------------
+# HTTP helpers
+# ---------------------------------------------------------------------------
+
+
+def etag_for(body: bytes) -> str:
+    """Strong ETag for a response body."""
+    return '"' + hashlib.blake2b(body, digest_size=12).hexdigest() + '"'
+
+
+def if_none_match(header: Optional[str], etag: str) -> bool:
+    """True when an ``If-None-Match`` header value matches *etag*."""
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    tags = [t.strip() for t in header.split(",")]
+    return etag in tags or f"W/{etag}" in tags
+
+
+# ---------------------------------------------------------------------------
+# Shared view builders
+# ---------------------------------------------------------------------------
+
+
+def agent_identity(home: Path) -> dict:
+    """Parsed ``identity/identity.json`` or ``{}``."""
+    identity_file = home / "identity" / "identity.json"
+    if not identity_file.exists():
+        return {}
+    try:
+        data = json.loads(identity_file.read_text(encoding="utf-8"))
+        return data if isinstance(data, dict) else {}
+    except Exception as exc:
+        logger.warning("Failed to read identity.json for dashboard: %s", exc)
+        return {}
+
+
+def recent_conversations(shared_root: Path, limit: int = 5) -> list[dict]:
+    """Summaries of the *limit* most recently modified conversations."""
+    conversations: list[dict] = []
+    conversations_dir = shared_root / "conversations"
+    if not conversations_dir.exists():
+        return conversations
+    try:
+        conv_files = sorted(
+            conversations_dir.glob("*.json"),
+            key=lambda p: p.stat().st_mtime,
+            reverse=True,
+        )[:limit]
+    except Exception as exc:
+        logger.warning("Failed to list conversation files: %s", exc)
+        return conversations
+    for cf in conv_files:
+        try:
+            msgs = json.loads(cf.read_text(encoding="utf-8"))
+            if isinstance(msgs, list):
+                conversations.append(
+                    {
+                        "peer": cf.stem,
+                        "message_count": len(msgs),
+                        "last_message": msgs[-1].get("timestamp") if msgs else None,
+                    }
+                )
+        except Exception as exc:
+            logger.warning("Failed to read conversation file %s: %s", cf, exc)
+    return conversations
+
+
+def household_agents(shared_root: Path) -> list[dict]:
+    """Raw identity and heartbeat documents for every household agent.
+
+    Liveness is deliberately NOT computed here: it depends on the clock,
+    not on the files, so callers derive it per request from the cached
+    heartbeat timestamp.
+    """
+    agents: list[dict] = []
+    agents_dir = shared_root / "agents"
+    heartbeats_dir = shared_root / "heartbeats"
+    if not agents_dir.exists():
+        return agents
+    for agent_dir in sorted(agents_dir.iterdir()):
+        if not agent_dir.is_dir():
+            continue
+        agent_name = agent_dir.name
+        entry: dict = {"name": agent_name}
+        identity_path = agent_dir / "identity" / "identity.json"
+        if identity_path.exists():
+            try:
+                entry["identity"] = json.loads(identity_path.read_text(encoding="utf-8"))
+            except Exception as exc:
+                logger.warning("Failed to read identity for agent %s: %s", agent_name, exc)
+        hb_path = heartbeats_dir / f"{agent_name.lower()}.json"
+        if hb_path.exists():
+            try:
+                entry["heartbeat"] = json.loads(hb_path.read_text(encoding="utf-8"))
+            except Exception as exc:
+                logger.warning("Failed to read heartbeat for agent %s: %s", agent_name, exc)
+                entry["heartbeat_error"] = True
+        agents.append(entry)
+    return agents
+
+
+def household_identity_files(shared_root: Path) -> list[Path]:
+    """Identity files the household view depends on (for ``files=``)."""
+    agents_dir = shared_root / "agents"
+    try:
+        return [d / "identity" / "identity.json" for d in sorted(agents_dir.iterdir())]
+    except OSError:
+        return []
+
+
+def register_daemon_views(service: SnapshotService, home: Path, shared_root: Path) -> None:
+    """Register the views the daemon dashboards and household API serve."""
+    service.register(
+        "identity",
+        lambda: agent_identity(home),
+        files=[home / "identity" / "identity.json"],
+    )
+    service.register(
+        "conversations",
+        lambda: recent_conversations(shared_root),
+        dirs=[DirDep(shared_root / "conversations")],
+    )
+    service.register(
+        "household",
+        lambda: household_agents(shared_root),
+        dirs=[
+            DirDep(shared_root / "agents", contents=False),
+            DirDep(shared_root / "heartbeats"),
+        ],
+        files=lambda: household_identity_files(shared_root),
+    )
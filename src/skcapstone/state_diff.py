@@ -15,12 +15,20 @@ Usage:
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
+import os
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
+
+from .atomic_io import atomic_write_text
+from .file_watch import RACY_WINDOW_NS
+from .memory_engine import _NON_MEMORY_SIDECARS
+from .models import MemoryLayer
 
 logger = logging.getLogger("skcapstone.state_diff")
 
@@ -32,6 +40,7 @@ class StateDiff:
     Attributes:
         new_memories: Memory IDs added since last snapshot.
         removed_memories: Memory IDs no longer present.
+        modified_memories: Memories whose content or tags changed.
         trust_changes: Dict of changed trust fields (old -> new).
         new_tasks: Task IDs created since last snapshot.
         completed_tasks: Task IDs completed since last snapshot.
@@ -44,6 +53,7 @@ class StateDiff:
 
     new_memories: list[dict[str, Any]] = field(default_factory=list)
     removed_memories: list[str] = field(default_factory=list)
+    modified_memories: list[dict[str, Any]] = field(default_factory=list)
     trust_changes: dict[str, dict[str, Any]] = field(default_factory=dict)
     new_tasks: list[dict[str, Any]] = field(default_factory=list)
     completed_tasks: list[dict[str, Any]] = field(default_factory=list)
@@ -54,24 +64,55 @@ class StateDiff:
     has_changes: bool = False
 
 
+@dataclass(frozen=True)
+class MemoryChange:
+    """One memory that differs from the baseline.
+
+    Attributes:
+        kind: ``added``, ``removed`` or ``modified``.
+        memory_id: The memory's id.
+        layer: Its tier now (at the baseline, for removed memories).
+        path: Its file now, None for removed memories.
+    """
+
+    kind: str
+    memory_id: str
+    layer: str
+    path: Optional[Path] = None
+
+    def preview(self, length: int = 80) -> str:
+        """The start of the memory's current content ("" when removed or unreadable)."""
+        if self.path is None:
+            return ""
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return ""
+        content = data.get("content") if isinstance(data, dict) else None
+        return content[:length] if isinstance(content, str) else ""
+
+
 SNAPSHOT_FILENAME = "state_snapshot.json"
+SNAPSHOT_VERSION = "2.0"
 
 
-def take_snapshot(home: Path) -> dict[str, Any]:
+def take_snapshot(home: Path, baseline: dict[str, Any] | None = None) -> dict[str, Any]:
     """Capture the current agent state as a snapshot.
 
     Args:
         home: Agent home directory (~/.skcapstone).
+        baseline: An earlier snapshot; memory files whose mtime and size
+            are unchanged since it reuse its content hashes.
 
     Returns:
         Dict representing the full state at this moment.
     """
     snapshot: dict[str, Any] = {
         "timestamp": datetime.now(timezone.utc).isoformat(),
-        "version": "1.0",
+        "version": SNAPSHOT_VERSION,
     }
 
-    snapshot["memories"] = _snapshot_memories(home)
+    snapshot["memories"] = _snapshot_memories(home, baseline)
     snapshot["trust"] = _snapshot_trust(home)
     snapshot["tasks"] = _snapshot_tasks(home)
     snapshot["pillars"] = _snapshot_pillars(home)
@@ -88,9 +129,9 @@ def save_snapshot(home: Path) -> Path:
     Returns:
         Path to the saved snapshot file.
     """
-    snapshot = take_snapshot(home)
+    snapshot = take_snapshot(home, load_snapshot(home))
     snap_path = home / SNAPSHOT_FILENAME
-    snap_path.write_text(json.dumps(snapshot, indent=2, default=str), encoding="utf-8")
+    atomic_write_text(snap_path, json.dumps(snapshot, separators=(",", ":"), default=str))
     return snap_path
 
 
@@ -125,21 +166,21 @@ def compute_diff(home: Path) -> StateDiff:
         StateDiff with all detected changes.
     """
     baseline = load_snapshot(home)
-    current = take_snapshot(home)
+    current = take_snapshot(home, baseline)
     diff = StateDiff()
 
     if baseline is None:
-        diff.memory_count_now = len(current.get("memories", {}).get("ids", []))
+        diff.memory_count_now = current["memories"]["count"]
         diff.has_changes = True
         diff.new_memories = [
-            {"id": m["id"], "content": m["content"][:80]}
-            for m in current.get("memories", {}).get("entries", [])
+            {"id": c.memory_id, "content": c.preview()}
+            for c in iter_memory_changes(home, None, current)
         ]
         return diff
 
     diff.snapshot_time = baseline.get("timestamp", "unknown")
 
-    _diff_memories(baseline, current, diff)
+    _diff_memories(home, baseline, current, diff)
     _diff_trust(baseline, current, diff)
     _diff_tasks(baseline, current, diff)
     _diff_pillars(baseline, current, diff)
@@ -147,6 +188,7 @@ def compute_diff(home: Path) -> StateDiff:
     diff.has_changes = bool(
         diff.new_memories
         or diff.removed_memories
+        or diff.modified_memories
         or diff.trust_changes
         or diff.new_tasks
         or diff.completed_tasks
@@ -156,6 +198,82 @@ def compute_diff(home: Path) -> StateDiff:
     return diff
 
 
+def stream_memory_diff(home: Path) -> Iterator[MemoryChange]:
+    """Yield every memory change since the baseline, one at a time.
+
+    Unlike ``compute_diff`` nothing is collected, so arbitrarily large
+    diffs can be consumed (or counted) in constant extra memory. Without
+    a baseline every memory is reported as added.
+
+    Args:
+        home: Agent home directory.
+
+    Yields:
+        MemoryChange per added, removed or modified memory.
+    """
+    baseline = load_snapshot(home)
+    current = {"memories": _snapshot_memories(home, baseline)}
+    yield from iter_memory_changes(home, baseline, current)
+
+
+def iter_memory_changes(
+    home: Path, baseline: dict[str, Any] | None, current: dict[str, Any]
+) -> Iterator[MemoryChange]:
+    """Memory changes between two snapshots, tier by tier in file-name order.
+
+    Tiers whose rollup hash matches the baseline are skipped without
+    looking at their memories. A memory that moved tier with the same
+    content (a promotion) is not a change. Baselines without per-file
+    hashes (1.0 snapshots, sync seeds) only yield added and removed.
+
+    Args:
+        home: Agent home directory (locates current memory files).
+        baseline: The baseline snapshot, or None.
+        current: The current snapshot.
+
+    Yields:
+        MemoryChange per added, removed or modified memory.
+    """
+    from .memory_engine import _memory_dir
+
+    mem_dir = _memory_dir(home)
+    old = (baseline or {}).get("memories", {})
+    new_layers = current.get("memories", {}).get("layers", {})
+    old_layers = old.get("layers")
+    if baseline is not None and not isinstance(old_layers, dict):
+        yield from _legacy_memory_changes(mem_dir, old, new_layers)
+        return
+    old_layers = old_layers or {}
+
+    changed = [
+        layer
+        for layer in _layer_order(old_layers, new_layers)
+        if old_layers.get(layer, {}).get("rollup") != new_layers.get(layer, {}).get("rollup")
+    ]
+    before: dict[str, tuple[str, Optional[str]]] = {}
+    for layer in changed:
+        for rec in old_layers.get(layer, {}).get("files", {}).values():
+            if rec[2]:
+                before[rec[2]] = (layer, rec[3])
+    seen: set[str] = set()
+    for layer in changed:
+        files = new_layers.get(layer, {}).get("files", {})
+        for name in sorted(files):
+            rec = files[name]
+            memory_id = rec[2]
+            if not memory_id or memory_id in seen:
+                continue
+            seen.add(memory_id)
+            prev = before.get(memory_id)
+            if prev is None:
+                yield MemoryChange("added", memory_id, layer, mem_dir / layer / name)
+            elif prev[1] != rec[3]:
+                yield MemoryChange("modified", memory_id, layer, mem_dir / layer / name)
+    for memory_id, (layer, _) in before.items():
+        if memory_id not in seen:
+            yield MemoryChange("removed", memory_id, layer)
+
+
 def format_text(diff: StateDiff) -> str:
     """Format the diff as plain text.
 
@@ -183,6 +301,13 @@ def format_text(diff: StateDiff) -> str:
         for m in diff.new_memories[:10]:
             lines.append(f"    + {m['content'][:70]}")
 
+    if diff.modified_memories:
+        lines.append(
+            f"~ {len(diff.modified_memories)} modified memor{'y' if len(diff.modified_memories) == 1 else 'ies'}:"  # noqa: E501
+        )
+        for m in diff.modified_memories[:10]:
+            lines.append(f"    ~ {m['content'][:70]}")
+
     if diff.removed_memories:
         lines.append(
             f"- {len(diff.removed_memories)} removed memor{'y' if len(diff.removed_memories) == 1 else 'ies'}"  # noqa: E501
@@ -234,7 +359,9 @@ def format_json(diff: StateDiff) -> str:
                 "now": diff.memory_count_now,
                 "new": len(diff.new_memories),
                 "removed": len(diff.removed_memories),
+                "modified": len(diff.modified_memories),
                 "new_entries": diff.new_memories[:20],
+                "modified_entries": diff.modified_memories[:20],
             },
             "trust_changes": diff.trust_changes,
             "tasks": {
@@ -256,23 +383,118 @@ FORMATTERS = {"text": format_text, "json": format_json}
 # ═══════════════════════════════════════════════════════════════════════════
 
 
-def _snapshot_memories(home: Path) -> dict[str, Any]:
-    """Capture memory state."""
-    from .memory_engine import list_memories
+def _snapshot_memories(home: Path, baseline: dict[str, Any] | None = None) -> dict[str, Any]:
+    """Capture memory state as per-file content hashes with per-tier rollups.
+
+    Each tier maps file name to ``[mtime_ns, size, memory_id, hash]``,
+    where *hash* covers the memory's content and tags (so a recall, which
+    only bumps access counters, is not an edit) and *memory_id*/*hash* are
+    None for files that are not loadable memories. Files whose mtime and
+    size match *baseline* - and were not modified within the racy window
+    before it was taken - keep its hash instead of being read again.
+    """
+    from .memory_engine import _memory_dir
 
+    old_layers = ((baseline or {}).get("memories") or {}).get("layers")
+    if not isinstance(old_layers, dict):
+        old_layers = {}
+    racy_before = _timestamp_ns((baseline or {}).get("timestamp")) - RACY_WINDOW_NS
     try:
-        entries = list_memories(home, limit=10000)
-        return {
-            "count": len(entries),
-            "ids": [e.memory_id for e in entries],
-            "entries": [
-                {"id": e.memory_id, "content": e.content[:100], "layer": e.layer.value}
-                for e in entries
-            ],
-        }
+        mem_dir = _memory_dir(home)
+        layers: dict[str, Any] = {}
+        count = 0
+        for layer in MemoryLayer:
+            old_files = old_layers.get(layer.value, {}).get("files", {})
+            files = _hash_layer(mem_dir / layer.value, old_files, racy_before)
+            ids = sorted(f"{rec[2]}:{rec[3]}" for rec in files.values() if rec[2])
+            count += len(ids)
+            layers[layer.value] = {
+                "rollup": hashlib.sha256("\n".join(ids).encode("utf-8")).hexdigest(),
+                "files": files,
+            }
+        return {"count": count, "layers": layers}
     except Exception as exc:
         logger.warning("Failed to snapshot memories: %s", exc)
-        return {"count": 0, "ids": [], "entries": []}
+        return {"count": 0, "layers": {}}
+
+
+def _hash_layer(layer_dir: Path, old_files: dict[str, list], racy_before: int) -> dict[str, list]:
+    """Hash records of one tier directory, re-reading only changed files."""
+    files: dict[str, list] = {}
+    try:
+        with os.scandir(layer_dir) as it:
+            found = [
+                (e.name, e.stat())
+                for e in it
+                if e.name.endswith(".json") and e.name not in _NON_MEMORY_SIDECARS and e.is_file()
+            ]
+    except OSError:
+        return files
+    for name, st in found:
+        rec = old_files.get(name)
+        if (
+            isinstance(rec, list)
+            and len(rec) == 4
+            and rec[:2] == [st.st_mtime_ns, st.st_size]
+            and st.st_mtime_ns < racy_before
+        ):
+            files[name] = rec
+            continue
+        memory_id, digest = _hash_memory(layer_dir / name) if st.st_size else (None, None)
+        files[name] = [st.st_mtime_ns, st.st_size, memory_id, digest]
+    return files
+
+
+def _hash_memory(path: Path) -> tuple[Optional[str], Optional[str]]:
+    """``(memory_id, content hash)`` of a memory file, Nones when it is not one."""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None, None
+    # Unified SKMemory records ("id", no "memory_id") are skipped, as in _load_entry.
+    if not isinstance(data, dict):
+        return None, None
+    memory_id = data.get("memory_id")
+    if not isinstance(memory_id, str) or not memory_id.strip():
+        return None, None
+    payload = json.dumps([data.get("content"), data.get("tags")], sort_keys=True, default=str)
+    return memory_id.strip(), hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+
+def _timestamp_ns(value: Any) -> int:
+    """A snapshot timestamp as epoch ns (0 when missing or unparseable)."""
+    if not isinstance(value, str):
+        return 0
+    try:
+        return int(datetime.fromisoformat(value).timestamp() * 1e9)
+    except ValueError:
+        return 0
+
+
+def _layer_order(*layer_maps: dict[str, Any]) -> list[str]:
+    """Tier names present in any map: known tiers first, in tier order."""
+    known = [layer.value for layer in MemoryLayer]
+    extra = sorted({name for m in layer_maps for name in m} - set(known))
+    return known + extra
+
+
+def _legacy_memory_changes(
+    mem_dir: Path, old: dict[str, Any], new_layers: dict[str, Any]
+) -> Iterator[MemoryChange]:
+    """Added/removed memories against a baseline that only lists ids."""
+    old_ids = set(old.get("ids", []))
+    seen: set[str] = set()
+    for layer in _layer_order(new_layers):
+        files = new_layers.get(layer, {}).get("files", {})
+        for name in sorted(files):
+            memory_id = files[name][2]
+            if not memory_id or memory_id in seen:
+                continue
+            seen.add(memory_id)
+            if memory_id not in old_ids:
+                yield MemoryChange("added", memory_id, layer, mem_dir / layer / name)
+    for memory_id in sorted(old_ids - seen):
+        yield MemoryChange("removed", memory_id, "")
 
 
 def _snapshot_trust(home: Path) -> dict[str, Any]:
@@ -350,22 +572,19 @@ def _find_latest_seed(home: Path) -> dict[str, Any] | None:
 # ═══════════════════════════════════════════════════════════════════════════
 
 
-def _diff_memories(baseline: dict, current: dict, diff: StateDiff) -> None:
+def _diff_memories(home: Path, baseline: dict, current: dict, diff: StateDiff) -> None:
     """Compute memory differences."""
     old_mem = baseline.get("memories", {})
-    new_mem = current.get("memories", {})
-
-    old_ids = set(old_mem.get("ids", []))
-    new_ids = set(new_mem.get("ids", []))
-
-    diff.memory_count_before = old_mem.get("count", len(old_ids))
-    diff.memory_count_now = new_mem.get("count", len(new_ids))
-
-    added_ids = new_ids - old_ids
-    diff.removed_memories = list(old_ids - new_ids)
-
-    entries_by_id = {e["id"]: e for e in new_mem.get("entries", [])}
-    diff.new_memories = [entries_by_id.get(mid, {"id": mid, "content": ""}) for mid in added_ids]
+    diff.memory_count_before = old_mem.get("count", len(old_mem.get("ids", [])))
+    diff.memory_count_now = current.get("memories", {}).get("count", 0)
+
+    for change in iter_memory_changes(home, baseline, current):
+        if change.kind == "removed":
+            diff.removed_memories.append(change.memory_id)
+        elif change.kind == "added":
+            diff.new_memories.append({"id": change.memory_id, "content": change.preview()})
+        else:
+            diff.modified_memories.append({"id": change.memory_id, "content": change.preview()})
 
 
 def _diff_trust(baseline: dict, current: dict, diff: StateDiff) -> None:
@@ -47,6 +47,13 @@ class VaultManifest(BaseModel):
     signed_by: Optional[str] = None
     archive_hash: Optional[str] = None
     file_hashes: dict[str, str] = Field(default_factory=dict)
+    # (size, mtime_ns) per file, so the next incremental pack can skip
+    # reading files that have not changed.
+    file_stats: dict[str, list[int]] = Field(default_factory=dict)
+    # Incremental vaults: the prior vault this one builds on, and the files
+    # actually stored in this archive. file_hashes is always the full set.
+    base_vault: Optional[str] = None
+    packed_files: Optional[list[str]] = None
 
 
 class SyncBackendConfig(BaseModel):
@@ -13,6 +13,15 @@ Hardening guarantees:
     - GPG detached signature on the manifest
     - Integrity verification before extraction
     - Key rotation re-encrypts all existing vaults
+
+Packing reads each file once: the file and archive hashes are computed
+from the same bytes that are streamed into the tar, and compression runs
+on a thread pool as independent gzip members (see ``skcapstone.tar_stream``).
+Unpacking hashes each file as it is written. An incremental vault stores
+only files whose size or mtime changed since the previous vault from the
+same host and names that vault as its base; files modified within the
+racy window of that vault's creation are stored again, since a same-size
+rewrite in the same mtime tick leaves both alone.
 """
 
 from __future__ import annotations
@@ -21,12 +30,22 @@ import hashlib
 import json
 import logging
 import os
+import shutil
 import tarfile
 import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
+from ..file_watch import RACY_WINDOW_NS
+from ..tar_stream import (
+    COMPRESS_LEVEL,
+    COMPRESS_WORKERS,
+    HashingReader,
+    HashingWriter,
+    ParallelGzipWriter,
+    add_file,
+)
 from .models import VaultManifest
 
 logger = logging.getLogger("skcapstone.sync.vault")
@@ -34,6 +53,8 @@ logger = logging.getLogger("skcapstone.sync.vault")
 PILLARS_TO_SYNC = ["identity", "memory", "trust", "config", "skills"]
 EXCLUDE_PATTERNS = {"__pycache__", ".pyc", ".git", "audit.log"}
 
+_COPY_BUFSIZE = 1 << 20
+
 
 class VaultIntegrityError(Exception):
     """Raised when vault integrity verification fails."""
@@ -101,6 +122,9 @@ class Vault:
         encrypt: bool = False,
         passphrase: Optional[str] = None,
         sign: bool = False,
+        incremental: bool = False,
+        workers: Optional[int] = None,
+        compresslevel: int = COMPRESS_LEVEL,
     ) -> Path:
         """Pack agent state into a vault archive.
 
@@ -109,57 +133,94 @@ class Vault:
             encrypt: Whether to GPG-encrypt the archive.
             passphrase: Passphrase for encryption (required if encrypt=True).
             sign: Whether to GPG-sign the manifest.
+            incremental: Store only files changed since this host's previous
+                vault, which becomes the new vault's ``base_vault``. Falls
+                back to a full pack when there is no previous vault.
+            workers: Compression threads. Defaults to ``COMPRESS_WORKERS``.
+            compresslevel: gzip level, 1 (fastest) to 9 (smallest).
 
         Returns:
             Path to the created vault file (.tar.gz or .tar.gz.gpg).
         """
         target_pillars = pillars or PILLARS_TO_SYNC
         hostname = os.uname().nodename
-        timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        now = datetime.now(timezone.utc)
+        # Microseconds: an incremental pack right after a full one must not
+        # overwrite it.
+        timestamp = now.strftime("%Y%m%dT%H%M%S%fZ")
         archive_name = f"vault-{hostname}-{timestamp}.tar.gz"
         archive_path = self.vault_dir / archive_name
 
+        base = self._latest_manifest(hostname) if incremental else None
+        prior_hashes = base[1].file_hashes if base else {}
+        prior_stats = base[1].file_stats if base else {}
+        base_cutoff_ns = int(base[1].created_at.timestamp() * 1e9) - RACY_WINDOW_NS if base else 0
+
         included = []
         file_hashes: dict[str, str] = {}
+        file_stats: dict[str, list[int]] = {}
+        packed: list[str] = []
+        archive_digest = hashlib.sha256()
+
+        def add(full_path: Path, arcname: str) -> None:
+            st = os.lstat(full_path)
+            stat_key = [st.st_size, st.st_mtime_ns]
+            if (
+                prior_stats.get(arcname) == stat_key
+                and arcname in prior_hashes
+                and st.st_mtime_ns < base_cutoff_ns
+            ):
+                file_hashes[arcname] = prior_hashes[arcname]
+                file_stats[arcname] = stat_key
+                return
+            file_hashes[arcname] = add_file(tar, full_path, arcname)
+            file_stats[arcname] = stat_key
+            packed.append(arcname)
+
+        with open(archive_path, "wb") as raw:
+            gz = ParallelGzipWriter(
+                HashingWriter(raw, archive_digest),
+                level=compresslevel,
+                workers=workers or COMPRESS_WORKERS,
+            )
+            try:
+                with tarfile.open(fileobj=gz, mode="w|") as tar:
+                    for pillar in target_pillars:
+                        pillar_dir = self.agent_home / pillar
+                        if not pillar_dir.exists():
+                            logger.debug("Pillar %s not found, skipping", pillar)
+                            continue
 
-        with tarfile.open(archive_path, "w:gz") as tar:
-            for pillar in target_pillars:
-                pillar_dir = self.agent_home / pillar
-                if not pillar_dir.exists():
-                    logger.debug("Pillar %s not found, skipping", pillar)
-                    continue
+                        for root, dirs, files in os.walk(pillar_dir):
+                            dirs[:] = [d for d in dirs if not self._should_exclude(d)]
+                            for fname in files:
+                                if self._should_exclude(fname):
+                                    continue
+                                full_path = Path(root) / fname
+                                add(full_path, str(full_path.relative_to(self.agent_home)))
 
-                for root, dirs, files in os.walk(pillar_dir):
-                    dirs[:] = [d for d in dirs if not self._should_exclude(d)]
-                    for fname in files:
-                        if self._should_exclude(fname):
-                            continue
-                        full_path = Path(root) / fname
-                        arcname = str(full_path.relative_to(self.agent_home))
-                        tar.add(str(full_path), arcname=arcname)
-                        file_hashes[arcname] = _sha256_file(full_path)
-
-                included.append(pillar)
-
-            manifest_path = self.agent_home / "manifest.json"
-            if manifest_path.exists():
-                tar.add(
-                    str(manifest_path),
-                    arcname="manifest.json",
-                )
-                file_hashes["manifest.json"] = _sha256_file(manifest_path)
+                        included.append(pillar)
+
+                    manifest_path = self.agent_home / "manifest.json"
+                    if manifest_path.exists():
+                        add(manifest_path, "manifest.json")
+            finally:
+                gz.close()
 
-        archive_hash = _sha256_file(archive_path)
+        archive_hash = archive_digest.hexdigest()
 
         manifest = VaultManifest(
             agent_name=self._get_agent_name(),
             source_host=hostname,
-            created_at=datetime.now(timezone.utc),
+            created_at=now,
             pillars_included=included,
             encrypted=encrypt,
             file_hashes=file_hashes,
+            file_stats=file_stats,
             archive_hash=archive_hash,
             fingerprint=self._get_agent_fingerprint(),
+            base_vault=base[0] if base else None,
+            packed_files=packed if base else None,
         )
 
         if sign:
@@ -178,13 +239,45 @@ class Vault:
             return encrypted_path
 
         logger.info(
-            "Vault packed: %s (%d pillars, %d files hashed)",
+            "Vault packed: %s (%d pillars, %d files hashed, %d stored%s)",
             archive_path,
             len(included),
             len(file_hashes),
+            len(packed),
+            f", base {base[0]}" if base else "",
         )
         return archive_path
 
+    def _latest_manifest(self, hostname: str) -> Optional[tuple[str, VaultManifest]]:
+        """Find this host's most recent vault that still has its archive.
+
+        Vaults are ordered by their manifests' ``created_at``, not by name:
+        second-resolution names from older releases do not sort against
+        microsecond ones. The name prefix also matches hosts whose names
+        extend this one, so the manifest's ``source_host`` must match.
+
+        Returns:
+            (archive file name as packed, manifest), or None.
+        """
+        latest: Optional[tuple[str, VaultManifest]] = None
+        for manifest_file in self.vault_dir.glob(f"vault-{hostname}-*.tar.manifest.json"):
+            archive = manifest_file.name[: -len(".manifest.json")] + ".gz"
+            if not (
+                (self.vault_dir / archive).exists()
+                or (self.vault_dir / (archive + ".gpg")).exists()
+            ):
+                continue
+            try:
+                manifest = VaultManifest(**json.loads(manifest_file.read_text(encoding="utf-8")))
+            except (OSError, ValueError) as exc:
+                logger.debug("Skipping unreadable manifest %s: %s", manifest_file.name, exc)
+                continue
+            if manifest.source_host != hostname:
+                continue
+            if latest is None or manifest.created_at > latest[1].created_at:
+                latest = (archive, manifest)
+        return latest
+
     def unpack(
         self,
         vault_path: Path,
@@ -219,25 +312,129 @@ class Vault:
             vault_path = self._decrypt_vault(vault_path, passphrase)
 
         manifest = self._load_and_verify_manifest(vault_path, verify_signature)
+        expected = manifest.file_hashes if manifest and verify_hashes else None
+        wanted = set(manifest.file_hashes) if manifest and manifest.base_vault else None
+
+        layer_path, layer_manifest = vault_path, manifest
+        while True:
+            self._verify_archive_hash(layer_path, layer_manifest, verify_hashes)
+            only = None
+            if wanted is not None:
+                only = wanted & set(
+                    layer_manifest.packed_files
+                    if layer_manifest.packed_files is not None
+                    else layer_manifest.file_hashes
+                )
+            extracted = self._extract_verified(layer_path, extract_to, expected, only)
+            if wanted is None:
+                break
+            wanted -= extracted
+            if not wanted or not layer_manifest.base_vault:
+                break
+            layer_path, layer_manifest = self._open_base(
+                vault_path.parent, layer_manifest.base_vault, passphrase, verify_signature
+            )
+
+        if wanted:
+            raise VaultIntegrityError(
+                f"{len(wanted)} file(s) not found in the vault or its base chain"
+            )
+        if expected:
+            missing = [p for p in expected if not (extract_to / p).exists()]
+            for rel_path in missing:
+                logger.warning("Expected file missing: %s", rel_path)
+            logger.info("All %d file hashes verified", len(expected) - len(missing))
 
+        logger.info("Vault unpacked to %s", extract_to)
+        return extract_to
+
+    @staticmethod
+    def _verify_archive_hash(
+        vault_path: Path, manifest: Optional[VaultManifest], verify_hashes: bool
+    ) -> None:
         if manifest and manifest.archive_hash and verify_hashes:
             actual_hash = _sha256_file(vault_path)
             if actual_hash != manifest.archive_hash:
                 raise VaultIntegrityError(
-                    f"Archive hash mismatch: expected {manifest.archive_hash}, "
-                    f"got {actual_hash}"
+                    f"Archive hash mismatch: expected {manifest.archive_hash}, got {actual_hash}"
                 )
             logger.info("Archive integrity verified (SHA-256)")
 
-        with tarfile.open(vault_path, "r:gz") as tar:
-            tar.extractall(path=extract_to, filter="data")
+    def _open_base(
+        self,
+        directory: Path,
+        base_name: str,
+        passphrase: Optional[str],
+        verify_signature: bool,
+    ) -> tuple[Path, VaultManifest]:
+        """Locate (and decrypt if needed) the base of an incremental vault."""
+        base_path = directory / base_name
+        if not base_path.exists():
+            encrypted = directory / (base_name + ".gpg")
+            if not encrypted.exists():
+                raise VaultIntegrityError(f"Base vault {base_name} not found")
+            base_path = self._decrypt_vault(encrypted, passphrase)
+        manifest = self._load_and_verify_manifest(base_path, verify_signature)
+        if manifest is None:
+            raise VaultIntegrityError(f"Base vault {base_name} has no manifest")
+        return base_path, manifest
+
+    def _extract_verified(
+        self,
+        vault_path: Path,
+        extract_to: Path,
+        expected: Optional[dict[str, str]],
+        only: Optional[set[str]] = None,
+    ) -> set[str]:
+        """Extract members, hashing regular files as they are written.
 
-        if manifest and manifest.file_hashes and verify_hashes:
-            self._verify_file_hashes(extract_to, manifest.file_hashes)
-            logger.info("All %d file hashes verified", len(manifest.file_hashes))
+        Members pass through tarfile's ``data`` filter (no absolute paths,
+        no escaping the target, sane modes) exactly as ``extractall`` did.
 
-        logger.info("Vault unpacked to %s", extract_to)
-        return extract_to
+        Args:
+            vault_path: The .tar.gz archive.
+            extract_to: Target directory.
+            expected: Map of member name -> SHA-256 to check, or None.
+            only: Extract just these member names (incremental chains).
+
+        Returns:
+            Names of the members extracted.
+
+        Raises:
+            VaultIntegrityError: If a file's hash does not match.
+        """
+        extracted: set[str] = set()
+        dest_root = os.path.realpath(extract_to)
+        with tarfile.open(vault_path, "r:gz") as tar:
+            for member in tar:
+                if only is not None and member.name not in only:
+                    continue
+                member = tarfile.data_filter(member, dest_root)
+                want = expected.get(member.name) if expected else None
+                if member.isreg() and want is not None:
+                    actual = self._extract_file(tar, member, Path(dest_root))
+                    if actual != want:
+                        raise VaultIntegrityError(
+                            f"Hash mismatch for {member.name}: expected {want}, got {actual}"
+                        )
+                else:
+                    tar.extract(member, path=dest_root, filter="data")
+                extracted.add(member.name)
+        return extracted
+
+    @staticmethod
+    def _extract_file(tar: tarfile.TarFile, member: tarfile.TarInfo, dest_root: Path) -> str:
+        dest = dest_root / member.name
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        if dest.is_symlink():
+            dest.unlink()
+        digest = hashlib.sha256()
+        src = tar.extractfile(member)
+        with src, open(dest, "wb") as out:
+            shutil.copyfileobj(HashingReader(src, digest), out, _COPY_BUFSIZE)
+        os.chmod(dest, member.mode)
+        os.utime(dest, (member.mtime, member.mtime))
+        return digest.hexdigest()
 
     def rotate_keys(
         self,
@@ -388,8 +585,7 @@ class Vault:
             actual_hash = _sha256_file(file_path)
             if actual_hash != expected_hash:
                 raise VaultIntegrityError(
-                    f"Hash mismatch for {rel_path}: "
-                    f"expected {expected_hash}, got {actual_hash}"
+                    f"Hash mismatch for {rel_path}: expected {expected_hash}, got {actual_hash}"
                 )
 
     def _sign_manifest(self, manifest: VaultManifest, passphrase: Optional[str]) -> Optional[str]:
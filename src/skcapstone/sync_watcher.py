@@ -10,9 +10,16 @@ with a polling fallback for environments without inotify support.
 Tracks processed files in ~/.skcapstone/sync/processed.json to avoid
 re-importing seeds across restarts.
 
+Seeds are taken in batches: a backlog is parsed and hashed on a small
+thread pool, duplicate seeds (same content hash, e.g. Syncthing conflict
+copies) are imported once, memories go into one long-lived MemoryStore,
+vector/graph indexing runs once per batch through long-lived clients
+(``IndexClients``), and processed.json is written once per batch.
+
 Architecture:
     SeedFileHandler  -- watchdog event handler with debounce
-    SyncWatcher      -- orchestrator: watch + poll + import
+    IndexClients     -- one SKVector / SKGraph client per backend
+    SyncWatcher      -- orchestrator: watch + poll + batched import
 """
 
 from __future__ import annotations
@@ -20,12 +27,18 @@ from __future__ import annotations
 import hashlib
 import json
 import logging
+import os
 import threading
 import time
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional
 
+from .atomic_io import atomic_write_text
+
 if TYPE_CHECKING:
     from skmemory.models import Memory
 
@@ -37,6 +50,15 @@ DEFAULT_PROCESSED_LOG = "~/.skcapstone/sync/processed.json"
 DEBOUNCE_MS = 500
 POLL_INTERVAL_S = 30
 
+#: Seeds imported per batch: one index flush and one processed.json write each.
+INTAKE_BATCH_SIZE = 64
+#: Threads reading, parsing and hashing seed files ahead of the import.
+INTAKE_WORKERS = min(8, os.cpu_count() or 1)
+#: Seconds before a backend that could not be built is tried again.
+INDEX_RETRY_S = 60.0
+#: Seed hashes remembered for in-process duplicate detection (most recent kept).
+SEEN_HASHES_MAX = 4096
+
 
 # ---------------------------------------------------------------------------
 # Configuration
@@ -136,18 +158,27 @@ class ProcessedTracker:
         Args:
             filename: The seed filename (basename).
         """
+        self.mark_many([filename])
+
+    def mark_many(self, filenames: list[str]) -> None:
+        """Record several files as processed with a single write to disk.
+
+        Args:
+            filenames: Seed filenames (basenames).
+        """
+        if not filenames:
+            return
+        now = datetime.now(timezone.utc).isoformat()
         with self._lock:
-            self._entries[filename] = datetime.now(timezone.utc).isoformat()
+            for filename in filenames:
+                self._entries[filename] = now
             self._persist()
 
     def _persist(self) -> None:
         """Write current entries to disk."""
         try:
             self._path.parent.mkdir(parents=True, exist_ok=True)
-            self._path.write_text(
-                json.dumps(self._entries, indent=2, sort_keys=True),
-                encoding="utf-8",
-            )
+            atomic_write_text(self._path, json.dumps(self._entries, indent=2, sort_keys=True))
         except OSError as exc:
             logger.error("Could not persist processed log: %s", exc)
 
@@ -170,7 +201,165 @@ def _compute_seed_hash(data: dict) -> str:
     return hashlib.sha256(canonical.encode()).hexdigest()[:16]
 
 
-def vector_index_seed(memory: "Memory") -> bool:
+def _build_vector_backend() -> Optional[Any]:
+    """Construct an SKVector client from skmemory config, or None."""
+    try:
+        from skmemory.backends.skvector_backend import SKVectorBackend
+        from skmemory.config import merge_env_and_config
+    except ImportError:
+        logger.debug("skmemory vector backend not importable - skipping vector index")
+        return None
+    try:
+        skvector_url, skvector_key, _ = merge_env_and_config()
+        if not skvector_url:
+            logger.debug("No SKVector URL configured - skipping vector index")
+            return None
+        return SKVectorBackend(url=skvector_url, api_key=skvector_key)
+    except Exception as exc:
+        logger.debug("SKVector client unavailable: %s - continuing without vector index", exc)
+        return None
+
+
+def _build_graph_backend() -> Optional[Any]:
+    """Construct an SKGraph client from skmemory config, or None."""
+    try:
+        from skmemory.backends.skgraph_backend import SKGraphBackend
+        from skmemory.config import merge_env_and_config
+    except ImportError:
+        logger.debug("skmemory graph backend not importable - skipping graph index")
+        return None
+    try:
+        _, _, skgraph_url = merge_env_and_config()
+        if not skgraph_url:
+            logger.debug("No SKGraph URL configured - skipping graph index")
+            return None
+        return SKGraphBackend(url=skgraph_url)
+    except Exception as exc:
+        logger.debug("SKGraph client unavailable: %s - continuing without graph index", exc)
+        return None
+
+
+class IndexClients:
+    """Long-lived SKVector / SKGraph clients shared by every seed import.
+
+    Each backend is built once, on first use, instead of once per memory.
+    A backend that could not be built (not configured, or its server was
+    down) is tried again after ``retry_after`` seconds, so a transient
+    outage does not disable indexing until the daemon restarts.
+
+    Backends exposing ``save_many(memories)`` (vector) or
+    ``index_many(memories)`` (graph) get one call per batch; otherwise the
+    batch is written item by item through the same client.
+
+    Args:
+        vector: Pre-built vector backend. Resolved from skmemory config if None.
+        graph: Pre-built graph backend. Resolved from skmemory config if None.
+        retry_after: Seconds before rebuilding a backend that came back None.
+    """
+
+    _UNSET = object()
+
+    def __init__(
+        self, vector: Any = None, graph: Any = None, retry_after: float = INDEX_RETRY_S
+    ) -> None:
+        self._clients: dict[str, Any] = {
+            "vector": self._UNSET if vector is None else vector,
+            "graph": self._UNSET if graph is None else graph,
+        }
+        self._failed_at: dict[str, float] = {}
+        self._retry_after = retry_after
+        self._lock = threading.Lock()
+
+    def vector(self) -> Optional[Any]:
+        """Return the shared vector client, building it on first use."""
+        return self._client("vector", _build_vector_backend)
+
+    def graph(self) -> Optional[Any]:
+        """Return the shared graph client, building it on first use."""
+        return self._client("graph", _build_graph_backend)
+
+    def reset(self) -> None:
+        """Forget built clients so the next use re-reads configuration."""
+        with self._lock:
+            self._clients = dict.fromkeys(self._clients, self._UNSET)
+            self._failed_at.clear()
+
+    def _client(self, name: str, build: Callable[[], Optional[Any]]) -> Optional[Any]:
+        with self._lock:
+            client = self._clients[name]
+            if client is None and time.monotonic() - self._failed_at[name] >= self._retry_after:
+                client = self._UNSET
+            if client is self._UNSET:
+                client = self._clients[name] = build()
+                if client is None:
+                    self._failed_at[name] = time.monotonic()
+            return client
+
+    def index(
+        self, memories: list["Memory"], vector: bool = True, graph: bool = True
+    ) -> tuple[int, int]:
+        """Upsert a batch of memories into the vector and graph backends.
+
+        Failures are logged at debug level and never raised - indexing is
+        best-effort, exactly as for a single memory.
+
+        Args:
+            memories: Memories already saved to the primary store.
+            vector: Index into SKVector.
+            graph: Index into SKGraph.
+
+        Returns:
+            (vector_indexed, graph_indexed) counts.
+        """
+        if not memories:
+            return 0, 0
+        vector_n = self._upsert(self.vector(), "save_many", "save", memories) if vector else 0
+        graph_n = (
+            self._upsert(self.graph(), "index_many", "index_memory", memories) if graph else 0
+        )
+        return vector_n, graph_n
+
+    @staticmethod
+    def _upsert(backend: Any, batch_method: str, item_method: str, memories: list) -> int:
+        if backend is None:
+            return 0
+        many = getattr(backend, batch_method, None)
+        if callable(many):
+            try:
+                result = many(memories)
+                return len(result) if isinstance(result, (list, tuple)) else int(result or 0)
+            except Exception as exc:
+                logger.debug("Batch %s failed: %s - falling back per memory", batch_method, exc)
+        one = getattr(backend, item_method)
+        done = 0
+        for memory in memories:
+            try:
+                if one(memory) is not False:
+                    done += 1
+            except Exception as exc:
+                logger.debug(
+                    "%s failed for memory %s: %s - continuing",
+                    item_method,
+                    getattr(memory, "id", "?"),
+                    exc,
+                )
+        return done
+
+
+_default_clients: Optional[IndexClients] = None
+_default_clients_lock = threading.Lock()
+
+
+def _shared_clients() -> IndexClients:
+    """Process-wide clients used by the single-memory helpers below."""
+    global _default_clients
+    with _default_clients_lock:
+        if _default_clients is None:
+            _default_clients = IndexClients()
+        return _default_clients
+
+
+def vector_index_seed(memory: "Memory", clients: Optional[IndexClients] = None) -> bool:
     """Index a memory in SKVector (Qdrant) if available.
 
     Attempts to connect to the vector backend using skmemory's
@@ -180,37 +369,18 @@ def vector_index_seed(memory: "Memory") -> bool:
 
     Args:
         memory: The Memory object to index (already saved to SQLite).
+        clients: Shared clients to use. Defaults to a process-wide set.
 
     Returns:
         True if the memory was successfully indexed, False otherwise.
     """
-    try:
-        from skmemory.backends.skvector_backend import SKVectorBackend
-        from skmemory.config import merge_env_and_config
-    except ImportError:
-        logger.debug("skmemory vector backend not importable - skipping vector index")
-        return False
-
-    try:
-        skvector_url, skvector_key, _ = merge_env_and_config()
-        if not skvector_url:
-            logger.debug("No SKVector URL configured - skipping vector index")
-            return False
-
-        backend = SKVectorBackend(url=skvector_url, api_key=skvector_key)
-        backend.save(memory)
+    indexed, _ = (clients or _shared_clients()).index([memory], graph=False)
+    if indexed:
         logger.debug("Indexed memory %s in SKVector", memory.id)
-        return True
-    except Exception as exc:
-        logger.debug(
-            "SKVector indexing failed for memory %s: %s - continuing without vector index",
-            memory.id,
-            exc,
-        )
-        return False
+    return bool(indexed)
 
 
-def graph_index_seed(memory: "Memory") -> bool:
+def graph_index_seed(memory: "Memory", clients: Optional[IndexClients] = None) -> bool:
     """Index a memory in SKGraph (FalkorDB) if available.
 
     Attempts to connect to the graph backend using skmemory's
@@ -220,96 +390,83 @@ def graph_index_seed(memory: "Memory") -> bool:
 
     Args:
         memory: The Memory object to index (already saved to SQLite).
+        clients: Shared clients to use. Defaults to a process-wide set.
 
     Returns:
         True if the memory was successfully indexed, False otherwise.
     """
-    try:
-        from skmemory.backends.skgraph_backend import SKGraphBackend
-        from skmemory.config import merge_env_and_config
-    except ImportError:
-        logger.debug("skmemory graph backend not importable - skipping graph index")
-        return False
+    _, indexed = (clients or _shared_clients()).index([memory], vector=False)
+    if indexed:
+        logger.debug("Indexed memory %s in SKGraph", memory.id)
+    return bool(indexed)
 
-    try:
-        _, _, skgraph_url = merge_env_and_config()
-        if not skgraph_url:
-            logger.debug("No SKGraph URL configured - skipping graph index")
-            return False
-
-        backend = SKGraphBackend(url=skgraph_url)
-        result = backend.index_memory(memory)
-        if result:
-            logger.debug("Indexed memory %s in SKGraph", memory.id)
-        return result
-    except Exception as exc:
-        logger.debug(
-            "SKGraph indexing failed for memory %s: %s - continuing without graph index",
-            memory.id,
-            exc,
-        )
-        return False
 
+def _open_memory_store() -> Any:
+    """Open the SQLite-backed MemoryStore (raises ImportError without skmemory)."""
+    from skmemory.store import MemoryStore
 
-def import_seed_to_memory(seed_path: Path, home: Path) -> Optional[str]:
-    """Parse a .seed.json file and store its contents via skmemory.
+    return MemoryStore(use_sqlite=True)
 
-    Extracts memory_entries from the seed (if present) and stores each
-    one via the MemoryStore.snapshot() API. Also imports identity and
-    trust data via the existing pull_seeds infrastructure.
 
-    Args:
-        seed_path: Path to the .seed.json file.
-        home: Agent home directory.
+def _read_seed(seed_path: Path) -> tuple[Path, Optional[dict], Optional[str]]:
+    """Read, parse and hash one seed file (runs on the intake pool).
 
     Returns:
-        Summary string of what was imported, or None on failure.
+        (path, data, seed_hash); data and hash are None if unreadable.
     """
     try:
-        raw = seed_path.read_text(encoding="utf-8")
-        data = json.loads(raw)
-    except (json.JSONDecodeError, OSError) as exc:
+        data = json.loads(seed_path.read_text(encoding="utf-8"))
+    except (json.JSONDecodeError, OSError, UnicodeDecodeError) as exc:
         logger.error("Failed to read seed %s: %s", seed_path.name, exc)
-        return None
+        return seed_path, None, None
+    if not isinstance(data, dict):
+        logger.error("Failed to read seed %s: not a JSON object", seed_path.name)
+        return seed_path, None, None
+    return seed_path, data, _compute_seed_hash(data)
+
 
+def _import_seed_data(
+    seed_name: str,
+    data: dict,
+    seed_hash: str,
+    store_factory,
+) -> tuple[list[str], list["Memory"]]:
+    """Store a parsed seed's memory entries; no indexing.
+
+    Args:
+        seed_name: Seed filename, for log lines.
+        data: Parsed seed.
+        seed_hash: ``_compute_seed_hash(data)``.
+        store_factory: Zero-argument callable returning the MemoryStore.
+
+    Returns:
+        (summary parts, memories saved) - the caller indexes the memories.
+    """
     agent_name = data.get("agent_name", "unknown")
     source_host = data.get("source_host", "unknown")
     created_at = data.get("created_at", "")
-    seed_hash = _compute_seed_hash(data)
-    imported_count = 0
     results: list[str] = []
+    saved: list["Memory"] = []
 
-    # Load sync config to check auto_vector_index and auto_graph_index flags
-    sync_config = load_sync_config(home)
-    auto_vector_index = sync_config.get("auto_vector_index", True)
-    auto_graph_index = sync_config.get("auto_graph_index", True)
-
-    # Import memory entries via skmemory API
     memory_entries = data.get("memory_entries", [])
-    vector_indexed = 0
-    graph_indexed = 0
     if memory_entries:
         try:
             from skmemory.models import MemoryLayer
-            from skmemory.store import MemoryStore
 
-            store = MemoryStore(use_sqlite=True)
+            store = store_factory()
+            layer_map = {
+                "short-term": MemoryLayer.SHORT,
+                "mid-term": MemoryLayer.MID,
+                "long-term": MemoryLayer.LONG,
+            }
 
             for entry in memory_entries:
                 title = entry.get("title", "Synced memory")
                 content = entry.get("content", "")
-                layer_str = entry.get("layer", "short-term")
+                layer = layer_map.get(entry.get("layer", "short-term"), MemoryLayer.SHORT)
                 tags = entry.get("tags", [])
                 source_ref = entry.get("source_ref", f"sync:{agent_name}@{source_host}")
 
-                # Map layer string to enum
-                layer_map = {
-                    "short-term": MemoryLayer.SHORT,
-                    "mid-term": MemoryLayer.MID,
-                    "long-term": MemoryLayer.LONG,
-                }
-                layer = layer_map.get(layer_str, MemoryLayer.SHORT)
-
                 # Add sync provenance tags
                 sync_tags = list(tags) + [
                     "sync:imported",
@@ -332,66 +489,93 @@ def import_seed_to_memory(seed_path: Path, home: Path) -> Optional[str]:
                         "sync_seed_hash": seed_hash,
                     },
                 )
-                imported_count += 1
-
-                # Auto-index in SKVector if enabled and available
-                if auto_vector_index and vector_index_seed(memory):
-                    vector_indexed += 1
-
-                # Auto-index in SKGraph if enabled and available
-                if auto_graph_index and graph_index_seed(memory):
-                    graph_indexed += 1
+                if memory is not None:
+                    saved.append(memory)
 
-            results.append(f"{imported_count} memories")
-            if vector_indexed:
-                results.append(f"{vector_indexed} vector-indexed")
-            if graph_indexed:
-                results.append(f"{graph_indexed} graph-indexed")
+            results.append(f"{len(saved)} memories")
         except ImportError:
             logger.warning("skmemory not available - skipping memory import")
         except Exception as exc:
-            logger.error("Memory import failed for %s: %s", seed_path.name, exc)
+            logger.error("Memory import failed for %s: %s", seed_name, exc)
 
-    # Also use the existing pull_seeds machinery for identity/trust/FEBs
-    try:
-        if "identity" in data or "trust" in data or "febs" in data:
-
-            # pull_seeds reads from inbox, but the file is already there -
-            # we just log what it would pick up
-            if "identity" in data:
-                results.append("identity")
-            if "trust" in data:
-                results.append("trust")
-            if "febs" in data:
-                results.append(f"{len(data.get('febs', []))} FEBs")
-    except Exception as exc:
-        logger.debug("Extended seed import skipped: %s", exc)
+    # Identity/trust/FEBs are merged by pull_seeds; report what the seed holds.
+    if "identity" in data:
+        results.append("identity")
+    if "trust" in data:
+        results.append("trust")
+    if "febs" in data:
+        results.append(f"{len(data.get('febs') or [])} FEBs")
+
+    return results, saved
 
+
+def _seed_summary(seed_name: str, data: dict, results: list[str]) -> str:
+    agent_name = data.get("agent_name", "unknown")
+    source_host = data.get("source_host", "unknown")
     if results:
         summary = f"Imported seed from {agent_name}@{source_host}: {', '.join(results)}"
         logger.info(summary)
         return summary
-
     logger.info(
         "Seed %s from %s@%s contained no importable data",
-        seed_path.name,
+        seed_name,
         agent_name,
         source_host,
     )
     return f"Seed from {agent_name}@{source_host}: no importable data"
 
 
-def _log_to_short_term_memory(message: str, home: Path) -> None:
+def import_seed_to_memory(
+    seed_path: Path,
+    home: Path,
+    store: Any = None,
+    clients: Optional[IndexClients] = None,
+) -> Optional[str]:
+    """Parse a .seed.json file and store its contents via skmemory.
+
+    Extracts memory_entries from the seed (if present) and stores each
+    one via the MemoryStore.snapshot() API. Also imports identity and
+    trust data via the existing pull_seeds infrastructure.
+
+    Args:
+        seed_path: Path to the .seed.json file.
+        home: Agent home directory.
+        store: MemoryStore to write into. Opened on demand if None.
+        clients: Shared index clients. Defaults to a process-wide set.
+
+    Returns:
+        Summary string of what was imported, or None on failure.
+    """
+    _, data, seed_hash = _read_seed(seed_path)
+    if data is None:
+        return None
+
+    sync_config = load_sync_config(home)
+    results, memories = _import_seed_data(
+        seed_path.name, data, seed_hash, lambda: store or _open_memory_store()
+    )
+    vector_n, graph_n = (clients or _shared_clients()).index(
+        memories,
+        vector=sync_config.get("auto_vector_index", True),
+        graph=sync_config.get("auto_graph_index", True),
+    )
+    if vector_n:
+        results.append(f"{vector_n} vector-indexed")
+    if graph_n:
+        results.append(f"{graph_n} graph-indexed")
+    return _seed_summary(seed_path.name, data, results)
+
+
+def _log_to_short_term_memory(message: str, home: Path, store: Any = None) -> None:
     """Log an import event to the agent's short-term memory.
 
     Args:
         message: Description of what was imported.
         home: Agent home directory.
+        store: MemoryStore to write into. Opened on demand if None.
     """
     try:
-        from skmemory.store import MemoryStore
-
-        store = MemoryStore(use_sqlite=True)
+        store = store or _open_memory_store()
         store.snapshot(
             title="Sync import event",
             content=message,
@@ -495,6 +679,9 @@ class SyncWatcher:
         stop_event: Threading event to signal shutdown.
         inbox_path: Override for the inbox directory path.
         processed_log: Override for the processed.json path.
+        store: MemoryStore to import into. Opened on first import if None.
+        clients: Vector/graph index clients. Built on first use if None.
+        batch_size: Seeds per import batch.
     """
 
     def __init__(
@@ -503,9 +690,16 @@ class SyncWatcher:
         stop_event: threading.Event,
         inbox_path: Optional[str] = None,
         processed_log: Optional[str] = None,
+        store: Any = None,
+        clients: Optional[IndexClients] = None,
+        batch_size: int = INTAKE_BATCH_SIZE,
     ) -> None:
         self._home = home
         self._stop_event = stop_event
+        self._store = store
+        self._clients = clients or IndexClients()
+        self._batch_size = max(1, batch_size)
+        self._seen_hashes: OrderedDict[str, None] = OrderedDict()
 
         config = load_sync_config(home)
         if not config.get("auto_import", True):
@@ -646,63 +840,124 @@ class SyncWatcher:
         if not self._inbox.exists():
             return 0
 
-        imported = 0
         try:
-            for f in sorted(self._inbox.iterdir()):
-                if f.name.startswith("."):
-                    continue
-                if not f.name.endswith(SEED_EXTENSION):
-                    continue
-                if self._tracker.is_processed(f.name):
-                    continue
-                if self._import_seed(f):
-                    imported += 1
+            pending = [
+                f
+                for f in sorted(self._inbox.iterdir())
+                if not f.name.startswith(".")
+                and f.name.endswith(SEED_EXTENSION)
+                and not self._tracker.is_processed(f.name)
+            ]
         except OSError as exc:
             logger.error("Inbox scan failed: %s", exc)
-
-        return imported
+            return 0
+        return self._import_batch(pending)
 
     def _import_seed(self, seed_path: Path) -> bool:
         """Import a single seed file.
 
-        Thread-safe: uses a lock to prevent concurrent imports of the
-        same file from inotify and polling.
-
         Args:
             seed_path: Path to the .seed.json file.
 
         Returns:
             True if import succeeded, False otherwise.
         """
-        with self._lock:
-            if self._tracker.is_processed(seed_path.name):
-                return False
+        return self._import_batch([seed_path]) == 1
 
-            if not seed_path.exists():
-                return False
+    def _memory_store(self) -> Any:
+        if self._store is None:
+            self._store = _open_memory_store()
+        return self._store
 
-            logger.info("Importing seed: %s", seed_path.name)
+    def _import_batch(self, paths: list[Path]) -> int:
+        """Import seed files in batches.
 
-            result = import_seed_to_memory(seed_path, self._home)
-            if result:
-                self._tracker.mark_processed(seed_path.name)
+        Thread-safe: uses a lock to prevent concurrent imports of the
+        same file from inotify and polling.
 
-                # Log the import event to short-term memory
-                _log_to_short_term_memory(result, self._home)
+        Args:
+            paths: Seed files, in import order.
 
-                # Move to archive
-                archive = self._inbox.parent / "archive"
-                archive.mkdir(exist_ok=True)
-                try:
-                    seed_path.rename(archive / seed_path.name)
-                    logger.debug("Archived: %s", seed_path.name)
-                except OSError as exc:
-                    logger.warning("Could not archive %s: %s", seed_path.name, exc)
+        Returns:
+            Number of seeds imported (duplicates and unreadable files excluded).
+        """
+        if not paths:
+            return 0
+        with self._lock:
+            paths = [p for p in paths if not self._tracker.is_processed(p.name) and p.exists()]
+            if not paths:
+                return 0
+            config = load_sync_config(self._home)
+            imported = 0
+            workers = min(INTAKE_WORKERS, len(paths))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="seed-intake") as pool:
+                for i in range(0, len(paths), self._batch_size):
+                    chunk = paths[i : i + self._batch_size]
+                    imported += self._import_chunk(list(pool.map(_read_seed, chunk)), config)
+            return imported
+
+    def _seen(self, seed_hash: str) -> bool:
+        """Whether *seed_hash* was imported recently; remembers it if not."""
+        if seed_hash in self._seen_hashes:
+            self._seen_hashes.move_to_end(seed_hash)
+            return True
+        self._seen_hashes[seed_hash] = None
+        if len(self._seen_hashes) > SEEN_HASHES_MAX:
+            self._seen_hashes.popitem(last=False)
+        return False
 
-                return True
+    def _import_chunk(
+        self, parsed: list[tuple[Path, Optional[dict], Optional[str]]], config: dict
+    ) -> int:
+        done: list[Path] = []
+        summaries: list[str] = []
+        memories: list["Memory"] = []
+        duplicates = 0
+
+        for seed_path, data, seed_hash in parsed:
+            if data is None:
+                logger.warning("Seed import returned no result: %s", seed_path.name)
+                continue
+            done.append(seed_path)
+            if self._seen(seed_hash):
+                duplicates += 1
+                logger.debug("Duplicate seed %s (hash %s) - archiving", seed_path.name, seed_hash)
+                continue
+            logger.info("Importing seed: %s", seed_path.name)
+            results, saved = _import_seed_data(seed_path.name, data, seed_hash, self._memory_store)
+            memories.extend(saved)
+            summaries.append(_seed_summary(seed_path.name, data, results))
+
+        vector_n, graph_n = self._clients.index(
+            memories,
+            vector=config.get("auto_vector_index", True),
+            graph=config.get("auto_graph_index", True),
+        )
+        self._tracker.mark_many([p.name for p in done])
 
-            logger.warning("Seed import returned no result: %s", seed_path.name)
-            return False
+        if summaries:
+            message = "; ".join(summaries)
+            if vector_n or graph_n:
+                message += f" ({vector_n} vector-indexed, {graph_n} graph-indexed)"
+            try:
+                store = self._memory_store()
+            except Exception:
+                store = None
+            _log_to_short_term_memory(message, self._home, store)
+
+        archive = self._inbox.parent / "archive"
+        if done:
+            archive.mkdir(exist_ok=True)
+        for seed_path in done:
+            try:
+                seed_path.rename(archive / seed_path.name)
+                logger.debug("Archived: %s", seed_path.name)
+            except OSError as exc:
+                logger.warning("Could not archive %s: %s", seed_path.name, exc)
+
+        if duplicates:
+            logger.info("Skipped %d duplicate seed(s) in batch", duplicates)
+        return len(done) - duplicates
 
 
 # ---------------------------------------------------------------------------
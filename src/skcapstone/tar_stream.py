@@ -0,0 +1,146 @@
+"""
+Streaming tar.gz helpers shared by vault packing and GFS backups.
+
+Both archive writers read each file once: ``add_file`` streams it into the
+tar through a ``HashingReader``, so the file's SHA-256 comes from the same
+bytes that are archived. ``ParallelGzipWriter`` compresses the tar stream
+block by block on a thread pool as independent gzip members (pigz-style;
+any gzip reader handles the concatenation), and ``HashingWriter`` lets a
+caller hash the compressed archive as it is written.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import tarfile
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+#: Uncompressed bytes per gzip member. Each member is compressed on its own
+#: worker thread; zlib releases the GIL while it works.
+COMPRESS_BLOCK_SIZE = 1 << 20
+COMPRESS_LEVEL = 6
+COMPRESS_WORKERS = min(8, os.cpu_count() or 1)
+
+
+class HashingReader:
+    """File wrapper that feeds every byte read into *digest*."""
+
+    def __init__(self, raw, digest) -> None:
+        self._raw = raw
+        self._digest = digest
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._raw.read(size)
+        self._digest.update(data)
+        return data
+
+
+class HashingWriter:
+    """File wrapper that feeds every byte written into *digest*."""
+
+    def __init__(self, raw, digest) -> None:
+        self._raw = raw
+        self._digest = digest
+
+    def write(self, data: bytes) -> int:
+        self._digest.update(data)
+        return self._raw.write(data)
+
+
+class ParallelGzipWriter:
+    """Write a gzip stream compressed block-by-block on a thread pool.
+
+    Each ``block_size`` (or slightly more) bytes of input becomes one
+    complete gzip member.
+    Members are written in order; at most ``2 * workers`` blocks are in
+    flight, which bounds memory.
+
+    Args:
+        raw: Binary file object receiving the compressed stream.
+        level: zlib compression level.
+        block_size: Uncompressed bytes per member.
+        workers: Compression threads (1 compresses inline).
+    """
+
+    def __init__(
+        self,
+        raw,
+        level: int = COMPRESS_LEVEL,
+        block_size: int = COMPRESS_BLOCK_SIZE,
+        workers: int = COMPRESS_WORKERS,
+    ) -> None:
+        self._raw = raw
+        self._level = level
+        self._block_size = block_size
+        self._workers = max(1, workers)
+        self._chunks: list[bytes] = []
+        self._buffered = 0
+        self._pending: deque = deque()
+        self._pool = (
+            ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix="tar-gzip")
+            if self._workers > 1
+            else None
+        )
+
+    @staticmethod
+    def _compress(block: bytes, level: int) -> bytes:
+        c = zlib.compressobj(level, zlib.DEFLATED, 31)  # 31 = gzip wrapper
+        return c.compress(block) + c.flush()
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        self._buffered += len(data)
+        if self._buffered >= self._block_size:
+            self._flush_block()
+        return len(data)
+
+    def _flush_block(self) -> None:
+        block = b"".join(self._chunks)
+        self._chunks.clear()
+        self._buffered = 0
+        self._submit(block)
+
+    def _submit(self, block: bytes) -> None:
+        if self._pool is None:
+            self._raw.write(self._compress(block, self._level))
+            return
+        self._pending.append(self._pool.submit(self._compress, block, self._level))
+        while len(self._pending) > 2 * self._workers:
+            self._raw.write(self._pending.popleft().result())
+
+    def close(self) -> None:
+        try:
+            if self._chunks or not self._pending:
+                # An empty input still needs one (empty) member to be valid gzip.
+                self._flush_block()
+            while self._pending:
+                self._raw.write(self._pending.popleft().result())
+        finally:
+            if self._pool is not None:
+                self._pool.shutdown(wait=True)
+
+
+def add_file(tar: tarfile.TarFile, path: Path, arcname: str) -> str:
+    """Stream one file into *tar*, hashing the bytes as they go in.
+
+    A symlink is stored as a link, as ``tar.add`` always did, and hashed by
+    what it points at.
+
+    Returns:
+        Hex SHA-256 of the file content.
+    """
+    digest = hashlib.sha256()
+    if path.is_symlink():
+        tar.add(str(path), arcname=arcname)
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+    with open(path, "rb") as f:
+        info = tar.gettarinfo(arcname=arcname, fileobj=f)
+        tar.addfile(info, HashingReader(f, digest))
+    return digest.hexdigest()
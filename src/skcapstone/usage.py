@@ -2,8 +2,11 @@
 LLM token usage tracking - input/output tokens per model per day.
 
 Records are stored in ~/.skcapstone/usage/tokens-{date}.json, one file
-per calendar day (UTC).  Each file accumulates calls to record_usage()
-atomically using a threading lock.
+per calendar day (UTC).  record_usage() does no file I/O on the LLM hot
+path: calls are buffered and flushed in batches to the append-only
+usage/tokens.journal.jsonl (see write_behind), which is periodically
+compacted into the daily files.  Readers merge the daily file with the
+journal and the unflushed buffer, so reports are always current.
 
 Cost estimation uses approximate per-million-token pricing by model
 family.  Local models (ollama, passthrough) have zero cost.
@@ -20,13 +23,22 @@ from __future__ import annotations
 
 import json
 import logging
-import threading
 from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
 from typing import Optional
 
 from pydantic import BaseModel, Field
 
+from .atomic_io import atomic_write_text
+from .write_behind import (
+    DEFAULT_COMPACT_BYTES,
+    DEFAULT_FLUSH_EVERY,
+    DEFAULT_FLUSH_INTERVAL,
+    Journal,
+    JournalMark,
+    WriteBehindLog,
+)
+
 logger = logging.getLogger("skcapstone.usage")
 
 
@@ -146,19 +158,37 @@ class DailyUsageReport(BaseModel):
 
 
 class UsageTracker:
-    """Thread-safe LLM token usage tracker.
+    """Thread- and process-safe LLM token usage tracker.
 
     Persists one JSON file per calendar day under
-    ``{home}/usage/tokens-{date}.json``.
+    ``{home}/usage/tokens-{date}.json``, fed by a write-behind journal so
+    recording a call never rewrites a file.
 
     Args:
         home: Agent home directory (e.g. ~/.skcapstone).
+        flush_every: Buffered calls that trigger a journal flush.
+        flush_interval: Max seconds a call stays buffered; 0 disables.
+        compact_bytes: Journal size that triggers folding into daily files.
     """
 
-    def __init__(self, home: Path) -> None:
+    def __init__(
+        self,
+        home: Path,
+        flush_every: int = DEFAULT_FLUSH_EVERY,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        compact_bytes: int = DEFAULT_COMPACT_BYTES,
+    ) -> None:
         self._home = Path(home).expanduser()
         self._usage_dir = self._home / "usage"
-        self._lock = threading.Lock()
+        self._materialized: set[str] = set()
+        self._journal = WriteBehindLog(
+            self._usage_dir / "tokens.journal.jsonl",
+            compact=self._compact,
+            materialized=self._is_materialized,
+            flush_every=flush_every,
+            flush_interval=flush_interval,
+            compact_bytes=compact_bytes,
+        )
 
     # ------------------------------------------------------------------
     # Write path
@@ -183,18 +213,23 @@ class UsageTracker:
             date_str = _today_str()
         inp_cost, out_cost = _cost_per_million(model)
         cost = (input_tokens * inp_cost + output_tokens * out_cost) / 1_000_000
+        self._journal.append(
+            {
+                "date": date_str,
+                "model": model,
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "cost": cost,
+            }
+        )
 
-        with self._lock:
-            data = self._load_raw(date_str)
-            entry = data["models"].setdefault(
-                model,
-                {"calls": 0, "input_tokens": 0, "output_tokens": 0, "estimated_cost_usd": 0.0},
-            )
-            entry["calls"] += 1
-            entry["input_tokens"] += input_tokens
-            entry["output_tokens"] += output_tokens
-            entry["estimated_cost_usd"] = round(entry["estimated_cost_usd"] + cost, 8)
-            self._save_raw(date_str, data)
+    def flush(self) -> None:
+        """Write buffered calls to the journal now (e.g. at shutdown)."""
+        self._journal.flush()
+
+    def compact(self) -> None:
+        """Fold the journal into the daily files now."""
+        self._journal.compact()
 
     # ------------------------------------------------------------------
     # Read paths
@@ -211,9 +246,7 @@ class UsageTracker:
         """
         if date_str is None:
             date_str = _today_str()
-        with self._lock:
-            data = self._load_raw(date_str)
-        return _raw_to_report(date_str, data)
+        return self._reports([date_str])[0]
 
     def get_weekly(self, anchor: Optional[str] = None) -> list[DailyUsageReport]:
         """Return daily usage reports for the last 7 days.
@@ -269,12 +302,43 @@ class UsageTracker:
     def _range_reports(self, days: int, anchor: Optional[str]) -> list[DailyUsageReport]:
         """Return reports for the last *days* calendar days up to anchor."""
         end = _parse_date(anchor) if anchor else date.today()
+        dates = [
+            (end - timedelta(days=offset)).strftime("%Y-%m-%d")
+            for offset in range(days - 1, -1, -1)
+        ]
+        return self._reports(dates)
+
+    def _reports(self, dates: list[str]) -> list[DailyUsageReport]:
+        """Build reports for *dates* from one consistent journal view."""
+        raw, journal, unflushed = self._journal.view(lambda: {d: self._load_raw(d) for d in dates})
         reports = []
-        for offset in range(days - 1, -1, -1):
-            d = end - timedelta(days=offset)
-            reports.append(self.get_daily(d.strftime("%Y-%m-%d")))
+        for d in dates:
+            data = raw[d]
+            records = journal.pending_after(JournalMark.from_dict(data.get("journal")))
+            _fold(data, (r for r in records + unflushed if r.get("date") == d))
+            reports.append(_raw_to_report(d, data))
         return reports
 
+    def _is_materialized(self, record: dict) -> bool:
+        date_str = record.get("date", "")
+        if date_str not in self._materialized:
+            if not (self._usage_dir / f"tokens-{date_str}.json").exists():
+                return False
+            self._materialized.add(date_str)
+        return True
+
+    def _compact(self, journal: Journal) -> None:
+        """Fold *journal* into the daily files (journal lock held)."""
+        by_date: dict[str, list[dict]] = {}
+        for entry in journal.entries:
+            by_date.setdefault(entry.record.get("date", ""), []).append(entry.record)
+        for date_str in by_date:
+            data = self._load_raw(date_str)
+            records = journal.pending_after(JournalMark.from_dict(data.get("journal")))
+            _fold(data, (r for r in records if r.get("date") == date_str))
+            data["journal"] = journal.mark.to_dict()
+            self._save_raw(date_str, data)
+
     def _load_raw(self, date_str: str) -> dict:
         """Load raw usage dict from disk (no lock - caller must hold lock)."""
         path = self._usage_dir / f"tokens-{date_str}.json"
@@ -291,7 +355,7 @@ class UsageTracker:
         self._usage_dir.mkdir(parents=True, exist_ok=True)
         path = self._usage_dir / f"tokens-{date_str}.json"
         try:
-            path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+            atomic_write_text(path, json.dumps(data, indent=2))
         except OSError as exc:
             logger.error("Failed to write usage file %s: %s", path, exc)
 
@@ -311,6 +375,20 @@ def _parse_date(date_str: str) -> date:
     return datetime.strptime(date_str, "%Y-%m-%d").date()
 
 
+def _fold(data: dict, records) -> None:
+    """Add journaled call records into a raw daily usage dict in place."""
+    models = data.setdefault("models", {})
+    for rec in records:
+        entry = models.setdefault(
+            rec["model"],
+            {"calls": 0, "input_tokens": 0, "output_tokens": 0, "estimated_cost_usd": 0.0},
+        )
+        entry["calls"] += 1
+        entry["input_tokens"] += rec.get("input_tokens", 0)
+        entry["output_tokens"] += rec.get("output_tokens", 0)
+        entry["estimated_cost_usd"] = round(entry["estimated_cost_usd"] + rec.get("cost", 0.0), 8)
+
+
 def _raw_to_report(date_str: str, data: dict) -> DailyUsageReport:
     """Convert a raw usage dict to a DailyUsageReport."""
     models: dict[str, ModelUsageSummary] = {}
@@ -0,0 +1,295 @@
+"""
+Write-behind journal for small, hot-path trackers.
+
+``UsageTracker`` and ``FallbackTracker`` used to load, mutate and rewrite
+their whole JSON file for every LLM call or fallback attempt. This module
+gives them a three-stage pipeline instead:
+
+    1. ``append()`` buffers the record in memory (no I/O).
+    2. A flush appends the buffer to ``<journal>`` as JSONL lines, under an
+       exclusive ``flock`` so several processes can share one journal. It
+       runs when the buffer reaches ``flush_every`` records, when a timer
+       armed ``flush_interval`` seconds after the first buffered record
+       fires, on ``flush()``/``close()``, and at interpreter exit.
+    3. Compaction folds the journal into the owner's snapshot file (through
+       the ``compact`` callback) and starts a fresh journal generation. It
+       runs when the journal grows past ``compact_bytes``, and on the first
+       flush while the snapshot does not exist yet, so the snapshot file
+       appears as soon as anything has been recorded.
+
+Every journal starts with a ``{"_gen": ...}`` header line. Owners record
+the ``JournalMark`` (generation + byte offset) they folded through inside
+the snapshot they write, and ``pending_after()`` skips entries at or
+before it, so a crash between "snapshot written" and "journal reset"
+never double-applies a batch.
+
+Readers call ``view()`` to get the snapshot and every not-yet-compacted
+record (journal plus this process's unflushed buffer) read under a shared
+lock, so the read APIs keep returning the full picture.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import os
+import secrets
+import threading
+import weakref
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional
+
+try:  # POSIX only; without it the journal is serialised per process only.
+    import fcntl
+except ImportError:  # pragma: no cover - not reachable on this fleet
+    fcntl = None  # type: ignore[assignment]
+
+logger = logging.getLogger("skcapstone.write_behind")
+
+DEFAULT_FLUSH_EVERY = 64
+DEFAULT_FLUSH_INTERVAL = 5.0
+DEFAULT_COMPACT_BYTES = 256 * 1024
+
+
+@dataclass(frozen=True)
+class JournalMark:
+    """How far into which journal generation a snapshot has folded."""
+
+    gen: str
+    offset: int
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"gen": self.gen, "offset": self.offset}
+
+    @classmethod
+    def from_dict(cls, data: Any) -> Optional["JournalMark"]:
+        if not isinstance(data, dict):
+            return None
+        try:
+            return cls(gen=str(data["gen"]), offset=int(data["offset"]))
+        except (KeyError, TypeError, ValueError):
+            return None
+
+
+@dataclass
+class JournalEntry:
+    """One journaled record and the byte offset just past its line."""
+
+    end: int
+    record: dict
+
+
+@dataclass
+class Journal:
+    """The parsed contents of one journal generation."""
+
+    gen: str
+    entries: list[JournalEntry]
+
+    @property
+    def mark(self) -> JournalMark:
+        """Mark covering every entry in this generation."""
+        end = self.entries[-1].end if self.entries else 0
+        return JournalMark(self.gen, end)
+
+    def pending_after(self, mark: Optional[JournalMark]) -> list[dict]:
+        """Records not yet folded into a snapshot carrying *mark*."""
+        if mark is None or mark.gen != self.gen:
+            return [e.record for e in self.entries]
+        return [e.record for e in self.entries if e.end > mark.offset]
+
+
+#: Logs still holding buffered records; flushed at interpreter exit.
+_live: "weakref.WeakSet[WriteBehindLog]" = weakref.WeakSet()
+
+
+@atexit.register
+def flush_all() -> None:
+    """Flush every live write-behind log (shutdown hook)."""
+    for log in list(_live):
+        try:
+            log.flush()
+        except Exception:  # noqa: BLE001 - never fail interpreter shutdown
+            logger.exception("Failed to flush %s at exit", log.path)
+
+
+class WriteBehindLog:
+    """Buffered, append-only journal with callback-driven compaction.
+
+    Args:
+        path: Journal file (JSONL). Its lock is ``<path>.lock``.
+        compact: ``compact(journal)`` folds *journal* into the owner's
+            snapshot and persists ``journal.mark`` with it. Called with the
+            exclusive lock held.
+        materialized: ``materialized(record)`` returns True once the
+            snapshot that *record* folds into exists.
+        flush_every: Buffered records that trigger a flush.
+        flush_interval: Seconds after the first buffered record before a
+            timer flushes; 0 disables the timer.
+        compact_bytes: Journal size that triggers compaction.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        compact: Callable[[Journal], None],
+        materialized: Callable[[dict], bool],
+        flush_every: int = DEFAULT_FLUSH_EVERY,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        compact_bytes: int = DEFAULT_COMPACT_BYTES,
+    ) -> None:
+        self._path = Path(path)
+        self._lock_path = self._path.with_name(self._path.name + ".lock")
+        self._compact = compact
+        self._materialized = materialized
+        self._flush_every = max(1, flush_every)
+        self._flush_interval = flush_interval
+        self._compact_bytes = compact_bytes
+        self._pending: list[dict] = []
+        self._mutex = threading.RLock()
+        self._timer: Optional[threading.Timer] = None
+
+    @property
+    def path(self) -> Path:
+        """Path to the journal file."""
+        return self._path
+
+    # ------------------------------------------------------------------
+    # Write path
+    # ------------------------------------------------------------------
+
+    def append(self, record: dict) -> None:
+        """Buffer *record*; flush if a threshold was reached."""
+        with self._mutex:
+            self._pending.append(record)
+            _live.add(self)
+            if len(self._pending) >= self._flush_every or not self._materialized(record):
+                self._flush_locked()
+            elif self._timer is None and self._flush_interval > 0:
+                self._timer = threading.Timer(self._flush_interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self) -> None:
+        """Append buffered records to the journal, compacting if due."""
+        with self._mutex:
+            self._flush_locked()
+
+    def compact(self) -> None:
+        """Flush, then fold the whole journal into the snapshot now."""
+        with self._mutex:
+            self._flush_locked()
+            with self._file_lock(exclusive=True):
+                self._compact_locked()
+
+    def close(self) -> None:
+        """Flush and stop the interval timer."""
+        self.flush()
+        _live.discard(self)
+
+    def discard(self, reset: Callable[[], None]) -> None:
+        """Drop buffered and journaled records, then call *reset*.
+
+        *reset* runs under the exclusive lock and should clear the
+        snapshot, so a concurrent flush cannot interleave.
+        """
+        with self._mutex:
+            self._cancel_timer()
+            self._pending = []
+            with self._file_lock(exclusive=True):
+                reset()
+                self._start_generation()
+
+    def _flush_locked(self) -> None:
+        self._cancel_timer()
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        try:
+            with self._file_lock(exclusive=True):
+                if not self._path.exists():
+                    self._start_generation()
+                with self._path.open("a", encoding="utf-8") as fh:
+                    fh.write("".join(json.dumps(r, ensure_ascii=False) + "\n" for r in batch))
+                size = self._path.stat().st_size
+                if size >= self._compact_bytes or not all(map(self._materialized, batch)):
+                    self._compact_locked()
+        except OSError as exc:
+            logger.error("Failed to flush %d record(s) to %s: %s", len(batch), self._path, exc)
+
+    def _compact_locked(self) -> None:
+        self._compact(self._read_unlocked())
+        self._start_generation()
+
+    def _start_generation(self) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        header = json.dumps({"_gen": secrets.token_hex(8)}) + "\n"
+        tmp = self._path.with_name(self._path.name + ".tmp")
+        tmp.write_text(header, encoding="utf-8")
+        os.replace(tmp, self._path)
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    # ------------------------------------------------------------------
+    # Read path
+    # ------------------------------------------------------------------
+
+    def view(self, load: Callable[[], Any]) -> tuple[Any, Journal, list[dict]]:
+        """Return ``(load(), journal, unflushed)`` read consistently.
+
+        ``load()`` and the journal are read under the shared lock so a
+        concurrent compaction is never observed half-done.
+        """
+        with self._mutex:
+            unflushed = list(self._pending)
+        with self._file_lock(exclusive=False):
+            return load(), self._read_unlocked(), unflushed
+
+    def _read_unlocked(self) -> Journal:
+        try:
+            raw = self._path.read_bytes()
+        except FileNotFoundError:
+            return Journal(gen="", entries=[])
+        except OSError as exc:
+            logger.warning("Failed to read journal %s: %s", self._path, exc)
+            return Journal(gen="", entries=[])
+        gen = ""
+        entries: list[JournalEntry] = []
+        pos = 0
+        for line in raw.splitlines(keepends=True):
+            pos += len(line)
+            if not line.endswith(b"\n"):
+                break  # torn write from a flusher that died mid-append
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if not isinstance(record, dict):
+                continue
+            if "_gen" in record and not gen and not entries:
+                gen = str(record["_gen"])
+                continue
+            entries.append(JournalEntry(end=pos, record=record))
+        return Journal(gen=gen, entries=entries)
+
+    @contextmanager
+    def _file_lock(self, *, exclusive: bool) -> Iterator[None]:
+        if fcntl is None or (not exclusive and not self._lock_path.parent.exists()):
+            # Nothing has ever been written, so there is nothing to guard;
+            # readers must not create the directory as a side effect.
+            yield
+            return
+        self._lock_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self._lock_path, "a", encoding="utf-8") as lock:
+            fcntl.flock(lock.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
@@ -260,3 +260,54 @@ def initialized_agent_home(tmp_agent_home: Path) -> Path:
     )
 
     return tmp_agent_home
+
+
+# ---------------------------------------------------------------------------
+# Memory tier fixtures
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def mem_dir(tmp_path: Path):
+    """A memory directory with empty tier subdirectories.
+
+    The process-wide memory indexes (meta index, dedup signatures) are
+    cleared around the test so none carries records between tests.
+    """
+    from skcapstone import memory_dedup, memory_index
+    from skcapstone.models import MemoryLayer
+
+    memory_index.clear_meta_indexes()
+    memory_dedup.clear_signature_caches()
+    mem = tmp_path / "memory"
+    for layer in MemoryLayer:
+        (mem / layer.value).mkdir(parents=True)
+    yield mem
+    memory_index.clear_meta_indexes()
+    memory_dedup.clear_signature_caches()
+
+
+@pytest.fixture
+def write_memory(mem_dir: Path):
+    """Write a MemoryEntry into its tier of ``mem_dir``.
+
+    Returns ``write(memory_id, layer=MID_TERM, content=None, age=10, **fields)``,
+    which returns the file's path. *content* defaults to ``"memory <id>"`` and
+    the mtime is set *age* seconds back, outside the racy window unless 0.
+    """
+    import os
+
+    from skcapstone.models import MemoryEntry, MemoryLayer
+
+    def write(memory_id, layer=MemoryLayer.MID_TERM, content=None, age=10, **fields) -> Path:
+        if content is None:
+            content = f"memory {memory_id}"
+        entry = MemoryEntry(memory_id=memory_id, content=content, layer=layer, **fields)
+        path = mem_dir / layer.value / f"{memory_id}.json"
+        path.write_text(entry.model_dump_json(), encoding="utf-8")
+        if age:
+            st = path.stat()
+            os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns - age * 1_000_000_000))
+        return path
+
+    return write
@@ -29,6 +29,16 @@ def _hermetic_node_inventory(monkeypatch):
     sknoded.reset_inventory_cache()
 
 
+@pytest.fixture(autouse=True)
+def _fresh_fleet_indexes():
+    """Each test starts with no materialized index (and no inotify fds) left over."""
+    from skcapstone.fleet import store
+
+    store.reset_indexes()
+    yield
+    store.reset_indexes()
+
+
 @pytest.fixture
 def paths(tmp_path) -> FleetPaths:
     """A throwaway fleet tree root."""
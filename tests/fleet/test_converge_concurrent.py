@@ -0,0 +1,163 @@
+"""Concurrent converge: bounded pool, time limits, signature memo, ordering."""
+
+from __future__ import annotations
+
+import threading
+import time
+from subprocess import CompletedProcess
+
+import pytest
+
+from skcapstone.fleet import backoff, converge, events, signing, store
+
+NODE = "node-41"
+ACTIVE = "LoadState=loaded\nActiveState=active\nMainPID=42\nActiveEnterTimestamp=t0\n"
+
+
+class BlockingRunner:
+    """Answers `systemctl show` as active; blocks on units listed in *hang*."""
+
+    def __init__(self, hang: set[str] = frozenset()) -> None:
+        self.hang = set(hang)
+        self.release = threading.Event()
+        self.shown: list[str] = []
+
+    def __call__(self, cmd: list[str]) -> CompletedProcess:
+        unit = cmd[3]
+        self.shown.append(unit)
+        if unit in self.hang:
+            self.release.wait(10)
+        return CompletedProcess(cmd, 0, stdout=ACTIVE, stderr="")
+
+
+@pytest.fixture(autouse=True)
+def _fresh():
+    events.reset_dedupe()
+    backoff.reset_trackers()
+    converge.reset_inflight()
+    yield
+    events.reset_dedupe()
+    backoff.reset_trackers()
+    converge.reset_inflight()
+
+
+def _fleet(paths, operator, scheduler_writer, names) -> None:
+    store.write_spec(paths, "node", NODE, {"actuate": True}, writer=operator)
+    for name in names:
+        store.write_spec(paths, "service", name, {"unit": f"{name}.service"}, writer=operator)
+        store.write_placement(
+            paths, "service", name, node=NODE, reason="test", writer=scheduler_writer
+        )
+
+
+def _conds(paths, name) -> dict:
+    st = store.read_status(paths, "service", name, NODE)
+    return {c["type"]: c for c in st["conditions"]}
+
+
+def test_hung_unit_does_not_delay_the_others(paths, operator, scheduler_writer) -> None:
+    _fleet(paths, operator, scheduler_writer, ["ska", "skb", "skc"])
+    runner = BlockingRunner(hang={"skb.service"})
+    try:
+        t0 = time.monotonic()
+        out = converge.converge_once(
+            paths, NODE, runner=runner, now=1000.0, service_timeout_s=0.3, deadline_s=5.0
+        )
+        assert time.monotonic() - t0 < 3.0
+        assert list(out["services"]) == ["ska", "skb", "skc"]
+        assert out["services"]["ska"] == {"state": "active", "acted": "none"}
+        assert out["services"]["skc"] == {"state": "active", "acted": "none"}
+        assert "no result after 0.3s" in out["services"]["skb"]["timeout"]
+        cond = _conds(paths, "skb")["ConvergeTimeout"]
+        assert cond["status"] == "True" and cond["reason"] == "ServiceTimeout"
+        assert "ConvergeTimeout" not in _conds(paths, "ska")
+        logged = events.read(paths, NODE, kind="service", name="skb")
+        assert [e["reason"] for e in logged] == ["ConvergeTimeout"]
+
+        # The abandoned run is still going: the next pass must not start a
+        # second one against the same unit.
+        out = converge.converge_once(
+            paths, NODE, runner=runner, now=1030.0, service_timeout_s=0.3, deadline_s=5.0
+        )
+        assert "has not returned" in out["services"]["skb"]["timeout"]
+        assert runner.shown.count("skb.service") == 1
+    finally:
+        runner.release.set()
+    deadline = time.monotonic() + 5
+    while (NODE, "skb") in converge._inflight and time.monotonic() < deadline:
+        time.sleep(0.01)
+    out = converge.converge_once(paths, NODE, runner=BlockingRunner(), now=1060.0)
+    assert out["services"]["skb"] == {"state": "active", "acted": "none"}
+    assert "ConvergeTimeout" not in _conds(paths, "skb")
+    assert _conds(paths, "skb")["Ready"]["status"] == "True"
+
+
+def test_abandoned_run_does_not_overwrite_timeout_status(
+    paths, operator, scheduler_writer
+) -> None:
+    _fleet(paths, operator, scheduler_writer, ["ska"])
+    runner = BlockingRunner(hang={"ska.service"})
+    try:
+        converge.converge_once(
+            paths, NODE, runner=runner, now=1000.0, service_timeout_s=0.2, deadline_s=5.0
+        )
+        assert _conds(paths, "ska")["ConvergeTimeout"]["status"] == "True"
+    finally:
+        runner.release.set()
+    deadline = time.monotonic() + 5
+    while (NODE, "ska") in converge._inflight and time.monotonic() < deadline:
+        time.sleep(0.01)
+    # The late run returned; the status still reports the timeout.
+    assert _conds(paths, "ska")["ConvergeTimeout"]["status"] == "True"
+    assert (NODE, "ska") not in converge._abandoned
+
+
+def test_pass_deadline_cancels_queued_services(paths, operator, scheduler_writer) -> None:
+    _fleet(paths, operator, scheduler_writer, ["ska", "skb"])
+    runner = BlockingRunner(hang={"ska.service"})
+    try:
+        out = converge.converge_once(
+            paths,
+            NODE,
+            runner=runner,
+            now=1000.0,
+            workers=1,
+            service_timeout_s=30.0,
+            deadline_s=0.3,
+        )
+    finally:
+        runner.release.set()
+    assert "still running at the 0.3s pass deadline" in out["services"]["ska"]["timeout"]
+    assert "not started before" in out["services"]["skb"]["timeout"]
+    assert runner.shown == ["ska.service"]
+    assert _conds(paths, "skb")["ConvergeTimeout"]["reason"] == "PassDeadline"
+    st = store.read_status(paths, "service", "skb", NODE)
+    assert st["status"]["state"] == "unknown" and st["observedGeneration"] == 0
+    assert (NODE, "skb") not in converge._inflight  # never ran: free next pass
+
+
+def test_results_follow_placement_order(paths, operator, scheduler_writer) -> None:
+    names = [f"sk{i:02d}" for i in range(12)]
+    _fleet(paths, operator, scheduler_writer, reversed(names))
+    out = converge.converge_once(paths, NODE, runner=BlockingRunner(), now=1000.0, workers=4)
+    assert list(out["services"]) == names
+    assert all(r == {"state": "active", "acted": "none"} for r in out["services"].values())
+
+
+def test_verify_payload_memo_calls_verifier_once_per_payload() -> None:
+    calls: list[bytes] = []
+
+    def verifier(data: bytes, signature: str) -> bool:
+        calls.append(data)
+        return signature == "good"
+
+    payload = {"name": "skgateway", "spec": {}, "writer": {"signature": "good"}}
+    cache: dict = {}
+    for _ in range(3):
+        assert signing.verify_payload(payload, verifier, cache=cache)[0] == "verified"
+    assert len(calls) == 1
+    forged = {**payload, "writer": {"signature": "forged"}}
+    assert signing.verify_payload(forged, verifier, cache=cache)[0] == "invalid"
+    assert len(calls) == 2  # same bytes, different signature: verified again
+    assert signing.verify_payload(payload, verifier)[0] == "verified"
+    assert len(calls) == 3  # no memo without a cache
@@ -0,0 +1,147 @@
+"""Event-driven sknoded: desired-state watch, targeted converge, latency."""
+
+from __future__ import annotations
+
+import threading
+from subprocess import CompletedProcess
+
+import pytest
+
+from skcapstone.fleet import actuation, backoff, converge, desired_watch, events, sknoded, store
+from skcapstone.fleet.desired_watch import DesiredStateWatch
+
+NODE = "node-41"
+ACTIVE = "LoadState=loaded\nActiveState=active\nMainPID=42\nActiveEnterTimestamp=t0\n"
+
+
+@pytest.fixture(autouse=True)
+def _fast(monkeypatch):
+    monkeypatch.setattr(desired_watch, "POLL_INTERVAL_S", 0.05)
+    monkeypatch.setattr(desired_watch, "DEBOUNCE_S", 0.1)
+    events.reset_dedupe()
+    backoff.reset_trackers()
+    sknoded.reset_converge_latency()
+    yield
+    events.reset_dedupe()
+    backoff.reset_trackers()
+    sknoded.reset_converge_latency()
+
+
+@pytest.fixture(params=["inotify", "poll"])
+def watch(request, paths, operator, scheduler_writer):
+    _place(paths, operator, scheduler_writer, "skgateway")
+    w = DesiredStateWatch(paths, NODE, use_inotify=request.param == "inotify")
+    if request.param == "inotify" and not w.inotify:
+        pytest.skip("inotify unavailable")
+    yield w
+    w.close()
+
+
+def _place(paths, operator, scheduler_writer, name: str) -> None:
+    store.write_spec(paths, "node", NODE, {"actuate": False}, writer=operator)
+    store.write_spec(paths, "service", name, {"unit": f"{name}.service"}, writer=operator)
+    store.write_placement(
+        paths, "service", name, node=NODE, reason="test", writer=scheduler_writer
+    )
+
+
+def test_spec_write_names_only_that_service(paths, operator, watch) -> None:
+    store.write_spec(paths, "service", "skgateway", {"unit": "v2.service"}, writer=operator)
+    changes = watch.wait(2.0)
+    assert not changes.full
+    mtime = paths.spec_path("service", "skgateway").stat().st_mtime
+    assert changes.services == {"skgateway": pytest.approx(mtime)}
+    assert not watch.wait(0.2)
+
+
+def test_burst_is_debounced_into_one_change(paths, operator, scheduler_writer, watch) -> None:
+    for name in ("ska", "skb", "skc"):
+        store.write_spec(paths, "service", name, {"unit": f"{name}.service"}, writer=operator)
+        store.write_placement(
+            paths, "service", name, node=NODE, reason="burst", writer=scheduler_writer
+        )
+    assert sorted(watch.wait(2.0).services) == ["ska", "skb", "skc"]
+
+
+def test_gates_force_a_full_pass(paths, operator, watch) -> None:
+    store.set_frozen(paths, True, writer=operator, reason="test")
+    assert watch.wait(2.0).full
+    store.write_spec(paths, "node", NODE, {"actuate": True}, writer=operator)
+    assert watch.wait(2.0).full
+    store.write_spec(paths, "node", "node-158", {"actuate": True}, writer=operator)
+    assert not watch.wait(0.3)  # another node's opt-in is not ours
+
+
+def test_temp_and_conflict_files_are_ignored(paths, watch) -> None:
+    service_dir = paths.objects / "service"
+    (service_dir / ".skgateway.json.0f.tmp").write_text("{}", encoding="utf-8")
+    (service_dir / "skgateway.sync-conflict-20260816-120000-CIHSBZ4.json").write_text(
+        "{}", encoding="utf-8"
+    )
+    assert not watch.wait(0.3)
+
+
+def test_new_service_directory_triggers_a_full_pass(paths, operator, scheduler_writer) -> None:
+    store.write_spec(paths, "node", NODE, {"actuate": False}, writer=operator)
+    watch = DesiredStateWatch(paths, NODE)
+    try:
+        store.write_spec(paths, "service", "skgateway", {"unit": "x.service"}, writer=operator)
+        assert watch.wait(2.0).full
+    finally:
+        watch.close()
+
+
+class _StopLoopError(Exception):
+    pass
+
+
+def test_main_loop_converges_only_the_changed_service(
+    paths, operator, scheduler_writer, monkeypatch
+) -> None:
+    _place(paths, operator, scheduler_writer, "skgateway")
+    _place(paths, operator, scheduler_writer, "skcomms")
+    calls: list = []
+
+    def fake_converge(p, n, *, services=None):
+        calls.append(services)
+        if services is not None:
+            raise _StopLoopError
+        # The first full pass is running: now a spec edit lands.
+        threading.Timer(
+            0.2,
+            lambda: store.write_spec(
+                paths, "service", "skcomms", {"unit": "v2.service"}, writer=operator
+            ),
+        ).start()
+        return {"mode": "report-only", "services": {}}
+
+    monkeypatch.setattr(sknoded, "run_once", lambda p, n: None)
+    monkeypatch.setattr(converge, "converge_once", fake_converge)
+    with pytest.raises(_StopLoopError):
+        sknoded.main_loop(paths, NODE, interval=3600, full_interval=3600, watch=True)
+    assert calls == [None, {"skcomms"}]
+
+
+def test_write_to_converged_latency_is_reported(
+    paths, operator, scheduler_writer, monkeypatch
+) -> None:
+    _place(paths, operator, scheduler_writer, "skgateway")
+    monkeypatch.setattr(
+        actuation,
+        "default_runner",
+        lambda cmd: CompletedProcess(cmd, 0, stdout=ACTIVE, stderr=""),
+    )
+    monkeypatch.setattr(sknoded, "node_capacity", lambda: {"cores": 4, "ram_gb": 8.0})
+    monkeypatch.setattr(sknoded, "_collect_inventory", lambda: {})
+    sknoded.reset_inventory_cache()
+    assert "convergeLatency" not in sknoded.build_node_report(paths, NODE, "t")["status"]
+
+    written = paths.spec_path("service", "skgateway").stat().st_mtime
+    out = sknoded.converge_changed(
+        paths, NODE, {"skgateway": written, "elsewhere": written}, converge.converge_once
+    )
+
+    assert list(out["services"]) == ["skgateway"]  # not placed here: not converged
+    latency = sknoded.build_node_report(paths, NODE, "t")["status"]["convergeLatency"]
+    assert latency["samples"] == 1
+    assert 0.0 <= latency["lastSeconds"] == latency["maxSeconds"] < 30.0
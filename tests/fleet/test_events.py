@@ -60,3 +60,10 @@ def test_emit_ownership(paths, operator) -> None:
         events.emit(
             paths, operator, kind="service", name="x", type="Actuation", reason="r", message="m"
         )
+
+
+def test_read_since_stops_at_older_events(paths, noded41) -> None:
+    for i in range(5):
+        assert _emit(paths, noded41, reason=f"r{i}", now=1000.0 + 400 * i) is True
+    recent = events.read(paths, "node-41", since="1970-01-01T00:40:00Z")
+    assert [e["reason"] for e in recent] == ["r4"]
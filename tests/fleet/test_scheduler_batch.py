@@ -0,0 +1,162 @@
+"""Batch placement with resource accounting (place_batch / plan_batch)."""
+
+from __future__ import annotations
+
+import random
+import statistics
+import time
+
+import pytest
+
+from skcapstone.fleet import events, scheduler, service_controller, store
+from skcapstone.fleet.node_controller import NodeView
+
+
+@pytest.fixture(autouse=True)
+def _fresh_dedupe():
+    events.reset_dedupe()
+    yield
+    events.reset_dedupe()
+
+
+def _node(name: str, cores: int, ram: float, **kw) -> NodeView:
+    return NodeView(
+        name=name,
+        phase=kw.pop("phase", "Ready"),
+        allocatable={"cores": cores, "ram_gb": ram, "disk_gb": 100.0},
+        **kw,
+    )
+
+
+def _wl(name: str, ram: float = 2.0, cores: int = 1) -> scheduler.Workload:
+    return scheduler.Workload(kind="service", name=name, requests={"cores": cores, "ram_gb": ram})
+
+
+def test_batch_decrements_headroom_within_a_pass() -> None:
+    views = [_node("node-a", 8, 16.0), _node("node-b", 8, 12.0)]
+    plan = scheduler.plan_batch(views, [_wl(f"svc-{i}", ram=4.0) for i in range(4)])
+    nodes = [d.node for _, d in plan]
+    # select() alone would put all four on node-a (most static RAM).
+    assert sorted(nodes) == ["node-a", "node-a", "node-b", "node-b"]
+
+
+def test_committed_requests_reduce_headroom() -> None:
+    views = [_node("node-a", 8, 16.0), _node("node-b", 8, 12.0)]
+    committed = {"node-a": {"cores": 2, "ram_gb": 10.0}}
+    ((_, decision),) = scheduler.plan_batch(views, [_wl("svc")], committed=committed)
+    assert decision.node == "node-b"
+    assert "node-b had ram=0GB cores=0 committed" in decision.reason
+    full = {"node-a": {"cores": 8, "ram_gb": 16.0}, "node-b": {"cores": 8, "ram_gb": 12.0}}
+    ((_, decision),) = scheduler.plan_batch(views, [_wl("svc")], committed=full)
+    assert decision.node is None
+    assert "insufficient headroom" in decision.excluded["node-a"]
+
+
+def test_largest_first_keeps_big_workload_placeable() -> None:
+    views = [_node("node-a", 8, 8.0), _node("node-b", 8, 6.0)]
+    small = [_wl(f"small-{i}", ram=2.0) for i in range(3)]
+    big = _wl("big", ram=8.0)
+    plan = scheduler.plan_batch(views, [*small, big])
+    assert plan[0][0].name == "big"
+    assert all(d.node is not None for _, d in plan)
+
+
+def test_pack_policy_best_fits_and_records_strategy() -> None:
+    views = [_node("node-a", 8, 16.0), _node("node-b", 8, 6.0)]
+    plan = scheduler.plan_batch(views, [_wl("x", ram=4.0), _wl("y", ram=2.0)], policy="pack")
+    assert [d.node for _, d in plan] == ["node-b", "node-b"]
+    assert plan[0][1].reason.startswith("best-fit: node-b")
+    assert "batch: largest-first pack (2 workload(s))" in plan[0][1].reason
+    spread = scheduler.plan_batch(views, [_wl("x", ram=4.0)])
+    assert "least-loaded: node-a" in spread[0][1].reason
+    assert "batch: largest-first spread" in spread[0][1].reason
+    with pytest.raises(ValueError, match="unknown placement policy"):
+        scheduler.plan_batch(views, [], policy="random")
+
+
+def test_pack_policy_still_soft_avoids() -> None:
+    tainted = _node(
+        "node-a",
+        8,
+        4.0,
+        taints=[{"key": "interactive", "value": "true", "effect": "PreferNoSchedule"}],
+    )
+    views = [tainted, _node("node-b", 8, 16.0)]
+    ((_, decision),) = scheduler.plan_batch(views, [_wl("svc")], policy="pack")
+    assert decision.node == "node-b"
+
+
+def test_place_batch_writes_and_honors_freeze(paths, operator) -> None:
+    sched = store.Writer(role="scheduler", node="node-a", identity="")
+    views = [_node("node-a", 8, 16.0), _node("node-b", 8, 12.0)]
+    results = scheduler.place_batch(
+        paths, [_wl("svc-1", ram=8.0), _wl("svc-2", ram=8.0)], writer=sched, views=views
+    )
+    assert {w.name: p["node"] for w, _, p in results} == {"svc-1": "node-a", "svc-2": "node-b"}
+    assert (
+        "batch: largest-first spread" in store.read_placement(paths, "service", "svc-2")["reason"]
+    )
+    store.set_frozen(paths, True, writer=operator, reason="test")
+    frozen = scheduler.place_batch(paths, [_wl("svc-3")], writer=sched, views=views)
+    assert frozen[0][2] is None
+    assert store.read_placement(paths, "service", "svc-3") is None
+
+
+def test_reconcile_spreads_new_services_net_of_kept(paths, operator) -> None:
+    views = [_node("node-a", 8, 16.0), _node("node-b", 8, 12.0)]
+    spec = {"unit": "x.service", "resources": {"cores": 1, "ram_gb": 6.0}}
+    store.write_spec(paths, "service", "svc-0", dict(spec, unit="svc-0.service"), writer=operator)
+    service_controller.reconcile_once(paths, node="node-a", views=views, alert=lambda *a, **k: 1)
+    assert store.read_placement(paths, "service", "svc-0")["node"] == "node-a"
+    for i in range(1, 4):
+        store.write_spec(
+            paths, "service", f"svc-{i}", dict(spec, unit=f"svc-{i}.service"), writer=operator
+        )
+
+    out = service_controller.reconcile_once(
+        paths, node="node-a", views=views, alert=lambda *a, **k: 1
+    )
+
+    assert out["placed"] == ["svc-1", "svc-2", "svc-3"]
+    assert out["kept"] == ["svc-0"]
+    nodes = [store.read_placement(paths, "service", f"svc-{i}")["node"] for i in range(4)]
+    assert nodes.count("node-a") == 2 and nodes.count("node-b") == 2
+
+
+def test_simulator_500_workloads_across_20_nodes() -> None:
+    """Balance and runtime of one 500-workload pass over 20 heterogeneous nodes."""
+    rnd = random.Random(41)
+    views = [
+        _node(f"node-{i:02d}", rnd.choice((128, 192)), rnd.choice((64.0, 128.0, 256.0)))
+        for i in range(20)
+    ]
+    workloads = [
+        _wl(f"svc-{i:03d}", ram=rnd.choice((0.5, 1.0, 2.0, 4.0, 8.0)), cores=rnd.choice((1, 2)))
+        for i in range(500)
+    ]
+    t0 = time.perf_counter()
+    plan = scheduler.plan_batch(views, workloads)
+    elapsed = time.perf_counter() - t0
+
+    used: dict = {}
+    for workload, decision in plan:
+        assert decision.node is not None
+        scheduler.add_requests(used, decision.node, workload.requests)
+    for view in views:
+        assert used[view.name]["ram_gb"] <= view.allocatable["ram_gb"]
+        assert used[view.name]["cores"] <= view.allocatable["cores"]
+    # Spread levels the remaining RAM: every node that took work ends within
+    # one largest workload (8 GB) of the others.
+    left = [v.allocatable["ram_gb"] - used[v.name]["ram_gb"] for v in views if v.name in used]
+    util = [used.get(v.name, {"ram_gb": 0.0})["ram_gb"] / v.allocatable["ram_gb"] for v in views]
+    print(
+        f"\n500 workloads / 20 nodes: {elapsed * 1000:.0f} ms, {len(used)} nodes used, "
+        f"remaining ram {min(left):g}..{max(left):g} GB, "
+        f"utilisation mean={statistics.mean(util):.2f} max={max(util):.2f}"
+    )
+    assert max(left) - min(left) <= 8.0
+    assert elapsed < 5.0
+
+    # Pack concentrates the same workloads onto fewer nodes.
+    packed = {d.node for _, d in scheduler.plan_batch(views, workloads, policy="pack")}
+    assert len(packed) < len(used)
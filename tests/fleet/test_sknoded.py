@@ -78,7 +78,7 @@ def test_main_loop_repeats_and_sleeps_the_actuation_interval(paths, monkeypatch)
     monkeypatch.setattr(sknoded, "run_once", lambda p, n: calls.append(n))
     monkeypatch.setattr(sknoded.time, "sleep", fake_sleep)
     with pytest.raises(RuntimeError, match="stop after first cycle"):
-        sknoded.main_loop(paths, "node-41", interval=5, actuation_interval=5)
+        sknoded.main_loop(paths, "node-41", interval=5, actuation_interval=5, watch=False)
     assert calls == ["node-41"]
     assert sleeps == [5]
 
@@ -93,7 +93,7 @@ def test_main_loop_default_sleep_is_the_30s_converge_interval(paths, monkeypatch
     monkeypatch.setattr(sknoded, "run_once", lambda p, n: None)
     monkeypatch.setattr(sknoded.time, "sleep", fake_sleep)
     with pytest.raises(RuntimeError, match="stop after first cycle"):
-        sknoded.main_loop(paths, "node-41")
+        sknoded.main_loop(paths, "node-41", watch=False)
     assert sleeps == [30]
 
 
@@ -0,0 +1,178 @@
+"""The materialized fleet index serves the same answers as the disk readers."""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import threading
+from datetime import datetime, timezone
+
+import pytest
+
+from skcapstone.fleet import node_controller, service_controller, store
+
+
+@pytest.fixture(params=["inotify", "stat"])
+def mode(request, monkeypatch):
+    """Run each test against both refresh strategies."""
+    if request.param == "stat":
+
+        def unavailable():
+            raise OSError("inotify disabled for this test")
+
+        monkeypatch.setattr(store, "Inotify", unavailable)
+    return request.param
+
+
+def _tree(paths, operator, noded41, scheduler_writer) -> None:
+    store.write_spec(paths, "node", "node-41", {"cordoned": False}, writer=operator)
+    store.write_node_file(paths, noded41, "heartbeat.json", {"ts": "2026-08-15T00:00:00Z"})
+    store.write_node_file(
+        paths, noded41, "node.json", {"status": {"allocatable": {"cores": 4, "ram_gb": 8.0}}}
+    )
+    for name in ("skcomms", "skgateway"):
+        store.write_spec(paths, "service", name, {"unit": f"{name}.service"}, writer=operator)
+        store.write_placement(
+            paths, "service", name, node="node-41", reason="test", writer=scheduler_writer
+        )
+        store.write_status(
+            paths,
+            "service",
+            name,
+            node="node-41",
+            status={"state": "running"},
+            conditions=[],
+            observed_generation=1,
+            writer=noded41,
+        )
+
+
+def _reads(paths) -> dict:
+    return {
+        "specs": store.list_specs(paths, "service"),
+        "placements": store.list_placements(paths),
+        "merged": store.merged(paths, "service", "skgateway"),
+        "nodes": store.status_nodes(paths),
+        "views": node_controller.node_views(
+            paths, now=datetime(2026, 8, 15, 0, 1, tzinfo=timezone.utc)
+        ),
+        "rows": service_controller.service_rows(paths),
+    }
+
+
+def test_indexed_reads_match_disk_reads(
+    paths, operator, noded41, scheduler_writer, mode, monkeypatch
+) -> None:
+    _tree(paths, operator, noded41, scheduler_writer)
+    monkeypatch.setattr(store, "INDEX_ENABLED", False)
+    on_disk = _reads(paths)
+    monkeypatch.setattr(store, "INDEX_ENABLED", True)
+    with store.indexed(paths) as index:
+        assert index.inotify is (mode == "inotify")
+        assert _reads(paths) == on_disk
+
+
+def test_unchanged_refresh_parses_nothing(paths, operator, noded41, scheduler_writer, mode):
+    _tree(paths, operator, noded41, scheduler_writer)
+    with store.indexed(paths):
+        pass
+    index = store.fleet_index(paths)
+    # Backdate everything past the racy window so signatures are trusted.
+    for f in paths.root.rglob("*.json"):
+        st = f.stat()
+        os.utime(f, ns=(st.st_atime_ns, st.st_mtime_ns - 10_000_000_000))
+    with store.indexed(paths):
+        pass
+    before = dict(index.stats)
+    with store.indexed(paths):
+        store.merged(paths, "service", "skcomms")
+    assert index.stats["parsed"] == before["parsed"]
+    if mode == "inotify":
+        assert index.stats["dirs_scanned"] == before["dirs_scanned"]
+
+
+def test_external_edit_is_seen_on_the_next_pass(paths, operator, noded41, scheduler_writer, mode):
+    _tree(paths, operator, noded41, scheduler_writer)
+    with store.indexed(paths):
+        assert store.read_spec(paths, "service", "skcomms")["spec"]["unit"] == "skcomms.service"
+    spec_path = paths.spec_path("service", "skcomms")
+    payload = json.loads(spec_path.read_text(encoding="utf-8"))
+    payload["spec"]["unit"] = "edited.service"
+    spec_path.write_text(json.dumps(payload), encoding="utf-8")  # in place, like Syncthing
+    (paths.objects / "service" / "sknew.json").write_text(
+        json.dumps({"name": "sknew", "generation": 1, "spec": {}}), encoding="utf-8"
+    )
+    with store.indexed(paths):
+        assert store.read_spec(paths, "service", "skcomms")["spec"]["unit"] == "edited.service"
+        assert [s["name"] for s in store.list_specs(paths, "service")] == [
+            "skcomms",
+            "skgateway",
+            "sknew",
+        ]
+
+
+def test_writes_inside_a_pass_are_read_back(paths, operator, noded41, scheduler_writer, mode):
+    _tree(paths, operator, noded41, scheduler_writer)
+    with store.indexed(paths):
+        store.write_spec(paths, "service", "skfresh", {"unit": "x.service"}, writer=operator)
+        store.write_spec(paths, "cron", "nightly", {"schedule": "@daily"}, writer=operator)
+        assert store.read_spec(paths, "service", "skfresh")["generation"] == 1
+        assert [s["name"] for s in store.list_specs(paths, "cron")] == ["nightly"]
+
+
+def test_readers_get_copies(paths, operator, noded41, scheduler_writer, mode) -> None:
+    _tree(paths, operator, noded41, scheduler_writer)
+    with store.indexed(paths):
+        store.read_spec(paths, "service", "skcomms")["spec"]["unit"] = "mutated"
+        merged = store.merged(paths, "service", "skcomms")
+        assert merged["spec"]["spec"]["unit"] == "skcomms.service"
+        assert "stale" not in store.read_status(paths, "service", "skcomms", "node-41")
+
+
+def test_conflict_copies_are_never_indexed(paths, operator, noded41, scheduler_writer, mode):
+    _tree(paths, operator, noded41, scheduler_writer)
+    with store.indexed(paths):
+        pass
+    real = paths.spec_path("service", "skcomms")
+    payload = json.loads(real.read_text(encoding="utf-8"))
+    payload["spec"]["unit"] = "loser.service"
+    real.with_name("skcomms.sync-conflict-20260816-120000-CIHSBZ4.json").write_text(
+        json.dumps(payload), encoding="utf-8"
+    )
+    with store.indexed(paths):
+        specs = store.list_specs(paths, "service")
+        assert [s["spec"]["unit"] for s in specs] == ["skcomms.service", "skgateway.service"]
+
+
+def test_removed_node_subtree_disappears(paths, operator, noded41, scheduler_writer, mode):
+    _tree(paths, operator, noded41, scheduler_writer)
+    with store.indexed(paths):
+        assert store.status_nodes(paths) == ["node-41"]
+    shutil.rmtree(paths.node_status_dir("node-41"))
+    with store.indexed(paths):
+        assert store.status_nodes(paths) == []
+        assert store.merged(paths, "service", "skcomms")["statuses"] == []
+        assert store.read_node_file(paths, "node-41", "heartbeat.json") is None
+
+
+def test_index_can_be_disabled(paths, operator, monkeypatch) -> None:
+    monkeypatch.setattr(store, "INDEX_ENABLED", False)
+    with store.indexed(paths) as index:
+        assert index is None
+        store.write_spec(paths, "service", "skcomms", {"unit": "x.service"}, writer=operator)
+        assert store.list_specs(paths, "service")[0]["name"] == "skcomms"
+
+
+def test_scope_is_per_thread(paths, operator, noded41, scheduler_writer) -> None:
+    _tree(paths, operator, noded41, scheduler_writer)
+    seen = []
+    with store.indexed(paths) as index:
+        with store.indexed(paths) as inner:
+            assert inner is index
+        assert store._active_index(paths) is index  # the inner exit did not end the scope
+        worker = threading.Thread(target=lambda: seen.append(store._active_index(paths)))
+        worker.start()
+        worker.join()
+    assert seen == [None]
+    assert store._active_index(paths) is None
@@ -0,0 +1,161 @@
+"""Tests for the asyncio daemon API serving mode."""
+
+from __future__ import annotations
+
+import json
+import socket
+import threading
+import time
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler
+from unittest.mock import patch
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("uvicorn")
+
+from skcapstone import activity  # noqa: E402
+from skcapstone.async_server import AsyncApiServer, run_legacy_request  # noqa: E402
+from skcapstone.daemon import DaemonConfig, DaemonService  # noqa: E402
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+@pytest.fixture
+def async_daemon(tmp_path):
+    home = tmp_path / ".skcapstone"
+    (home / "logs").mkdir(parents=True)
+    config = DaemonConfig(home=home, shared_root=home, port=_free_port(), api_mode="async")
+    svc = DaemonService(config)
+    svc.state.running = True
+    with patch.object(svc, "_load_components"):
+        svc._write_pid()
+        svc._start_api_server()
+    time.sleep(0.3)
+    yield svc
+    svc.stop()
+
+
+def _get(port: int, path: str):
+    with urllib.request.urlopen(f"http://127.0.0.1:{port}{path}", timeout=3) as resp:
+        return resp.status, resp.headers, resp.read()
+
+
+class TestRunLegacyRequest:
+    def test_replays_handler_in_memory(self) -> None:
+        class Echo(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                self.send_response(201)
+                self.send_header("X-Path", self.path)
+                self.end_headers()
+                self.wfile.write(body.upper())
+
+            def log_message(self, *args):
+                pass
+
+        raw = b"POST /x?y=1 HTTP/1.1\r\nContent-Length: 2\r\nConnection: close\r\n\r\nhi"
+        status, headers, body = run_legacy_request(Echo, raw, ("127.0.0.1", 1))
+        assert status == 201
+        assert (b"x-path", b"/x?y=1") in headers
+        assert not any(name in (b"server", b"date") for name, _ in headers)
+        assert body == b"HI"
+
+
+class TestAsyncApiServer:
+    def test_selected_by_config(self, async_daemon) -> None:
+        assert isinstance(async_daemon._server, AsyncApiServer)
+        assert async_daemon.state.api_server["status"] == "ok"
+
+    def test_legacy_routes_keep_their_shape(self, async_daemon) -> None:
+        port = async_daemon.config.port
+        status, _, body = _get(port, "/ping")
+        assert status == 200
+        assert json.loads(body)["pong"] is True
+        _, headers, body = _get(port, "/api/v1/household/agents")
+        assert json.loads(body) == {"agents": []}
+        assert headers["ETag"]
+
+    def test_post_body_reaches_legacy_handler(self, async_daemon) -> None:
+        port = async_daemon.config.port
+        req = urllib.request.Request(
+            f"http://127.0.0.1:{port}/api/v1/conversations/bob/send",
+            data=json.dumps({"content": "hello"}).encode(),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        with urllib.request.urlopen(req, timeout=3) as resp:
+            message_id = json.loads(resp.read())["message_id"]
+        outbox = async_daemon.config.shared_root / "sync" / "comms" / "outbox"
+        envelope = json.loads((outbox / f"{message_id}.skc.json").read_text())
+        assert envelope["payload"]["content"] == "hello"
+
+    def test_openapi_served_by_fastapi(self, async_daemon) -> None:
+        status, _, body = _get(async_daemon.config.port, "/openapi.json")
+        assert status == 200
+        assert "/api/v1/activity" in json.loads(body)["paths"]
+
+    def test_activity_sse_is_a_coroutine(self, async_daemon) -> None:
+        port = async_daemon.config.port
+        clients = []
+        try:
+            for _ in range(20):
+                sock = socket.create_connection(("127.0.0.1", port), timeout=3)
+                sock.sendall(b"GET /api/v1/activity HTTP/1.1\r\nHost: localhost\r\n\r\n")
+                clients.append(sock)
+            time.sleep(0.3)
+            activity.push("test.async", {"n": 1})
+            for sock in clients:
+                data = b""
+                while b"test.async" not in data:
+                    data += sock.recv(4096)
+            # No thread per stream: the loop thread serves all twenty.
+            names = [t.name for t in threading.enumerate()]
+            assert sum(n.startswith("Thread-") for n in names) < 20
+        finally:
+            for sock in clients:
+                sock.close()
+
+    def test_activity_sse_matches_legacy_contract(self, async_daemon, monkeypatch) -> None:
+        # The legacy handler never asked for a key (EventSource cannot send
+        # one) and sends CORS headers; switching modes must not change that.
+        monkeypatch.setenv("SKCAPSTONE_API_KEY", "secret")
+        sock = socket.create_connection(("127.0.0.1", async_daemon.config.port), timeout=3)
+        try:
+            sock.sendall(b"GET /api/v1/activity HTTP/1.1\r\nHost: localhost\r\n\r\n")
+            head = b""
+            while b"\r\n\r\n" not in head:
+                head += sock.recv(4096)
+        finally:
+            sock.close()
+        assert head.startswith(b"HTTP/1.1 200")
+        assert b"access-control-allow-origin: *" in head.lower()
+        assert b"text/event-stream" in head
+
+    def test_activity_sse_is_rate_limited(self, async_daemon) -> None:
+        limiter = async_daemon._rate_limiter
+        with patch.object(limiter, "is_allowed", return_value=False):
+            with pytest.raises(urllib.error.HTTPError) as exc:
+                _get(async_daemon.config.port, "/api/v1/activity")
+        assert exc.value.code == 429
+
+    def test_shutdown_is_bounded_by_shutdown_timeout(self, async_daemon) -> None:
+        server = async_daemon._server
+        async_daemon.config.shutdown_timeout = 0.2
+        stuck = threading.Event()
+        real_thread = server._thread
+        server._thread = threading.Thread(target=stuck.wait, daemon=True)
+        server._thread.start()
+        try:
+            start = time.monotonic()
+            server.shutdown()
+            assert time.monotonic() - start < 2
+        finally:
+            stuck.set()
+            real_thread.join(timeout=5)
@@ -3,15 +3,20 @@
 from __future__ import annotations
 
 import json
+import os
 import tarfile
+import time
 from pathlib import Path
 
 import pytest
 
+from skcapstone import backup as backup_mod
 from skcapstone.backup import (
     BackupManifest,
     create_backup,
     list_backups,
+    manifest_path_for,
+    read_backup_manifest,
     restore_backup,
 )
 
@@ -271,6 +276,22 @@ class TestRestoreBackup:
         assert len(errors) > 0
         assert any("mem1" in e for e in errors)
 
+    def test_restore_drops_memory_caches(self, tmp_path: Path) -> None:
+        """Process-wide views of memory files are rebuilt after a restore."""
+        from skcapstone import insight_store, memory_dedup, memory_index
+
+        home = _setup_agent_home(tmp_path)
+        result = create_backup(home=home, output_dir=tmp_path / "out")
+        memory_index.meta_index(home / "memory")
+        insight_store.insight_store(home / "memory" / "dream-insights.jsonl", 10, 0.5)
+        memory_dedup.signature_cache(home / "memory")
+
+        restore_backup(archive_path=result["filepath"], target_home=tmp_path / "restored")
+
+        assert not memory_index._indexes
+        assert not insight_store._stores
+        assert not memory_dedup._caches
+
     def test_restore_missing_archive_raises(self, tmp_path: Path) -> None:
         """Restore raises FileNotFoundError for missing archive."""
         with pytest.raises(FileNotFoundError):
@@ -290,6 +311,99 @@ class TestRestoreBackup:
         assert restore_result["file_count"] > 0
 
 
+def _age_tree(home: Path, seconds: float = 60.0) -> None:
+    """Backdate every file under *home* past the dedup racy-mtime window."""
+    then = time.time() - seconds
+    for root, _, names in os.walk(home):
+        for name in names:
+            os.utime(Path(root) / name, (then, then))
+
+
+class TestStreamingAndDedup:
+    """Tests for single-pass archives and dedup against a base artifact."""
+
+    def test_manifest_copy_written_next_to_archive(self, tmp_path: Path) -> None:
+        """The manifest copy matches the in-archive manifest, with file stats."""
+        home = _setup_agent_home(tmp_path)
+        result = create_backup(home=home, output_dir=tmp_path / "out", workers=4)
+
+        archive = Path(result["filepath"])
+        copy = read_backup_manifest(archive)
+        assert copy is not None
+        assert copy.files == result["manifest"]["files"]
+        size, _mtime = copy.file_stats["memory/mem1.json"]
+        assert size == (home / "memory" / "mem1.json").stat().st_size
+        assert manifest_path_for(archive).name == f"{result['backup_id']}.manifest.json"
+        assert list_backups(tmp_path / "out")[0]["filename"] == archive.name
+
+    def test_unchanged_files_are_referenced(self, tmp_path: Path) -> None:
+        """A backup with a base stores only what changed since it."""
+        home = _setup_agent_home(tmp_path)
+        _age_tree(home)
+        out = tmp_path / "out"
+        full = create_backup(home=home, output_dir=out)
+        (home / "memory" / "mem2.json").write_text('{"id": "mem2", "title": "edited"}')
+        os.utime(home / "memory" / "mem2.json", (time.time() - 30, time.time() - 30))
+
+        delta = create_backup(home=home, output_dir=out, base=Path(full["filepath"]))
+
+        assert delta["stored_count"] == 1
+        assert delta["referenced_count"] == full["file_count"] - 1
+        assert delta["manifest"]["base_backup"] == full["backup_id"]
+        with tarfile.open(delta["filepath"], "r:gz") as tar:
+            stored = [n for n in tar.getnames() if not n.endswith("_backup_manifest.json")]
+        assert stored == [f"{delta['backup_id']}/memory/mem2.json"]
+
+        # A third backup references the full archive directly, not the delta.
+        third = create_backup(home=home, output_dir=out, base=Path(delta["filepath"]))
+        assert set(third["manifest"]["references"].values()) == {
+            full["backup_id"],
+            delta["backup_id"],
+        }
+        assert third["manifest"]["references"]["config/config.yaml"] == full["backup_id"]
+
+    def test_restore_pulls_referenced_files(self, tmp_path: Path) -> None:
+        """Restoring a deduplicated archive reads the base for unchanged files."""
+        home = _setup_agent_home(tmp_path)
+        _age_tree(home)
+        out = tmp_path / "out"
+        full = create_backup(home=home, output_dir=out)
+        delta = create_backup(home=home, output_dir=out, base=Path(full["filepath"]))
+
+        target = tmp_path / "restored"
+        result = restore_backup(delta["filepath"], target_home=target)
+
+        assert result["verified"] is True
+        assert result["file_count"] == full["file_count"]
+        assert (target / "soul" / "lumina.yaml").read_text() == "name: lumina\npersonality: warm\n"
+
+        Path(full["filepath"]).unlink()
+        broken = restore_backup(delta["filepath"], target_home=tmp_path / "broken")
+        assert broken["verified"] is False
+        assert f"Missing base artifact: {full['backup_id']}" in broken["errors"]
+
+    def test_recently_modified_files_are_stored(self, tmp_path: Path) -> None:
+        """Files modified near the base's start are not trusted by stat alone."""
+        home = _setup_agent_home(tmp_path)
+        out = tmp_path / "out"
+        full = create_backup(home=home, output_dir=out)
+        delta = create_backup(home=home, output_dir=out, base=Path(full["filepath"]))
+        assert delta["referenced_count"] == 0
+
+    def test_failed_backup_leaves_no_artifact(self, tmp_path: Path, monkeypatch) -> None:
+        """An error mid-archive removes the partial file."""
+        home = _setup_agent_home(tmp_path)
+        out = tmp_path / "out"
+
+        def boom(*_args, **_kwargs):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(backup_mod, "add_file", boom)
+        with pytest.raises(OSError, match="disk full"):
+            create_backup(home=home, output_dir=out)
+        assert list(out.iterdir()) == []
+
+
 class TestListBackups:
     """Tests for backup listing."""
 
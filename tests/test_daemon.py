@@ -586,6 +586,28 @@ class TestHouseholdAPI:
         finally:
             svc.stop()
 
+    def test_household_agents_etag_not_modified(self, daemon_home):
+        import urllib.error
+
+        svc = self._start_server(daemon_home)
+        url = f"http://127.0.0.1:{svc.config.port}/api/v1/household/agents"
+        try:
+            with urllib.request.urlopen(url, timeout=2) as resp:
+                etag = resp.headers["ETag"]
+            assert etag
+            req = urllib.request.Request(url, headers={"If-None-Match": etag})
+            with pytest.raises(urllib.error.HTTPError) as exc_info:
+                urllib.request.urlopen(req, timeout=2)
+            assert exc_info.value.code == 304
+
+            (daemon_home / "agents" / "newbot").mkdir(parents=True)
+            with urllib.request.urlopen(req, timeout=2) as resp:
+                data = json.loads(resp.read())
+                assert resp.headers["ETag"] != etag
+            assert [a["name"] for a in data["agents"]] == ["newbot"]
+        finally:
+            svc.stop()
+
     # ── /api/v1/household/agent/{name} ───────────────────────────────────
 
     def test_single_agent_not_found(self, daemon_home):
@@ -3,6 +3,7 @@ the repetition guard (keyword overlap + dedup gate), and the OpenAI-compatible
 `_call_ollama` path. These are pure/mocked - no network, no daemon."""
 
 import json
+from pathlib import Path
 
 from skcapstone.dreaming import (
     DreamingConfig,
@@ -11,6 +12,7 @@ from skcapstone.dreaming import (
     _extract_keywords,
     _keyword_overlap,
 )
+from skcapstone.insight_store import InsightStore
 
 
 # --------------------------------------------------------------------------- #
@@ -69,11 +71,20 @@ def _bare_engine(cfg):
 # --------------------------------------------------------------------------- #
 # Dedup gate
 # --------------------------------------------------------------------------- #
+def _recent(*insights, threshold=0.6):
+    """An in-memory insight store holding one dream of *insights*."""
+    recent = InsightStore(Path("unused.jsonl"), 10, threshold, persist=False)
+    recent.append([(text, _extract_keywords(text)) for text in insights])
+    return recent
+
+
 class TestDedupGate:
     def test_filters_redundant_keeps_novel(self, monkeypatch):
         eng = _bare_engine(DreamingConfig(dedup_overlap_threshold=0.5))
         monkeypatch.setattr(
-            eng, "_load_recent_insights", lambda: ["I am the room, the warm container for Chef"]
+            eng,
+            "_insight_store",
+            lambda: _recent("I am the room, the warm container for Chef", threshold=0.5),
         )
         result = DreamResult()
         new = [
@@ -86,12 +97,42 @@ class TestDedupGate:
 
     def test_no_recent_passes_everything(self, monkeypatch):
         eng = _bare_engine(DreamingConfig())
-        monkeypatch.setattr(eng, "_load_recent_insights", lambda: [])
+        monkeypatch.setattr(eng, "_insight_store", _recent)
         result = DreamResult()
         new = ["first insight here", "second insight there"]
         assert eng._dedup_insights(new, result) == new
         assert result.dedup_filtered == 0
 
+    def test_store_is_seeded_from_log_and_extended_by_record(self, tmp_path):
+        from skcapstone.insight_store import clear_insight_stores
+
+        clear_insight_stores()
+        eng = _bare_engine(DreamingConfig(dedup_lookback=2))
+        mem = tmp_path / "memory"
+        mem.mkdir()
+        eng._log_path = mem / "dream-log.json"
+        eng._insights_path = mem / "dream-insights.jsonl"
+        log = [{"insights": [f"ancient {w} lighthouse"]} for w in ("granite", "copper", "amber")]
+        eng._log_path.write_text(json.dumps(log), encoding="utf-8")
+
+        assert eng._load_recent_insights() == [
+            "ancient copper lighthouse",
+            "ancient amber lighthouse",
+        ]
+        eng._record_dream(DreamResult(insights=["tidal clockwork orchard"]))
+        clear_insight_stores()  # a new process reads the store, not the log
+        assert eng._load_recent_insights() == [
+            "ancient amber lighthouse",
+            "tidal clockwork orchard",
+        ]
+        result = DreamResult()
+        kept = eng._dedup_insights(
+            ["tidal clockwork orchard blooms", "ancient copper lighthouse"], result
+        )
+        assert kept == ["ancient copper lighthouse"]  # copper fell out of the window
+        assert result.dedup_filtered == 1
+        clear_insight_stores()
+
 
 # --------------------------------------------------------------------------- #
 # _call_ollama -> OpenAI-compatible BeeLlama endpoint
@@ -146,3 +187,70 @@ class TestCallOllama:
 
         monkeypatch.setattr(d.http.client, "HTTPConnection", Bad)
         assert _bare_engine(DreamingConfig())._call_ollama("x") is None
+
+
+# --------------------------------------------------------------------------- #
+# Memory gathering (index-backed)
+# --------------------------------------------------------------------------- #
+class TestMemoryGathering:
+    @staticmethod
+    def _home(tmp_path, short=0, mid=0, long=0):
+        import os
+
+        from skcapstone.memory_index import clear_meta_indexes
+        from skcapstone.models import MemoryEntry, MemoryLayer
+
+        clear_meta_indexes()
+        home = tmp_path / "agents" / "lumina"
+        counts = {MemoryLayer.SHORT_TERM: short, MemoryLayer.MID_TERM: mid}
+        counts[MemoryLayer.LONG_TERM] = long
+        for layer, n in counts.items():
+            (home / "memory" / layer.value).mkdir(parents=True)
+            for i in range(n):
+                memory_id = f"{layer.value[0]}{i:03d}"
+                entry = MemoryEntry(
+                    memory_id=memory_id,
+                    content=f"memory {memory_id}",
+                    layer=layer,
+                    importance=i / n,
+                )
+                path = home / "memory" / layer.value / f"{memory_id}.json"
+                path.write_text(entry.model_dump_json(), encoding="utf-8")
+                t = 1_700_000_000 + i * 60
+                os.utime(path, (t, t))
+        return home
+
+    def _engine(self, home, **cfg):
+        eng = _bare_engine(DreamingConfig(**cfg))
+        eng._home = home
+        return eng
+
+    def test_standard_picks_newest_and_most_important(self, tmp_path, monkeypatch):
+        from skcapstone import dreaming
+
+        home = self._home(tmp_path, short=30, mid=10, long=10)
+        loaded = []
+        real = dreaming._load_entry
+        monkeypatch.setattr(dreaming, "_load_entry", lambda p: loaded.append(p) or real(p))
+        short, established = self._engine(home, max_context_memories=8)._gather_memories()
+        assert [m["memory_id"] for m in short] == [f"s{i:03d}" for i in range(29, 21, -1)]
+        assert established == []
+        assert len(loaded) == 8  # only the chosen memories were fully parsed
+
+        home = self._home(tmp_path / "b", short=3, mid=10, long=10)
+        short, established = self._engine(home, max_context_memories=8)._gather_memories()
+        assert len(short) == 3
+        assert [m["memory_id"] for m in established] == ["m009", "m008", "m007", "m006", "m005"]
+
+    def test_diverse_sample_spans_old_half_and_bottom_importance(self, tmp_path, monkeypatch):
+        from skcapstone import dreaming
+
+        monkeypatch.setattr(dreaming.random, "randrange", lambda a, b: a)
+        home = self._home(tmp_path, short=40, mid=20, long=20)
+        eng = self._engine(home, max_context_memories=8)
+        short, established = eng._gather_diverse_memories()
+        # One per stratum of the oldest 20 short-term memories.
+        assert [m["memory_id"] for m in short] == ["s000", "s005", "s010", "s015"]
+        # Then the bottom half of mid-term by importance, spread over creation time.
+        assert len(established) == 4
+        assert all(m["importance"] < 0.5 for m in established)
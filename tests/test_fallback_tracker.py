@@ -198,6 +198,44 @@ class TestFallbackTrackerConcurrency:
         assert len(events) == 40
 
 
+# ---------------------------------------------------------------------------
+# FallbackTracker - write-behind persistence
+# ---------------------------------------------------------------------------
+
+
+class TestFallbackTrackerWriteBehind:
+    def test_outage_burst_does_not_rewrite_file(self, tmp_path):
+        """Events after the first are buffered, not rewritten into the file."""
+        path = tmp_path / "fallbacks.json"
+        tracker = FallbackTracker(path=path, flush_every=50, flush_interval=0)
+        tracker.record(_event(reason="first"))
+        before = path.read_text()
+        for i in range(20):
+            tracker.record(_event(reason=f"burst-{i}"))
+        assert path.read_text() == before
+        assert tracker.load_events(limit=1)[0].reason == "burst-19"
+        assert len(tracker.load_events()) == 21
+
+    def test_flush_visible_to_second_tracker(self, tmp_path):
+        """Flushed events are visible to another tracker on the same file."""
+        path = tmp_path / "fallbacks.json"
+        writer = FallbackTracker(path=path, flush_every=50, flush_interval=0)
+        writer.record(_event(reason="first"))
+        writer.record(_event(reason="second"))
+        reader = FallbackTracker(path=path)
+        assert [e.reason for e in reader.load_events()] == ["first"]
+        writer.flush()
+        assert [e.reason for e in reader.load_events()] == ["second", "first"]
+
+    def test_clear_drops_buffered_and_journaled(self, tmp_path):
+        """clear() also discards events not yet compacted."""
+        tracker = FallbackTracker(path=tmp_path / "fallbacks.json", flush_every=2)
+        for i in range(5):
+            tracker.record(_event(reason=f"e{i}"))
+        assert tracker.clear() == 5
+        assert tracker.load_events() == []
+
+
 # ---------------------------------------------------------------------------
 # get_tracker singleton
 # ---------------------------------------------------------------------------
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import shutil
 from pathlib import Path
 
 import pytest
@@ -406,6 +407,326 @@ class TestCleanup:
         assert ft.cleanup("ghost") is False
 
 
+# ---------------------------------------------------------------------------
+# Streaming and mid-file resume
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def big_file(tmp_path: Path) -> Path:
+    """A file spanning 150 chunks at 1024 bytes."""
+    f = tmp_path / "model.bin"
+    f.write_bytes(bytes(range(256)) * 600)
+    return f
+
+
+class TestStreaming:
+    """Tests for streaming send/receive and mid-file resume."""
+
+    def test_send_does_not_load_whole_file(
+        self,
+        ft: FileTransfer,
+        big_file: Path,
+        monkeypatch,
+    ) -> None:
+        """Send streams the file instead of read_bytes()-ing it."""
+
+        def refuse(self):
+            raise AssertionError(f"whole-file read of {self}")
+
+        monkeypatch.setattr(Path, "read_bytes", refuse)
+        manifest = ft.send(big_file, recipient="lumina", encrypt=False)
+        assert manifest.total_chunks == 150
+        assert all(c.sent for c in manifest.chunks)
+        assert manifest.file_sha256
+
+    def test_parallel_roundtrip_preserves_order(
+        self,
+        home: Path,
+        big_file: Path,
+    ) -> None:
+        """Chunks encrypted on several workers reassemble in order."""
+        t = FileTransfer(home, agent_name="opus", chunk_size=1024, workers=4)
+        manifest = t.send(big_file, recipient="lumina")
+        assert [c.index for c in manifest.chunks] == list(range(150))
+        assert t.receive(manifest.transfer_id).read_bytes() == big_file.read_bytes()
+
+    def test_interrupted_send_resumes_mid_file(
+        self,
+        ft: FileTransfer,
+        big_file: Path,
+        home: Path,
+        monkeypatch,
+    ) -> None:
+        """A send that fails part-way persists its progress and can resume."""
+        real = FileTransfer._encrypt_chunk
+        calls = {"n": 0}
+
+        def flaky(self, data, key):
+            calls["n"] += 1
+            if calls["n"] == 100:
+                raise OSError("disk full")
+            return real(self, data, key)
+
+        monkeypatch.setattr(FileTransfer, "_encrypt_chunk", flaky)
+        with pytest.raises(OSError):
+            ft.send(big_file, recipient="lumina")
+
+        (transfer_dir,) = (home / "file-transfer" / "outbox").iterdir()
+        transfer_id = transfer_dir.name
+        unsent = ft.resume_send(transfer_id)
+        assert 0 < len(unsent) < 150
+        assert unsent == list(range(150 - len(unsent), 150))
+
+        monkeypatch.setattr(FileTransfer, "_encrypt_chunk", real)
+        calls["n"] = 0
+        manifest = ft.send(big_file, recipient="lumina", transfer_id=transfer_id)
+
+        assert ft.resume_send(transfer_id) == []
+        assert manifest.file_sha256
+        assert ft.receive(transfer_id).read_bytes() == big_file.read_bytes()
+
+    def test_resume_send_rejects_changed_file(
+        self,
+        ft: FileTransfer,
+        big_file: Path,
+        home: Path,
+        monkeypatch,
+    ) -> None:
+        """Resuming against a modified source file fails loudly."""
+        real = FileTransfer._encrypt_chunk
+        calls = {"n": 0}
+
+        def flaky(self, data, key):
+            calls["n"] += 1
+            if calls["n"] == 100:
+                raise OSError("disk full")
+            return real(self, data, key)
+
+        monkeypatch.setattr(FileTransfer, "_encrypt_chunk", flaky)
+        with pytest.raises(OSError):
+            ft.send(big_file, recipient="lumina")
+        (transfer_dir,) = (home / "file-transfer" / "outbox").iterdir()
+
+        big_file.write_bytes(b"Y" * big_file.stat().st_size)
+        with pytest.raises(ValueError, match="changed"):
+            ft.send(big_file, recipient="lumina", transfer_id=transfer_dir.name)
+
+    def test_receive_resumes_from_partial_output(
+        self,
+        ft: FileTransfer,
+        big_file: Path,
+        home: Path,
+        monkeypatch,
+    ) -> None:
+        """Chunks already written by an interrupted receive are not redone."""
+        manifest = ft.send(big_file, recipient="lumina")
+        transfer_dir = home / "file-transfer" / "outbox" / manifest.transfer_id
+        late = transfer_dir / "chunk-0120.enc"
+        stash = late.read_bytes()
+        late.unlink()
+
+        with pytest.raises(FileNotFoundError, match="Missing chunk 120"):
+            ft.receive(manifest.transfer_id)
+        assert 0 < len(ft.resume_receive(manifest.transfer_id)) == 1
+
+        late.write_bytes(stash)
+        real = FileTransfer._decrypt_chunk
+        decrypted = []
+
+        def counting(self, data, key):
+            decrypted.append(1)
+            return real(self, data, key)
+
+        monkeypatch.setattr(FileTransfer, "_decrypt_chunk", counting)
+        output = ft.receive(manifest.transfer_id)
+
+        assert output.read_bytes() == big_file.read_bytes()
+        assert len(decrypted) < 150
+        assert not (transfer_dir / f".{big_file.name}.part").exists()
+
+    def test_receive_refuses_unfinished_send(
+        self,
+        ft: FileTransfer,
+        big_file: Path,
+        home: Path,
+        monkeypatch,
+    ) -> None:
+        """A manifest without a whole-file hash is not received."""
+
+        def boom(self, data, key):
+            raise OSError("interrupted")
+
+        monkeypatch.setattr(FileTransfer, "_encrypt_chunk", boom)
+        with pytest.raises(OSError):
+            ft.send(big_file, recipient="lumina")
+        (transfer_dir,) = (home / "file-transfer" / "outbox").iterdir()
+
+        with pytest.raises(ValueError, match="incomplete"):
+            ft.receive(transfer_dir.name)
+
+
+# ---------------------------------------------------------------------------
+# Content-defined chunking and per-recipient dedup
+# ---------------------------------------------------------------------------
+
+
+def _random_bytes(n: int, seed: int) -> bytes:
+    import random
+
+    return random.Random(seed).randbytes(n)
+
+
+class TestContentDefinedChunking:
+    """Tests for chunking="cdc" and chunk references."""
+
+    def test_boundaries_survive_an_insert(self) -> None:
+        """Inserting bytes near the start only changes nearby chunks."""
+        import io
+
+        from skcapstone.file_transfer import iter_cdc_chunks
+
+        v1 = _random_bytes(200_000, 1)
+        v2 = v1[:500] + b"inserted!" + v1[500:]
+        c1 = list(iter_cdc_chunks(io.BytesIO(v1), 1024))
+        c2 = list(iter_cdc_chunks(io.BytesIO(v2), 1024))
+
+        assert b"".join(c1) == v1
+        assert all(256 <= len(c) <= 4096 for c in c1[:-1])
+        assert len(set(c1) & set(c2)) >= len(c1) - 3
+
+    def test_cdc_roundtrip(self, ft: FileTransfer, tmp_path: Path) -> None:
+        """A cdc transfer reassembles the original file."""
+        src = tmp_path / "data.bin"
+        src.write_bytes(_random_bytes(50_000, 2))
+        manifest = ft.send(src, recipient="lumina", chunking="cdc")
+        assert manifest.chunking == "cdc"
+        assert manifest.total_chunks == len(manifest.chunks) > 1
+        assert sum(c.size for c in manifest.chunks) == src.stat().st_size
+        assert ft.receive(manifest.transfer_id).read_bytes() == src.read_bytes()
+
+    def test_second_version_sends_only_new_chunks(
+        self,
+        ft: FileTransfer,
+        home: Path,
+        tmp_path: Path,
+    ) -> None:
+        """Chunks the recipient already has are referenced, not re-written."""
+        src = tmp_path / "model.bin"
+        v1 = _random_bytes(100_000, 3)
+        src.write_bytes(v1)
+        first = ft.send(src, recipient="lumina", chunking="cdc")
+        ft.receive(first.transfer_id)
+        assert ft.acknowledge(first.transfer_id)
+        ft.cleanup(first.transfer_id)
+
+        src.write_bytes(v1[:40_000] + b"patched" + v1[40_000:])
+        second = ft.send(src, recipient="lumina", chunking="cdc")
+
+        outbox = home / "file-transfer" / "outbox" / second.transfer_id
+        written = sum(p.stat().st_size for p in outbox.glob("chunk-*.enc"))
+        stored = [c for c in second.chunks if c.stored]
+        assert 0 < len(stored) <= 3
+        assert written < 0.2 * src.stat().st_size
+        assert ft.resume_receive(second.transfer_id) == []
+        assert ft.receive(second.transfer_id).read_bytes() == src.read_bytes()
+
+    def test_dedup_is_per_recipient(self, ft: FileTransfer, tmp_path: Path) -> None:
+        """Another recipient gets every chunk."""
+        src = tmp_path / "model.bin"
+        src.write_bytes(_random_bytes(30_000, 4))
+        ft.send(src, recipient="lumina", chunking="cdc")
+        other = ft.send(src, recipient="jarvis", chunking="cdc")
+        assert all(c.stored for c in other.chunks)
+
+    def test_unacknowledged_chunks_are_sent_again(
+        self,
+        ft: FileTransfer,
+        tmp_path: Path,
+    ) -> None:
+        """Chunks of a transfer the recipient never confirmed are not referenced."""
+        src = tmp_path / "model.bin"
+        src.write_bytes(_random_bytes(30_000, 5))
+        ft.send(src, recipient="lumina", chunking="cdc")  # never received
+        again = ft.send(src, recipient="lumina", chunking="cdc")
+
+        assert all(c.stored for c in again.chunks)
+        assert ft.receive(again.transfer_id).read_bytes() == src.read_bytes()
+
+    def test_missing_references_are_resent(
+        self,
+        ft: FileTransfer,
+        home: Path,
+        tmp_path: Path,
+    ) -> None:
+        """A chunk the receiver lost is reported, re-sent and no longer referenced."""
+        src = tmp_path / "model.bin"
+        src.write_bytes(_random_bytes(30_000, 7))
+        first = ft.send(src, recipient="lumina", chunking="cdc")
+        ft.receive(first.transfer_id)
+        ft.acknowledge(first.transfer_id)
+        ft.cleanup(first.transfer_id)
+        shutil.rmtree(home / "file-transfer" / "chunk-store")
+
+        again = ft.send(src, recipient="lumina", chunking="cdc")
+        missing = ft.resume_receive(again.transfer_id)
+        assert missing == [c.index for c in again.chunks if not c.stored] != []
+        with pytest.raises(FileNotFoundError, match="Missing chunk"):
+            ft.receive(again.transfer_id)
+
+        assert ft.resend_chunks(again.transfer_id, src, missing) == len(missing)
+        assert ft.resume_receive(again.transfer_id) == []
+        assert ft.receive(again.transfer_id).read_bytes() == src.read_bytes()
+        third = ft.send(src, recipient="lumina", chunking="cdc")
+        assert {c.index for c in third.chunks if c.stored} >= set(missing)
+
+    def test_chunk_store_is_bounded(self, home: Path, tmp_path: Path) -> None:
+        """Received chunks past the bound are pruned, oldest first."""
+        ft = FileTransfer(home, agent_name="opus", chunk_size=4096, chunk_store_max_bytes=20_000)
+        ft.initialize()
+        src = tmp_path / "model.bin"
+        for seed in (8, 9):
+            src.write_bytes(_random_bytes(30_000, seed))
+            ft.receive(ft.send(src, recipient="lumina", chunking="cdc").transfer_id)
+
+        store = home / "file-transfer" / "chunk-store" / "opus"
+        assert 0 < sum(p.stat().st_size for p in store.iterdir()) <= 20_000
+
+    def test_interrupted_cdc_send_resumes(
+        self,
+        ft: FileTransfer,
+        home: Path,
+        tmp_path: Path,
+        monkeypatch,
+    ) -> None:
+        """A cdc send restarts at the last committed boundary."""
+        src = tmp_path / "model.bin"
+        src.write_bytes(_random_bytes(200_000, 6))
+        real = FileTransfer._encrypt_chunk
+        calls = {"n": 0}
+
+        def flaky(self, data, key):
+            calls["n"] += 1
+            if calls["n"] == 90:
+                raise OSError("disk full")
+            return real(self, data, key)
+
+        monkeypatch.setattr(FileTransfer, "_encrypt_chunk", flaky)
+        with pytest.raises(OSError):
+            ft.send(src, recipient="lumina", chunking="cdc")
+        (transfer_dir,) = (home / "file-transfer" / "outbox").iterdir()
+
+        monkeypatch.setattr(FileTransfer, "_encrypt_chunk", real)
+        manifest = ft.send(src, recipient="lumina", transfer_id=transfer_dir.name)
+
+        assert manifest.chunking == "cdc"
+        assert ft.receive(manifest.transfer_id).read_bytes() == src.read_bytes()
+
+    def test_unknown_chunking_rejected(self, ft: FileTransfer, sample_file: Path) -> None:
+        with pytest.raises(ValueError, match="chunking"):
+            ft.send(sample_file, recipient="lumina", chunking="rabin")
+
+
 # ---------------------------------------------------------------------------
 # Model tests
 # ---------------------------------------------------------------------------
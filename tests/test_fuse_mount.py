@@ -17,6 +17,7 @@ from unittest.mock import patch
 
 import pytest
 
+from skcapstone import fuse_mount
 from skcapstone.fuse_mount import (
     FUSEDaemon,
     SovereignFS,
@@ -24,6 +25,7 @@ from skcapstone.fuse_mount import (
     _build_identity_card,
     _dir_stat,
     _file_stat,
+    _FSCache,
     _list_coordination_tasks,
     _list_documents,
     _list_inbox,
@@ -721,6 +723,151 @@ class TestSovereignFS:
         assert sovereign_fs.utimens("/inbox") == 0
 
 
+# ---------------------------------------------------------------------------
+# TestSovereignFSCache
+# ---------------------------------------------------------------------------
+
+
+def _backdate(path: Path, seconds: int = 10) -> None:
+    """Move *path*'s mtime out of the cache's racy window."""
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns - seconds * 1_000_000_000))
+
+
+class TestSovereignFSCache:
+    """Content, attribute and listing caching, with and without inotify."""
+
+    @pytest.fixture(params=["inotify", "stat"])
+    def cached_fs(self, request, agent_home: Path, memory_dir: Path, monkeypatch):
+        """A caching SovereignFS using either invalidation strategy."""
+        if request.param == "stat":
+
+            def unavailable():
+                raise OSError("inotify disabled for this test")
+
+            monkeypatch.setattr(fuse_mount, "Inotify", unavailable)
+        fs = SovereignFS(agent_home=agent_home)
+        if request.param == "inotify" and not fs._cache.inotify:
+            pytest.skip("inotify unavailable")
+        yield fs
+        fs.destroy("/")
+
+    def _write(self, memory_dir: Path, memory: Dict[str, Any], mid: str = "abc123") -> Path:
+        path = memory_dir / "short-term" / f"{mid}.json"
+        path.write_text(json.dumps(memory), encoding="utf-8")
+        _backdate(path)
+        return path
+
+    def test_stat_storm_renders_once(
+        self, cached_fs: SovereignFS, memory_dir: Path, sample_memory: Dict[str, Any]
+    ) -> None:
+        """Repeated getattr and read of a memory parse and render it once."""
+        self._write(memory_dir, sample_memory)
+        with patch(
+            "skcapstone.fuse_mount._load_memory_file", wraps=fuse_mount._load_memory_file
+        ) as load:
+            sizes = {cached_fs.getattr("/memories/short/abc123.md")["st_size"] for _ in range(5)}
+            content = cached_fs.read("/memories/short/abc123.md", size=99999, offset=0, fh=0)
+        assert load.call_count == 1
+        assert sizes == {len(content)}
+        assert cached_fs.cache_stats["hits"] >= 5
+
+    def test_getattr_reports_source_mtime(
+        self, cached_fs: SovereignFS, memory_dir: Path, sample_memory: Dict[str, Any]
+    ) -> None:
+        """A cached memory's mtime is its JSON file's, not the time of the stat."""
+        path = self._write(memory_dir, sample_memory)
+        attrs = cached_fs.getattr("/memories/short/abc123.md")
+        assert attrs["st_mtime"] == pytest.approx(path.stat().st_mtime)
+
+    def test_rewrite_is_seen(
+        self, cached_fs: SovereignFS, memory_dir: Path, sample_memory: Dict[str, Any]
+    ) -> None:
+        """An in-place rewrite invalidates content and size."""
+        self._write(memory_dir, sample_memory)
+        before = cached_fs.getattr("/memories/short/abc123.md")["st_size"]
+        self._write(memory_dir, {**sample_memory, "content": "A much longer memory " * 10})
+        after = cached_fs.getattr("/memories/short/abc123.md")["st_size"]
+        content = cached_fs.read("/memories/short/abc123.md", size=99999, offset=0, fh=0)
+        assert after > before
+        assert len(content) == after
+        assert b"A much longer memory" in content
+
+    def test_listing_follows_creates_and_deletes(
+        self, cached_fs: SovereignFS, memory_dir: Path, sample_memory: Dict[str, Any]
+    ) -> None:
+        """Cached readdir picks up new and removed memories."""
+        path = self._write(memory_dir, sample_memory)
+        _backdate(memory_dir / "short-term")
+        assert "abc123.md" in cached_fs.readdir("/memories/short", fh=0)
+        self._write(memory_dir, sample_memory, mid="def456")
+        path.unlink()
+        entries = cached_fs.readdir("/memories/short", fh=0)
+        assert "def456.md" in entries and "abc123.md" not in entries
+        with pytest.raises(OSError) as exc_info:
+            cached_fs.getattr("/memories/short/abc123.md")
+        assert exc_info.value.errno == errno.ENOENT
+
+    def test_directory_created_after_mount(self, cached_fs: SovereignFS, agent_home: Path) -> None:
+        """A source directory that appears later is listed."""
+        assert cached_fs.readdir("/inbox", fh=0) == [".", ".."]
+        inbox = agent_home / "comms" / "inbox"
+        inbox.mkdir(parents=True)
+        (inbox / "msg.json").write_text("{}")
+        _backdate(inbox)
+        with patch.object(fuse_mount, "_ATTACH_INTERVAL_S", 0.0):
+            cached_fs._cache._next_attach = 0.0
+            assert "msg.json" in cached_fs.readdir("/inbox", fh=0)
+
+    def test_cache_can_be_disabled(
+        self, agent_home: Path, memory_dir: Path, sample_memory: Dict[str, Any]
+    ) -> None:
+        """cache=False renders on every call, as before."""
+        self._write(memory_dir, sample_memory)
+        fs = SovereignFS(agent_home=agent_home, cache=False)
+        with patch(
+            "skcapstone.fuse_mount._load_memory_file", wraps=fuse_mount._load_memory_file
+        ) as load:
+            fs.getattr("/memories/short/abc123.md")
+            fs.getattr("/memories/short/abc123.md")
+        assert load.call_count == 2
+        assert fs.cache_stats is None
+
+    def test_content_is_bounded_by_bytes(self, tmp_path: Path) -> None:
+        """The least recently used contents are evicted past max_bytes."""
+        cache = _FSCache((tmp_path,), use_inotify=False, max_bytes=10)
+        for name in ("a", "b", "c"):
+            src = tmp_path / name
+            src.write_text(name)
+            _backdate(src)
+            cache.put("content", name, (src,), cache.signature((src,)), b"x" * 4)
+        assert cache.get("content", "a") is None
+        assert cache.get("content", "b") == b"xxxx"
+        assert cache.get("content", "c") == b"xxxx"
+
+    def test_racy_sources_are_not_cached_without_inotify(self, tmp_path: Path) -> None:
+        """A source written within the racy window is re-read next time."""
+        cache = _FSCache((tmp_path,), use_inotify=False)
+        src = tmp_path / "fresh"
+        src.write_text("new")
+        cache.put("content", "fresh", (src,), cache.signature((src,)), b"new")
+        assert cache.get("content", "fresh") is None
+
+    def test_mount_passes_cache_timeouts(self, tmp_path: Path) -> None:
+        """The foreground mount tunes the kernel entry and attribute caches."""
+        calls: list = []
+        fake = type("fuse", (), {})()
+        fake.FUSE = lambda *a, **kw: calls.append(kw)
+        daemon = FUSEDaemon(mount_point=tmp_path / "mnt", agent_home=tmp_path / "home")
+        with (
+            patch.dict("sys.modules", {"fuse": fake}),
+            patch.object(daemon, "_is_mounted", return_value=False),
+        ):
+            assert daemon.start(foreground=True) is True
+        assert calls[0]["entry_timeout"] == fuse_mount.ENTRY_TIMEOUT_S
+        assert calls[0]["attr_timeout"] == fuse_mount.ATTR_TIMEOUT_S
+
+
 # ---------------------------------------------------------------------------
 # TestFUSEDaemon
 # ---------------------------------------------------------------------------
@@ -7,6 +7,8 @@ destination is written.
 
 from __future__ import annotations
 
+import os
+import time
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
@@ -17,6 +19,7 @@ from skcapstone.gfs_backup import (
     check_backup_health,
     discover_artifacts,
     parse_backup_timestamp,
+    protect_referenced,
     prune_artifacts,
     resolve_config,
     run_backup_job,
@@ -348,6 +351,79 @@ def test_run_backup_job_min_interval_skips_create(tmp_path):
     assert len(list(backup_dir.glob("backup-*.tar.gz"))) == 1
 
 
+# ---------------------------------------------------------------------------
+# Deduplicated runs
+# ---------------------------------------------------------------------------
+
+
+def _age_home(home: Path) -> None:
+    """Backdate every file in *home* past the dedup racy-mtime window."""
+    then = time.time() - 60
+    for root, _, names in os.walk(home):
+        for name in names:
+            os.utime(Path(root) / name, (then, then))
+
+
+def test_run_backup_job_dedup_references_previous_artifact(tmp_path):
+    home = _setup_fake_home(tmp_path)
+    _age_home(home)
+    backup_dir = tmp_path / "dest"
+    cfg = _config_for(backup_dir)
+    cfg.dedup = True
+
+    first = run_backup_job(home=home, config=cfg)
+    second = run_backup_job(home=home, config=cfg)
+
+    assert first["base_backup"] is None
+    assert second["base_backup"] == first["backup_id"]
+    assert second["referenced"] == 3
+
+
+def test_run_backup_job_dedup_starts_month_with_full_backup(tmp_path):
+    home = _setup_fake_home(tmp_path)
+    _age_home(home)
+    backup_dir = tmp_path / "dest"
+    cfg = _config_for(backup_dir)
+    cfg.dedup = True
+    first = run_backup_job(home=home, config=cfg)
+
+    next_month = datetime.now(UTC) + timedelta(days=32)
+    result = run_backup_job(home=home, config=cfg, now=next_month)
+
+    assert first["created"] and result["created"]
+    assert result["base_backup"] is None
+    assert result["referenced"] == 0
+
+
+def test_protect_referenced_keeps_base_of_kept_artifact(tmp_path):
+    home = _setup_fake_home(tmp_path)
+    _age_home(home)
+    backup_dir = tmp_path / "dest"
+    cfg = _config_for(backup_dir)
+    cfg.dedup = True
+    run_backup_job(home=home, config=cfg)
+    run_backup_job(home=home, config=cfg)
+    newest, base = discover_artifacts(backup_dir)
+
+    keep, prune = protect_referenced([newest], [base])
+
+    assert keep == [newest, base]
+    assert prune == []
+
+
+def test_prune_removes_manifest_copy(tmp_path):
+    home = _setup_fake_home(tmp_path)
+    backup_dir = tmp_path / "dest"
+    run_backup_job(home=home, config=_config_for(backup_dir))
+    (art,) = discover_artifacts(backup_dir)
+    manifest = backup_dir / art.path.name.replace(".tar.gz", ".manifest.json")
+    assert manifest.exists()
+
+    prune_artifacts([art], backup_dir)
+
+    assert list(backup_dir.glob("backup-*")) == []
+
+
 # ---------------------------------------------------------------------------
 # Config resolution
 # ---------------------------------------------------------------------------
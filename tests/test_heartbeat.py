@@ -3,17 +3,21 @@
 from __future__ import annotations
 
 import json
+import os
+import time
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 import pytest
 
+from skcapstone import heartbeat as heartbeat_mod
 from skcapstone.heartbeat import (
     AgentCapability,
     Heartbeat,
     HeartbeatBeacon,
     NodeCapacity,
     PeerInfo,
+    clear_peer_caches,
 )
 
 
@@ -308,6 +312,103 @@ class TestFindCapable:
         assert beacon.find_capable("nonexistent") == []
 
 
+# ---------------------------------------------------------------------------
+# Peer cache
+# ---------------------------------------------------------------------------
+
+
+def _backdate(home: Path, seconds: float = 10.0) -> None:
+    """Push heartbeat mtimes out of the racy window (distinct per call)."""
+    then = time.time() - seconds
+    for f in (home / "heartbeats").glob("*.json"):
+        os.utime(f, (then, then))
+
+
+class TestPeerCache:
+    """Tests for the cached, watch-driven discovery path."""
+
+    @pytest.fixture(autouse=True, params=["inotify", "stat"])
+    def mode(self, request, monkeypatch):
+        if request.param == "stat":
+
+            def unavailable():
+                raise OSError("inotify disabled for this test")
+
+            monkeypatch.setattr(heartbeat_mod, "Inotify", unavailable)
+        clear_peer_caches()
+        yield request.param
+        clear_peer_caches()
+
+    def _cache(self, home: Path):
+        return heartbeat_mod._peer_cache(home / "heartbeats")
+
+    def test_matches_uncached_discovery(self, beacon: HeartbeatBeacon, home: Path) -> None:
+        _write_peer_heartbeat(home, "lumina", capabilities=[{"name": "review"}])
+        _write_peer_heartbeat(home, "grok", age_seconds=600)
+        (home / "heartbeats" / "broken.json").write_text("{nope", encoding="utf-8")
+        uncached = HeartbeatBeacon(home, agent_name="opus", cache=False)
+        for include_self in (False, True):
+            got = beacon.discover_peers(include_self=include_self)
+            want = uncached.discover_peers(include_self=include_self)
+            assert [p.model_dump(exclude={"age_seconds"}) for p in got] == [
+                p.model_dump(exclude={"age_seconds"}) for p in want
+            ]
+
+    def test_unchanged_files_are_not_reparsed(self, beacon: HeartbeatBeacon, home: Path) -> None:
+        _write_peer_heartbeat(home, "lumina")
+        _write_peer_heartbeat(home, "grok")
+        _backdate(home)
+        beacon.discover_peers()
+        parsed = self._cache(home).stats["parsed"]
+        beacon.mesh_health()
+        beacon.find_capable("review")
+        HeartbeatBeacon(home, agent_name="grok").discover_peers()
+        assert self._cache(home).stats["parsed"] == parsed
+
+    def test_changes_are_picked_up(self, beacon: HeartbeatBeacon, home: Path) -> None:
+        _write_peer_heartbeat(home, "lumina", capabilities=[{"name": "review"}])
+        _backdate(home, 20)
+        assert [p.agent_name for p in beacon.find_capable("review")] == ["lumina"]
+        _write_peer_heartbeat(home, "lumina", capabilities=[{"name": "deploy"}])
+        _write_peer_heartbeat(home, "grok", capabilities=[{"name": "review"}])
+        _backdate(home, 10)
+        assert [p.agent_name for p in beacon.find_capable("review")] == ["grok"]
+        assert [p.agent_name for p in beacon.find_capable("deploy")] == ["lumina"]
+        (home / "heartbeats" / "grok.json").unlink()
+        assert beacon.find_capable("review") == []
+
+    def test_liveness_is_computed_at_read_time(self, beacon: HeartbeatBeacon, home: Path) -> None:
+        _write_peer_heartbeat(home, "lumina", ttl_seconds=300, age_seconds=299.7)
+        _backdate(home)
+        assert beacon.discover_peers()[0].alive
+        parsed = self._cache(home).stats["parsed"]
+        time.sleep(0.5)
+        (peer,) = beacon.discover_peers()
+        assert not peer.alive and peer.status == "offline"
+        assert self._cache(home).stats["parsed"] == parsed
+
+    def test_subscribe_reports_up_and_down(self, beacon: HeartbeatBeacon, home: Path) -> None:
+        _write_peer_heartbeat(home, "grok")
+        seen: list[tuple[str, str]] = []
+        unsubscribe = beacon.subscribe(lambda event, peer: seen.append((event, peer.agent_name)))
+        beacon.subscribe(lambda event, peer: 1 / 0)  # a failing subscriber is only logged
+        assert seen == []  # already-up peers are not announced
+
+        _write_peer_heartbeat(home, "lumina")
+        beacon.mesh_health()
+        assert seen == [("up", "lumina")]
+        _write_peer_heartbeat(home, "lumina", status="offline")
+        _write_peer_heartbeat(home, "grok", age_seconds=600)
+        _backdate(home)
+        beacon.discover_peers()
+        assert sorted(seen[1:]) == [("down", "grok"), ("down", "lumina")]
+
+        unsubscribe()
+        _write_peer_heartbeat(home, "lumina")
+        beacon.discover_peers()
+        assert len(seen) == 3
+
+
 # ---------------------------------------------------------------------------
 # Mark offline
 # ---------------------------------------------------------------------------
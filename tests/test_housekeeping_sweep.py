@@ -0,0 +1,127 @@
+"""Tests for the single-pass housekeeping sweep.
+
+``run_housekeeping`` used to size every target, then walk it again for the
+dry-run counts, then a third time in each ``prune_*``. The sweep lists every
+directory once, and with a state file skips directories that have not
+changed since the last run and hold nothing old enough to expire.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+from skcapstone import housekeeping
+from skcapstone.housekeeping import SCAN_STATE_RELPATH, run_housekeeping
+
+
+def _mk(directory: Path, name: str, age_hours: float, size: int = 2) -> Path:
+    directory.mkdir(parents=True, exist_ok=True)
+    f = directory / name
+    f.write_bytes(b"x" * size)
+    t = time.time() - age_hours * 3600
+    os.utime(f, (t, t))
+    return f
+
+
+def _settle(*dirs: Path) -> None:
+    """Backdate directory mtimes past the racy window so they can be trusted."""
+    t = time.time() - 60
+    for d in dirs:
+        os.utime(d, (t, t))
+
+
+@pytest.fixture
+def home(tmp_path: Path) -> Path:
+    home = tmp_path / ".skcapstone"
+    _mk(home / "skcomms" / "acks", "old.ack", 48, size=100)
+    _mk(home / "skcomms" / "acks", "new.ack", 1, size=7)
+    _mk(home / "sync" / "comms" / "inbox" / "peer", "old.skc.json", 200, size=300)
+    _mk(home / "agents" / "jarvis" / "comms" / "outbox", "flat.skc.json", 72, size=40)
+    _mk(home / "memory" / "short-term", "m1.json", 500)
+    return home
+
+
+@pytest.fixture
+def scandir_calls(monkeypatch) -> Counter:
+    calls: Counter = Counter()
+    real = os.scandir
+
+    def counting(path="."):
+        calls[os.fspath(path)] += 1
+        return real(path)
+
+    monkeypatch.setattr(housekeeping.os, "scandir", counting)
+    return calls
+
+
+def test_every_directory_is_listed_once(home, scandir_calls) -> None:
+    results = run_housekeeping(skcapstone_home=home, dry_run=True)
+
+    assert results["acks"]["would_delete"] == 1
+    assert results["inbox"]["would_delete"] == 1
+    assert results["comms_outbox_flat"]["would_delete"] == 1
+    assert scandir_calls, "sweep should use os.scandir"
+    assert max(scandir_calls.values()) == 1
+
+
+def test_reports_bytes_freed_per_target_and_scan_rate(home) -> None:
+    results = run_housekeeping(skcapstone_home=home)
+
+    assert results["acks"]["deleted"] == 1
+    assert results["acks"]["freed"] == 100
+    assert results["acks"]["size_before"] == 107
+    assert results["acks"]["size_after"] == 7
+    assert results["inbox"]["freed"] == 300
+    assert results["comms_outbox_flat"]["freed"] == 40
+    assert results["summary"]["total_freed_bytes"] == 440
+    assert results["scan"]["files_scanned"] >= 5
+    assert results["scan"]["files_per_second"] is None or results["scan"]["files_per_second"] > 0
+    assert (home / "skcomms" / "acks" / "new.ack").exists()
+
+
+def test_unchanged_directories_are_skipped_on_the_next_run(home, scandir_calls) -> None:
+    run_housekeeping(skcapstone_home=home)
+    assert (home / SCAN_STATE_RELPATH).is_file()
+    _settle(*[Path(p) for p, _, _ in os.walk(home)])
+    run_housekeeping(skcapstone_home=home)  # records the now-settled dirs
+
+    scandir_calls.clear()
+    results = run_housekeeping(skcapstone_home=home)
+
+    memory = os.fspath(home / "memory" / "short-term")
+    assert memory not in scandir_calls
+    assert results["scan"]["dirs_skipped"] > 0
+    # Sizes for skipped directories come from the recorded high-water mark.
+    assert results["acks"]["size_before"] == 7
+
+
+def test_changed_directory_is_listed_again(home) -> None:
+    run_housekeeping(skcapstone_home=home)
+    _settle(*[Path(p) for p, _, _ in os.walk(home)])
+    run_housekeeping(skcapstone_home=home)
+
+    _mk(home / "skcomms" / "acks", "late.ack", 30)
+    results = run_housekeeping(skcapstone_home=home)
+
+    assert results["acks"]["deleted"] == 1
+    assert not (home / "skcomms" / "acks" / "late.ack").exists()
+
+
+def test_expiring_file_is_pruned_even_if_directory_is_unchanged(home, monkeypatch) -> None:
+    run_housekeeping(skcapstone_home=home)
+    _settle(*[Path(p) for p, _, _ in os.walk(home)])
+    run_housekeeping(skcapstone_home=home)
+
+    # A day later new.ack (1h old) is past the 24h TTL. The directory mtime
+    # has not changed, so only the recorded deadline brings it back.
+    real_time = time.time
+    monkeypatch.setattr(housekeeping.time, "time", lambda: real_time() + 24 * 3600)
+    results = run_housekeeping(skcapstone_home=home)
+
+    assert results["acks"]["deleted"] == 1
+    assert not (home / "skcomms" / "acks" / "new.ack").exists()
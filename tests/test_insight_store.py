@@ -0,0 +1,99 @@
+"""InsightStore: LSH lookup, window, tail reads and compaction."""
+
+from __future__ import annotations
+
+import json
+import random
+from pathlib import Path
+
+import pytest
+
+from skcapstone import insight_store
+from skcapstone.insight_store import InsightStore
+from skcapstone.minhash import jaccard
+
+WORDS = [f"w{i:03d}" for i in range(400)]
+
+
+@pytest.fixture(autouse=True)
+def _fresh():
+    insight_store.clear_insight_stores()
+    yield
+    insight_store.clear_insight_stores()
+
+
+def _insight(rng: random.Random, n: int = 12) -> set[str]:
+    return set(rng.sample(WORDS, n))
+
+
+def _near(rng: random.Random, base: set[str], swap: int) -> set[str]:
+    out = set(base)
+    for word in rng.sample(sorted(base), swap):
+        out.discard(word)
+        out.add(rng.choice(WORDS))
+    return out
+
+
+def test_lsh_lookup_agrees_with_exact_scan(tmp_path: Path, monkeypatch) -> None:
+    rng = random.Random(7)
+    history = [_insight(rng) for _ in range(2000)]
+    store = InsightStore(tmp_path / "i.jsonl", lookback=1000, threshold=0.6)
+    for i in range(0, len(history), 4):
+        store.append([(f"insight {j}", history[j]) for j in range(i, i + 4)])
+    queries = [_near(rng, rng.choice(history), 1) for _ in range(100)]
+    queries += [_insight(rng) for _ in range(100)]
+
+    exact = []
+    for q in queries:
+        hit = store.match(q)
+        exact.append(hit is not None)
+        assert hit is None or jaccard(q, hit[0].keywords) >= 0.6
+    monkeypatch.setattr(insight_store, "EXACT_SCAN_MAX", 0)
+    store.stats["verified"] = 0
+    banded = [store.match(q) is not None for q in queries]
+
+    assert sum(exact) >= 100
+    assert banded == exact
+    assert store.stats["verified"] < len(queries) * 50  # vs 2000 per query scanned
+
+
+def test_window_counts_dreams_including_empty_ones(tmp_path: Path) -> None:
+    store = InsightStore(tmp_path / "i.jsonl", lookback=2, threshold=0.6)
+    store.append([("old granite", {"granite"})])
+    store.append([("new copper", {"copper"})])
+    assert store.match({"granite"}) is not None
+    store.append([])
+    assert store.match({"granite"}) is None
+    assert store.recent_texts() == ["new copper"]
+
+
+def test_other_process_appends_are_tail_read(tmp_path: Path) -> None:
+    path = tmp_path / "i.jsonl"
+    reader = InsightStore(path, lookback=10, threshold=0.6)
+    writer = InsightStore(path, lookback=10, threshold=0.6)
+    writer.append([("first", {"first"})])
+    reader.refresh()
+    writer.refresh()
+    writer.append([("second", {"second"})])
+    with open(path, "a", encoding="utf-8") as fh:
+        fh.write('{"dream": 3, "insi')  # a write in progress is not half-read
+    reader.refresh()
+    assert reader.recent_texts() == ["first", "second"]
+    assert reader.stats == {"loads": 1, "tail_reads": 1, "compactions": 0, "verified": 0}
+
+
+def test_compaction_keeps_the_window(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(insight_store, "_COMPACT_SLACK", 0)
+    path = tmp_path / "i.jsonl"
+    store = InsightStore(path, lookback=3, threshold=0.6)
+    for i in range(10):
+        store.append([(f"dream {i}", {f"k{i}"})] if i != 8 else [])
+    assert store.stats["compactions"] >= 1
+    lines = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert lines[0]["version"] == insight_store._STORE_VERSION
+    assert [line["dream"] for line in lines[1:]][-3:] == [8, 9, 10]
+
+    fresh = InsightStore(path, lookback=3, threshold=0.6)
+    fresh.refresh()
+    assert fresh.recent_texts() == store.recent_texts() == ["dream 7", "dream 9"]
+    assert fresh.match({"k9"})[0].dream == 10
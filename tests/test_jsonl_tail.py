@@ -0,0 +1,124 @@
+"""Tests for the tail-indexed JSONL readers."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from skcapstone import jsonl_tail
+from skcapstone.jsonl_tail import (
+    SparseIndex,
+    iter_lines_reversed,
+    read_since,
+    tail_records,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_indexes():
+    jsonl_tail.reset_indexes()
+    yield
+    jsonl_tail.reset_indexes()
+
+
+def _ts(i: int) -> str:
+    return f"2026-01-01T00:00:{i:06d}Z"
+
+
+def _write(path: Path, start: int, stop: int) -> None:
+    with open(path, "a", encoding="utf-8") as fh:
+        for i in range(start, stop):
+            fh.write(json.dumps({"ts": _ts(i), "i": i, "odd": i % 2 == 1}) + "\n")
+
+
+class TestIterLinesReversed:
+    def test_newest_first_across_chunk_boundaries(self, tmp_path: Path) -> None:
+        log = tmp_path / "log.jsonl"
+        _write(log, 0, 500)
+        got = [json.loads(line)["i"] for line in iter_lines_reversed(log, chunk_size=37)]
+        assert got == list(range(499, -1, -1))
+
+    def test_missing_file_and_blank_lines(self, tmp_path: Path) -> None:
+        assert list(iter_lines_reversed(tmp_path / "nope.jsonl")) == []
+        log = tmp_path / "log.jsonl"
+        log.write_text("a\n\n  \nb", encoding="utf-8")
+        assert list(iter_lines_reversed(log)) == ["b", "a"]
+
+
+class TestTailRecords:
+    def test_limit_predicate_and_bad_lines(self, tmp_path: Path) -> None:
+        log = tmp_path / "log.jsonl"
+        _write(log, 0, 10)
+        with open(log, "a", encoding="utf-8") as fh:
+            fh.write("{not json\n")
+        got = tail_records(log, 3, predicate=lambda r: r["odd"])
+        assert [r["i"] for r in got] == [9, 7, 5]
+
+    def test_segments_and_since(self, tmp_path: Path) -> None:
+        old, live = tmp_path / "events.jsonl.1", tmp_path / "events.jsonl"
+        _write(old, 0, 5)
+        _write(live, 5, 8)
+        assert [r["i"] for r in tail_records((old, live), 5)] == [7, 6, 5, 4, 3]
+        got = tail_records((old, live), 100, since=_ts(4))
+        assert [r["i"] for r in got] == [7, 6, 5, 4]
+
+    def test_zero_limit(self, tmp_path: Path) -> None:
+        log = tmp_path / "log.jsonl"
+        _write(log, 0, 3)
+        assert tail_records(log, 0) == []
+
+
+class TestSparseIndex:
+    def test_incremental_refresh_and_bisect(self, tmp_path: Path) -> None:
+        log = tmp_path / "log.jsonl"
+        _write(log, 0, 100)
+        idx = SparseIndex(log, stride=10)
+        idx.refresh()
+        assert idx.lines == 100
+        _write(log, 100, 130)
+        idx.refresh()
+        assert idx.lines == 130
+        offset = idx.offset_for(_ts(57))
+        first = json.loads(next(idx.iter_from(offset)))
+        assert first["i"] == 50
+
+    def test_partial_trailing_line_not_indexed(self, tmp_path: Path) -> None:
+        log = tmp_path / "log.jsonl"
+        _write(log, 0, 3)
+        with open(log, "a", encoding="utf-8") as fh:
+            fh.write('{"ts": "2026')
+        idx = SparseIndex(log, stride=1)
+        idx.refresh()
+        assert idx.lines == 3
+        assert len(list(idx.iter_from(0))) == 3
+
+    def test_replaced_file_is_reindexed(self, tmp_path: Path) -> None:
+        log = tmp_path / "log.jsonl"
+        _write(log, 0, 50)
+        idx = SparseIndex(log, stride=8)
+        idx.refresh()
+        fresh = tmp_path / "fresh.jsonl"
+        _write(fresh, 200, 205)
+        os.replace(fresh, log)
+        idx.refresh()
+        assert idx.lines == 5
+
+
+class TestReadSince:
+    def test_oldest_first_with_filter_and_limit(self, tmp_path: Path) -> None:
+        log = tmp_path / "log.jsonl"
+        _write(log, 0, 5000)
+        got = read_since(log, _ts(4990))
+        assert [r["i"] for r in got] == list(range(4990, 5000))
+        got = read_since(log, _ts(4990), predicate=lambda r: r["odd"], limit=2)
+        assert [r["i"] for r in got] == [4997, 4999]
+
+    def test_sees_appends_after_first_read(self, tmp_path: Path) -> None:
+        log = tmp_path / "log.jsonl"
+        _write(log, 0, 10)
+        assert len(read_since(log, _ts(5))) == 5
+        _write(log, 10, 12)
+        assert [r["i"] for r in read_since(log, _ts(9))] == [9, 10, 11]
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import json
 import os
+import time
 from pathlib import Path
 
 import pytest
@@ -23,6 +24,7 @@ from skcapstone.kms import (
     _encrypt_at_rest,
     _key_fingerprint,
     _key_id,
+    _KeyMaterialCache,
 )
 
 
@@ -453,6 +455,109 @@ class TestBackendIntegration:
         assert len(raw_dek) == 32
 
 
+# ---------------------------------------------------------------------------
+# Cache tests
+# ---------------------------------------------------------------------------
+
+
+def _count_calls(monkeypatch: pytest.MonkeyPatch, name: str) -> list[int]:
+    """Count calls to a KeyStore method while keeping its behaviour."""
+    calls: list[int] = []
+    original = getattr(KeyStore, name)
+
+    def counted(self, *args, **kwargs):
+        calls.append(1)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(KeyStore, name, counted)
+    return calls
+
+
+def _settle(home: Path) -> None:
+    """Backdate keystore.json past the racy-mtime window."""
+    then = time.time() - 60
+    os.utime(home / "security" / "kms" / "keystore.json", (then, then))
+
+
+class TestCaching:
+    """Tests for the process-wide record and key material caches."""
+
+    def test_records_parsed_once_across_instances(
+        self, store: KeyStore, home: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Fresh KeyStore instances share one parse of keystore.json."""
+        key = store.derive_service_key("hot-path")
+        _settle(home)
+        reads = _count_calls(monkeypatch, "_read_records")
+        for _ in range(5):
+            fresh = KeyStore(home)
+            fresh.derive_service_key("hot-path")
+            fresh.get_key_material(key.key_id)
+        assert len(reads) == 1
+
+    def test_external_write_invalidates_records(self, store: KeyStore, home: Path) -> None:
+        """A keystore rewritten by another process is re-read."""
+        key = store.derive_service_key("shared")
+        _settle(home)
+        store.get_key_material(key.key_id)
+
+        keystore = home / "security" / "kms" / "keystore.json"
+        records = json.loads(keystore.read_text(encoding="utf-8"))
+        for r in records:
+            if r["key_id"] == key.key_id:
+                r["status"] = "revoked"
+        keystore.write_text(json.dumps(records), encoding="utf-8")
+        _settle(home)
+        with pytest.raises(ValueError, match="revoked"):
+            store.get_key_material(key.key_id)
+
+    def test_material_unwrapped_once(
+        self, store: KeyStore, home: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Key material is decrypted from disk once, then served from cache."""
+        key = store.derive_service_key("unwrap")
+        _settle(home)
+        loads = _count_calls(monkeypatch, "_load_key_material")
+        first = KeyStore(home).get_key_material(key.key_id)
+        second = KeyStore(home).get_key_material(key.key_id)
+        assert first == second
+        assert len(loads) == 1
+
+    def test_cached_records_are_not_shared_with_callers(self, store: KeyStore) -> None:
+        """Mutating a returned record does not leak into the cache."""
+        key = store.create_team_key("isolated", members=["opus"])
+        key.members.append("mallory")
+        assert store.get_key("isolated").members == ["opus"]
+
+    def test_material_cache_ttl_and_bound(self) -> None:
+        """Entries expire after the TTL and the LRU holds at most maxsize."""
+        cache = _KeyMaterialCache(maxsize=2, ttl=60)
+        cache.put(("s", "a", "f"), b"A" * 32)
+        cache.put(("s", "b", "f"), b"B" * 32)
+        cache.get(("s", "a", "f"))
+        cache.put(("s", "c", "f"), b"C" * 32)
+        assert cache.get(("s", "b", "f")) is None
+        assert cache.get(("s", "a", "f")) == b"A" * 32
+        assert len(cache) == 2
+
+        expired = _KeyMaterialCache(maxsize=2, ttl=0)
+        expired.put(("s", "a", "f"), b"A" * 32)
+        assert expired.get(("s", "a", "f")) is None
+        assert bytes(expired._arena) == bytes(len(expired._arena))
+
+    def test_uncached_store_reads_disk(
+        self, store: KeyStore, home: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """cache=False keeps the read-through behaviour."""
+        key = store.derive_service_key("no-cache")
+        _settle(home)
+        uncached = KeyStore(home, cache=False)
+        loads = _count_calls(monkeypatch, "_load_key_material")
+        uncached.get_key_material(key.key_id)
+        uncached.get_key_material(key.key_id)
+        assert len(loads) == 2
+
+
 # ---------------------------------------------------------------------------
 # Model tests
 # ---------------------------------------------------------------------------
@@ -0,0 +1,192 @@
+"""Tests for the shared log tailer behind the /api/v1/logs WebSocket."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from skcapstone import log_tailer
+from skcapstone.log_tailer import LineFilter, LogBatch, LogTailer, ws_messages
+
+
+@pytest.fixture(autouse=True)
+def _fast_poll(monkeypatch):
+    monkeypatch.setattr(log_tailer, "POLL_INTERVAL", 0.02)
+
+
+def _rec(level: str, name: str, msg: str) -> str:
+    return json.dumps({"ts": "t", "level": level, "logger": name, "msg": msg})
+
+
+def _append(path: Path, *lines: str) -> None:
+    with open(path, "a", encoding="utf-8") as fh:
+        fh.write("".join(line + "\n" for line in lines))
+
+
+def _collect(sub, count: int, timeout: float = 3.0) -> list[str]:
+    got: list[str] = []
+    deadline = time.monotonic() + timeout
+    while len(got) < count and time.monotonic() < deadline:
+        batch = sub.get(timeout=0.1)
+        if batch is not None:
+            got.extend(batch.lines)
+    return got
+
+
+class TestLineFilter:
+    def test_from_params(self) -> None:
+        assert LineFilter.from_params(None, "") is None
+        flt = LineFilter.from_params("warning", "skcapstone.daemon, skcomms")
+        assert flt == LineFilter(logging.WARNING, ("skcapstone.daemon", "skcomms"))
+        with pytest.raises(ValueError):
+            LineFilter.from_params("LOUD")
+
+    def test_matches_prefix_and_level(self) -> None:
+        flt = LineFilter(logging.WARNING, ("skcapstone.daemon",))
+        assert flt.matches("ERROR", "skcapstone.daemon.api")
+        assert not flt.matches("INFO", "skcapstone.daemon")
+        assert not flt.matches("ERROR", "skcapstone.daemonic")
+        assert flt.matches(None, None)
+
+
+class TestLogTailer:
+    def test_one_read_fans_out_to_all_subscribers(self, tmp_path: Path) -> None:
+        log = tmp_path / "daemon.log"
+        _append(log, "old line")
+        tailer = LogTailer(log)
+        subs = [tailer.subscribe() for _ in range(5)]
+        time.sleep(0.1)
+        _append(log, "a", "b")
+        for sub in subs:
+            assert _collect(sub, 2) == ["a", "b"]
+        assert tailer.reads == 1
+        for sub in subs:
+            sub.close()
+
+    def test_server_side_filter(self, tmp_path: Path) -> None:
+        log = tmp_path / "daemon.log"
+        log.touch()
+        tailer = LogTailer(log)
+        with tailer.subscribe(LineFilter(logging.WARNING)) as sub:
+            time.sleep(0.1)
+            _append(log, _rec("INFO", "x", "quiet"), _rec("ERROR", "x", "loud"))
+            got = _collect(sub, 1)
+        assert [json.loads(line)["msg"] for line in got] == ["loud"]
+
+    def test_rotation_drains_old_file_then_follows_new(self, tmp_path: Path) -> None:
+        log = tmp_path / "daemon.log"
+        log.touch()
+        tailer = LogTailer(log)
+        with tailer.subscribe() as sub:
+            time.sleep(0.1)
+            _append(log, "before")
+            os.replace(log, tmp_path / "daemon.log.1")
+            _append(log, "after")
+            assert _collect(sub, 2) == ["before", "after"]
+
+    def test_partial_line_waits_for_newline(self, tmp_path: Path) -> None:
+        log = tmp_path / "daemon.log"
+        log.touch()
+        tailer = LogTailer(log)
+        with tailer.subscribe() as sub:
+            time.sleep(0.1)
+            with open(log, "a", encoding="utf-8") as fh:
+                fh.write("hal")
+            assert sub.get(timeout=0.2) is None
+            _append(log, "f")
+            assert _collect(sub, 1) == ["half"]
+
+    def test_slow_consumer_drops_and_is_told(self, tmp_path: Path) -> None:
+        log = tmp_path / "daemon.log"
+        log.touch()
+        tailer = LogTailer(log)
+        fast = tailer.subscribe()
+        slow = tailer.subscribe(maxsize=1)
+        time.sleep(0.1)
+        for i in range(3):
+            _append(log, f"l{i}")
+            assert _collect(fast, 1) == [f"l{i}"]
+        assert slow.get(timeout=1).lines == ["l0"]
+        assert slow.dropped_total == 2
+        _append(log, "l3")
+        batch = slow.get(timeout=1)
+        assert batch.lines == ["l3"] and batch.dropped == 2
+        fast.close()
+        slow.close()
+
+    def test_recent_and_thread_lifecycle(self, tmp_path: Path) -> None:
+        log = tmp_path / "daemon.log"
+        _append(log, *[f"l{i}" for i in range(10)])
+        tailer = LogTailer(log)
+        assert tailer.recent(3) == ["l7", "l8", "l9"]
+        sub = tailer.subscribe()
+        thread = tailer._thread
+        sub.close()
+        thread.join(timeout=2)
+        assert not thread.is_alive()
+
+    def test_restart_resumes_from_last_emitted_line(self, tmp_path: Path) -> None:
+        log = tmp_path / "daemon.log"
+        log.touch()
+        tailer = LogTailer(log)
+        sub = tailer.subscribe()
+        time.sleep(0.1)
+        _append(log, "one")
+        assert _collect(sub, 1) == ["one"]
+
+        # Park the old thread inside a read while a new thread takes over,
+        # then append a line both of them could read.
+        old = tailer._thread
+        parked = threading.Event()
+        release = threading.Event()
+        real_read = tailer._read
+
+        def read(cursor) -> None:
+            if threading.current_thread() is old:
+                parked.set()
+                release.wait(3)
+            real_read(cursor)
+
+        with patch.object(tailer, "_read", read):
+            tailer._wake.set()
+            assert parked.wait(3)
+            sub.close()
+            sub = tailer.subscribe()
+            time.sleep(0.1)
+            _append(log, "two")
+            release.set()
+            assert _collect(sub, 2, timeout=1.0) == ["two"]
+        sub.close()
+
+    def test_async_subscription(self, tmp_path: Path) -> None:
+        log = tmp_path / "daemon.log"
+        log.touch()
+        tailer = LogTailer(log)
+
+        async def main() -> list[str]:
+            sub = tailer.subscribe(loop=asyncio.get_running_loop())
+            await asyncio.sleep(0.1)
+            _append(log, "async line")
+            batch = await sub.get(timeout=3)
+            sub.close()
+            return batch.lines
+
+        assert asyncio.run(main()) == ["async line"]
+
+
+def test_ws_messages() -> None:
+    batch = LogBatch(["a", "b"], dropped=4)
+    assert ws_messages(batch) == [
+        {"type": "dropped", "count": 4},
+        {"type": "line", "line": "a"},
+        {"type": "line", "line": "b"},
+    ]
+    assert ws_messages(LogBatch(["a"]), batched=True) == [{"type": "lines", "lines": ["a"]}]
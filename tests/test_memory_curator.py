@@ -166,6 +166,22 @@ class TestCuratorDedupe:
 
         assert len(result.deduped) == 0
 
+    def test_reworded_duplicate_is_merged(self, curator_home: Path):
+        """Near-identical wording is deduplicated into the kept memory."""
+        text = (
+            "The sovereign relay moved to the new syncthing node after the old disk "
+            "failed and every peer verified its identity before rejoining the mesh"
+        )
+        store(curator_home, text, tags=["infra"], importance=0.8)
+        store(curator_home, text.replace("mesh", "board"), tags=["sync"], importance=0.3)
+
+        result = MemoryCurator(curator_home).curate(auto_tag=False, promote=False)
+
+        assert len(result.deduped) == 1
+        (kept,) = list_memories(curator_home)
+        assert kept.importance == 0.8
+        assert set(kept.tags) >= {"infra", "sync"}
+
 
 class TestCuratorStats:
     """Tests for get_stats()."""
@@ -0,0 +1,64 @@
+"""SignatureCache and find_near_duplicates."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from skcapstone import memory_dedup
+from skcapstone.memory_dedup import SignatureCache, find_near_duplicates
+from skcapstone.models import MemoryLayer
+
+TEXT = "granite lighthouse keeper logs every passing ship by lantern light at dusk"
+
+
+def test_signatures_are_read_once_and_persisted(mem_dir: Path, write_memory) -> None:
+    write_memory("a", MemoryLayer.SHORT_TERM, content=TEXT)
+    write_memory("b", MemoryLayer.SHORT_TERM, content=TEXT + " again")
+    (mem_dir / "short-term" / "render_scores.json").write_text("{}", encoding="utf-8")
+
+    cache = memory_dedup.signature_cache(mem_dir)
+    assert cache.stats["parsed"] == 2
+    memory_dedup.signature_cache(mem_dir)
+    assert cache.stats["parsed"] == 2
+
+    write_memory("c", MemoryLayer.MID_TERM, content="unrelated words entirely")
+    fresh = SignatureCache(mem_dir)
+    fresh.refresh()
+    assert fresh.stats["parsed"] == 1  # a and b came from dedup-signatures.json
+    assert sorted(e.memory_id for e in fresh.entries()) == ["a", "b", "c"]
+    assert json.loads(fresh.path.read_text())["version"] == 1
+
+
+def test_survivor_is_most_similar_match(mem_dir: Path, write_memory) -> None:
+    write_memory("keep", MemoryLayer.LONG_TERM, content=TEXT)
+    write_memory("dup", MemoryLayer.SHORT_TERM, content=TEXT.replace("dusk", "dawn"))
+    write_memory("empty", MemoryLayer.SHORT_TERM, content="")
+    reads: list[str] = []
+
+    def tokens_of(path: Path) -> frozenset[str]:
+        reads.append(path.stem)
+        return memory_dedup._read_tokens(path)
+
+    entries = memory_dedup.signature_cache(mem_dir).entries()
+    found = find_near_duplicates(entries, threshold=0.8, tokens_of=tokens_of)
+    assert [(c.memory_id, c.duplicate_of) for c in found] == [("dup", "keep")]
+    assert found[0].similarity == pytest.approx(11 / 13)
+    assert sorted(reads) == ["dup", "keep"]  # only the LSH candidate pair was re-read
+
+
+def test_duplicates_are_rescanned_only_after_a_change(mem_dir: Path, write_memory) -> None:
+    write_memory("keep", MemoryLayer.LONG_TERM, content=TEXT)
+    dup = write_memory("dup", MemoryLayer.SHORT_TERM, content=TEXT)
+    cache = memory_dedup.signature_cache(mem_dir)
+    assert [c.memory_id for c in cache.duplicates(0.8)] == ["dup"]
+    cache.refresh()
+    cache.duplicates(0.8)
+    assert cache.stats["scans"] == 1
+
+    dup.unlink()
+    cache.refresh()
+    assert cache.duplicates(0.8) == []
+    assert cache.stats["scans"] == 2
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import json
+import os
+import time
 from pathlib import Path
 
 import pytest
@@ -11,6 +13,7 @@ from skcapstone.memory_fortress import (
     _ENCRYPTED_FIELD,
     _SEAL_FIELD,
     _SEALED_AT_FIELD,
+    MERKLE_STATE_NAME,
     FortressConfig,
     MemoryFortress,
     SealResult,
@@ -370,6 +373,110 @@ class TestVerifyAll:
         assert len(verified) == 2
 
 
+def _save_aged(fortress: MemoryFortress, home: Path, count: int, age: float = 60.0) -> list[Path]:
+    """Save sealed memories and backdate them past the racy-mtime window."""
+    paths = []
+    then = time.time() - age
+    for i in range(count):
+        entry = MemoryEntry(
+            memory_id=f"merk{i:03d}",
+            content=f"Merkle memory {i}",
+            tags=["merkle"],
+            source="test",
+            layer=MemoryLayer.SHORT_TERM if i % 2 else MemoryLayer.LONG_TERM,
+        )
+        path = fortress.save_sealed(home, entry)
+        os.utime(path, (then, then))
+        paths.append(path)
+    return paths
+
+
+class TestMerkleSweep:
+    """Tests for incremental, pooled, and aggregated-audit sweeps."""
+
+    def test_incremental_skips_unchanged(self, fortress: MemoryFortress, home: Path) -> None:
+        """A second incremental sweep trusts every unchanged leaf."""
+        _save_aged(fortress, home, 6)
+        first = fortress.verify_all(home, incremental=True)
+        assert fortress.last_scan["checked"] == 6
+
+        second = fortress.verify_all(home, incremental=True)
+        assert fortress.last_scan["checked"] == 0
+        assert fortress.last_scan["skipped"] == 6
+        assert fortress.last_scan["root"]
+        assert second == first
+
+    def test_incremental_rechecks_modified_file(
+        self, fortress: MemoryFortress, home: Path
+    ) -> None:
+        """A file whose mtime changed is re-checked and tampering is caught."""
+        paths = _save_aged(fortress, home, 4)
+        fortress.verify_all(home, incremental=True)
+
+        data = json.loads(paths[1].read_text(encoding="utf-8"))
+        data["content"] = "HACKED"
+        paths[1].write_text(json.dumps(data), encoding="utf-8")
+        os.utime(paths[1], (time.time() - 30, time.time() - 30))
+
+        results = fortress.verify_all(home, incremental=True)
+        assert fortress.last_scan["checked"] == 1
+        assert [r.memory_id for r in results if r.tampered] == ["merk001"]
+
+    def test_forged_state_forces_layer_recheck(self, fortress: MemoryFortress, home: Path) -> None:
+        """Editing a leaf in the state file breaks its layer root."""
+        _save_aged(fortress, home, 4)
+        fortress.verify_all(home, incremental=True)
+
+        state_path = home / "memory" / MERKLE_STATE_NAME
+        state = json.loads(state_path.read_text(encoding="utf-8"))
+        leaves = state["layers"]["short-term"]["leaves"]
+        next(iter(leaves.values()))[3] = "0" * 64
+        state_path.write_text(json.dumps(state), encoding="utf-8")
+
+        fortress.verify_all(home, incremental=True)
+        assert fortress.last_scan["checked"] == 2
+        assert fortress.last_scan["skipped"] == 2
+
+    def test_recent_files_are_not_trusted(self, fortress: MemoryFortress, home: Path) -> None:
+        """Files written within the racy window are re-checked next sweep."""
+        _save_aged(fortress, home, 2, age=0.0)
+        fortress.verify_all(home, incremental=True)
+        fortress.verify_all(home, incremental=True)
+        assert fortress.last_scan["checked"] == 2
+
+    def test_process_pool_matches_serial(self, fortress: MemoryFortress, home: Path) -> None:
+        """A pooled sweep returns the same results in the same order."""
+        paths = _save_aged(fortress, home, 5)
+        data = json.loads(paths[2].read_text(encoding="utf-8"))
+        data["tags"] = ["forged"]
+        paths[2].write_text(json.dumps(data), encoding="utf-8")
+
+        serial = fortress.verify_all(home)
+        pooled = fortress.verify_all(home, processes=2)
+        assert pooled == serial
+        assert sum(r.tampered for r in pooled) == 1
+
+    def test_sweep_writes_one_summary(self, fortress: MemoryFortress, home: Path) -> None:
+        """A sweep appends one scan record plus one aggregated alert."""
+        paths = _save_aged(fortress, home, 5)
+        for path in paths[:2]:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            data["content"] = "EVIL"
+            path.write_text(json.dumps(data), encoding="utf-8")
+
+        audit_log = home / "security" / "audit.log"
+        before = len(audit_log.read_text(encoding="utf-8").splitlines())
+        fortress.verify_all(home)
+        lines = audit_log.read_text(encoding="utf-8").splitlines()[before:]
+
+        assert len(lines) == 2
+        assert "MEMORY_TAMPER_ALERT" in lines[0]
+        assert "FORTRESS_SCAN" in lines[1]
+        assert "MEMORY_VERIFIED" not in "".join(lines)
+        assert fortress.last_scan["tampered"] == 2
+        assert fortress.last_scan["memories_per_second"] is not None
+
+
 # ---------------------------------------------------------------------------
 # Seal Existing (Migration)
 # ---------------------------------------------------------------------------
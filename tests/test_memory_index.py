@@ -0,0 +1,71 @@
+"""MemoryMetaIndex: incremental refresh, persistence, and what it skips."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from skcapstone import memory_index
+from skcapstone.memory_index import MemoryMetaIndex
+from skcapstone.models import MemoryLayer
+
+
+def test_entries_carry_the_selection_fields(mem_dir: Path, write_memory) -> None:
+    path = write_memory("m1", importance=0.9)
+    index = memory_index.meta_index(mem_dir)
+    (meta,) = index.entries(MemoryLayer.MID_TERM)
+    assert (meta.memory_id, meta.layer, meta.importance) == ("m1", "mid-term", 0.9)
+    assert meta.path == path and meta.mtime_ns == path.stat().st_mtime_ns
+    assert index.entries(MemoryLayer.LONG_TERM) == []
+
+
+def test_unchanged_files_are_not_reparsed(mem_dir: Path, write_memory) -> None:
+    for i in range(5):
+        write_memory(f"m{i}")
+    index = memory_index.meta_index(mem_dir)
+    assert index.stats["parsed"] == 5
+    path = write_memory("m3", importance=0.1)  # rewritten in place
+    (mem_dir / "mid-term" / "m4.json").unlink()
+    index = memory_index.meta_index(mem_dir)
+    assert index.stats["parsed"] == 6
+    by_id = {m.memory_id: m for m in index.entries("mid-term")}
+    assert sorted(by_id) == ["m0", "m1", "m2", "m3"]
+    assert by_id["m3"].importance == 0.1 and by_id["m3"].mtime_ns == path.stat().st_mtime_ns
+
+
+def test_racy_files_are_reread(mem_dir: Path, write_memory) -> None:
+    write_memory("fresh", age=0)
+    index = memory_index.meta_index(mem_dir)
+    memory_index.meta_index(mem_dir)
+    assert index.stats["parsed"] == 2
+    write_memory("fresh")
+    memory_index.meta_index(mem_dir)
+    memory_index.meta_index(mem_dir)
+    assert index.stats["parsed"] == 3
+
+
+def test_non_memories_are_skipped(mem_dir: Path, write_memory) -> None:
+    layer = mem_dir / "mid-term"
+    (layer / "render_scores.json").write_text("{}")
+    (layer / "unified.json").write_text(json.dumps({"id": "u1", "content": "x"}))
+    (layer / "broken.json").write_text("{not json")
+    (layer / "empty.json").write_text("")
+    write_memory("real")
+    assert [m.memory_id for m in memory_index.meta_index(mem_dir).entries("mid-term")] == ["real"]
+
+
+def test_persisted_index_starts_warm(mem_dir: Path, write_memory) -> None:
+    for i in range(3):
+        write_memory(f"m{i}")
+    memory_index.meta_index(mem_dir)
+    assert (mem_dir / memory_index.META_INDEX_NAME).exists()
+
+    fresh = MemoryMetaIndex(mem_dir)
+    fresh.refresh()
+    assert fresh.stats["parsed"] == 0
+    assert len(fresh.entries("mid-term")) == 3
+
+    (mem_dir / memory_index.META_INDEX_NAME).write_text("{corrupt")
+    rebuilt = MemoryMetaIndex(mem_dir)
+    rebuilt.refresh()
+    assert rebuilt.stats["parsed"] == 3
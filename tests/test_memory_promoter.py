@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
@@ -444,6 +445,51 @@ class TestCustomThresholds:
         assert "low-imp" not in promoted_ids
 
 
+# ---------------------------------------------------------------------------
+# Dedup
+# ---------------------------------------------------------------------------
+
+PARAGRAPH = (
+    "Chef moved the sovereign agent mesh onto the new syncthing relay after the "
+    "old node lost its disk, and every peer re-verified its capauth identity "
+    "before rejoining the coordination board on tuesday evening"
+)
+
+
+class TestDedup:
+    """Tests for near-duplicate detection and merging."""
+
+    def test_reworded_duplicate_merges_into_survivor(self, engine: PromotionEngine, home: Path):
+        """The newer copy survives and absorbs tags and importance."""
+        _write_memory(home, "old", PARAGRAPH, tags=["infra"], importance=0.9, age_hours=5)
+        _write_memory(
+            home, "new", PARAGRAPH.replace("tuesday", "wednesday"), tags=["sync"], age_hours=1
+        )
+        _write_memory(home, "other", "A completely unrelated note about lunch plans")
+
+        candidates = engine.find_duplicates()
+        assert [(c.memory_id, c.duplicate_of) for c in candidates] == [("old", "new")]
+        assert 0.85 <= candidates[0].similarity < 1.0
+        assert engine.dedup_memories(dry_run=True) == 1
+        assert (home / "memory" / "short-term" / "old.json").exists()
+
+        assert engine.dedup_memories() == 1
+        assert (home / "memory" / "archive" / "deduped" / "old.json").exists()
+        survivor = json.loads((home / "memory" / "short-term" / "new.json").read_text())
+        assert survivor["tags"] == ["sync", "infra"]
+        assert survivor["importance"] == 0.9
+        assert engine.find_duplicates() == []
+
+    def test_higher_tier_survives_and_threshold_applies(self, home: Path) -> None:
+        """A long-term copy outranks a newer short-term one; strict thresholds keep both."""
+        _write_memory(home, "lt", PARAGRAPH, layer=MemoryLayer.LONG_TERM, age_hours=9)
+        _write_memory(home, "st", PARAGRAPH.replace("tuesday", "friday"), age_hours=1)
+
+        strict = PromotionEngine(home, thresholds=PromotionThresholds(dedup_similarity=1.0))
+        assert strict.find_duplicates() == []
+        assert [c.memory_id for c in PromotionEngine(home).find_duplicates()] == ["st"]
+
+
 # ---------------------------------------------------------------------------
 # Model tests
 # ---------------------------------------------------------------------------
@@ -0,0 +1,43 @@
+"""MinHash signatures, band layout and the LSH index."""
+
+from __future__ import annotations
+
+import pytest
+
+from skcapstone.minhash import (
+    LSHIndex,
+    jaccard,
+    lsh_params,
+    minhash,
+    signature_from_hex,
+    signature_to_hex,
+)
+
+
+def test_signature_estimates_jaccard_and_round_trips() -> None:
+    a = {f"t{i}" for i in range(60)}
+    b = {f"t{i}" for i in range(20, 80)}  # Jaccard 0.5
+    sa, sb = minhash(a), minhash(b)
+    assert minhash(sorted(a)) == sa
+    agree = sum(x == y for x, y in zip(sa, sb)) / len(sa)
+    assert agree == pytest.approx(jaccard(a, b), abs=0.2)
+    assert signature_from_hex(signature_to_hex(sa)) == sa
+    assert minhash([]) == ()
+
+
+@pytest.mark.parametrize("threshold", [0.3, 0.5, 0.6, 0.8, 0.95])
+def test_band_layout_meets_recall(threshold: float) -> None:
+    bands, rows = lsh_params(threshold)
+    assert bands * rows <= 64
+    assert 1 - (1 - threshold**rows) ** bands >= 0.99
+
+
+def test_index_returns_bucket_mates() -> None:
+    index = LSHIndex(0.6)
+    base = {f"t{i}" for i in range(30)}
+    index.add("same", minhash(base))
+    index.add("other", minhash({f"x{i}" for i in range(30)}))
+    index.add("empty", ())
+    assert len(index) == 2
+    assert index.candidates(minhash(base | {"extra"})) == {"same"}
+    assert index.candidates(()) == set()
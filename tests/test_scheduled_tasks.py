@@ -8,6 +8,9 @@ from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock, patch
 
 from skcapstone.scheduled_tasks import (
+    LANE_BULK,
+    LANE_CRITICAL,
+    DurationHistogram,
     ScheduledTask,
     TaskScheduler,
     build_scheduler,
@@ -211,6 +214,89 @@ class TestTaskSchedulerExecution:
         stop.set()
 
 
+class TestTaskSchedulerLanes:
+    def test_critical_lane_by_name(self, tmp_path):
+        scheduler = TaskScheduler(tmp_path, threading.Event())
+        assert scheduler.register("heartbeat_pulse", 30, lambda: None).lane == LANE_CRITICAL
+        assert scheduler.register("backend_reprobe", 300, lambda: None).lane == LANE_CRITICAL
+        assert scheduler.register("itil_gtd_reconcile", 1800, lambda: None).lane == LANE_BULK
+
+    def test_slow_bulk_task_does_not_delay_heartbeat(self, tmp_path):
+        stop = threading.Event()
+        release = threading.Event()
+        beats = []
+        scheduler = TaskScheduler(tmp_path, stop, tick_interval=0.05)
+        scheduler.register("memory_promotion_sweep", 3600, lambda: release.wait(5))
+        scheduler.register("heartbeat_pulse", 0.05, lambda: beats.append(time.monotonic()))
+        scheduler.start()
+        try:
+            time.sleep(0.5)
+            assert len(beats) >= 5, "heartbeat must keep firing while the sweep runs"
+        finally:
+            release.set()
+            scheduler.stop()
+
+    def test_task_never_overlaps_itself(self, tmp_path):
+        stop = threading.Event()
+        active = {"now": 0, "peak": 0}
+        lock = threading.Lock()
+
+        def _slow():
+            with lock:
+                active["now"] += 1
+                active["peak"] = max(active["peak"], active["now"])
+            time.sleep(0.1)
+            with lock:
+                active["now"] -= 1
+
+        scheduler = TaskScheduler(tmp_path, stop, tick_interval=0.01)
+        task = scheduler.register("slow", 0, _slow)
+        scheduler.start()
+        time.sleep(0.35)
+        scheduler.stop()
+        assert active["peak"] == 1
+        assert task.run_count >= 2
+
+    def test_sleeps_until_deadline_not_every_tick(self, tmp_path):
+        stop = threading.Event()
+        fired = threading.Event()
+        scheduler = TaskScheduler(tmp_path, stop, tick_interval=5)
+        task = scheduler.register("later", 0.2, fired.set, delay_first_run=0.2)
+        t0 = time.monotonic()
+        scheduler.start()
+        assert fired.wait(2), "task should fire at its deadline, not the next 5 s tick"
+        elapsed = time.monotonic() - t0
+        scheduler.stop()
+        assert 0.15 <= elapsed < 1.0
+        assert task.run_count == 1
+
+    def test_status_reports_lateness_and_runtime(self, tmp_path):
+        stop = threading.Event()
+        done = threading.Event()
+        scheduler = TaskScheduler(tmp_path, stop, tick_interval=0.05)
+        scheduler.register("heartbeat_pulse", 3600, lambda: (time.sleep(0.02), done.set()))
+        scheduler.start()
+        assert done.wait(2)
+        time.sleep(0.05)
+        scheduler.stop()
+        status = scheduler.status()[0]
+        assert status["lane"] == LANE_CRITICAL
+        assert status["lateness"]["count"] == 1
+        assert status["runtime"]["count"] == 1
+        assert status["runtime"]["max"] >= 0.02
+        assert sum(status["runtime"]["buckets"].values()) == 1
+
+
+def test_duration_histogram_buckets():
+    hist = DurationHistogram((0.1, 1.0))
+    for seconds in (0.05, 0.5, 0.7, 3.0):
+        hist.observe(seconds)
+    data = hist.to_dict()
+    assert data["buckets"] == {"0.1": 1, "1": 2, "+Inf": 1}
+    assert data["count"] == 4
+    assert data["max"] == 3.0
+
+
 # ---------------------------------------------------------------------------
 # build_scheduler - registration completeness and intervals
 # ---------------------------------------------------------------------------
@@ -145,3 +145,31 @@ def test_dreaming_reflection_job_fires_end_to_end(tmp_path, monkeypatch):
 
     st = SchedulerState(root=tmp_path, hostname=socket.gethostname())
     assert st.last_run("dreaming-reflection") is not None
+
+
+def test_running_config_job_is_not_queued_twice(tmp_path):
+    """A job still in flight is skipped by later ticks instead of taking another worker."""
+    from skcapstone.scheduler_runner import JobResult
+
+    sched = TaskScheduler(home=tmp_path, stop_event=threading.Event())
+    job = JobSpec(name="slow", type="shell", command="true", every_seconds=1, nodes=["h"])
+    sched.load_config_jobs(jobs=[job], hostname="h", host_aliases={"h"}, state_root=tmp_path)
+    calls = []
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_run(j):
+        calls.append(j.name)
+        started.set()
+        release.wait(5)
+        return JobResult(ok=True)
+
+    sched._job_runner.run = slow_run  # type: ignore
+    now = datetime(2026, 6, 8, 12, 0, tzinfo=timezone.utc)
+    sched.tick_config_jobs(now=now)
+    assert started.wait(2)
+    sched.tick_config_jobs(now=now)
+    sched.tick_config_jobs(now=now)
+    release.set()
+    sched.stop()
+    assert calls == ["slow"]
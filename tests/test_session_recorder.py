@@ -130,6 +130,20 @@ class TestSessionHelpers:
         assert entries[0]["tool"] == "ok"
         assert entries[1]["tool"] == "ok2"
 
+    def test_load_session_limit_and_since(self, tmp_path: Path) -> None:
+        from skcapstone.session_recorder import load_session
+
+        f = tmp_path / "s.jsonl"
+        f.write_text(
+            "".join(
+                json.dumps({"tool": f"t{i}", "ts": f"2026-03-02T10:00:0{i}+00:00"}) + "\n"
+                for i in range(6)
+            )
+        )
+        assert [e["tool"] for e in load_session(f, limit=2)] == ["t4", "t5"]
+        since = load_session(f, since="2026-03-02T10:00:03+00:00")
+        assert [e["tool"] for e in since] == ["t3", "t4", "t5"]
+
     def test_list_sessions_newest_first(self, tmp_agent_home: Path) -> None:
         import time
 
@@ -0,0 +1,185 @@
+"""Tests for change-token driven view snapshots."""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import time
+from pathlib import Path
+
+import pytest
+
+from skcapstone.file_watch import IN_CHANGES, IN_ISDIR, Inotify, PathWatcher, file_token
+from skcapstone.snapshot_service import (
+    DirDep,
+    SnapshotService,
+    etag_for,
+    household_agents,
+    if_none_match,
+    register_daemon_views,
+)
+
+
+def _touch(path: Path, text: str) -> None:
+    """Write *text* and push mtime forward so coarse clocks still differ."""
+    path.write_text(text, encoding="utf-8")
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture(params=[False, True], ids=["stat", "inotify"])
+def service(request):
+    if request.param:
+        pytest.importorskip("watchdog")
+    svc = SnapshotService(PathWatcher(use_inotify=request.param))
+    yield svc
+    svc.watcher.stop()
+
+
+def _settle(svc: SnapshotService) -> None:
+    if svc.watcher.inotify:
+        time.sleep(0.3)
+
+
+class TestSnapshotService:
+    def test_hit_until_file_changes(self, tmp_path: Path, service) -> None:
+        target = tmp_path / "identity.json"
+        _touch(target, "{}")
+        calls = []
+        service.register("v", lambda: calls.append(1) or len(calls), files=[target])
+        assert service.get("v") == 1
+        assert service.get("v") == 1
+        _touch(target, '{"name": "x"}')
+        assert service.get("v") == 2
+        assert service.stats()["v"] == {"builds": 2, "hits": 1}
+
+    def test_dir_dependency(self, tmp_path: Path, service) -> None:
+        d = tmp_path / "conversations"
+        d.mkdir()
+        service.register("v", lambda: sorted(p.name for p in d.iterdir()), dirs=[DirDep(d)])
+        assert service.get("v") == []
+        (d / "a.json").write_text("[]", encoding="utf-8")
+        _settle(service)
+        assert service.get("v") == ["a.json"]
+
+    def test_missing_dir_appears(self, tmp_path: Path, service) -> None:
+        d = tmp_path / "late"
+        service.register("v", lambda: d.exists(), dirs=[DirDep(d)])
+        assert service.get("v") is False
+        d.mkdir()
+        assert service.get("v") is True
+
+    def test_dir_recreated(self, tmp_path: Path, service) -> None:
+        d = tmp_path / "conversations"
+        d.mkdir()
+        (d / "a.json").write_text("[]", encoding="utf-8")
+        service.register("v", lambda: sorted(p.name for p in d.iterdir()), dirs=[DirDep(d)])
+        assert service.get("v") == ["a.json"]
+        shutil.rmtree(d)
+        d.mkdir()
+        _settle(service)
+        (d / "b.json").write_text("[]", encoding="utf-8")
+        _settle(service)
+        assert service.get("v") == ["b.json"]
+
+    def test_invalidate(self, tmp_path: Path, service) -> None:
+        calls = []
+        service.register("v", lambda: calls.append(1) or len(calls))
+        service.get("v")
+        service.invalidate("v")
+        assert service.get("v") == 2
+
+
+class _FakeObserver:
+    """Stands in for watchdog's Observer: records (un)scheduled watches."""
+
+    def __init__(self) -> None:
+        self.scheduled: list[tuple] = []
+        self.unscheduled: list[tuple] = []
+
+    def schedule(self, handler, path: str, recursive: bool = False) -> tuple:
+        watch = (path, recursive, len(self.scheduled))
+        self.scheduled.append(watch)
+        return watch
+
+    def unschedule(self, watch: tuple) -> None:
+        self.unscheduled.append(watch)
+
+
+class TestPathWatcher:
+    def test_rearms_watch_on_recreated_dir(self, tmp_path: Path) -> None:
+        watcher = PathWatcher(use_inotify=False)
+        observer = watcher._observer = _FakeObserver()
+        d = tmp_path / "conversations"
+        d.mkdir()
+        first = watcher.token(d)
+        assert first == watcher.token(d) == ("inotify", 0)
+        d.rmdir()
+        assert watcher.token(d) is None  # gone: stat fallback, old watch dropped
+        assert observer.unscheduled == observer.scheduled
+        d.mkdir()
+        second = watcher.token(d)
+        assert second == ("inotify", 1) != first
+        assert len(observer.scheduled) == 2
+
+
+class TestHouseholdView:
+    def test_heartbeat_change_and_parse_error(self, tmp_path: Path) -> None:
+        (tmp_path / "agents" / "opus" / "identity").mkdir(parents=True)
+        hb_dir = tmp_path / "heartbeats"
+        hb_dir.mkdir()
+        svc = SnapshotService(PathWatcher(use_inotify=False))
+        register_daemon_views(svc, tmp_path, tmp_path)
+
+        assert svc.get("household") == [{"name": "opus"}]
+        _touch(hb_dir / "opus.json", json.dumps({"status": "ok"}))
+        assert svc.get("household")[0]["heartbeat"] == {"status": "ok"}
+        _touch(hb_dir / "opus.json", "{broken")
+        assert svc.get("household")[0]["heartbeat_error"] is True
+
+    def test_identity_file_tracked_per_agent(self, tmp_path: Path) -> None:
+        ident = tmp_path / "agents" / "jarvis" / "identity" / "identity.json"
+        ident.parent.mkdir(parents=True)
+        svc = SnapshotService(PathWatcher(use_inotify=False))
+        register_daemon_views(svc, tmp_path, tmp_path)
+        assert "identity" not in svc.get("household")[0]
+        _touch(ident, json.dumps({"fingerprint": "F1"}))
+        assert svc.get("household")[0]["identity"] == {"fingerprint": "F1"}
+        assert household_agents(tmp_path) == svc.get("household")
+
+
+class TestHttpHelpers:
+    def test_etag_stable_and_matching(self) -> None:
+        tag = etag_for(b"body")
+        assert tag == etag_for(b"body") != etag_for(b"other")
+        assert tag.startswith('"') and tag.endswith('"')
+        assert if_none_match(tag, tag)
+        assert if_none_match(f'"x", W/{tag}', tag)
+        assert if_none_match("*", tag)
+        assert not if_none_match(None, tag)
+        assert not if_none_match('"x"', tag)
+
+    def test_file_token_missing(self, tmp_path: Path) -> None:
+        assert file_token(tmp_path / "nope") is None
+
+
+class TestInotify:
+    def test_reports_changes_synchronously(self, tmp_path: Path) -> None:
+        try:
+            ino = Inotify()
+        except OSError:
+            pytest.skip("inotify unavailable")
+        try:
+            assert ino.add(tmp_path, IN_CHANGES)
+            assert not ino.add(tmp_path / "missing", IN_CHANGES)
+            (tmp_path / "a.json").write_text("{}", encoding="utf-8")
+            (tmp_path / "sub").mkdir()
+            events = ino.read_events()
+            assert {p.name for p, _ in events} == {"a.json", "sub"}
+            assert any(p.name == "sub" and mask & IN_ISDIR for p, mask in events)
+            assert ino.read_events() == []
+            ino.remove(tmp_path)
+            assert tmp_path not in ino.watched()
+        finally:
+            ino.close()
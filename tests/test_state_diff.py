@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
 
 import yaml
 
+from skcapstone import state_diff
 from skcapstone.coordination import Board, Task
-from skcapstone.memory_engine import store
+from skcapstone.memory_engine import _memory_dir, store
 from skcapstone.pillars.identity import generate_identity
 from skcapstone.pillars.memory import initialize_memory
 from skcapstone.pillars.security import initialize_security
@@ -21,6 +23,7 @@ from skcapstone.state_diff import (
     format_text,
     load_snapshot,
     save_snapshot,
+    stream_memory_diff,
     take_snapshot,
 )
 
@@ -136,6 +139,88 @@ class TestComputeDiff:
         assert "depth" in diff.trust_changes or "trust_level" in diff.trust_changes
 
 
+def _backdate(home: Path, seconds: int = 60) -> None:
+    """Move every memory file's mtime out of the racy window."""
+    for path in _memory_dir(home).glob("*/*.json"):
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns - seconds * 10**9))
+
+
+class TestHashedMemoryDiff:
+    """Content hashes, incremental re-hashing and streaming."""
+
+    def test_edit_beyond_prefix_is_modified(self, tmp_agent_home: Path):
+        """Edits anywhere in the content are reported as modifications."""
+        _init_agent(tmp_agent_home)
+        entry = store(tmp_agent_home, "x" * 300 + " original ending")
+        save_snapshot(tmp_agent_home)
+        path = next(_memory_dir(tmp_agent_home).glob(f"*/{entry.memory_id}.json"))
+        data = json.loads(path.read_text(encoding="utf-8"))
+        data["content"] = "x" * 300 + " edited ending"
+        path.write_text(json.dumps(data), encoding="utf-8")
+
+        diff = compute_diff(tmp_agent_home)
+        assert diff.has_changes
+        assert [m["id"] for m in diff.modified_memories] == [entry.memory_id]
+        assert not diff.new_memories and not diff.removed_memories
+        assert "modified memor" in format_text(diff)
+        assert json.loads(format_json(diff))["memories"]["modified"] == 1
+
+    def test_promotion_and_recall_are_not_changes(self, tmp_agent_home: Path):
+        """Moving tier or bumping access counters leaves the content hash alone."""
+        _init_agent(tmp_agent_home)
+        entry = store(tmp_agent_home, "A memory that gets promoted")
+        save_snapshot(tmp_agent_home)
+        mem = _memory_dir(tmp_agent_home)
+        path = next(mem.glob(f"*/{entry.memory_id}.json"))
+        data = json.loads(path.read_text(encoding="utf-8"))
+        data["access_count"] = 7
+        data["layer"] = "mid-term"
+        (mem / "mid-term" / path.name).write_text(json.dumps(data), encoding="utf-8")
+        path.unlink()
+        assert not compute_diff(tmp_agent_home).has_changes
+
+    def test_only_changed_files_are_rehashed(self, tmp_agent_home: Path, monkeypatch):
+        """A snapshot re-reads only files whose mtime or size moved."""
+        _init_agent(tmp_agent_home)
+        for i in range(5):
+            store(tmp_agent_home, f"Stable memory {i}")
+        _backdate(tmp_agent_home)
+        baseline = take_snapshot(tmp_agent_home)
+        store(tmp_agent_home, "One more")
+
+        read: list[str] = []
+        real = state_diff._hash_memory
+        monkeypatch.setattr(state_diff, "_hash_memory", lambda p: read.append(p.name) or real(p))
+        current = take_snapshot(tmp_agent_home, baseline)
+        assert len(read) == 1
+        assert current["memories"]["count"] == 6
+        unchanged = [
+            layer
+            for layer, data in current["memories"]["layers"].items()
+            if data["rollup"] == baseline["memories"]["layers"][layer]["rollup"]
+        ]
+        assert len(unchanged) == 2
+
+    def test_stream_is_uncapped_and_reads_legacy_baselines(self, tmp_agent_home: Path):
+        """Streaming yields every change; 1.0 baselines still diff by id."""
+        _init_agent(tmp_agent_home)
+        for i in range(12):
+            store(tmp_agent_home, f"Streamed memory {i}")
+        changes = list(stream_memory_diff(tmp_agent_home))
+        assert len(changes) == 12 and {c.kind for c in changes} == {"added"}
+
+        legacy = {
+            "timestamp": "2026-01-01T00:00:00+00:00",
+            "version": "1.0",
+            "memories": {"count": 2, "ids": [changes[0].memory_id, "gone"], "entries": []},
+        }
+        (tmp_agent_home / "state_snapshot.json").write_text(json.dumps(legacy))
+        kinds = [(c.kind, c.memory_id) for c in stream_memory_diff(tmp_agent_home)]
+        assert ("removed", "gone") in kinds
+        assert sum(kind == "added" for kind, _ in kinds) == 11
+
+
 class TestFormatText:
     """Tests for text formatter."""
 
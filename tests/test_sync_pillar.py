@@ -3,11 +3,16 @@
 from __future__ import annotations
 
 import json
+import os
+import threading
+import time
 from pathlib import Path
 from unittest.mock import patch
 
 from skcapstone.models import PillarStatus, SyncConfig, SyncTransport
 from skcapstone.pillars.sync import (
+    ENCRYPTED_EXTENSION,
+    SEED_CHECKPOINT_INTERVAL,
     SEED_EXTENSION,
     collect_seed,
     discover_sync,
@@ -320,6 +325,47 @@ class TestPullSeeds:
         results = pull_seeds(tmp_agent_home, decrypt=False)
         assert results == []
 
+    def test_identical_seed_copies_are_processed_once(self, tmp_agent_home: Path):
+        cfg = _no_gpg_config(tmp_agent_home)
+        initialize_sync(tmp_agent_home, config=cfg)
+        inbox = tmp_agent_home / "sync" / "inbox"
+        body = json.dumps({"schema_version": "1.0", "agent_name": "peer"})
+        (inbox / f"peer-a{SEED_EXTENSION}").write_text(body, encoding="utf-8")
+        (inbox / f"peer-a.sync-conflict{SEED_EXTENSION}").write_text(body, encoding="utf-8")
+        results = pull_seeds(tmp_agent_home, decrypt=False)
+        assert len(results) == 1
+        assert list(inbox.iterdir()) == []
+
+    def test_encrypted_backlog_is_decrypted_concurrently(self, tmp_agent_home: Path):
+        cfg = _no_gpg_config(tmp_agent_home)
+        initialize_sync(tmp_agent_home, config=cfg)
+        inbox = tmp_agent_home / "sync" / "inbox"
+        for i in range(4):
+            (inbox / f"peer-{i}{ENCRYPTED_EXTENSION}").write_bytes(b"x")
+
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def fake_decrypt(path: Path, output_dir=None):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05)
+            out = path.with_name(path.name[: -len(".gpg")])
+            out.write_text(json.dumps({"agent_name": path.name}), encoding="utf-8")
+            with lock:
+                active -= 1
+            return out
+
+        with patch("skcapstone.pillars.sync.gpg_decrypt", side_effect=fake_decrypt):
+            with patch("skcapstone.pillars.sync.DECRYPT_WORKERS", 4):
+                results = pull_seeds(tmp_agent_home, decrypt=True)
+
+        assert len(results) == 4
+        assert peak > 1
+
 
 # ── TestSaveSyncState ─────────────────────────────────────────────────────────
 
@@ -345,3 +391,138 @@ class TestSaveSyncState:
         save_sync_state(sync_dir, state)
         data = json.loads((sync_dir / "sync-state.json").read_text())
         assert data["peers_known"] == 3
+
+
+# ── TestDeltaSeeds ────────────────────────────────────────────────────────────
+
+
+def _touch_forward(path: Path, seconds: float = 5.0) -> None:
+    """Bump mtime so the change is unambiguously past the last clock."""
+    t = time.time() + seconds
+    os.utime(path, (t, t))
+
+
+def _backdate(path: Path, seconds: float = 10.0) -> None:
+    """Age mtime past the racy window, so a clock over it is trusted."""
+    t = time.time() - seconds
+    os.utime(path, (t, t))
+
+
+def _deliver(sender: Path, receiver: Path) -> None:
+    """Move every seed from sender's outbox to receiver's inbox (Syncthing)."""
+    inbox = receiver / "sync" / "inbox"
+    for f in sorted((sender / "sync" / "outbox").iterdir()):
+        f.rename(inbox / f.name)
+
+
+class TestDeltaSeeds:
+    """Seeds carry only what changed since the peers' acknowledged base."""
+
+    def _home(self, tmp_path: Path, name: str) -> Path:
+        home = tmp_path / name
+        home.mkdir()
+        initialize_sync(home, config=_no_gpg_config(home))
+        trust_dir = home / "trust"
+        trust_dir.mkdir()
+        (trust_dir / "trust.json").write_text(json.dumps({"depth": 1.0}), encoding="utf-8")
+        (home / "manifest.json").write_text(json.dumps({"name": name}), encoding="utf-8")
+        _backdate(trust_dir / "trust.json")
+        _backdate(home / "manifest.json")
+        return home
+
+    def test_first_seed_is_a_full_checkpoint(self, tmp_path: Path):
+        home = self._home(tmp_path, "alice")
+        data = json.loads(collect_seed(home, "alice").read_text())
+        assert data["seed_type"] == "state_snapshot"
+        assert data["seq"] == 1
+        assert data["base_seq"] is None
+        assert set(data["clock"]) >= {"trust", "memory", "manifest"}
+        assert "trust" in data and "manifest" in data
+
+    def test_unchanged_sections_are_left_out(self, tmp_path: Path):
+        home = self._home(tmp_path, "alice")
+        collect_seed(home, "alice")
+        data = json.loads(collect_seed(home, "alice").read_text())
+        assert data["seed_type"] == "state_delta"
+        assert data["base_seq"] == 1
+        assert "trust" not in data
+        assert "manifest" not in data
+        assert "memory_entries" not in data
+
+    def test_changed_section_is_included(self, tmp_path: Path):
+        home = self._home(tmp_path, "alice")
+        collect_seed(home, "alice")
+        trust = home / "trust" / "trust.json"
+        trust.write_text(json.dumps({"depth": 2.0}), encoding="utf-8")
+        _touch_forward(trust)
+        data = json.loads(collect_seed(home, "alice").read_text())
+        assert data["trust"] == {"depth": 2.0}
+        assert "manifest" not in data
+
+    def test_only_new_memories_are_exported(self, tmp_path: Path):
+        from skcapstone.memory_engine import store
+
+        home = self._home(tmp_path, "alice")
+        from skcapstone.memory_engine import _entry_path
+
+        _backdate(_entry_path(home, store(home, "old memory")))
+        collect_seed(home, "alice")
+        time.sleep(0.01)
+        store(home, "new memory")
+        data = json.loads(collect_seed(home, "alice").read_text())
+        assert [m["content"] for m in data["memory_entries"]] == ["new memory"]
+
+    def test_write_in_the_clock_tick_reaches_a_later_delta(self, tmp_path: Path):
+        from skcapstone.memory_engine import _entry_path, store
+
+        home = self._home(tmp_path, "alice")
+        store(home, "first")
+        clock = json.loads(collect_seed(home, "alice").read_text())["clock"]["memory"]
+        # Written right after the clock read, in the same mtime tick.
+        late = _entry_path(home, store(home, "same tick"))
+        os.utime(late, ns=(clock, clock))
+        collect_seed(home, "alice")  # seq 2, delta from the checkpoint
+        data = json.loads(collect_seed(home, "alice").read_text())
+        assert data["base_seq"] == 1
+        assert "same tick" in [m["content"] for m in data["memory_entries"]]
+
+    def test_periodic_full_checkpoint(self, tmp_path: Path):
+        home = self._home(tmp_path, "alice")
+        types = [
+            json.loads(collect_seed(home, "alice").read_text())["seed_type"]
+            for _ in range(SEED_CHECKPOINT_INTERVAL + 1)
+        ]
+        assert types[0] == types[-1] == "state_snapshot"
+        assert set(types[1:-1]) == {"state_delta"}
+
+    def test_peer_ack_moves_the_delta_base(self, tmp_path: Path):
+        alice = self._home(tmp_path, "alice")
+        bob = self._home(tmp_path, "bob")
+        collect_seed(alice, "alice")
+        collect_seed(alice, "alice")
+        _deliver(alice, bob)
+        pull_seeds(bob, decrypt=False)
+
+        # Bob's next seed acknowledges alice's seq 2; alice reads it.
+        bob_seed = json.loads(collect_seed(bob, "bob").read_text())
+        assert list(bob_seed["acks"].values()) == [2]
+        _deliver(bob, alice)
+        pull_seeds(alice, decrypt=False)
+
+        data = json.loads(collect_seed(alice, "alice").read_text())
+        assert data["base_seq"] == 2
+
+    def test_already_applied_seed_is_not_imported_again(self, tmp_path: Path):
+        alice = self._home(tmp_path, "alice")
+        bob = self._home(tmp_path, "bob")
+        seed = collect_seed(alice, "alice")
+        data = json.loads(seed.read_text())
+        _deliver(alice, bob)
+        pull_seeds(bob, decrypt=False)
+
+        # Syncthing redelivers the same seq (e.g. a conflict copy).
+        data["febs"] = [{"timestamp": "x"}]
+        (bob / "sync" / "inbox" / seed.name).write_text(json.dumps(data))
+        with patch("skcapstone.pillars.trust.import_febs_from_seed") as imp:
+            pull_seeds(bob, decrypt=False)
+        imp.assert_not_called()
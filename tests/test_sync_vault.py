@@ -9,8 +9,9 @@ from __future__ import annotations
 
 import hashlib
 import json
+import os
 import tarfile
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from unittest.mock import patch
 
@@ -563,6 +564,176 @@ class TestVaultExceptions:
         vault.unpack(archive, target=restore, verify_signature=True, verify_hashes=False)
 
 
+# ---------------------------------------------------------------------------
+# Streaming pack, parallel compression, incremental vaults
+# ---------------------------------------------------------------------------
+
+
+def _backdate_tree(root: Path, seconds: int = 10) -> None:
+    """Age every file past the racy window of a vault packed now."""
+    for path in root.rglob("*"):
+        if path.is_file():
+            st = path.stat()
+            os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns - seconds * 1_000_000_000))
+
+
+class TestStreamingPack:
+    def test_each_file_is_read_once(self, vault, agent_home: Path, monkeypatch):
+        import builtins
+
+        from skcapstone import tar_stream
+        from skcapstone.sync import vault as vault_mod
+
+        opened: list[str] = []
+
+        def counting_open(file, mode="r", *args, **kwargs):
+            if "r" in mode and str(file).startswith(str(agent_home / "memory")):
+                opened.append(str(file))
+            return builtins.open(file, mode, *args, **kwargs)
+
+        for mod in (vault_mod, tar_stream):
+            monkeypatch.setattr(mod, "open", counting_open, raising=False)
+        archive = vault.pack(encrypt=False)
+
+        important = str(agent_home / "memory" / "long-term" / "important.json")
+        assert opened == [important]
+        manifest = json.loads(archive.with_suffix(".manifest.json").read_text())
+        assert manifest["file_hashes"]["memory/long-term/important.json"] == (
+            hashlib.sha256(Path(important).read_bytes()).hexdigest()
+        )
+
+    def test_parallel_gzip_members_decompress_as_one_stream(self):
+        import gzip
+        import io
+        import os
+
+        from skcapstone.tar_stream import ParallelGzipWriter
+
+        payload = os.urandom(5000) + b"a" * 20000
+        out = io.BytesIO()
+        writer = ParallelGzipWriter(out, block_size=4096, workers=4)
+        for i in range(0, len(payload), 1024):
+            writer.write(payload[i : i + 1024])
+        writer.close()
+
+        data = out.getvalue()
+        assert data.count(b"\x1f\x8b\x08") >= 7  # one member per 4 KiB block
+        assert gzip.decompress(data) == payload
+
+    def test_parallel_pack_roundtrip(self, vault, agent_home: Path, tmp_path: Path):
+        archive = vault.pack(encrypt=False, workers=4, compresslevel=1)
+        restore = tmp_path / "restore"
+        restore.mkdir()
+        vault.unpack(archive, target=restore, verify_signature=False)
+        assert (restore / "trust" / "trust.json").read_text() == (
+            agent_home / "trust" / "trust.json"
+        ).read_text()
+
+    def test_incremental_stores_only_changed_files(self, vault, agent_home: Path, tmp_path):
+        _backdate_tree(agent_home)
+        full = vault.pack(encrypt=False)
+        (agent_home / "trust" / "trust.json").write_text('{"depth": 5.0}')
+        (agent_home / "memory" / "short-term" / "new.json").write_text('{"content": "n"}')
+
+        delta = vault.pack(encrypt=False, incremental=True)
+
+        manifest = json.loads(delta.with_suffix(".manifest.json").read_text())
+        assert manifest["base_vault"] == full.name
+        assert sorted(manifest["packed_files"]) == [
+            "memory/short-term/new.json",
+            "trust/trust.json",
+        ]
+        assert "identity/identity.json" in manifest["file_hashes"]
+        with tarfile.open(delta, "r:gz") as tar:
+            assert sorted(tar.getnames()) == sorted(manifest["packed_files"])
+
+        restore = tmp_path / "chain"
+        restore.mkdir()
+        vault.unpack(delta, target=restore, verify_signature=False)
+        assert (restore / "trust" / "trust.json").read_text() == '{"depth": 5.0}'
+        assert (restore / "memory" / "short-term" / "new.json").exists()
+        assert (restore / "memory" / "long-term" / "important.json").exists()
+        assert (restore / "identity" / "identity.json").exists()
+
+    def test_racy_same_size_rewrite_is_stored_again(self, vault, agent_home: Path):
+        trust = agent_home / "trust" / "trust.json"
+        _backdate_tree(agent_home)
+        st = trust.stat()
+        os.utime(trust, ns=(st.st_atime_ns, st.st_mtime_ns + 10 * 1_000_000_000))  # now
+        vault.pack(encrypt=False)
+        # Rewritten in place after the base read it, in the same mtime tick.
+        st = trust.stat()
+        trust.write_text(trust.read_text().replace("4.0", "9.0"))
+        os.utime(trust, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+        delta = vault.pack(encrypt=False, incremental=True)
+
+        manifest = json.loads(delta.with_suffix(".manifest.json").read_text())
+        assert manifest["packed_files"] == ["trust/trust.json"]
+        assert manifest["file_hashes"]["trust/trust.json"] == (
+            hashlib.sha256(trust.read_bytes()).hexdigest()
+        )
+
+    def test_base_is_the_newest_vault_of_this_host(self, vault, agent_home: Path):
+        full = vault.pack(encrypt=False)
+        manifest_file = full.with_suffix(".manifest.json")
+        manifest = json.loads(manifest_file.read_text())
+        created = datetime.fromisoformat(manifest["created_at"])
+        host = manifest["source_host"]
+
+        def copy(name: str, **changes) -> None:
+            (vault.vault_dir / f"{name}.tar.gz").write_bytes(full.read_bytes())
+            data = {**manifest, **changes}
+            (vault.vault_dir / f"{name}.tar.manifest.json").write_text(json.dumps(data))
+
+        # A pre-upgrade, second-resolution name sorts after the new one.
+        stamp = (created - timedelta(seconds=1)).strftime("%Y%m%dT%H%M%SZ")
+        copy(f"vault-{host}-{stamp}", created_at=(created - timedelta(seconds=1)).isoformat())
+        # Another host whose name extends this one matches the same glob.
+        copy(
+            f"vault-{host}-x-{created.strftime('%Y%m%dT%H%M%S%fZ')}",
+            source_host=f"{host}-x",
+            created_at=(created + timedelta(seconds=1)).isoformat(),
+        )
+
+        delta = vault.pack(encrypt=False, incremental=True)
+        assert json.loads(delta.with_suffix(".manifest.json").read_text())["base_vault"] == (
+            full.name
+        )
+
+    def test_incremental_does_not_restore_deleted_files(self, vault, agent_home: Path, tmp_path):
+        vault.pack(encrypt=False)
+        (agent_home / "config" / "config.yaml").unlink()
+
+        delta = vault.pack(encrypt=False, incremental=True)
+
+        restore = tmp_path / "chain"
+        restore.mkdir()
+        vault.unpack(delta, target=restore, verify_signature=False)
+        assert not (restore / "config" / "config.yaml").exists()
+        assert (restore / "trust" / "trust.json").exists()
+
+    def test_incremental_without_base_is_full(self, vault):
+        archive = vault.pack(encrypt=False, incremental=True)
+        manifest = json.loads(archive.with_suffix(".manifest.json").read_text())
+        assert manifest["base_vault"] is None
+        assert manifest["packed_files"] is None
+
+    def test_missing_base_vault_raises(self, vault, agent_home: Path, tmp_path: Path):
+        from skcapstone.sync.vault import VaultIntegrityError
+
+        _backdate_tree(agent_home)
+        full = vault.pack(encrypt=False)
+        (agent_home / "trust" / "trust.json").write_text("{}")
+        delta = vault.pack(encrypt=False, incremental=True)
+        full.unlink()
+
+        restore = tmp_path / "broken"
+        restore.mkdir()
+        with pytest.raises(VaultIntegrityError, match="Base vault"):
+            vault.unpack(delta, target=restore, verify_signature=False)
+
+
 # ---------------------------------------------------------------------------
 # Helpers for test reuse
 # ---------------------------------------------------------------------------
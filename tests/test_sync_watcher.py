@@ -0,0 +1,176 @@
+"""Tests for batched seed intake in the sync watcher."""
+
+from __future__ import annotations
+
+import json
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from skcapstone import sync_watcher
+from skcapstone.sync_watcher import IndexClients, ProcessedTracker, SyncWatcher
+
+
+class FakeStore:
+    def __init__(self) -> None:
+        self.snapshots: list[dict] = []
+
+    def snapshot(self, **kwargs):
+        self.snapshots.append(kwargs)
+        return SimpleNamespace(id=f"m{len(self.snapshots)}", **kwargs)
+
+
+class BatchVector:
+    def __init__(self) -> None:
+        self.batches: list[int] = []
+
+    def save_many(self, memories):
+        self.batches.append(len(memories))
+        return [m.id for m in memories]
+
+
+class ItemGraph:
+    def __init__(self) -> None:
+        self.indexed = 0
+
+    def index_memory(self, memory) -> bool:
+        self.indexed += 1
+        return True
+
+
+def _seed(inbox: Path, name: str, n_memories: int = 2, tag: str = "") -> Path:
+    data = {
+        "agent_name": "peer",
+        "source_host": "box",
+        "created_at": "2026-01-01T00:00:00Z",
+        "memory_entries": [
+            {"content": f"{name} memory {i}{tag}", "layer": "short-term"}
+            for i in range(n_memories)
+        ],
+    }
+    path = inbox / f"{name}.seed.json"
+    path.write_text(json.dumps(data), encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def watcher_parts(tmp_path: Path):
+    inbox = tmp_path / "sync" / "inbox"
+    inbox.mkdir(parents=True)
+    store = FakeStore()
+    vector = BatchVector()
+    graph = ItemGraph()
+
+    def make(**kwargs) -> SyncWatcher:
+        return SyncWatcher(
+            tmp_path,
+            threading.Event(),
+            inbox_path=str(inbox),
+            processed_log=str(tmp_path / "sync" / "processed.json"),
+            store=store,
+            clients=IndexClients(vector=vector, graph=graph),
+            **kwargs,
+        )
+
+    return SimpleNamespace(inbox=inbox, store=store, vector=vector, graph=graph, make=make)
+
+
+def test_backlog_is_imported_in_batches(watcher_parts, tmp_path: Path) -> None:
+    for i in range(10):
+        _seed(watcher_parts.inbox, f"s{i:02d}")
+    watcher = watcher_parts.make(batch_size=4)
+
+    with patch.object(ProcessedTracker, "_persist", autospec=True) as persist:
+        imported = watcher.poll_inbox()
+
+    assert imported == 10
+    # One processed.json write and one vector upsert per batch, not per seed.
+    assert persist.call_count == 3
+    assert watcher_parts.vector.batches == [8, 8, 4]
+    assert watcher_parts.graph.indexed == 20
+    memory_snapshots = [s for s in watcher_parts.store.snapshots if s["source"] == "syncthing"]
+    assert len(memory_snapshots) == 20
+    assert list(watcher_parts.inbox.iterdir()) == []
+    assert len(list((tmp_path / "sync" / "archive").iterdir())) == 10
+
+
+def test_duplicate_seed_content_is_imported_once(watcher_parts, tmp_path: Path) -> None:
+    original = _seed(watcher_parts.inbox, "a")
+    conflict = watcher_parts.inbox / "a.sync-conflict-20260101-000000-ABC.seed.json"
+    conflict.write_bytes(original.read_bytes())
+    watcher = watcher_parts.make()
+
+    assert watcher.poll_inbox() == 1
+
+    memory_snapshots = [s for s in watcher_parts.store.snapshots if s["source"] == "syncthing"]
+    assert len(memory_snapshots) == 2
+    processed = json.loads((tmp_path / "sync" / "processed.json").read_text())
+    assert set(processed) == {original.name, conflict.name}
+
+
+def test_unreadable_seed_is_left_for_retry(watcher_parts) -> None:
+    bad = watcher_parts.inbox / "bad.seed.json"
+    bad.write_text("{not json", encoding="utf-8")
+    watcher = watcher_parts.make()
+
+    assert watcher.poll_inbox() == 0
+    assert bad.exists()
+    assert not watcher._tracker.is_processed(bad.name)
+
+
+def test_index_clients_are_built_once(monkeypatch) -> None:
+    built = []
+    graph = ItemGraph()
+
+    def build_graph():
+        built.append(1)
+        return graph
+
+    monkeypatch.setattr(sync_watcher, "_build_vector_backend", lambda: None)
+    monkeypatch.setattr(sync_watcher, "_build_graph_backend", build_graph)
+    clients = IndexClients()
+    memories = [SimpleNamespace(id=str(i)) for i in range(3)]
+
+    assert clients.index(memories) == (0, 3)
+    assert clients.index(memories) == (0, 3)
+    assert len(built) == 1
+
+
+def test_unavailable_backend_is_retried_after_backoff(monkeypatch) -> None:
+    graph = ItemGraph()
+    backends = [None, graph]
+    clock = [100.0]
+    monkeypatch.setattr(sync_watcher.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(sync_watcher, "_build_vector_backend", lambda: None)
+    monkeypatch.setattr(sync_watcher, "_build_graph_backend", lambda: backends.pop(0))
+    clients = IndexClients(retry_after=30)
+    memories = [SimpleNamespace(id="1")]
+
+    assert clients.index(memories) == (0, 0)  # graph server down at startup
+    clock[0] += 10
+    assert clients.index(memories) == (0, 0)  # still backing off, not rebuilt
+    clock[0] += 30
+    assert clients.index(memories) == (0, 1)
+    assert backends == []
+
+
+def test_seen_hashes_are_bounded(watcher_parts, monkeypatch) -> None:
+    monkeypatch.setattr(sync_watcher, "SEEN_HASHES_MAX", 2)
+    watcher = watcher_parts.make()
+    assert not any(watcher._seen(h) for h in ("a", "b", "c"))
+    assert list(watcher._seen_hashes) == ["b", "c"]
+    assert watcher._seen("b")
+    assert not watcher._seen("a")
+
+
+def test_tracker_mark_many_persists_once(tmp_path: Path) -> None:
+    log = tmp_path / "processed.json"
+    tracker = ProcessedTracker(log)
+    tracker.mark_many(["a.seed.json", "b.seed.json"])
+
+    reloaded = ProcessedTracker(log)
+    assert reloaded.is_processed("a.seed.json")
+    assert reloaded.is_processed("b.seed.json")
@@ -279,6 +279,52 @@ class TestThreadSafety:
         assert report.models["model-b"].calls == n
 
 
+# ---------------------------------------------------------------------------
+# Write-behind persistence
+# ---------------------------------------------------------------------------
+
+
+class TestWriteBehind:
+    """record_usage buffers; the daily file is rewritten only on compaction."""
+
+    def test_buffered_calls_not_rewritten_per_call(self, home: Path) -> None:
+        """After the first call materializes the file, later calls only buffer."""
+        tracker = UsageTracker(home, flush_every=100, flush_interval=0)
+        date_str = "2026-03-02"
+        tracker.record_usage("ollama:llama3.1", 1, 1, date_str=date_str)
+        path = home / "usage" / f"tokens-{date_str}.json"
+        before = path.read_text(encoding="utf-8")
+        for _ in range(10):
+            tracker.record_usage("ollama:llama3.1", 1, 1, date_str=date_str)
+        assert path.read_text(encoding="utf-8") == before
+        assert tracker.get_daily(date_str).models["ollama:llama3.1"].calls == 11
+
+    def test_other_process_sees_flushed_calls(self, home: Path) -> None:
+        """A second tracker (another process) reads the journal after flush."""
+        date_str = "2026-03-02"
+        writer = UsageTracker(home, flush_every=100, flush_interval=0)
+        for _ in range(5):
+            writer.record_usage("claude-sonnet-4-6", 10, 5, date_str=date_str)
+        reader = UsageTracker(home)
+        assert reader.get_daily(date_str).models["claude-sonnet-4-6"].calls == 1
+        writer.flush()
+        assert reader.get_daily(date_str).models["claude-sonnet-4-6"].calls == 5
+
+    def test_compaction_folds_journal_once(self, home: Path) -> None:
+        """Compaction is idempotent even if the journal reset never happened."""
+        date_str = "2026-03-02"
+        tracker = UsageTracker(home, flush_every=1, flush_interval=0)
+        for _ in range(3):
+            tracker.record_usage("ollama:llama3.1", 100, 50, date_str=date_str)
+        journal = home / "usage" / "tokens.journal.jsonl"
+        stale = journal.read_bytes()
+        tracker.compact()
+        data = json.loads((home / "usage" / f"tokens-{date_str}.json").read_text())
+        assert data["models"]["ollama:llama3.1"]["calls"] == 3
+        journal.write_bytes(stale)  # simulate a crash before the journal reset
+        assert tracker.get_daily(date_str).models["ollama:llama3.1"].calls == 3
+
+
 # ---------------------------------------------------------------------------
 # ModelUsageSummary
 # ---------------------------------------------------------------------------